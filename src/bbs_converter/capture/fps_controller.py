@@ -2,46 +2,184 @@
 
 from __future__ import annotations
 
+import threading
 import time
 
-from bbs_converter.utils.constants import DEFAULT_FPS
+from bbs_converter.utils.constants import (
+    ADAPTIVE_FPS_DECAY,
+    DEFAULT_FPS,
+    DEFAULT_IDLE_FPS,
+    DEFAULT_SPIN_SECONDS,
+    DOWNSTREAM_FPS_HEADROOM,
+    MAX_CATCH_UP_TICKS,
+    OverrunPolicy,
+)
+from bbs_converter.utils.timer import IntervalStats, TimingStats
 
 
 class FPSController:
     """Throttle a loop to run at a target frames-per-second.
 
     Call :meth:`tick` at the end of each loop iteration. It will
-    sleep for the remaining time to maintain the target FPS.
+    sleep until the next absolute deadline, so oversleeping on one tick
+    is absorbed by the next instead of accumulating as drift.  With
+    *spin* enabled the final millisecond is busy-waited for tighter
+    timing.  When a tick arrives after its deadline the *overrun_policy*
+    decides whether the missed slots are skipped or caught up; either
+    way the miss counts as one overrun, not one per catch-up tick.
+    Recent intervals are kept for jitter and percentile statistics.
+
+    In adaptive mode the pacing rate moves between *idle_fps* and
+    *target_fps*: :meth:`report_activity` snaps it back to the ceiling
+    whenever a frame changed and decays it toward the idle floor while
+    frames stay static.  :meth:`report_downstream_fps` lowers the
+    ceiling to a small multiple of what the consumer can actually
+    process, since frames captured faster than that are overwritten
+    unread.  The feedback methods may be called from other threads than
+    the one calling :meth:`tick`.
 
     Parameters
     ----------
     target_fps:
-        Desired frames per second.
+        Desired frames per second (the ceiling in adaptive mode).
+    adaptive:
+        Enable activity-adaptive pacing.
+    idle_fps:
+        Floor the rate decays to while frames are unchanged.
+    decay:
+        Multiplier applied to the rate on each unchanged frame.
+    spin:
+        Busy-wait the last millisecond before each deadline.
+    overrun_policy:
+        How to reschedule after a missed deadline.
     """
 
-    def __init__(self, target_fps: int = DEFAULT_FPS) -> None:
+    def __init__(
+        self,
+        target_fps: int = DEFAULT_FPS,
+        adaptive: bool = False,
+        idle_fps: float = DEFAULT_IDLE_FPS,
+        decay: float = ADAPTIVE_FPS_DECAY,
+        spin: bool = False,
+        overrun_policy: OverrunPolicy = OverrunPolicy.SKIP,
+    ) -> None:
         self._target_fps = target_fps
+        self._adaptive = adaptive
+        self._idle_fps = min(float(idle_fps), float(target_fps))
+        self._decay = decay
+        self._downstream_fps: float | None = None
+        self._current_fps = float(target_fps)
         self._frame_time = 1.0 / target_fps
+        self._spin_seconds = DEFAULT_SPIN_SECONDS if spin else 0.0
+        self._overrun_policy = overrun_policy
         self._last_time: float | None = None
-        self._actual_fps: float = 0.0
+        self._deadline: float | None = None
+        self._catching_up = False
+        self._intervals = IntervalStats()
+        # Guards the rate and schedule, which feedback from the processing
+        # thread rewrites while the capture thread ticks.
+        self._lock = threading.Lock()
 
     def tick(self) -> None:
-        """Wait as needed to maintain the target frame rate."""
+        """Wait until the next deadline to maintain the target frame rate."""
         now = time.perf_counter()
-        if self._last_time is not None:
-            elapsed = now - self._last_time
-            remaining = self._frame_time - elapsed
-            if remaining > 0:
-                time.sleep(remaining)
-            actual_elapsed = time.perf_counter() - self._last_time
-            self._actual_fps = 1.0 / actual_elapsed if actual_elapsed > 0 else 0.0
-        self._last_time = time.perf_counter()
+        with self._lock:
+            if self._deadline is None or self._last_time is None:
+                self._last_time = now
+                self._deadline = now + self._frame_time
+                return
+            deadline = self._deadline
+
+        if now < deadline:
+            self._wait_until(deadline)
+        elif not self._catching_up:
+            self._intervals.record_overrun()
+
+        tick_time = time.perf_counter()
+        with self._lock:
+            assert self._deadline is not None and self._last_time is not None
+            self._intervals.record(tick_time - self._last_time)
+            self._last_time = tick_time
+            self._deadline = self._next_deadline(self._deadline, tick_time)
+
+    def _wait_until(self, deadline: float) -> None:
+        """Sleep (and optionally spin) until *deadline*."""
+        remaining = deadline - time.perf_counter() - self._spin_seconds
+        if remaining > 0:
+            time.sleep(remaining)
+        while self._spin_seconds and time.perf_counter() < deadline:
+            pass
+
+    def _next_deadline(self, deadline: float, now: float) -> float:
+        """Schedule the next tick one period after *deadline*.
+
+        Notes whether that deadline is already past because the loop is
+        catching up, so the tick that meets it is not another overrun.
+        """
+        following = deadline + self._frame_time
+        self._catching_up = False
+        if following > now:
+            return following
+        behind = (now - deadline) / self._frame_time
+        if (
+            self._overrun_policy is OverrunPolicy.CATCH_UP
+            and behind <= MAX_CATCH_UP_TICKS
+        ):
+            self._catching_up = True
+            return following
+        return now + self._frame_time
+
+    def report_activity(self, changed: bool) -> None:
+        """Adapt the pacing rate to whether the last frame changed."""
+        if not self._adaptive:
+            return
+        with self._lock:
+            if changed:
+                self._set_rate(self._ceiling())
+            else:
+                self._set_rate(max(self._idle_fps, self._current_fps * self._decay))
+
+    def report_downstream_fps(self, fps: float) -> None:
+        """Record the consumer's measured throughput in frames per second."""
+        with self._lock:
+            self._downstream_fps = fps if fps > 0 else None
+            if self._adaptive:
+                self._set_rate(min(self._current_fps, self._ceiling()))
+
+    def _ceiling(self) -> float:
+        ceiling = float(self._target_fps)
+        if self._downstream_fps is not None:
+            ceiling = min(ceiling, self._downstream_fps * DOWNSTREAM_FPS_HEADROOM)
+        return max(self._idle_fps, ceiling)
+
+    def _set_rate(self, fps: float) -> None:
+        """Pace to *fps* from now on.  Caller holds the lock."""
+        self._current_fps = fps
+        self._frame_time = 1.0 / fps
+        # Pull a pending idle-rate deadline in so activity is seen promptly.
+        if self._deadline is not None and self._last_time is not None:
+            self._deadline = min(self._deadline, self._last_time + self._frame_time)
 
     @property
     def actual_fps(self) -> float:
-        """Return the measured FPS from the last tick interval."""
-        return self._actual_fps
+        """Return the measured FPS averaged over recent tick intervals."""
+        mean = self._intervals.mean
+        return 1.0 / mean if mean > 0 else 0.0
+
+    @property
+    def timing_stats(self) -> TimingStats:
+        """Interval mean, jitter, p95/p99 and overrun count."""
+        return self._intervals.snapshot()
+
+    @property
+    def current_fps(self) -> float:
+        """Return the rate :meth:`tick` is currently pacing to."""
+        return self._current_fps
 
     @property
     def target_fps(self) -> int:
         return self._target_fps
+
+    @property
+    def adaptive(self) -> bool:
+        return self._adaptive
@@ -1,55 +1,281 @@
-"""Thread-safe frame buffer for passing frames between threads."""
+"""Thread-safe frame buffers for passing frames between threads."""
 
 from __future__ import annotations
 
-import queue
+import threading
+from typing import TYPE_CHECKING
 
 import numpy as np
 
+from bbs_converter.capture.frame_pool import PooledFrame
+from bbs_converter.models import FrameEnvelope
 from bbs_converter.utils.constants import DEFAULT_QUEUE_MAXSIZE
+from bbs_converter.utils.exceptions import CaptureError
+from bbs_converter.utils.logger import get_logger
+from bbs_converter.utils.memory import BoundedDeque, BufferStats, MemoryAccount
+
+_log = get_logger("capture.frame_buffer")
+
+if TYPE_CHECKING:
+    # Annotation-only: a runtime ``|`` union needs Python 3.10.
+    Frame = FrameEnvelope | PooledFrame | np.ndarray
 
 
 class FrameBuffer:
     """Thread-safe bounded buffer for captured frames.
 
-    When the buffer is full, the oldest frame is discarded to make
-    room for the new one (drop-oldest policy).
+    When the buffer is full — by frame count or by byte budget — the
+    oldest frames are discarded to make room for the new one
+    (drop-oldest policy).  Discarded pooled frames and envelopes are
+    released back to their pool.  A single frame larger than the whole
+    budget is still accepted so the pipeline never stalls.
 
     Parameters
     ----------
     maxsize:
         Maximum number of frames to hold.
+    max_bytes:
+        Optional byte budget across all buffered frames.
     """
 
-    def __init__(self, maxsize: int = DEFAULT_QUEUE_MAXSIZE) -> None:
-        self._queue: queue.Queue[np.ndarray] = queue.Queue(maxsize=maxsize)
-
-    def put(self, frame: np.ndarray) -> None:
-        """Add a frame, dropping the oldest if full."""
-        try:
-            self._queue.put_nowait(frame)
-        except queue.Full:
-            try:
-                self._queue.get_nowait()
-            except queue.Empty:
-                pass
-            self._queue.put_nowait(frame)
-
-    def get(self, timeout: float | None = None) -> np.ndarray | None:
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_QUEUE_MAXSIZE,
+        max_bytes: int | None = None,
+    ) -> None:
+        self._items: BoundedDeque[Frame] = BoundedDeque(maxsize, max_bytes)
+        self._cond = threading.Condition()
+
+    def put(self, frame: Frame) -> None:
+        """Add a frame, dropping the oldest until it fits."""
+        with self._cond:
+            for dropped in self._items.push(frame):
+                if isinstance(dropped, (FrameEnvelope, PooledFrame)):
+                    dropped.release()
+            self._cond.notify_all()
+
+    def get(self, timeout: float | None = None) -> Frame | None:
         """Retrieve the next frame, blocking up to *timeout* seconds.
 
         Returns ``None`` if no frame is available within the timeout.
         """
-        try:
-            return self._queue.get(timeout=timeout)
-        except queue.Empty:
-            return None
+        with self._cond:
+            if not self._cond.wait_for(lambda: bool(self._items), timeout=timeout):
+                return None
+            frame = self._items.pop()
+            self._cond.notify_all()
+            return frame
+
+    def wait_drained(self, timeout: float | None = None) -> bool:
+        """Block until the consumer has taken every queued frame.
+
+        Returns False if frames are still queued after *timeout*.
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._items, timeout=timeout)
 
     @property
     def size(self) -> int:
         """Current number of frames in the buffer."""
-        return self._queue.qsize()
+        with self._cond:
+            return len(self._items)
+
+    @property
+    def empty(self) -> bool:
+        return self.size == 0
+
+    @property
+    def stats(self) -> BufferStats:
+        """Live bytes, high-water mark and drop count."""
+        with self._cond:
+            return self._items.snapshot()
+
+
+class LatestFrameBuffer:
+    """Single-consumer "latest wins" frame mailbox.
+
+    Plain frames are copied into a small ring of reusable slots.  An
+    envelope backed by a :class:`PooledFrame` is kept as it is, with no
+    copy, and its lease is released once the frame is neither the
+    latest nor the one being read, so a capture pool of three slots is
+    enough.  The consumer always receives the newest frame; anything it
+    was too slow to read is overwritten rather than queued, so
+    processing never falls behind capture.  The frame behind the
+    envelope last returned by :meth:`get` is never written to until the
+    consumer asks for the next frame, so the caller may read it without
+    copying.
+
+    Parameters
+    ----------
+    slots:
+        Number of ring slots (at least 3: one being written, one holding
+        the latest frame, one lent to the consumer).
+    shape:
+        Optional frame shape to preallocate eagerly.  Otherwise slots are
+        allocated from the first frame and reallocated only when the
+        frame shape changes.
+    max_bytes:
+        Optional byte budget, monitored but not enforced: the buffer
+        needs three frames whatever their size, so it never drops a
+        frame to stay within it.  Crossing the budget is logged once and
+        shows in :attr:`stats`, which counts both copy slots and the
+        pooled frames held.
+    """
+
+    def __init__(
+        self,
+        slots: int = 3,
+        shape: tuple[int, ...] | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
+        if slots < 3:
+            raise CaptureError(f"LatestFrameBuffer needs >= 3 slots, got {slots}")
+        self._slots: list[np.ndarray | None] = [
+            np.empty(shape, dtype=np.uint8) if shape is not None else None
+            for _ in range(slots)
+        ]
+        self._envelopes: list[FrameEnvelope | None] = [None] * slots
+        self._cond = threading.Condition()
+        self._latest = -1
+        self._reading = -1
+        self._sequence = 0
+        self._consumed = 0
+        self._account = MemoryAccount(max_bytes)
+        for slot in self._slots:
+            if slot is not None:
+                self._account.add(slot.nbytes)
+        self._budget_warned = False
+
+    def put(self, envelope: FrameEnvelope) -> None:
+        """Publish the envelope's frame, copying it unless it is pooled."""
+        with self._cond:
+            index = self._free_slot()
+
+        if envelope.lease is not None:
+            with self._cond:
+                self._account.add(envelope.nbytes)
+            self._warn_if_over_budget()
+        else:
+            frame = envelope.frame
+            slot = self._slots[index]
+            if slot is None or slot.shape != frame.shape or slot.dtype != frame.dtype:
+                slot = self._allocate(index, frame)
+            np.copyto(slot, frame)
+            envelope = envelope.with_frame(slot)
+
+        with self._cond:
+            if self._sequence > self._consumed:
+                self._account.record_drop()
+            previous = self._latest
+            self._latest = index
+            self._envelopes[index] = envelope
+            retired = self._retire(previous)
+            self._sequence += 1
+            self._cond.notify_all()
+        if retired is not None:
+            retired.release()
+
+    def get(self, timeout: float | None = None) -> FrameEnvelope | None:
+        """Wait for a frame newer than the last one returned.
+
+        The returned envelope's frame stays valid until the next call to
+        ``get``.  Returns ``None`` if no newer frame arrives within
+        *timeout*.
+        """
+        with self._cond:
+            if not self._cond.wait_for(
+                lambda: self._sequence > self._consumed, timeout=timeout,
+            ):
+                return None
+            previous = self._reading
+            self._reading = self._latest
+            self._consumed = self._sequence
+            retired = self._retire(previous)
+            self._cond.notify_all()
+            envelope = self._envelopes[self._reading]
+        if retired is not None:
+            retired.release()
+        return envelope
+
+    def wait_drained(self, timeout: float | None = None) -> bool:
+        """Block until the consumer has read the newest frame.
+
+        Returns False if an unread frame is still waiting after *timeout*.
+        """
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: self._sequence == self._consumed, timeout=timeout,
+            )
+
+    def _allocate(self, index: int, frame: np.ndarray) -> np.ndarray:
+        """(Re)allocate slot *index* to match *frame*."""
+        old = self._slots[index]
+        slot = np.empty_like(frame)
+        with self._cond:
+            if old is not None:
+                self._account.remove(old.nbytes)
+            self._account.add(slot.nbytes)
+            self._slots[index] = slot
+        self._warn_if_over_budget()
+        return slot
+
+    def _warn_if_over_budget(self) -> None:
+        with self._cond:
+            over_budget = not self._account.fits(0)
+        if over_budget and not self._budget_warned:
+            self._budget_warned = True
+            _log.warning(
+                "Frame ring needs %d bytes, over the %d byte budget",
+                self._account.live_bytes, self._account.max_bytes,
+            )
+
+    def _retire(self, index: int) -> FrameEnvelope | None:
+        """Take a pooled envelope out of slot *index* once nothing holds it.
+
+        Called with the lock held; the caller releases the lease outside.
+        """
+        if index < 0 or index in (self._latest, self._reading):
+            return None
+        envelope = self._envelopes[index]
+        if envelope is None or envelope.lease is None:
+            return None
+        self._envelopes[index] = None
+        self._account.remove(envelope.nbytes)
+        return envelope
+
+    def _free_slot(self) -> int:
+        """Pick the next slot that is neither the latest nor being read."""
+        count = len(self._slots)
+        for step in range(1, count + 1):
+            index = (self._latest + step) % count
+            if index != self._latest and index != self._reading:
+                return index
+        raise CaptureError("No free frame slot")  # unreachable with >= 3 slots
+
+    @property
+    def sequence(self) -> int:
+        """Sequence number of the newest published frame (0 if none)."""
+        with self._cond:
+            return self._sequence
+
+    @property
+    def overwritten(self) -> int:
+        """Number of frames replaced before the consumer read them."""
+        with self._cond:
+            return self._account.snapshot().drops
+
+    @property
+    def stats(self) -> BufferStats:
+        """Slot bytes in use, high-water mark and overwrite count."""
+        with self._cond:
+            return self._account.snapshot()
+
+    @property
+    def size(self) -> int:
+        """1 if an unread frame is waiting, else 0."""
+        with self._cond:
+            return 1 if self._sequence > self._consumed else 0
 
     @property
     def empty(self) -> bool:
-        return self._queue.empty()
+        return self.size == 0
@@ -0,0 +1,135 @@
+"""Preallocated, reusable frame storage for the capture loop."""
+
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+
+from bbs_converter.utils.exceptions import CaptureError
+
+
+class PooledFrame:
+    """A frame slot borrowed from a :class:`FramePool`.
+
+    The holder owns :attr:`array` until :meth:`release` is called, after
+    which the slot may be overwritten by the next capture.  Releasing is
+    idempotent, and the object can be used as a context manager that
+    releases on exit.
+
+    Parameters
+    ----------
+    pool:
+        The pool the slot belongs to.
+    index:
+        Slot index within the pool.
+    array:
+        The preallocated frame storage.
+    """
+
+    __slots__ = ("_pool", "_index", "_array", "_released")
+
+    def __init__(self, pool: FramePool, index: int, array: np.ndarray) -> None:
+        self._pool = pool
+        self._index = index
+        self._array = array
+        self._released = False
+
+    @property
+    def array(self) -> np.ndarray:
+        """Return the frame pixels.
+
+        Raises
+        ------
+        CaptureError
+            If the frame has already been released.
+        """
+        if self._released:
+            raise CaptureError("Pooled frame used after release")
+        return self._array
+
+    @property
+    def released(self) -> bool:
+        return self._released
+
+    @property
+    def nbytes(self) -> int:
+        return self._array.nbytes
+
+    def release(self) -> None:
+        """Return the slot to its pool."""
+        self._pool._give_back(self)
+
+    def __enter__(self) -> PooledFrame:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.release()
+
+
+class FramePool:
+    """Fixed set of preallocated frame arrays handed out one at a time.
+
+    Avoids a fresh allocation per captured frame: the capture loop
+    acquires a slot, fills it in place and passes ownership downstream.
+    The consumer releases the slot when it is done with the pixels.
+
+    Parameters
+    ----------
+    shape:
+        Shape of every frame in the pool, e.g. ``(height, width, 4)``.
+    capacity:
+        Number of preallocated slots.
+    dtype:
+        Pixel data type.
+    """
+
+    def __init__(
+        self,
+        shape: tuple[int, ...],
+        capacity: int = 4,
+        dtype: np.dtype | type = np.uint8,
+    ) -> None:
+        if capacity < 1:
+            raise CaptureError(f"Frame pool capacity must be >= 1, got {capacity}")
+        self._shape = tuple(shape)
+        self._slots = [np.empty(self._shape, dtype=dtype) for _ in range(capacity)]
+        self._free = list(range(capacity - 1, -1, -1))
+        self._lock = threading.Lock()
+        self._exhausted = 0
+
+    def acquire(self) -> PooledFrame | None:
+        """Borrow a free slot, or return ``None`` if all are in use."""
+        with self._lock:
+            if not self._free:
+                self._exhausted += 1
+                return None
+            index = self._free.pop()
+        return PooledFrame(self, index, self._slots[index])
+
+    def _give_back(self, frame: PooledFrame) -> None:
+        """Free *frame*'s slot, once, however many threads release it."""
+        with self._lock:
+            if frame._released:
+                return
+            frame._released = True
+            self._free.append(frame._index)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self._shape
+
+    @property
+    def capacity(self) -> int:
+        return len(self._slots)
+
+    @property
+    def available(self) -> int:
+        """Number of slots currently free."""
+        with self._lock:
+            return len(self._free)
+
+    @property
+    def exhausted_count(self) -> int:
+        """Number of :meth:`acquire` calls that found no free slot."""
+        return self._exhausted
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import mss
+import mss.exception
+import mss.screenshot
 import mss.tools
 import numpy as np
 
@@ -17,12 +19,20 @@ class FrameGrabber:
     ----------
     region:
         The screen region to capture.
+    zero_copy:
+        If True, :meth:`grab` returns a view over the mss pixel buffer
+        instead of copying it into a new array.
     """
 
-    def __init__(self, region: CaptureRegion) -> None:
+    # Live capture never runs dry and relies on the caller for pacing.
+    self_paced = False
+    exhausted = False
+
+    def __init__(self, region: CaptureRegion, zero_copy: bool = False) -> None:
         self._region = region
         self._monitor = region.to_mss_monitor()
         self._sct: mss.mss | None = None
+        self._zero_copy = zero_copy
 
     def open(self) -> None:
         """Initialize the mss capture context."""
@@ -37,6 +47,10 @@ class FrameGrabber:
     def grab(self) -> np.ndarray:
         """Capture a single frame as a numpy array (BGRA).
 
+        In zero-copy mode the returned array is a view over the buffer
+        mss allocated for this screenshot; it stays valid for as long as
+        the caller holds it.
+
         Returns
         -------
         numpy.ndarray
@@ -47,11 +61,52 @@ class FrameGrabber:
         CaptureError
             If the grabber has not been opened.
         """
+        screenshot = self._grab_raw()
+        if self._zero_copy:
+            return _as_view(screenshot)
+        return np.array(screenshot)
+
+    def grab_into(self, out: np.ndarray) -> np.ndarray:
+        """Capture a single frame into the preallocated array *out*.
+
+        Parameters
+        ----------
+        out:
+            Destination array of shape (height, width, 4), e.g. a
+            :class:`~bbs_converter.capture.frame_pool.PooledFrame` slot.
+
+        Returns
+        -------
+        numpy.ndarray
+            *out*, filled with the captured BGRA pixels.
+
+        Raises
+        ------
+        CaptureError
+            If the grabber has not been opened or *out* has the wrong shape.
+        """
+        view = _as_view(self._grab_raw())
+        if out.shape != view.shape:
+            raise CaptureError(
+                f"Destination shape {out.shape} does not match frame {view.shape}"
+            )
+        np.copyto(out, view)
+        return out
+
+    def grab_region(self, region: CaptureRegion) -> np.ndarray:
+        """Capture an arbitrary *region* through this grabber's mss context.
+
+        Always zero-copy.  Lets one context serve several regions, e.g.
+        one grab per monitor when capturing many tables.
+        """
+        return _as_view(self._grab_raw(region.to_mss_monitor()))
+
+    def _grab_raw(
+        self, monitor: dict[str, int] | None = None,
+    ) -> mss.screenshot.ScreenShot:
         if self._sct is None:
             raise CaptureError("FrameGrabber is not open — call open() first")
-
-        screenshot = self._sct.grab(self._monitor)
-        return np.array(screenshot)
+        return self._sct.grab(monitor if monitor is not None else self._monitor)
 
     def __enter__(self) -> FrameGrabber:
         self.open()
@@ -59,3 +114,28 @@ class FrameGrabber:
 
     def __exit__(self, *args: object) -> None:
         self.close()
+
+
+def capture_size(region: CaptureRegion) -> tuple[int, int]:
+    """Return the ``(width, height)`` in pixels of frames grabbed from *region*.
+
+    On HiDPI screens this is larger than the region's size in logical
+    points, so one frame is grabbed to measure it.
+
+    Raises
+    ------
+    CaptureError
+        If the screen cannot be captured.
+    """
+    try:
+        with FrameGrabber(region) as grabber:
+            screenshot = grabber._grab_raw()
+    except mss.exception.ScreenShotError as exc:
+        raise CaptureError(f"Cannot capture {region}: {exc}") from exc
+    return screenshot.width, screenshot.height
+
+
+def _as_view(screenshot: mss.screenshot.ScreenShot) -> np.ndarray:
+    """Wrap the raw BGRA bytes of an mss screenshot without copying."""
+    pixels = np.frombuffer(screenshot.raw, dtype=np.uint8)
+    return pixels.reshape(screenshot.height, screenshot.width, 4)
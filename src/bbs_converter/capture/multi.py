@@ -0,0 +1,243 @@
+"""Capture several table regions from a single grab loop."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Sequence
+
+import numpy as np
+
+from bbs_converter.capture.fps_controller import FPSController
+from bbs_converter.capture.frame_buffer import LatestFrameBuffer
+from bbs_converter.capture.grabber import FrameGrabber
+from bbs_converter.capture.monitor import MonitorInfo
+from bbs_converter.capture.signature import FrameSignature
+from bbs_converter.models import CaptureRegion, FrameEnvelope
+from bbs_converter.utils.constants import DEFAULT_FPS, DEFAULT_IDLE_FPS, OverrunPolicy
+from bbs_converter.utils.exceptions import CaptureError
+from bbs_converter.utils.logger import get_logger
+from bbs_converter.utils.timer import TimingStats
+
+_log = get_logger("capture.multi")
+
+
+def bounding_region(regions: Sequence[CaptureRegion]) -> CaptureRegion:
+    """Return the smallest region containing every region in *regions*.
+
+    Raises
+    ------
+    CaptureError
+        If *regions* is empty.
+    """
+    if not regions:
+        raise CaptureError("Cannot bound an empty set of regions")
+    left = min(r.x for r in regions)
+    top = min(r.y for r in regions)
+    right = max(r.x + r.width for r in regions)
+    bottom = max(r.y + r.height for r in regions)
+    return CaptureRegion(x=left, y=top, width=right - left, height=bottom - top)
+
+
+def group_by_monitor(
+    regions: Sequence[CaptureRegion],
+    monitors: Sequence[MonitorInfo],
+) -> list[list[int]]:
+    """Group region indices by the monitor containing each region's centre.
+
+    Regions whose centre lies on no monitor form their own group.
+    """
+    groups: dict[int, list[int]] = {}
+    for index, region in enumerate(regions):
+        cx = region.x + region.width // 2
+        cy = region.y + region.height // 2
+        key = -1 - index
+        for monitor in monitors:
+            if (
+                monitor.left <= cx < monitor.left + monitor.width
+                and monitor.top <= cy < monitor.top + monitor.height
+            ):
+                key = monitor.index
+                break
+        groups.setdefault(key, []).append(index)
+    return list(groups.values())
+
+
+class _CaptureGroup:
+    """Regions served by one screen grab of their bounding box."""
+
+    def __init__(self, indices: list[int], regions: Sequence[CaptureRegion]) -> None:
+        self.indices = indices
+        self.bounds = bounding_region([regions[i] for i in indices])
+
+    def views(
+        self, frame: np.ndarray, regions: Sequence[CaptureRegion],
+    ) -> list[tuple[int, np.ndarray]]:
+        """Slice zero-copy per-region views out of the group frame.
+
+        Offsets are scaled by the ratio of captured pixels to logical
+        points so HiDPI grabs line up.
+        """
+        scale_x = frame.shape[1] / self.bounds.width
+        scale_y = frame.shape[0] / self.bounds.height
+        views = []
+        for index in self.indices:
+            region = regions[index]
+            x0 = round((region.x - self.bounds.x) * scale_x)
+            y0 = round((region.y - self.bounds.y) * scale_y)
+            x1 = x0 + round(region.width * scale_x)
+            y1 = y0 + round(region.height * scale_y)
+            views.append((index, frame[y0:y1, x0:x1]))
+        return views
+
+
+class MultiRegionCapture:
+    """One capture thread and mss context feeding many table regions.
+
+    Each tick grabs the bounding box of all regions once (or of each
+    monitor's regions when *monitors* is given), slices a zero-copy view
+    per table and publishes it to that table's
+    :class:`LatestFrameBuffer`.  Tables whose pixels did not change since
+    the previous tick are skipped.
+
+    Parameters
+    ----------
+    regions:
+        Screen region of each table.
+    buffers:
+        One buffer per region, in the same order.
+    fps:
+        Target capture frame rate.
+    monitors:
+        If given, regions are grouped per monitor and each group is
+        grabbed separately instead of one bounding box spanning screens.
+    dedupe:
+        Skip tables whose frame matches their previous one.
+    adaptive:
+        Slow down toward *idle_fps* while no table changes.
+    idle_fps:
+        Adaptive-mode floor.
+    spin:
+        Busy-wait the last millisecond before each capture deadline.
+    overrun_policy:
+        How capture pacing reschedules after a missed deadline.
+    """
+
+    def __init__(
+        self,
+        regions: Sequence[CaptureRegion],
+        buffers: Sequence[LatestFrameBuffer],
+        fps: int = DEFAULT_FPS,
+        monitors: Sequence[MonitorInfo] | None = None,
+        dedupe: bool = True,
+        adaptive: bool = False,
+        idle_fps: float = DEFAULT_IDLE_FPS,
+        spin: bool = False,
+        overrun_policy: OverrunPolicy = OverrunPolicy.SKIP,
+    ) -> None:
+        if len(regions) != len(buffers):
+            raise CaptureError(
+                f"Got {len(regions)} regions but {len(buffers)} buffers"
+            )
+        self._regions = list(regions)
+        self._buffers = list(buffers)
+        if monitors:
+            indices = group_by_monitor(self._regions, monitors)
+        else:
+            indices = [list(range(len(self._regions)))]
+        self._groups = [_CaptureGroup(group, self._regions) for group in indices]
+        self._fps_ctrl = FPSController(
+            target_fps=fps, adaptive=adaptive, idle_fps=idle_fps,
+            spin=spin, overrun_policy=overrun_policy,
+        )
+        self._signatures = (
+            [FrameSignature() for _ in self._regions] if dedupe or adaptive else None
+        )
+        self._last_signatures: list[int | None] = [None] * len(self._regions)
+        self._dedupe = dedupe
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._seq = 0
+        self._duplicates = 0
+        self._views = 0
+
+    def start(self) -> None:
+        """Start the capture thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        _log.info(
+            "Multi-table capture started: %d tables in %d grab(s) at %d FPS",
+            len(self._regions), len(self._groups), self._fps_ctrl.target_fps,
+        )
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Signal the capture thread to stop and wait for it."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        _log.info("Multi-table capture stopped")
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def actual_fps(self) -> float:
+        return self._fps_ctrl.actual_fps
+
+    @property
+    def timing_stats(self) -> TimingStats:
+        return self._fps_ctrl.timing_stats
+
+    @property
+    def grab_count(self) -> int:
+        """Number of screen grabs performed per tick."""
+        return len(self._groups)
+
+    @property
+    def duplicate_rate(self) -> float:
+        """Share of per-table views skipped as unchanged (%)."""
+        return self._duplicates / self._views * 100 if self._views else 0.0
+
+    def report_downstream_fps(self, fps: float) -> None:
+        """Feed back processing throughput to cap the capture rate."""
+        self._fps_ctrl.report_downstream_fps(fps)
+
+    def readmit(self, index: int) -> None:
+        """Push table *index*'s next frame even if it is unchanged."""
+        self._last_signatures[index] = None
+
+    def _run(self) -> None:
+        """Main capture loop executed on the background thread."""
+        with FrameGrabber(self._groups[0].bounds, zero_copy=True) as grabber:
+            while not self._stop_event.is_set():
+                self._seq += 1
+                changed = False
+                for group in self._groups:
+                    frame = grabber.grab_region(group.bounds)
+                    captured_at = time.perf_counter()
+                    for index, view in group.views(frame, self._regions):
+                        if self._publish(index, view, captured_at):
+                            changed = True
+                self._fps_ctrl.report_activity(changed)
+                self._fps_ctrl.tick()
+
+    def _publish(self, index: int, view: np.ndarray, captured_at: float) -> bool:
+        """Push one table view; return True if it differed from the last."""
+        self._views += 1
+        changed = True
+        if self._signatures is not None:
+            signature = self._signatures[index].compute(view)
+            changed = signature != self._last_signatures[index]
+            self._last_signatures[index] = signature
+        if not changed and self._dedupe:
+            self._duplicates += 1
+            return False
+        self._buffers[index].put(
+            FrameEnvelope(self._seq, captured_at, self._regions[index], view)
+        )
+        return changed
@@ -0,0 +1,409 @@
+"""Session recorder: persist captured frames to memory-mapped segment files.
+
+A session is a directory of ``segment-NNNNNN.bbsrec`` files.  Each
+segment is preallocated, memory-mapped and filled append-only:
+
+* a fixed 64-byte header (magic, version, index capacity, frame count
+  and end of data),
+* an index of ``index_capacity`` entries of timestamp, data offset and
+  frame shape,
+* the frame data region, one contiguous ``uint8`` block per frame.
+
+A frame is committed by bumping the header's frame count after its data
+and index entry are written, so a reader never sees a partial frame.  On
+close the file is truncated to the end of its data.
+"""
+
+from __future__ import annotations
+
+import mmap
+import queue
+import struct
+import threading
+from collections import deque
+from pathlib import Path
+
+import numpy as np
+
+from bbs_converter.capture.signature import FrameSignature
+from bbs_converter.models import FrameEnvelope
+from bbs_converter.utils.constants import (
+    RECORDER_INDEX_CAPACITY,
+    RECORDER_QUEUE_SIZE,
+    RECORDER_SEGMENT_BYTES,
+)
+from bbs_converter.utils.exceptions import CaptureError
+from bbs_converter.utils.logger import get_logger
+
+_log = get_logger("capture.recorder")
+
+SEGMENT_SUFFIX = ".bbsrec"
+
+_MAGIC = b"BBSREC\x00\x01"
+_VERSION = 1
+# magic, version, reserved, index capacity, frame count, data end
+_HEADER = struct.Struct("<8sHHIIQ")
+_HEADER_SIZE = 64
+_ENTRY = struct.Struct("<dQIII")       # timestamp, offset, height, width, channels
+_DATA_ALIGN = 64
+
+
+def _align(value: int) -> int:
+    return (value + _DATA_ALIGN - 1) // _DATA_ALIGN * _DATA_ALIGN
+
+
+class _SegmentWriter:
+    """One preallocated, memory-mapped segment being filled."""
+
+    def __init__(self, path: Path, capacity: int, index_capacity: int) -> None:
+        self.path = path
+        self._index_capacity = index_capacity
+        self._data_start = _align(_HEADER_SIZE + index_capacity * _ENTRY.size)
+        if self._data_start >= capacity:
+            raise CaptureError(
+                f"Segment size {capacity} too small for a {index_capacity}-entry index"
+            )
+        self._file = open(path, "w+b")  # closed in close()
+        self._file.truncate(capacity)
+        self._mm = mmap.mmap(self._file.fileno(), capacity)
+        self._capacity = capacity
+        self._count = 0
+        self._data_end = self._data_start
+        self._write_header()
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def data_end(self) -> int:
+        return self._data_end
+
+    def fits(self, nbytes: int) -> bool:
+        return (
+            self._count < self._index_capacity
+            and _align(self._data_end) + nbytes <= self._capacity
+        )
+
+    def append(self, frame: np.ndarray, timestamp: float) -> None:
+        offset = _align(self._data_end)
+        dst = np.ndarray(frame.shape, dtype=np.uint8, buffer=self._mm, offset=offset)
+        np.copyto(dst, frame)
+        del dst  # drop the export so the map can be closed later
+
+        height, width = frame.shape[:2]
+        channels = frame.shape[2] if frame.ndim == 3 else 0
+        _ENTRY.pack_into(
+            self._mm, _HEADER_SIZE + self._count * _ENTRY.size,
+            timestamp, offset, height, width, channels,
+        )
+        self._data_end = offset + frame.nbytes
+        self._count += 1
+        self._write_header()  # commit
+
+    def close(self) -> int:
+        """Flush, unmap and truncate the file; return its final size."""
+        self._mm.flush()
+        self._mm.close()
+        self._file.truncate(self._data_end)
+        self._file.close()
+        return self._data_end
+
+    def _write_header(self) -> None:
+        _HEADER.pack_into(
+            self._mm, 0, _MAGIC, _VERSION, 0,
+            self._index_capacity, self._count, self._data_end,
+        )
+
+
+class SessionRecorder:
+    """Tee captured frames to disk without blocking the capture loop.
+
+    :meth:`record` only enqueues the frame; a background writer thread
+    copies it into the current segment.  When the queue is full the frame
+    is dropped and counted rather than stalling capture.  If writing
+    fails, e.g. the disk is full, the error is logged, the recorder is
+    marked :attr:`failed` and later frames are dropped.
+
+    Parameters
+    ----------
+    directory:
+        Session directory; created if missing.  Existing segments are
+        kept and new ones are numbered after them.
+    segment_bytes:
+        Preallocated size of each segment file.
+    max_total_bytes:
+        Rolling retention cap for the segments this recorder writes.
+        The oldest of them are deleted to stay under it; segments left
+        in *directory* by earlier sessions are never touched.  ``None``
+        keeps everything.
+    dedupe:
+        Skip frames whose :class:`FrameSignature` matches the previously
+        written frame.
+    queue_size:
+        Frames the writer may fall behind by before frames are dropped.
+    index_capacity:
+        Maximum frames per segment.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        segment_bytes: int = RECORDER_SEGMENT_BYTES,
+        max_total_bytes: int | None = None,
+        dedupe: bool = False,
+        queue_size: int = RECORDER_QUEUE_SIZE,
+        index_capacity: int = RECORDER_INDEX_CAPACITY,
+    ) -> None:
+        if max_total_bytes is not None and max_total_bytes < segment_bytes:
+            raise CaptureError(
+                f"Recorder cap {max_total_bytes} is smaller than one "
+                f"{segment_bytes}-byte segment"
+            )
+        self._directory = Path(directory)
+        self._segment_bytes = segment_bytes
+        self._max_total_bytes = max_total_bytes
+        self._index_capacity = index_capacity
+        self._signature = FrameSignature() if dedupe else None
+        self._last_signature: int | None = None
+        self._queue: queue.Queue[tuple[np.ndarray, float] | None] = queue.Queue(
+            maxsize=queue_size,
+        )
+        self._segment: _SegmentWriter | None = None
+        self._closed_segments: deque[tuple[Path, int]] = deque()
+        self._next_segment = 0
+        self._thread: threading.Thread | None = None
+        self._failed = False
+        self._frames_written = 0
+        self._frames_deduped = 0
+        self._frames_dropped = 0
+        self._segments_deleted = 0
+
+    def start(self) -> None:
+        """Start the background writer."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._directory.mkdir(parents=True, exist_ok=True)
+        existing = sorted(self._directory.glob(f"segment-*{SEGMENT_SUFFIX}"))
+        if existing:
+            self._next_segment = int(existing[-1].stem.split("-")[1]) + 1
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        _log.info("Recording session to %s", self._directory)
+
+    def record(self, envelope: FrameEnvelope) -> bool:
+        """Queue *envelope*'s frame for writing.
+
+        Pooled frames are copied because their slot is recycled; other
+        frames are queued by reference.  Returns False if the frame was
+        dropped because the writer is behind or has failed.
+        """
+        if self._failed:
+            self._frames_dropped += 1
+            return False
+        frame = envelope.frame
+        if envelope.lease is not None:
+            frame = frame.copy()
+        try:
+            self._queue.put_nowait((frame, envelope.captured_at))
+        except queue.Full:
+            self._frames_dropped += 1
+            return False
+        return True
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write out queued frames, stop the writer and finalise the segment."""
+        if self._thread is None:
+            return
+        if self._thread.is_alive():
+            try:
+                self._queue.put(None, timeout=timeout)
+            except queue.Full:
+                _log.warning("Recorder writer did not drain its queue")
+            self._thread.join(timeout=timeout)
+        self._thread = None
+        _log.info(
+            "Recorded %d frames (%d deduped, %d dropped)",
+            self._frames_written, self._frames_deduped, self._frames_dropped,
+        )
+
+    @property
+    def recording(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def failed(self) -> bool:
+        """True once the writer stopped on an error."""
+        return self._failed
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    @property
+    def frames_written(self) -> int:
+        return self._frames_written
+
+    @property
+    def frames_deduped(self) -> int:
+        return self._frames_deduped
+
+    @property
+    def frames_dropped(self) -> int:
+        """Frames discarded because the writer queue was full."""
+        return self._frames_dropped
+
+    @property
+    def segments_deleted(self) -> int:
+        """Segments removed by rolling retention."""
+        return self._segments_deleted
+
+    def _run(self) -> None:
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    break
+                self._write(*item)
+            self._close_segment()
+        except Exception as exc:  # e.g. no space left, or an oversized frame
+            self._fail(exc)
+
+    def _fail(self, exc: Exception) -> None:
+        """Stop recording after *exc*, keeping what was committed."""
+        self._failed = True
+        _log.error("Recording stopped: %s", exc)
+        try:
+            self._close_segment()
+        except Exception as close_exc:
+            _log.debug("Could not finalise the segment: %s", close_exc)
+        while True:  # release queued frames and unblock close()
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+    def _write(self, frame: np.ndarray, timestamp: float) -> None:
+        if frame.dtype != np.uint8:
+            _log.warning("Skipping %s frame; only uint8 is recorded", frame.dtype)
+            return
+        if self._signature is not None:
+            signature = self._signature.compute(frame)
+            if signature == self._last_signature:
+                self._frames_deduped += 1
+                return
+            self._last_signature = signature
+
+        if self._segment is None or not self._segment.fits(frame.nbytes):
+            self._close_segment()
+            self._open_segment(frame.nbytes)
+        assert self._segment is not None
+        self._segment.append(frame, timestamp)
+        self._frames_written += 1
+
+    def _open_segment(self, nbytes: int) -> None:
+        self._enforce_retention()
+        path = self._directory / f"segment-{self._next_segment:06d}{SEGMENT_SUFFIX}"
+        self._next_segment += 1
+        segment = _SegmentWriter(path, self._segment_bytes, self._index_capacity)
+        if not segment.fits(nbytes):
+            segment.close()
+            path.unlink()
+            raise CaptureError(
+                f"Frame of {nbytes} bytes does not fit a "
+                f"{self._segment_bytes}-byte segment"
+            )
+        self._segment = segment
+
+    def _close_segment(self) -> None:
+        if self._segment is None:
+            return
+        segment, self._segment = self._segment, None
+        size = segment.close()
+        if segment.count == 0:
+            segment.path.unlink(missing_ok=True)
+        else:
+            self._closed_segments.append((segment.path, size))
+
+    def _enforce_retention(self) -> None:
+        """Delete the oldest segments so a new one fits under the cap."""
+        if self._max_total_bytes is None:
+            return
+        cap = self._max_total_bytes
+        total = sum(size for _, size in self._closed_segments)
+        while self._closed_segments and total + self._segment_bytes > cap:
+            path, size = self._closed_segments.popleft()
+            path.unlink(missing_ok=True)
+            total -= size
+            self._segments_deleted += 1
+            _log.debug("Retention removed %s", path.name)
+
+
+class _SegmentReader:
+    """Read-only view of one segment file."""
+
+    def __init__(self, path: Path) -> None:
+        with open(path, "rb") as f:
+            try:
+                self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as exc:  # empty file
+                raise CaptureError(f"Empty session segment: {path}") from exc
+        if len(self._mm) < _HEADER_SIZE:
+            raise CaptureError(f"Truncated session segment: {path}")
+        magic, version, _, _, count, _ = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise CaptureError(f"Not a session segment: {path}")
+        self._entries = [
+            _ENTRY.unpack_from(self._mm, _HEADER_SIZE + i * _ENTRY.size)
+            for i in range(count)
+        ]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def timestamp(self, index: int) -> float:
+        return float(self._entries[index][0])
+
+    def frame(self, index: int) -> np.ndarray:
+        _, offset, height, width, channels = self._entries[index]
+        shape = (height, width, channels) if channels else (height, width)
+        frame: np.ndarray = np.ndarray(
+            shape, dtype=np.uint8, buffer=self._mm, offset=offset,
+        )
+        return frame
+
+
+class SessionReader:
+    """Random access to the frames of a recorded session.
+
+    Frames are read-only views straight into the memory-mapped
+    segments.
+
+    Parameters
+    ----------
+    path:
+        A session directory or a single segment file.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        path = Path(path)
+        if path.is_dir():
+            files = sorted(path.glob(f"segment-*{SEGMENT_SUFFIX}"))
+        else:
+            files = [path]
+        self._segments = [_SegmentReader(p) for p in files]
+        self._locations = [
+            (seg, i) for seg in self._segments for i in range(len(seg))
+        ]
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        segment, local = self._locations[index]
+        return segment.frame(local)
+
+    @property
+    def timestamps(self) -> list[float]:
+        """Capture time of every frame, in recording order."""
+        return [segment.timestamp(local) for segment, local in self._locations]
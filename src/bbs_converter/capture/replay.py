@@ -0,0 +1,239 @@
+"""Replay capture backend: feed recorded frames instead of the live screen."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Protocol
+
+import cv2
+import numpy as np
+
+from bbs_converter.capture.recorder import SEGMENT_SUFFIX, SessionReader
+from bbs_converter.models import CaptureRegion
+from bbs_converter.utils.constants import DEFAULT_FPS
+from bbs_converter.utils.exceptions import CaptureError
+from bbs_converter.utils.logger import get_logger
+
+_log = get_logger("capture.replay")
+
+_IMAGE_SUFFIXES = (".png",)
+
+
+class _FrameStore(Protocol):
+    """Indexable frames: arrays, image paths or a :class:`SessionReader`."""
+
+    def __len__(self) -> int: ...
+
+    def __getitem__(self, index: int, /) -> np.ndarray | Path: ...
+
+
+class ReplaySource:
+    """An ordered set of recorded frames with optional capture timestamps.
+
+    Frames are BGRA ``uint8`` arrays, the same layout the live grabber
+    produces.  Image directories are decoded lazily, one frame at a
+    time; ``.npy`` stacks are memory-mapped.
+
+    Parameters
+    ----------
+    frames:
+        Frame arrays, or image paths decoded on access.
+    timestamps:
+        Capture time of each frame in seconds, or ``None`` to space
+        frames evenly at *fps*.
+    fps:
+        Nominal rate used when no timestamps were recorded.
+    """
+
+    def __init__(
+        self,
+        frames: _FrameStore,
+        timestamps: Sequence[float] | None = None,
+        fps: float = DEFAULT_FPS,
+    ) -> None:
+        if len(frames) == 0:
+            raise CaptureError("Replay source contains no frames")
+        if timestamps is not None and len(timestamps) != len(frames):
+            raise CaptureError(
+                f"Replay source has {len(frames)} frames "
+                f"but {len(timestamps)} timestamps"
+            )
+        self._frames = frames
+        if timestamps is None:
+            timestamps = [i / fps for i in range(len(frames))]
+        self._timestamps = [float(t) for t in timestamps]
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def frame(self, index: int) -> np.ndarray:
+        """Return frame *index* as a BGRA array."""
+        item = self._frames[index]
+        if isinstance(item, Path):
+            return _read_image(item)
+        return _to_bgra(item)
+
+    def offset(self, index: int) -> float:
+        """Seconds between the first frame and frame *index*."""
+        return self._timestamps[index] - self._timestamps[0]
+
+    @property
+    def duration(self) -> float:
+        return self.offset(len(self) - 1)
+
+
+def load_replay_source(path: str | Path, fps: float = DEFAULT_FPS) -> ReplaySource:
+    """Open a recorded frame store.
+
+    Supported layouts are a recorded session (a directory of
+    ``.bbsrec`` segments or a single segment, replayed with its
+    timestamps), a directory of PNG images (replayed in file name order)
+    and a ``.npy`` stack of shape ``(n, height, width, c)``.
+
+    Raises
+    ------
+    CaptureError
+        If *path* does not exist or is not a supported frame store.
+    """
+    path = Path(path)
+    if not path.exists():
+        raise CaptureError(f"Replay source not found: {path}")
+    if path.suffix == SEGMENT_SUFFIX or (
+        path.is_dir() and any(path.glob(f"*{SEGMENT_SUFFIX}"))
+    ):
+        session = SessionReader(path)
+        if len(session) == 0:
+            raise CaptureError(f"Replay source contains no frames: {path}")
+        return ReplaySource(session, timestamps=session.timestamps)
+    if path.is_dir():
+        images = sorted(
+            p for p in path.iterdir() if p.suffix.lower() in _IMAGE_SUFFIXES
+        )
+        return ReplaySource(images, fps=fps)
+    if path.suffix == ".npy":
+        stack = np.load(path, mmap_mode="r")
+        if stack.ndim not in (3, 4):
+            raise CaptureError(
+                f"Expected a (n, h, w[, c]) frame stack in {path}, got {stack.shape}"
+            )
+        return ReplaySource(stack, fps=fps)
+    raise CaptureError(f"Unsupported replay source: {path}")
+
+
+class ReplayGrabber:
+    """Drop-in for :class:`FrameGrabber` that plays back a :class:`ReplaySource`.
+
+    In realtime mode each :meth:`grab` blocks until the frame's original
+    offset from the start of playback, reproducing the recorded timing.
+    Otherwise frames are returned as fast as they are requested, so the
+    caller's consumption rate sets the pace.
+
+    Parameters
+    ----------
+    source:
+        Frames to replay.
+    realtime:
+        Honour the recorded timestamps.
+    """
+
+    # The grabber paces itself, so the capture loop must not add its own delay.
+    self_paced = True
+
+    def __init__(self, source: ReplaySource, realtime: bool = True) -> None:
+        self._source = source
+        self._realtime = realtime
+        self._index = 0
+        self._started_at: float | None = None
+
+    @property
+    def region(self) -> CaptureRegion:
+        """Region covering one full recorded frame."""
+        height, width = self._source.frame(0).shape[:2]
+        return CaptureRegion(x=0, y=0, width=width, height=height)
+
+    @property
+    def realtime(self) -> bool:
+        return self._realtime
+
+    @property
+    def exhausted(self) -> bool:
+        """True once every recorded frame has been returned."""
+        return self._index >= len(self._source)
+
+    @property
+    def position(self) -> int:
+        """Index of the next frame to be returned."""
+        return self._index
+
+    def open(self) -> None:
+        self._index = 0
+        self._started_at = None
+        _log.debug(
+            "Replaying %d frames (%.1fs, %s)", len(self._source),
+            self._source.duration, "realtime" if self._realtime else "fast",
+        )
+
+    def close(self) -> None:
+        pass
+
+    def grab(self) -> np.ndarray:
+        """Return the next recorded frame.
+
+        Raises
+        ------
+        CaptureError
+            If the replay is exhausted.
+        """
+        if self.exhausted:
+            raise CaptureError("Replay source exhausted")
+        if self._realtime:
+            self._wait_for(self._index)
+        frame = self._source.frame(self._index)
+        self._index += 1
+        return frame
+
+    def grab_into(self, out: np.ndarray) -> np.ndarray:
+        """Copy the next recorded frame into *out*."""
+        frame = self.grab()
+        if frame.shape != out.shape:
+            raise CaptureError(
+                f"Replay frame {frame.shape} does not match destination {out.shape}"
+            )
+        np.copyto(out, frame)
+        return out
+
+    def _wait_for(self, index: int) -> None:
+        now = time.perf_counter()
+        if self._started_at is None:
+            self._started_at = now
+        delay = self._started_at + self._source.offset(index) - now
+        if delay > 0:
+            time.sleep(delay)
+
+    def __enter__(self) -> ReplayGrabber:
+        self.open()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+
+def _read_image(path: Path) -> np.ndarray:
+    image = cv2.imread(str(path), cv2.IMREAD_UNCHANGED)
+    if image is None:
+        raise CaptureError(f"Failed to read replay frame {path}")
+    return _to_bgra(image)
+
+
+def _to_bgra(frame: np.ndarray) -> np.ndarray:
+    """Normalise a recorded frame to the live grabber's BGRA layout."""
+    if frame.ndim == 2:
+        return cv2.cvtColor(np.asarray(frame), cv2.COLOR_GRAY2BGRA)
+    channels = frame.shape[2]
+    if channels == 4:
+        return np.asarray(frame)
+    if channels == 3:
+        return cv2.cvtColor(np.asarray(frame), cv2.COLOR_BGR2BGRA)
+    raise CaptureError(f"Unsupported replay frame shape {frame.shape}")
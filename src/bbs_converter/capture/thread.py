@@ -3,12 +3,21 @@
 from __future__ import annotations
 
 import threading
+import time
+
+import numpy as np
 
 from bbs_converter.capture.fps_controller import FPSController
-from bbs_converter.capture.frame_buffer import FrameBuffer
+from bbs_converter.capture.frame_buffer import FrameBuffer, LatestFrameBuffer
+from bbs_converter.capture.frame_pool import FramePool, PooledFrame
 from bbs_converter.capture.grabber import FrameGrabber
-from bbs_converter.models import CaptureRegion
+from bbs_converter.capture.recorder import SessionRecorder
+from bbs_converter.capture.replay import ReplayGrabber
+from bbs_converter.capture.signature import FrameSignature
+from bbs_converter.models import CaptureRegion, FrameEnvelope
+from bbs_converter.utils.constants import DEFAULT_IDLE_FPS, OverrunPolicy
 from bbs_converter.utils.logger import get_logger
+from bbs_converter.utils.timer import TimingStats
 
 _log = get_logger("capture.thread")
 
@@ -16,6 +25,9 @@ _log = get_logger("capture.thread")
 class CaptureThread:
     """Manages a background thread that continuously captures frames.
 
+    Each frame is pushed as a :class:`FrameEnvelope` carrying a
+    monotonic sequence number and its ``perf_counter`` capture time.
+
     Parameters
     ----------
     region:
@@ -24,17 +36,71 @@ class CaptureThread:
         Thread-safe buffer to push frames into.
     fps:
         Target capture frame rate.
+    pool_size:
+        If positive, frames are captured into a :class:`FramePool` of
+        this many preallocated slots and pushed as
+        leases on the pushed :class:`FrameEnvelope` objects, which the
+        consumer must release.  Zero pushes a zero-copy view per frame,
+        which suits a :class:`LatestFrameBuffer` that copies into its
+        own slots.
+    dedupe:
+        If True, frames whose :class:`FrameSignature` matches the
+        previous frame are not pushed to the buffer.
+    adaptive:
+        If True, the capture rate decays toward *idle_fps* while frames
+        are unchanged and returns to *fps* as soon as one changes.
+    idle_fps:
+        Adaptive-mode floor.
+    spin:
+        Busy-wait the last millisecond before each capture deadline.
+    overrun_policy:
+        How capture pacing reschedules after a missed deadline.
+    grabber:
+        Frame source to use instead of live screen capture, e.g. a
+        :class:`ReplayGrabber`.  A self-paced grabber replaces the FPS
+        controller's pacing, and the thread stops once it is exhausted.
+    lossless:
+        If True, wait for the consumer to drain the buffer before each
+        push so no frame is overwritten.  Meant for as-fast-as-possible
+        replay, where the consumer sets the pace.
+    recorder:
+        Optional :class:`SessionRecorder` that every pushed frame is
+        teed to.  The caller starts and closes it.
     """
 
     def __init__(
         self,
         region: CaptureRegion,
-        buffer: FrameBuffer,
+        buffer: FrameBuffer | LatestFrameBuffer,
         fps: int = 30,
+        pool_size: int = 0,
+        dedupe: bool = False,
+        adaptive: bool = False,
+        idle_fps: float = DEFAULT_IDLE_FPS,
+        spin: bool = False,
+        overrun_policy: OverrunPolicy = OverrunPolicy.SKIP,
+        grabber: FrameGrabber | ReplayGrabber | None = None,
+        lossless: bool = False,
+        recorder: SessionRecorder | None = None,
     ) -> None:
         self._region = region
+        self._grabber = grabber
+        self._lossless = lossless
+        self._recorder = recorder
         self._buffer = buffer
-        self._fps_ctrl = FPSController(target_fps=fps)
+        self._fps_ctrl = FPSController(
+            target_fps=fps, adaptive=adaptive, idle_fps=idle_fps,
+            spin=spin, overrun_policy=overrun_policy,
+        )
+        self._dedupe = dedupe
+        self._pool_size = pool_size
+        self._pool: FramePool | None = None
+        self._pool_misses = 0
+        self._seq = 0
+        self._signature = FrameSignature() if dedupe or adaptive else None
+        self._last_signature: int | None = None
+        self._frames_captured = 0
+        self._duplicates = 0
         self._stop_event = threading.Event()
         self._thread: threading.Thread | None = None
 
@@ -55,6 +121,16 @@ class CaptureThread:
             self._thread = None
         _log.info("Capture thread stopped")
 
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until the capture thread exits on its own.
+
+        Returns True if it has finished, e.g. because a replay source
+        ran out, or False if it is still running after *timeout*.
+        """
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+        return not self.running
+
     @property
     def running(self) -> bool:
         return self._thread is not None and self._thread.is_alive()
@@ -63,10 +139,139 @@ class CaptureThread:
     def actual_fps(self) -> float:
         return self._fps_ctrl.actual_fps
 
+    @property
+    def pool_misses(self) -> int:
+        """Frames skipped because every pool slot was still held downstream."""
+        return self._pool_misses
+
+    @property
+    def timing_stats(self) -> TimingStats:
+        """Capture interval jitter, percentiles and overruns."""
+        return self._fps_ctrl.timing_stats
+
+    @property
+    def current_fps(self) -> float:
+        """Rate the capture loop is currently pacing to."""
+        return self._fps_ctrl.current_fps
+
+    def report_downstream_fps(self, fps: float) -> None:
+        """Feed back the consumer's throughput to cap the capture rate."""
+        self._fps_ctrl.report_downstream_fps(fps)
+
+    def readmit(self) -> None:
+        """Push the next frame even if it matches the previous one.
+
+        Called after a frame failed to read, so a static table is read
+        again rather than skipped as a duplicate for good.
+        """
+        self._last_signature = None
+
+    @property
+    def frames_captured(self) -> int:
+        return self._frames_captured
+
+    @property
+    def duplicates(self) -> int:
+        """Frames skipped because they matched the previous frame."""
+        return self._duplicates
+
+    @property
+    def duplicate_rate(self) -> float:
+        """Return the share of captured frames skipped as duplicates (%)."""
+        if self._frames_captured == 0:
+            return 0.0
+        return self._duplicates / self._frames_captured * 100
+
     def _run(self) -> None:
         """Main capture loop executed on the background thread."""
-        with FrameGrabber(self._region) as grabber:
+        if self._grabber is not None:
+            self._run_source(self._grabber)
+            return
+        with FrameGrabber(self._region, zero_copy=True) as grabber:
             while not self._stop_event.is_set():
-                frame = grabber.grab()
-                self._buffer.put(frame)
+                envelope = self._capture_one(grabber)
+                if envelope is not None:
+                    self._buffer.put(envelope)
                 self._fps_ctrl.tick()
+
+    def _run_source(self, grabber: FrameGrabber | ReplayGrabber) -> None:
+        """Capture loop for a supplied grabber that may pace itself or run dry."""
+        with grabber:
+            while not self._stop_event.is_set():
+                if grabber.exhausted:
+                    _log.info("Capture source exhausted")
+                    break
+                envelope = self._capture_one(grabber)
+                if envelope is not None:
+                    self._push(envelope)
+                if not grabber.self_paced:
+                    self._fps_ctrl.tick()
+
+    def _push(self, envelope: FrameEnvelope) -> None:
+        if self._lossless:
+            while not self._buffer.wait_drained(timeout=0.1):
+                if self._stop_event.is_set():
+                    envelope.release()
+                    return
+        self._buffer.put(envelope)
+
+    def _capture_one(
+        self, grabber: FrameGrabber | ReplayGrabber,
+    ) -> FrameEnvelope | None:
+        """Grab one frame and wrap it in a sequenced envelope."""
+        lease: PooledFrame | None = None
+        if self._pool_size > 0:
+            lease = self._grab_pooled(grabber)
+            if lease is None:
+                return None
+            frame = lease.array
+        else:
+            frame = grabber.grab()
+        self._frames_captured += 1
+
+        duplicate = self._is_duplicate(frame)
+        self._fps_ctrl.report_activity(not duplicate)
+        if duplicate and self._dedupe:
+            self._duplicates += 1
+            if lease is not None:
+                lease.release()
+            return None
+
+        self._seq += 1
+        envelope = FrameEnvelope(
+            self._seq, time.perf_counter(), self._region, frame, lease=lease,
+        )
+        if self._recorder is not None:
+            self._recorder.record(envelope)
+        return envelope
+
+    def _is_duplicate(self, frame: np.ndarray) -> bool:
+        if self._signature is None:
+            return False
+        signature = self._signature.compute(frame)
+        duplicate = signature == self._last_signature
+        self._last_signature = signature
+        return duplicate
+
+    def _grab_pooled(
+        self, grabber: FrameGrabber | ReplayGrabber,
+    ) -> PooledFrame | None:
+        """Capture into a pool slot, creating the pool on first use.
+
+        The pool is sized from the first frame rather than the region
+        because HiDPI displays return more pixels than logical points.
+        """
+        if self._pool is None:
+            frame = grabber.grab()
+            self._pool = FramePool(frame.shape, capacity=self._pool_size)
+            pooled = self._pool.acquire()
+            assert pooled is not None
+            pooled.array[...] = frame
+            return pooled
+
+        pooled = self._pool.acquire()
+        if pooled is None:
+            self._pool_misses += 1
+            return None
+        grabber.grab_into(pooled.array)
+        return pooled
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import sys
 import threading
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from bbs_converter.utils.logger import get_logger
 
@@ -16,11 +16,28 @@ class PipelineStats:
     """Mutable container for live pipeline statistics."""
 
     capture_fps: float = 0.0
+    capture_duplicate_rate: float = 0.0
+    capture_interval_p95_ms: float = 0.0
+    capture_overruns: int = 0
+    overlay_interval_p95_ms: float = 0.0
     ocr_confidence: float = 0.0
     cache_hit_rate: float = 0.0
+    result_cache_hit_rate: float = 0.0
+    parse_memo_hit_rate: float = 0.0
     frames_processed: int = 0
     parse_errors: int = 0
+    parse_failure_rate: float = 0.0
+    parse_repairs: int = 0
     ocr_errors: int = 0
+    ocr_restarts: int = 0
+    ocr_engine_healthy: bool = True
+    buffer_bytes: int = 0
+    buffer_high_water_bytes: int = 0
+    buffer_drops: int = 0
+    stale_frames: int = 0
+    unchanged_frames: int = 0
+    latency_ms: float = 0.0
+    preprocess_ms: dict[str, float] = field(default_factory=dict)
 
 
 class StatusDashboard:
@@ -74,12 +91,22 @@ class StatusDashboard:
     def _print_status(self) -> None:
         """Print a single status line."""
         s = self._stats
+        degraded = "" if s.ocr_engine_healthy else ", degraded"
         line = (
-            f"[BBS] FPS: {s.capture_fps:.0f} | "
+            f"[BBS] FPS: {s.capture_fps:.0f} "
+            f"(p95 {s.capture_interval_p95_ms:.0f}ms) | "
+            f"Dup: {s.capture_duplicate_rate:.0f}% | "
             f"OCR: {s.ocr_confidence:.0f}% | "
-            f"Cache: {s.cache_hit_rate:.0f}% | "
+            f"Cache: {s.cache_hit_rate:.0f}% "
+            f"(results {s.result_cache_hit_rate:.0f}%, "
+            f"parse {s.parse_memo_hit_rate:.0f}%) | "
             f"Frames: {s.frames_processed} | "
-            f"Errors: parse={s.parse_errors} ocr={s.ocr_errors}"
+            f"Latency: {s.latency_ms:.0f}ms | "
+            f"Buf: {s.buffer_bytes / 1e6:.1f}MB "
+            f"(peak {s.buffer_high_water_bytes / 1e6:.1f}MB, drops={s.buffer_drops}) | "
+            f"Errors: parse={s.parse_errors} ({s.parse_failure_rate:.0f}%, "
+            f"repaired {s.parse_repairs}) ocr={s.ocr_errors} "
+            f"(restarts {s.ocr_restarts}{degraded})"
         )
         sys.stderr.write(f"\r{line}")
         sys.stderr.flush()
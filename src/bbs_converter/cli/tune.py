@@ -0,0 +1,207 @@
+"""Tune OCR preprocessing and engine settings on a labelled frame corpus.
+
+Usage::
+
+    bbs-converter-tune --frames session/ --labels labels.json --site stars
+
+The labels file maps frame indices of the recording to the expected
+text, either the whole-frame string or, when the config has a
+``[layout]``, the expected text of each field::
+
+    {"0": "Blinds 50/100", "12": {"pot": "1,250", "seat1_stack": "980"}}
+
+The winning profile is written to the config file under
+``[ocr.profiles.<site>.<width>x<height>]``, the recorded frame size in
+pixels, which is also how the converter looks it up at start.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+
+from bbs_converter.capture.replay import load_replay_source
+from bbs_converter.ocr.layout import TableLayout
+from bbs_converter.ocr.tuning import (
+    LabelledFrame,
+    TrialResult,
+    candidate_profiles,
+    profile_key,
+    select_best,
+    tune,
+)
+from bbs_converter.utils.config import config_choice, load_config, save_table
+from bbs_converter.utils.constants import (
+    DEFAULT_CONFIG_FILENAME,
+    DEFAULT_PSM,
+    TUNE_ACCURACY_TOLERANCE,
+    TUNE_BLOCK_SIZES,
+    TUNE_CONSTANTS,
+    TUNE_KERNEL_SIZES,
+    TUNE_PSMS,
+    TUNE_STEP_SETS,
+    OCREngine,
+)
+from bbs_converter.utils.exceptions import BBSConverterError, ConfigError
+from bbs_converter.utils.logger import get_logger
+
+_log = get_logger("cli.tune")
+
+
+def _int_list(value: str) -> tuple[int, ...]:
+    try:
+        return tuple(int(part) for part in value.split(",") if part.strip())
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(
+            f"expected comma-separated integers: {exc}",
+        ) from exc
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command-line arguments of the tuning command."""
+    parser = argparse.ArgumentParser(
+        prog="bbs-converter-tune",
+        description="Find the fastest accurate OCR settings for a site",
+    )
+    parser.add_argument(
+        "--frames", required=True, metavar="PATH",
+        help="Recorded frames (session directory, PNG directory or .npy stack)",
+    )
+    parser.add_argument(
+        "--labels", required=True, metavar="PATH",
+        help="JSON file mapping frame indices to their expected text",
+    )
+    parser.add_argument(
+        "--site", default=None,
+        help="Site the profile is stored under (default: ocr.site from config)",
+    )
+    parser.add_argument(
+        "--config", default=None, metavar="PATH",
+        help=f"TOML config to read and update (default: ./{DEFAULT_CONFIG_FILENAME})",
+    )
+    parser.add_argument("--block-sizes", type=_int_list, default=TUNE_BLOCK_SIZES)
+    parser.add_argument("--constants", type=_int_list, default=TUNE_CONSTANTS)
+    parser.add_argument("--kernel-sizes", type=_int_list, default=TUNE_KERNEL_SIZES)
+    parser.add_argument("--psms", type=_int_list, default=TUNE_PSMS)
+    parser.add_argument(
+        "--tolerance", type=float, default=TUNE_ACCURACY_TOLERANCE,
+        help="Accuracy a faster profile may give up (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--top", type=int, default=5, help="Results to print (default: 5)",
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true",
+        help="Report the winner without writing it to the config",
+    )
+    return parser.parse_args(argv)
+
+
+def load_corpus(frames: str | Path, labels: str | Path) -> list[LabelledFrame]:
+    """Pair recorded frames with their labels.
+
+    Raises
+    ------
+    ConfigError
+        If the labels file is unreadable, refers to missing frames, or
+        labels frames of different sizes.  A profile is stored per frame
+        size, so each size needs its own corpus.
+    CaptureError
+        If the frames cannot be loaded.
+    """
+    source = load_replay_source(frames)
+    try:
+        mapping = json.loads(Path(labels).read_text())
+    except (OSError, ValueError) as exc:
+        raise ConfigError(f"Cannot read labels file {labels}: {exc}") from exc
+    if not isinstance(mapping, dict):
+        raise ConfigError("Labels file must map frame indices to expected text")
+
+    corpus: list[LabelledFrame] = []
+    for key, expected in mapping.items():
+        try:
+            index = int(key)
+        except ValueError as exc:
+            raise ConfigError(f"Label key {key!r} is not a frame index") from exc
+        if not 0 <= index < len(source):
+            raise ConfigError(f"Label for frame {index}, but only {len(source)} frames")
+        valid_fields = isinstance(expected, dict) and all(
+            isinstance(text, str) for text in expected.values()
+        )
+        if not (isinstance(expected, str) or valid_fields):
+            raise ConfigError(f"Label for frame {index} must be text or field texts")
+        frame = source.frame(index)
+        if corpus and frame.shape[:2] != corpus[0].frame.shape[:2]:
+            first, this = corpus[0].frame.shape, frame.shape
+            raise ConfigError(
+                f"Frame {index} is {this[1]}x{this[0]}, other labelled frames are "
+                f"{first[1]}x{first[0]}; tune each frame size separately",
+            )
+        corpus.append(LabelledFrame(frame, expected))
+    return corpus
+
+
+def _report(results: Sequence[TrialResult], best: TrialResult, top: int) -> None:
+    print(f"{'accuracy':>9} {'ms/frame':>9}  profile")
+    for result in results[:top]:
+        marker = "*" if result is best else " "
+        print(
+            f"{result.accuracy * 100:8.1f}% {result.ms_per_frame:9.2f} "
+            f"{marker}{result.profile.describe()}"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the tuner; returns the process exit code."""
+    args = parse_args(argv)
+    config_path = Path(args.config or DEFAULT_CONFIG_FILENAME)
+    try:
+        config = load_config(config_path)
+        ocr = config["ocr"]
+        site = args.site or ocr["site"]
+        configured = TableLayout.from_config(config.get("layout", {}))
+        layout = configured if len(configured) else None
+        corpus = load_corpus(args.frames, args.labels)
+
+        # Layout fields bring their own page segmentation mode.
+        psms = args.psms if layout is None else (DEFAULT_PSM,)
+        profiles = candidate_profiles(
+            TUNE_STEP_SETS, args.block_sizes, args.constants,
+            args.kernel_sizes, psms,
+        )
+        print(
+            f"Tuning {len(profiles)} profiles on {len(corpus)} labelled frames...",
+        )
+        results = tune(
+            corpus, profiles, layout=layout,
+            engine=config_choice(OCREngine, ocr["engine"], "ocr.engine"),
+            confidence_threshold=ocr["confidence_threshold"],
+        )
+        best = select_best(results, args.tolerance)
+    except BBSConverterError as exc:
+        print(f"Tuning failed: {exc}", file=sys.stderr)
+        return 1
+
+    _report(results, best, args.top)
+    height, width = corpus[0].frame.shape[:2]
+    key = profile_key(width, height)
+    if args.dry_run:
+        print(f"Best profile for {site} at {key}: {best.profile.describe()}")
+        return 0
+
+    try:
+        table = ["ocr", "profiles", site, key]
+        save_table(config_path, table, best.profile.to_config())
+    except ConfigError as exc:
+        print(f"Tuning failed: {exc}", file=sys.stderr)
+        return 1
+    _log.info("Saved tuned profile for %s at %s to %s", site, key, config_path)
+    print(f"Wrote [ocr.profiles.{site}.{key}] to {config_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
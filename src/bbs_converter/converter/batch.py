@@ -17,13 +17,19 @@ def convert_table(state: TableState) -> BBState:
     Returns
     -------
     BBState
-        All values expressed in big blinds.  Returns zeroed-out
+        All values expressed in big blinds, with the on-screen position
+        of every player whose seat was located.  Returns zeroed-out
         BBState when big_blind is zero (e.g. between hands).
     """
+    positions = {
+        player.name: player.position
+        for player in state.players if player.position is not None
+    }
     if state.big_blind <= 0:
         return BBState(
             pot_bb=0.0,
             stacks_bb={name: 0.0 for name in state.stacks},
+            positions=positions,
         )
 
     pot_bb = chips_to_bb(state.pot, state.big_blind)
@@ -31,4 +37,4 @@ def convert_table(state: TableState) -> BBState:
         name: chips_to_bb(stack, state.big_blind)
         for name, stack in state.stacks.items()
     }
-    return BBState(pot_bb=pot_bb, stacks_bb=stacks_bb)
+    return BBState(pot_bb=pot_bb, stacks_bb=stacks_bb, positions=positions)
@@ -5,11 +5,33 @@ from __future__ import annotations
 import argparse
 import signal
 import sys
+import time
+from typing import Any
 
+from bbs_converter.capture.grabber import capture_size
+from bbs_converter.capture.monitor import list_monitors
+from bbs_converter.capture.recorder import SessionRecorder
 from bbs_converter.capture.region_selector import select_region
+from bbs_converter.capture.replay import ReplayGrabber, load_replay_source
 from bbs_converter.models import CaptureRegion
+from bbs_converter.ocr.glyph import GlyphBank
+from bbs_converter.ocr.layout import TableLayout
+from bbs_converter.ocr.preprocess_chain import PreprocessConfig
+from bbs_converter.ocr.result_cache import OCRResultCache
+from bbs_converter.ocr.tuning import TunedProfile, find_profile
+from bbs_converter.parser.profiles import SiteProfile, load_profiles
+from bbs_converter.parser.spatial import SeatTemplate
+from bbs_converter.pipeline.multi_table import MultiTableOrchestrator
+from bbs_converter.pipeline.ocr_pool import ocr_worker_count
 from bbs_converter.pipeline.orchestrator import PipelineOrchestrator
-from bbs_converter.utils.config import load_config
+from bbs_converter.utils.config import config_choice, load_config
+from bbs_converter.utils.constants import (
+    DEFAULT_PARSER_SITE,
+    CaptureBackend,
+    OCREngine,
+    OverrunPolicy,
+)
+from bbs_converter.utils.exceptions import CaptureError, ConfigError
 from bbs_converter.utils.logger import get_logger
 
 _log = get_logger("main")
@@ -46,6 +68,14 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         metavar="X,Y,W,H",
         help="Capture region as 'x,y,width,height' (skips interactive selector)",
     )
+    parser.add_argument(
+        "--table",
+        type=str,
+        action="append",
+        default=None,
+        metavar="X,Y,W,H",
+        help="Region of one of several tables to capture together (repeatable)",
+    )
     parser.add_argument(
         "--delay",
         type=int,
@@ -59,6 +89,28 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         default=None,
         help="Path to TOML config file",
     )
+    parser.add_argument(
+        "--replay",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help=(
+            "Run headless on recorded frames (recorded session directory, "
+            "PNG directory or .npy stack)"
+        ),
+    )
+    parser.add_argument(
+        "--replay-fast",
+        action="store_true",
+        help="Replay as fast as the pipeline can process, ignoring timestamps",
+    )
+    parser.add_argument(
+        "--record",
+        type=str,
+        default=None,
+        metavar="DIR",
+        help="Record captured frames to a session directory for later --replay",
+    )
     return parser.parse_args(argv)
 
 
@@ -70,10 +122,225 @@ def _parse_region(region_str: str) -> CaptureRegion:
     return CaptureRegion(x=parts[0], y=parts[1], width=parts[2], height=parts[3])
 
 
-def main(argv: list[str] | None = None) -> None:
-    """Run the BBS Converter pipeline."""
-    args = parse_args(argv)
+def _build_tables(
+    args: argparse.Namespace, config: dict[str, Any],
+) -> list[CaptureRegion]:
+    """Return the table regions of multi-table mode, from the CLI or config.
+
+    Raises
+    ------
+    ConfigError
+        If several tables are combined with options that support one.
+    """
+    specs = args.table or config["capture"]["tables"]
+    tables = [_parse_region(spec) for spec in specs]
+    if len(tables) > 1:
+        if args.region or args.replay or args.record:
+            raise ConfigError("--region, --replay and --record support a single table")
+        if config["capture"]["replay_source"] or config["capture"]["record_dir"]:
+            raise ConfigError("Replay and recording support a single table")
+        if config["pipeline"]["ocr_workers"]:
+            raise ConfigError("pipeline.ocr_workers supports a single table")
+    return tables
 
+
+def _overrun_policy(config: dict[str, Any]) -> OverrunPolicy:
+    return config_choice(
+        OverrunPolicy, config["capture"]["overrun_policy"], "capture.overrun_policy",
+    )
+
+
+def _build_replay(
+    args: argparse.Namespace, config: dict[str, Any],
+) -> ReplayGrabber | None:
+    """Return a replay grabber if the CLI or config selects the replay backend.
+
+    Raises
+    ------
+    ConfigError
+        If the replay backend is selected without a replay source.
+    """
+    capture = config["capture"]
+    source = args.replay or capture["replay_source"]
+    backend = config_choice(CaptureBackend, capture["backend"], "capture.backend")
+    if args.replay is None and backend is not CaptureBackend.REPLAY:
+        return None
+    if not source:
+        raise ConfigError(
+            "capture.backend is 'replay' but no capture.replay_source or "
+            "--replay is given"
+        )
+    realtime = capture["replay_realtime"] and not args.replay_fast
+    return ReplayGrabber(load_replay_source(source, fps=capture["fps"]), realtime)
+
+
+def _build_recorder(
+    args: argparse.Namespace, config: dict[str, Any],
+) -> SessionRecorder | None:
+    """Return a session recorder if the CLI or config asks for one."""
+    capture = config["capture"]
+    directory = args.record or capture["record_dir"]
+    if not directory:
+        return None
+    return SessionRecorder(
+        directory,
+        max_total_bytes=capture["record_max_bytes"] or None,
+        dedupe=capture["record_dedupe"],
+    )
+
+
+def _build_layout(config: dict[str, Any]) -> TableLayout | None:
+    """Return the configured field layout, or None to OCR the whole region."""
+    layout = TableLayout.from_config(config.get("layout", {}))
+    return layout if len(layout) else None
+
+
+def _build_result_cache(config: dict[str, Any]) -> OCRResultCache | None:
+    """Return the OCR result cache, or None if its size is set to 0."""
+    ocr = config["ocr"]
+    if ocr["result_cache_size"] <= 0:
+        return None
+    return OCRResultCache(
+        max_entries=ocr["result_cache_size"],
+        path=ocr["result_cache_path"] or None,
+    )
+
+
+def _build_glyph_bank(
+    config: dict[str, Any], engine: OCREngine,
+) -> GlyphBank | None:
+    """Return the glyph template bank when the glyph engine is selected."""
+    if engine is not OCREngine.GLYPH:
+        return None
+    return GlyphBank(config["ocr"]["glyph_bank"] or None)
+
+
+def _frame_size(
+    region: CaptureRegion, replay: ReplayGrabber | None = None,
+) -> tuple[int, int]:
+    """Return the pixel size of the frames the pipeline will read.
+
+    Tuned profiles are keyed by frame pixels, which is what the tuner
+    sees in a recording; live regions are in logical points, so one
+    frame is grabbed to measure them.
+    """
+    if replay is not None:
+        return replay.region.width, replay.region.height
+    try:
+        return capture_size(region)
+    except CaptureError as exc:
+        _log.warning("Cannot measure capture size, using region size: %s", exc)
+        return region.width, region.height
+
+
+def _build_profile(config: dict[str, Any], width: int, height: int) -> TunedProfile:
+    """Return the tuned profile for the site and frame size, else the config's."""
+    ocr = config["ocr"]
+    profile = find_profile(ocr, ocr["site"], width, height)
+    if profile is not None:
+        _log.info("Using tuned OCR profile: %s", profile.describe())
+        return profile
+    return TunedProfile(PreprocessConfig.from_config(ocr.get("preprocess", {})))
+
+
+def _build_parser_profiles(
+    config: dict[str, Any],
+) -> tuple[dict[str, SiteProfile], str]:
+    """Return the configured parsing profiles and the site to start with.
+
+    The site is ``ocr.site``, falling back to the default profile when
+    that site has no parsing profile of its own.
+    """
+    profiles = load_profiles(config["parser"]["profiles"])
+    site = config["ocr"]["site"]
+    if site not in profiles:
+        _log.info("No parser profile for site %r, using the default", site)
+        site = DEFAULT_PARSER_SITE
+    return profiles, site
+
+
+def _build_seat_template(config: dict[str, Any]) -> SeatTemplate | None:
+    """Return the seat template of ``parser.table_size``, or None if it is 0."""
+    seats = config["parser"]["table_size"]
+    return SeatTemplate.for_table_size(seats) if seats else None
+
+
+def _build_multi_table(
+    config: dict[str, Any],
+    tables: list[CaptureRegion],
+    fps: int,
+    confidence: float,
+) -> MultiTableOrchestrator:
+    """Return an orchestrator capturing every table in *tables* together.
+
+    The tuned profile and the parser profile are those of the first
+    table's frame size and of ``ocr.site``.
+    """
+    ocr_engine = config_choice(OCREngine, config["ocr"]["engine"], "ocr.engine")
+    profile = _build_profile(config, *_frame_size(tables[0]))
+    parser_profiles, parser_site = _build_parser_profiles(config)
+    return MultiTableOrchestrator(
+        tables,
+        fps=fps,
+        confidence_threshold=confidence,
+        buffer_max_bytes=config["pipeline"]["buffer_max_bytes"],
+        frame_deadline=config["pipeline"]["frame_deadline"] or None,
+        monitors=list_monitors(),
+        dedupe=config["capture"]["dedupe"],
+        adaptive_fps=config["capture"]["adaptive"],
+        idle_fps=config["capture"]["idle_fps"],
+        capture_spin=config["capture"]["spin"],
+        overrun_policy=_overrun_policy(config),
+        ocr_engine=ocr_engine,
+        ocr_pool_size=config["ocr"]["pool_size"],
+        layout=_build_layout(config),
+        result_cache=_build_result_cache(config),
+        glyph_bank=_build_glyph_bank(config, ocr_engine),
+        ocr_batch_fields=config["ocr"]["batch_fields"],
+        preprocess=profile.preprocess,
+        ocr_psm=profile.psm,
+        parser_profile=parser_profiles[parser_site],
+        seat_template=_build_seat_template(config),
+    )
+
+
+def _run_headless(orchestrator: PipelineOrchestrator) -> None:
+    """Process a replay to the end without an overlay and print a summary."""
+    start = time.perf_counter()
+    orchestrator.start()
+    orchestrator.wait_until_exhausted()
+    orchestrator.stop()
+    elapsed = time.perf_counter() - start
+
+    stats = orchestrator.stats
+    throughput = stats.frames_processed / elapsed if elapsed > 0 else 0.0
+    print(
+        f"Replay finished: {stats.frames_processed} frames in {elapsed:.2f}s "
+        f"({throughput:.1f} frames/s), latency {stats.latency_ms:.0f}ms, "
+        f"errors parse={stats.parse_errors} ({stats.parse_failure_rate:.1f}%, "
+        f"{stats.parse_repairs} repaired) ocr={stats.ocr_errors}"
+    )
+    if stats.preprocess_ms:
+        steps = ", ".join(
+            f"{name} {ms:.2f}ms" for name, ms in stats.preprocess_ms.items()
+        )
+        print(f"Preprocessing per call: {steps}")
+
+
+def _build_orchestrator(
+    args: argparse.Namespace,
+) -> tuple[PipelineOrchestrator | MultiTableOrchestrator, ReplayGrabber | None]:
+    """Load the config and build the orchestrator the CLI asks for.
+
+    Returns the orchestrator and, for a headless replay, its grabber.
+
+    Raises
+    ------
+    ConfigError
+        If the configuration is invalid.
+    CaptureError
+        If the replay source cannot be loaded.
+    """
     # Load config
     config_path = None
     if args.config:
@@ -85,23 +352,76 @@ def main(argv: list[str] | None = None) -> None:
     fps = args.fps or config["capture"]["fps"]
     confidence = args.confidence or config["ocr"]["confidence_threshold"]
 
-    # Get capture region
-    if args.region:
-        region = _parse_region(args.region)
+    tables = _build_tables(args, config)
+    replay = _build_replay(args, config)
+    orchestrator: PipelineOrchestrator | MultiTableOrchestrator
+    if len(tables) > 1:
+        _log.info(
+            "Starting BBS Converter: %d tables fps=%d confidence=%.0f",
+            len(tables), fps, confidence,
+        )
+        orchestrator = _build_multi_table(config, tables, fps, confidence)
     else:
-        region = select_region(delay=args.delay)
+        # Get capture region
+        if args.region:
+            region = _parse_region(args.region)
+        elif tables:
+            region = tables[0]
+        elif replay is not None:
+            region = replay.region
+        else:
+            region = select_region(delay=args.delay)
 
-    _log.info(
-        "Starting BBS Converter: region=%s fps=%d confidence=%.0f",
-        region, fps, confidence,
-    )
+        _log.info(
+            "Starting BBS Converter: region=%s fps=%d confidence=%.0f",
+            region, fps, confidence,
+        )
 
-    # Run pipeline
-    orchestrator = PipelineOrchestrator(
-        region=region,
-        fps=fps,
-        confidence_threshold=confidence,
-    )
+        # Run pipeline
+        ocr_engine = config_choice(OCREngine, config["ocr"]["engine"], "ocr.engine")
+        profile = _build_profile(config, *_frame_size(region, replay))
+        parser_profiles, parser_site = _build_parser_profiles(config)
+        orchestrator = PipelineOrchestrator(
+            region=region,
+            fps=fps,
+            confidence_threshold=confidence,
+            buffer_max_bytes=config["pipeline"]["buffer_max_bytes"],
+            frame_deadline=config["pipeline"]["frame_deadline"] or None,
+            dedupe=config["capture"]["dedupe"],
+            adaptive_fps=config["capture"]["adaptive"],
+            idle_fps=config["capture"]["idle_fps"],
+            capture_spin=config["capture"]["spin"],
+            overrun_policy=_overrun_policy(config),
+            capture_pool_size=config["capture"]["pool_size"],
+            replay=replay,
+            recorder=_build_recorder(args, config),
+            ocr_engine=ocr_engine,
+            ocr_pool_size=config["ocr"]["pool_size"],
+            layout=_build_layout(config),
+            result_cache=_build_result_cache(config),
+            glyph_bank=_build_glyph_bank(config, ocr_engine),
+            ocr_batch_fields=config["ocr"]["batch_fields"],
+            preprocess=profile.preprocess,
+            ocr_psm=profile.psm,
+            ocr_workers=ocr_worker_count(
+                config["pipeline"]["ocr_workers"], config["pipeline"]["cpu_budget"],
+            ),
+            parser_profiles=parser_profiles,
+            parser_site=parser_site,
+            seat_template=_build_seat_template(config),
+        )
+
+    return orchestrator, replay
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the BBS Converter pipeline."""
+    args = parse_args(argv)
+    try:
+        orchestrator, replay = _build_orchestrator(args)
+    except (ConfigError, CaptureError) as exc:
+        print(f"Cannot start: {exc}", file=sys.stderr)
+        sys.exit(2)
 
     def shutdown(signum: int, frame: object) -> None:
         _log.info("Received signal %d, shutting down...", signum)
@@ -111,6 +431,10 @@ def main(argv: list[str] | None = None) -> None:
     signal.signal(signal.SIGINT, shutdown)
     signal.signal(signal.SIGTERM, shutdown)
 
+    if replay is not None and isinstance(orchestrator, PipelineOrchestrator):
+        _run_headless(orchestrator)
+        return
+
     orchestrator.start()
 
     # Wait for user to be ready before starting the overlay.
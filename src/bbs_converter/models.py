@@ -2,25 +2,43 @@
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from bbs_converter.capture.frame_pool import PooledFrame
 
 
 @dataclass(frozen=True)
 class TableState:
-    """Parsed state of the poker table from OCR output."""
+    """Parsed state of the poker table from OCR output.
+
+    *players* is filled when seats were assigned from word boxes.
+    """
 
     big_blind: float
     small_blind: float
     pot: float
     stacks: dict[str, float] = field(default_factory=dict)
+    players: tuple[PlayerInfo, ...] = ()
 
 
 @dataclass(frozen=True)
 class BBState:
-    """Table state converted to big blind units."""
+    """Table state converted to big blind units.
+
+    *positions* maps a player to where their name was read on screen,
+    in capture-region points, when known.
+    """
 
     pot_bb: float
     stacks_bb: dict[str, float] = field(default_factory=dict)
+    frame_seq: int | None = None
+    captured_at: float | None = None
+    positions: dict[str, tuple[int, int]] = field(default_factory=dict)
 
 
 @dataclass(frozen=True)
@@ -44,11 +62,16 @@ class CaptureRegion:
 
 @dataclass(frozen=True)
 class PlayerInfo:
-    """Information about a single player at the table."""
+    """Information about a single player at the table.
+
+    *position* is the centre of the player's name in captured frame
+    pixels, when it was read from word boxes.
+    """
 
     name: str
     seat: int
     stack: float
+    position: tuple[int, int] | None = None
 
 
 @dataclass(frozen=True)
@@ -58,3 +81,76 @@ class GameConfig:
     big_blind: float
     small_blind: float
     ante: float = 0.0
+
+
+class FrameEnvelope:
+    """A captured frame plus the metadata needed to track its age.
+
+    Parameters
+    ----------
+    seq:
+        Monotonic capture sequence number.
+    captured_at:
+        ``time.perf_counter()`` timestamp taken when the frame was grabbed.
+    region:
+        Screen region the frame was captured from.
+    frame:
+        Frame pixels (BGRA), usually a view into capture-owned storage.
+    lease:
+        Pooled slot backing *frame*, released together with the envelope.
+        Capture then reuses the slot, so *frame* is swapped for a
+        read-only blank of the same shape and :attr:`released` is set.
+    """
+
+    __slots__ = ("seq", "captured_at", "region", "frame", "lease", "_released")
+
+    def __init__(
+        self,
+        seq: int,
+        captured_at: float,
+        region: CaptureRegion,
+        frame: np.ndarray,
+        lease: PooledFrame | None = None,
+    ) -> None:
+        self.seq = seq
+        self.captured_at = captured_at
+        self.region = region
+        self.frame = frame
+        self.lease = lease
+        self._released = False
+
+    @property
+    def released(self) -> bool:
+        """True once a pooled frame was released; its pixels are gone."""
+        return self._released
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.frame.nbytes)
+
+    def age(self, now: float | None = None) -> float:
+        """Seconds elapsed since capture."""
+        if now is None:
+            now = time.perf_counter()
+        return now - self.captured_at
+
+    def with_frame(self, frame: np.ndarray) -> FrameEnvelope:
+        """Return a copy of this envelope wrapping a different frame view."""
+        return FrameEnvelope(self.seq, self.captured_at, self.region, frame)
+
+    def release(self) -> None:
+        """Release the pooled slot backing the frame, if any."""
+        if self.lease is not None:
+            self.lease.release()
+            self.lease = None
+            # A late reader sees blank pixels, not those of a later frame.
+            self.frame = np.broadcast_to(
+                np.zeros((), dtype=self.frame.dtype), self.frame.shape,
+            )
+            self._released = True
+
+    def __repr__(self) -> str:
+        return (
+            f"FrameEnvelope(seq={self.seq}, captured_at={self.captured_at:.6f}, "
+            f"region={self.region!r}, shape={self.frame.shape})"
+        )
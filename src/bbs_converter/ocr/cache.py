@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import cv2
 import numpy as np
 
 from bbs_converter.ocr.engine import OCRResult
@@ -50,7 +51,7 @@ class FrameDiffCache:
             self._misses += 1
             return None
 
-        diff = np.mean(np.abs(frame.astype(float) - self._last_frame.astype(float)))
+        diff = float(np.mean(cv2.absdiff(frame, self._last_frame)))
         if diff < self._threshold:
             self._hits += 1
             _log.debug("Cache hit (diff=%.2f)", diff)
@@ -0,0 +1,102 @@
+"""Per-field change detection on a downsampled frame."""
+
+from __future__ import annotations
+
+import cv2
+import numpy as np
+
+from bbs_converter.ocr.layout import TableLayout
+from bbs_converter.utils.constants import DIRTY_DOWNSCALE, DIRTY_PIXEL_THRESHOLD
+from bbs_converter.utils.logger import get_logger
+
+_log = get_logger("ocr.dirty")
+
+
+class DirtyRegionDetector:
+    """Report which layout fields changed since they were last read.
+
+    Frames are shrunk by *downscale* with area averaging.  Each field
+    keeps its own reference cell, taken when its result was last stored
+    (see :meth:`commit`); a field is dirty if any pixel of its cell
+    differs from that reference by more than *pixel_threshold*.  A
+    ticking timer or chat line elsewhere on the table therefore does not
+    force a re-read, a field whose read failed stays dirty until it is
+    read, and a slow fade is caught once it drifts far enough from the
+    reference.
+
+    Parameters
+    ----------
+    downscale:
+        Integer shrink factor applied before diffing.
+    pixel_threshold:
+        Minimum per-pixel intensity change (0-255) that counts as a
+        change; filters out compression and anti-aliasing noise.
+    """
+
+    def __init__(
+        self,
+        downscale: int = DIRTY_DOWNSCALE,
+        pixel_threshold: int = DIRTY_PIXEL_THRESHOLD,
+    ) -> None:
+        self._downscale = max(1, downscale)
+        self._threshold = pixel_threshold
+        self._shape: tuple[int, ...] | None = None
+        self._cells: dict[str, np.ndarray] = {}
+        self._references: dict[str, np.ndarray] = {}
+        self._checked = 0
+        self._dirty = 0
+
+    def update(self, gray: np.ndarray, layout: TableLayout) -> set[str]:
+        """Diff each field of *gray* against its reference; return dirty names.
+
+        A field without a reference is dirty, as is every field whenever
+        the frame size changes.  References are not touched here; call
+        :meth:`commit` once a field's new result is stored.
+        """
+        small = self._shrink(gray)
+        if small.shape != self._shape:
+            self._references.clear()
+            self._shape = small.shape
+        self._cells = {roi.name: roi.crop(small, copy=False) for roi in layout}
+        self._checked += len(layout)
+        dirty = set()
+        for name, cell in self._cells.items():
+            reference = self._references.get(name)
+            if reference is None or self._changed(cell, reference):
+                dirty.add(name)
+        self._dirty += len(dirty)
+        return dirty
+
+    def commit(self, name: str) -> None:
+        """Make field *name* of the last updated frame its new reference."""
+        cell = self._cells.get(name)
+        if cell is not None:
+            self._references[name] = cell.copy()
+
+    def reset(self) -> None:
+        """Forget every reference so every field is dirty next time."""
+        self._references.clear()
+
+    @property
+    def clean_rate(self) -> float:
+        """Share of field checks that found no change (%)."""
+        if self._checked == 0:
+            return 0.0
+        return (self._checked - self._dirty) / self._checked * 100
+
+    def _changed(self, cell: np.ndarray, reference: np.ndarray) -> bool:
+        if cell.shape != reference.shape:
+            return True
+        if cell.size == 0:
+            return False
+        diff = cv2.absdiff(cell, reference)
+        _, mask = cv2.threshold(diff, self._threshold, 255, cv2.THRESH_BINARY)
+        return bool(cv2.countNonZero(mask))
+
+    def _shrink(self, gray: np.ndarray) -> np.ndarray:
+        if self._downscale == 1:
+            return gray
+        height, width = gray.shape[:2]
+        size = (max(1, width // self._downscale), max(1, height // self._downscale))
+        small: np.ndarray = cv2.resize(gray, size, interpolation=cv2.INTER_AREA)
+        return small
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Protocol, cast, runtime_checkable
 
 import numpy as np
 
@@ -12,12 +14,170 @@ from bbs_converter.utils.logger import get_logger
 _log = get_logger("ocr.engine")
 
 
+@dataclass(frozen=True)
+class OCRWord:
+    """One recognised word and its bounding box in image pixels.
+
+    *block* and *line* number the Tesseract layout block and the text
+    line within it that the word belongs to.
+    """
+
+    text: str
+    confidence: float
+    left: int
+    top: int
+    width: int
+    height: int
+    block: int = 0
+    line: int = 0
+
+
+TOKEN_DTYPE = np.dtype([
+    ("left", np.int32),
+    ("top", np.int32),
+    ("width", np.int32),
+    ("height", np.int32),
+    ("confidence", np.float32),
+    ("block", np.int16),
+    ("line", np.int16),
+])
+
+
+@dataclass(frozen=True, eq=False)
+class OCRTokens:
+    """Per-word text, confidence, box and line numbers of one OCR call.
+
+    Stored column-wise: the word strings plus one :data:`TOKEN_DTYPE`
+    record per word, so a result costs a few dozen bytes per word
+    rather than a Python object per attribute.  Boxes are in pixels of
+    the image that was read unless :meth:`offset` moved them.
+    """
+
+    texts: tuple[str, ...] = ()
+    records: np.ndarray = field(default_factory=lambda: np.zeros(0, TOKEN_DTYPE))
+
+    def __post_init__(self) -> None:
+        if len(self.texts) != len(self.records):
+            raise OCRError(
+                f"{len(self.texts)} token texts for {len(self.records)} records"
+            )
+
+    @classmethod
+    def from_words(cls, words: Sequence[OCRWord]) -> OCRTokens:
+        """Pack *words* into arrays."""
+        records = np.array(
+            [
+                (w.left, w.top, w.width, w.height, w.confidence, w.block, w.line)
+                for w in words
+            ],
+            dtype=TOKEN_DTYPE,
+        )
+        return cls(tuple(w.text for w in words), records)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def __getitem__(self, index: int) -> OCRWord:
+        r = self.records[index]
+        return OCRWord(
+            self.texts[index], float(r["confidence"]),
+            int(r["left"]), int(r["top"]), int(r["width"]), int(r["height"]),
+            int(r["block"]), int(r["line"]),
+        )
+
+    def __iter__(self) -> Iterator[OCRWord]:
+        return (self[i] for i in range(len(self)))
+
+    @property
+    def boxes(self) -> np.ndarray:
+        """``(n, 4)`` array of ``left, top, width, height`` per word."""
+        r = self.records
+        return np.stack([r["left"], r["top"], r["width"], r["height"]], axis=1)
+
+    @property
+    def centres(self) -> np.ndarray:
+        """``(n, 2)`` float array of each box's ``x, y`` centre."""
+        r = self.records
+        return np.stack(
+            [r["left"] + r["width"] / 2, r["top"] + r["height"] / 2], axis=1,
+        )
+
+    @property
+    def confidences(self) -> np.ndarray:
+        return self.records["confidence"]
+
+    def offset(self, dx: int, dy: int) -> OCRTokens:
+        """Return the tokens with every box moved by ``(dx, dy)``."""
+        if not (dx or dy) or not len(self):
+            return self
+        records = self.records.copy()
+        records["left"] += dx
+        records["top"] += dy
+        return OCRTokens(self.texts, records)
+
+    def to_payload(self) -> list[list[Any]]:
+        """Return the tokens as JSON-serialisable rows."""
+        return [
+            [text, *record.tolist()] for text, record in zip(self.texts, self.records)
+        ]
+
+    @classmethod
+    def from_payload(cls, rows: Sequence[Sequence[Any]]) -> OCRTokens:
+        """Rebuild tokens from :meth:`to_payload` rows."""
+        records = np.array([tuple(row[1:]) for row in rows], dtype=TOKEN_DTYPE)
+        return cls(tuple(str(row[0]) for row in rows), records)
+
+
+NO_TOKENS = OCRTokens()
+
+
 @dataclass(frozen=True)
 class OCRResult:
-    """Result of an OCR extraction."""
+    """Result of an OCR extraction.
+
+    *tokens* holds the words behind *text* when the engine reports
+    them; it takes no part in equality.
+    """
 
     text: str
     confidence: float
+    tokens: OCRTokens = field(default=NO_TOKENS, compare=False, repr=False)
+
+    @classmethod
+    def from_words(cls, words: Sequence[OCRWord]) -> OCRResult:
+        """Join *words* into a result with their mean confidence."""
+        confidences = [w.confidence for w in words]
+        avg_conf = sum(confidences) / len(confidences) if confidences else 0.0
+        return cls(
+            text=" ".join(w.text for w in words),
+            confidence=avg_conf,
+            tokens=OCRTokens.from_words(words),
+        )
+
+
+class TextEngine(Protocol):
+    """Anything that turns a preprocessed image into an :class:`OCRResult`."""
+
+    def extract(
+        self,
+        image: np.ndarray,
+        psm: int | None = None,
+        whitelist: str | None = None,
+    ) -> OCRResult: ...
+
+    def close(self) -> None: ...
+
+
+@runtime_checkable
+class WordEngine(Protocol):
+    """An engine that can also report where each word was found."""
+
+    def extract_words(
+        self,
+        image: np.ndarray,
+        psm: int | None = None,
+        whitelist: str | None = None,
+    ) -> list[OCRWord]: ...
 
 
 class TesseractEngine:
@@ -33,26 +193,73 @@ class TesseractEngine:
 
     def __init__(self, lang: str = "eng", psm: int = 7) -> None:
         self._lang = lang
-        self._config = f"--psm {psm}"
+        self._psm = psm
 
-    def extract(self, image: np.ndarray) -> OCRResult:
+    def extract(
+        self,
+        image: np.ndarray,
+        psm: int | None = None,
+        whitelist: str | None = None,
+    ) -> OCRResult:
         """Run OCR on a preprocessed image.
 
         Parameters
         ----------
         image:
             Grayscale or binary preprocessed image.
+        psm:
+            Page segmentation mode for this call; defaults to the
+            engine's.
+        whitelist:
+            Restrict recognition to these characters.
 
         Returns
         -------
         OCRResult
-            Extracted text and average confidence score.
+            Extracted text, average confidence score and the words with
+            their boxes.
 
         Raises
         ------
         OCRError
             If Tesseract fails.
         """
+        return OCRResult.from_words(self.extract_words(image, psm, whitelist))
+
+    def extract_words(
+        self,
+        image: np.ndarray,
+        psm: int | None = None,
+        whitelist: str | None = None,
+    ) -> list[OCRWord]:
+        """Run OCR and return every confident word with its bounding box.
+
+        Raises
+        ------
+        OCRError
+            If Tesseract fails.
+        """
+        data = self._image_to_data(image, psm, whitelist)
+        words: list[OCRWord] = []
+        for i, conf in enumerate(data["conf"]):
+            conf_val = float(conf)
+            word = data["text"][i].strip()
+            if conf_val > 0 and word:
+                words.append(OCRWord(
+                    text=word,
+                    confidence=conf_val,
+                    left=int(data["left"][i]),
+                    top=int(data["top"][i]),
+                    width=int(data["width"][i]),
+                    height=int(data["height"][i]),
+                    block=int(data["block_num"][i]),
+                    line=int(data["line_num"][i]),
+                ))
+        return words
+
+    def _image_to_data(
+        self, image: np.ndarray, psm: int | None, whitelist: str | None,
+    ) -> dict[str, list[Any]]:
         try:
             import pytesseract
         except ImportError as exc:
@@ -62,23 +269,18 @@ class TesseractEngine:
             data = pytesseract.image_to_data(
                 image,
                 lang=self._lang,
-                config=self._config,
+                config=self._config(psm, whitelist),
                 output_type=pytesseract.Output.DICT,
             )
         except Exception as exc:
             raise OCRError(f"Tesseract extraction failed: {exc}") from exc
+        return cast("dict[str, list[Any]]", data)
 
-        texts: list[str] = []
-        confidences: list[float] = []
-
-        for i, conf in enumerate(data["conf"]):
-            conf_val = float(conf)
-            if conf_val > 0:
-                word = data["text"][i].strip()
-                if word:
-                    texts.append(word)
-                    confidences.append(conf_val)
+    def _config(self, psm: int | None, whitelist: str | None) -> str:
+        config = f"--psm {psm if psm is not None else self._psm}"
+        if whitelist:
+            config += f" -c tessedit_char_whitelist={whitelist}"
+        return config
 
-        text = " ".join(texts)
-        avg_conf = sum(confidences) / len(confidences) if confidences else 0.0
-        return OCRResult(text=text, confidence=avg_conf)
+    def close(self) -> None:
+        """Nothing to release; each call runs its own process."""
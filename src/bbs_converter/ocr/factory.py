@@ -0,0 +1,36 @@
+"""Construct the OCR engine selected by :class:`OCREngine`."""
+
+from __future__ import annotations
+
+from bbs_converter.ocr.engine import TesseractEngine, TextEngine
+from bbs_converter.ocr.glyph import GlyphBank, GlyphEngine
+from bbs_converter.utils.constants import TESSERACT_POOL_SIZE, OCREngine
+from bbs_converter.utils.exceptions import OCRError
+
+
+def create_engine(
+    kind: OCREngine,
+    lang: str = "eng",
+    psm: int = 7,
+    pool_size: int = TESSERACT_POOL_SIZE,
+    glyph_bank: GlyphBank | None = None,
+) -> TextEngine:
+    """Return a ready-to-use engine of the requested *kind*.
+
+    *glyph_bank* supplies the templates for :attr:`OCREngine.GLYPH`; an
+    empty in-memory bank is used when it is None.
+
+    Raises
+    ------
+    OCRError
+        If the engine is unknown or its backend is unavailable.
+    """
+    if kind is OCREngine.TESSERACT:
+        return TesseractEngine(lang=lang, psm=psm)
+    if kind is OCREngine.TESSERACT_POOL:
+        from bbs_converter.ocr.tesseract_pool import TesseractPool
+
+        return TesseractPool(size=pool_size, lang=lang, psm=psm)
+    if kind is OCREngine.GLYPH:
+        return GlyphEngine(TesseractEngine(lang=lang, psm=psm), bank=glyph_bank)
+    raise OCRError(f"Unsupported OCR engine: {kind}")
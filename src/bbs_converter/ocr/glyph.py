@@ -0,0 +1,342 @@
+"""Template-matching glyph recognizer for fixed-font amounts.
+
+Poker clients draw stacks, pots and blinds in a single font from a tiny
+alphabet, so most numeric crops can be read by cutting them into glyphs
+and correlating each one against known templates — far cheaper than an
+LSTM pass.  Templates are learned from confident Tesseract reads, and
+Tesseract remains the fallback whenever a glyph does not match well.
+"""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Any
+
+import cv2
+import numpy as np
+
+from bbs_converter.ocr.engine import OCRResult, TextEngine
+from bbs_converter.utils.constants import (
+    GLYPH_ALPHABET,
+    GLYPH_HARVEST_CONFIDENCE,
+    GLYPH_MIN_AREA,
+    GLYPH_MIN_SCORE,
+    GLYPH_SIZE,
+    GLYPH_SPACE_RATIO,
+    GLYPH_TEMPLATES_PER_CHAR,
+)
+from bbs_converter.utils.logger import get_logger
+
+_log = get_logger("ocr.glyph")
+
+_DUPLICATE_SCORE = 0.98  # a new sample this close to a stored template adds nothing
+
+
+def segment_glyphs(image: np.ndarray) -> tuple[np.ndarray, list[bool]]:
+    """Cut a binarised text line into normalised glyph descriptors.
+
+    Foreground is taken to be the minority colour, so both dark-on-light
+    and light-on-dark renders work.  Connected components whose columns
+    overlap are merged into one glyph.  Each glyph spans the full line
+    height, which keeps ``.``, ``,`` and digits distinguishable after
+    normalisation.
+
+    Returns
+    -------
+    tuple
+        ``(descriptors, space_before)`` — an ``(n, GLYPH_SIZE**2)``
+        float32 array of zero-mean, unit-norm descriptors in reading
+        order, and for each glyph whether a word gap precedes it.
+    """
+    mask = image < 128 if image.mean() > 127 else image >= 128
+    fg = mask.astype(np.uint8)
+    count, _, stats, _ = cv2.connectedComponentsWithStats(fg, connectivity=8)
+    boxes = [
+        stats[i]
+        for i in range(1, count)
+        if stats[i, cv2.CC_STAT_AREA] >= GLYPH_MIN_AREA
+    ]
+    if not boxes:
+        return np.zeros((0, GLYPH_SIZE * GLYPH_SIZE), dtype=np.float32), []
+
+    boxes.sort(key=lambda b: b[cv2.CC_STAT_LEFT])
+    top = min(int(b[cv2.CC_STAT_TOP]) for b in boxes)
+    bottom = max(int(b[cv2.CC_STAT_TOP] + b[cv2.CC_STAT_HEIGHT]) for b in boxes)
+    line_height = bottom - top
+
+    spans: list[list[int]] = []
+    for box in boxes:
+        left = int(box[cv2.CC_STAT_LEFT])
+        right = left + int(box[cv2.CC_STAT_WIDTH])
+        if spans and left < spans[-1][1]:
+            spans[-1][1] = max(spans[-1][1], right)
+        else:
+            spans.append([left, right])
+
+    descriptors = np.empty((len(spans), GLYPH_SIZE * GLYPH_SIZE), dtype=np.float32)
+    space_before: list[bool] = []
+    prev_right: int | None = None
+    for i, (left, right) in enumerate(spans):
+        descriptors[i] = _describe(fg[top:bottom, left:right])
+        space_before.append(
+            prev_right is not None
+            and left - prev_right > GLYPH_SPACE_RATIO * line_height
+        )
+        prev_right = right
+    return descriptors, space_before
+
+
+def _describe(glyph: np.ndarray) -> np.ndarray:
+    """Centre *glyph* on a square canvas, shrink it and normalise it."""
+    height, width = glyph.shape
+    side = max(height, width)
+    canvas = np.zeros((side, side), dtype=np.float32)
+    y = (side - height) // 2
+    x = (side - width) // 2
+    canvas[y:y + height, x:x + width] = glyph
+    small = cv2.resize(canvas, (GLYPH_SIZE, GLYPH_SIZE), interpolation=cv2.INTER_AREA)
+    vector = small.ravel()
+    vector -= vector.mean()
+    norm = float(np.linalg.norm(vector))
+    return vector / norm if norm > 0 else vector
+
+
+class GlyphBank:
+    """Labelled glyph templates for one site's font.
+
+    Thread-safe, so one bank can be shared by every table of a site.
+    With a *path* the bank is loaded on creation and written back by
+    :meth:`save`.
+
+    Parameters
+    ----------
+    path:
+        Optional ``.npz`` file to persist templates to.
+    per_char:
+        Template variants kept per character.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        per_char: int = GLYPH_TEMPLATES_PER_CHAR,
+    ) -> None:
+        self._path = Path(path) if path else None
+        self._per_char = per_char
+        self._templates = np.zeros((0, GLYPH_SIZE * GLYPH_SIZE), dtype=np.float32)
+        self._labels = np.zeros(0, dtype="<U1")
+        self._lock = threading.Lock()
+        self._added: list[tuple[str, np.ndarray]] | None = None
+        if self._path is not None and self._path.exists():
+            self._load(self._path)
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Picklable (e.g. into OCR worker processes) minus the lock.
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def characters(self) -> set[str]:
+        """Characters with at least one template."""
+        return set(self._labels.tolist())
+
+    def add(self, label: str, descriptor: np.ndarray) -> bool:
+        """Learn *descriptor* as a sample of *label*.
+
+        Returns False if the character already has its quota of
+        templates or the sample duplicates an existing one.
+        """
+        with self._lock:
+            same = self._templates[self._labels == label]
+            if len(same) >= self._per_char:
+                return False
+            if len(same) and float((same @ descriptor).max()) >= _DUPLICATE_SCORE:
+                return False
+            self._templates = np.vstack([self._templates, descriptor[None, :]])
+            self._labels = np.append(self._labels, label)
+            if self._added is not None:
+                self._added.append((label, descriptor))
+            return True
+
+    def track_additions(self) -> None:
+        """Remember templates learned from now on, for :meth:`take_additions`."""
+        with self._lock:
+            if self._added is None:
+                self._added = []
+
+    def take_additions(self) -> list[tuple[str, np.ndarray]]:
+        """Return and forget the templates learned since the last call.
+
+        Pairs of label and descriptor; empty unless
+        :meth:`track_additions` was called.
+        """
+        with self._lock:
+            added, self._added = self._added, None if self._added is None else []
+        return added or []
+
+    def match(
+        self, descriptors: np.ndarray, alphabet: str | None = None,
+    ) -> tuple[list[str], np.ndarray]:
+        """Classify every descriptor at once by normalised correlation.
+
+        Parameters
+        ----------
+        descriptors:
+            ``(n, d)`` descriptors from :func:`segment_glyphs`.
+        alphabet:
+            Only consider templates of these characters.
+
+        Returns
+        -------
+        tuple
+            Best label per glyph and its score in ``[-1, 1]``; scores are
+            ``-1`` when no template is eligible.
+        """
+        with self._lock:
+            templates, labels = self._templates, self._labels
+        if alphabet is not None:
+            keep = np.isin(labels, list(alphabet))
+            templates, labels = templates[keep], labels[keep]
+        if len(labels) == 0 or len(descriptors) == 0:
+            return [""] * len(descriptors), np.full(len(descriptors), -1.0)
+        scores = descriptors @ templates.T
+        best = scores.argmax(axis=1)
+        return labels[best].tolist(), scores[np.arange(len(best)), best]
+
+    def save(self) -> None:
+        """Write the templates to the bank's path, if it has one."""
+        if self._path is None:
+            return
+        with self._lock:
+            templates, labels = self._templates, self._labels
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._path, "wb") as f:
+            np.savez(f, templates=templates, labels=labels)
+        _log.debug("Saved %d glyph templates to %s", len(labels), self._path)
+
+    def _load(self, path: Path) -> None:
+        try:
+            with np.load(path) as data:
+                templates = data["templates"].astype(np.float32)
+                labels = data["labels"].astype("<U1")
+        except (OSError, ValueError, KeyError) as exc:
+            _log.warning("Ignoring unreadable glyph bank %s: %s", path, exc)
+            return
+        if templates.shape != (len(labels), GLYPH_SIZE * GLYPH_SIZE):
+            _log.warning("Ignoring glyph bank %s with shape %s", path, templates.shape)
+            return
+        self._templates, self._labels = templates, labels
+        _log.info("Loaded %d glyph templates from %s", len(labels), path)
+
+
+class GlyphEngine:
+    """Read fixed-font amounts by template matching, falling back to Tesseract.
+
+    Only calls with a *whitelist* drawn from :data:`GLYPH_ALPHABET` are
+    matched; anything else (names, whole-frame text) goes straight to
+    the fallback.  A crop is answered from the bank only if every glyph
+    scores at least *min_score*.  Otherwise the fallback reads it, and a
+    confident read whose character count equals the glyph count teaches
+    the bank each glyph.
+
+    Parameters
+    ----------
+    fallback:
+        Engine used for unmatched crops and to harvest templates.
+    bank:
+        Template bank, possibly shared with other engines.
+    min_score:
+        Worst per-glyph correlation accepted without fallback.
+    harvest_confidence:
+        Fallback confidence needed before its glyphs are learned.
+    """
+
+    def __init__(
+        self,
+        fallback: TextEngine,
+        bank: GlyphBank | None = None,
+        min_score: float = GLYPH_MIN_SCORE,
+        harvest_confidence: float = GLYPH_HARVEST_CONFIDENCE,
+    ) -> None:
+        self._fallback = fallback
+        self._bank = bank if bank is not None else GlyphBank()
+        self._min_score = min_score
+        self._harvest_confidence = harvest_confidence
+        self._matched = 0
+        self._fallbacks = 0
+
+    @property
+    def bank(self) -> GlyphBank:
+        return self._bank
+
+    @property
+    def matched(self) -> int:
+        """Crops answered from the template bank."""
+        return self._matched
+
+    @property
+    def fallbacks(self) -> int:
+        """Crops handed to the fallback engine."""
+        return self._fallbacks
+
+    def extract(
+        self,
+        image: np.ndarray,
+        psm: int | None = None,
+        whitelist: str | None = None,
+    ) -> OCRResult:
+        """Read *image*, from templates when possible.
+
+        Raises
+        ------
+        OCRError
+            If the fallback engine fails.
+        """
+        alphabet = "".join(c for c in whitelist or "" if c in GLYPH_ALPHABET)
+        if not alphabet:
+            self._fallbacks += 1
+            return self._fallback.extract(image, psm=psm, whitelist=whitelist)
+
+        descriptors, space_before = segment_glyphs(image)
+        if len(descriptors) == 0:
+            return OCRResult(text="", confidence=0.0)
+
+        labels, scores = self._bank.match(descriptors, alphabet)
+        if float(scores.min()) >= self._min_score:
+            self._matched += 1
+            text = "".join(
+                (" " if space else "") + label
+                for label, space in zip(labels, space_before)
+            )
+            return OCRResult(text=text, confidence=float(scores.mean()) * 100)
+
+        self._fallbacks += 1
+        result = self._fallback.extract(image, psm=psm, whitelist=whitelist)
+        self._harvest(descriptors, result)
+        return result
+
+    def close(self) -> None:
+        """Close the fallback engine."""
+        self._fallback.close()
+
+    def _harvest(self, descriptors: np.ndarray, result: OCRResult) -> None:
+        """Learn glyph templates from a confident fallback read."""
+        if result.confidence < self._harvest_confidence:
+            return
+        chars = result.text.replace(" ", "")
+        if len(chars) != len(descriptors):
+            return
+        if any(c not in GLYPH_ALPHABET for c in chars):
+            return
+        learned = sum(self._bank.add(c, d) for c, d in zip(chars, descriptors))
+        if learned:
+            _log.debug("Learned %d glyph templates from %r", learned, result.text)
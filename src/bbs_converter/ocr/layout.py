@@ -0,0 +1,139 @@
+"""Table layouts: named regions of interest OCR'd one field at a time."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from bbs_converter.models import CaptureRegion
+from bbs_converter.ocr.roi import extract_roi
+from bbs_converter.utils.constants import (
+    AMOUNT_WHITELIST,
+    BLINDS_WHITELIST,
+    FieldKind,
+)
+from bbs_converter.utils.exceptions import ConfigError
+
+# Tesseract settings per field kind: (page segmentation mode, whitelist).
+_KIND_DEFAULTS: dict[FieldKind, tuple[int, str | None]] = {
+    FieldKind.BLINDS: (7, BLINDS_WHITELIST),   # single line
+    FieldKind.AMOUNT: (8, AMOUNT_WHITELIST),   # single word
+    FieldKind.TEXT: (7, None),
+}
+
+
+@dataclass(frozen=True)
+class FieldROI:
+    """One named field of a table layout.
+
+    Coordinates are fractions of the captured frame (0-1), so a layout
+    survives window resizes and HiDPI scaling.
+
+    Parameters
+    ----------
+    name:
+        Field name, e.g. ``"pot"`` or ``"seat3_stack"``.
+    kind:
+        What the field contains.
+    x, y, width, height:
+        Fractional position and size within the frame.
+    psm:
+        Tesseract page segmentation mode; defaults by *kind*.
+    whitelist:
+        Characters Tesseract may emit; defaults by *kind*.
+    """
+
+    name: str
+    kind: FieldKind
+    x: float
+    y: float
+    width: float
+    height: float
+    psm: int | None = None
+    whitelist: str | None = None
+
+    def __post_init__(self) -> None:
+        if not (0 <= self.x < 1 and 0 <= self.y < 1):
+            raise ConfigError(f"Field '{self.name}' origin must lie inside the frame")
+        if self.width <= 0 or self.height <= 0:
+            raise ConfigError(f"Field '{self.name}' must have a positive size")
+        default_psm, default_whitelist = _KIND_DEFAULTS[self.kind]
+        if self.psm is None:
+            object.__setattr__(self, "psm", default_psm)
+        if self.whitelist is None:
+            object.__setattr__(self, "whitelist", default_whitelist)
+
+    def region(self, frame_width: int, frame_height: int) -> CaptureRegion:
+        """Return the field's pixel region in a frame of the given size."""
+        return CaptureRegion(
+            x=round(self.x * frame_width),
+            y=round(self.y * frame_height),
+            width=max(1, round(self.width * frame_width)),
+            height=max(1, round(self.height * frame_height)),
+        )
+
+    def crop(self, frame: np.ndarray, copy: bool = True) -> np.ndarray:
+        """Cut this field out of *frame*, as a view when *copy* is False."""
+        height, width = frame.shape[:2]
+        return extract_roi(frame, self.region(width, height), copy=copy)
+
+
+@dataclass(frozen=True)
+class TableLayout:
+    """The set of fields to OCR on one table.
+
+    Field names follow a convention the field parser relies on:
+    ``blinds``, ``pot``, and ``seat<N>_name`` / ``seat<N>_stack`` per
+    seat.
+    """
+
+    fields: tuple[FieldROI, ...]
+
+    def __post_init__(self) -> None:
+        names = [f.name for f in self.fields]
+        if len(set(names)) != len(names):
+            raise ConfigError("Layout field names must be unique")
+
+    def __iter__(self) -> Iterator[FieldROI]:
+        return iter(self.fields)
+
+    def __len__(self) -> int:
+        return len(self.fields)
+
+    @classmethod
+    def from_config(cls, section: Mapping[str, Any]) -> TableLayout:
+        """Build a layout from a ``[layout.fields.<name>]`` config section.
+
+        Each field table takes ``kind`` (``blinds``, ``amount`` or
+        ``text``), ``x``, ``y``, ``width``, ``height`` and optionally
+        ``psm`` and ``whitelist``.
+
+        Raises
+        ------
+        ConfigError
+            If a field is missing keys or has invalid values.
+        """
+        fields = []
+        for name, spec in section.get("fields", {}).items():
+            kind_name = str(spec.get("kind", "")).upper()
+            if kind_name not in FieldKind.__members__:
+                raise ConfigError(
+                    f"Layout field '{name}' has unknown kind '{spec.get('kind')}'"
+                )
+            try:
+                fields.append(FieldROI(
+                    name=name,
+                    kind=FieldKind[kind_name],
+                    x=float(spec["x"]),
+                    y=float(spec["y"]),
+                    width=float(spec["width"]),
+                    height=float(spec["height"]),
+                    psm=spec.get("psm"),
+                    whitelist=spec.get("whitelist"),
+                ))
+            except KeyError as exc:
+                raise ConfigError(f"Layout field '{name}' is missing {exc}") from exc
+        return cls(tuple(fields))
@@ -0,0 +1,74 @@
+"""Pack many small crops into one image so they share a single OCR call."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import replace
+
+import numpy as np
+
+from bbs_converter.ocr.engine import OCRResult, OCRWord
+from bbs_converter.utils.constants import MOSAIC_GAP, MOSAIC_PAD
+
+
+def build_mosaic(
+    crops: Sequence[np.ndarray],
+    gap: int = MOSAIC_GAP,
+    pad: int = MOSAIC_PAD,
+) -> tuple[np.ndarray, list[tuple[int, int]]]:
+    """Stack binarised *crops* vertically on a white canvas.
+
+    Each crop becomes its own text line, separated by *gap* blank rows
+    so the engine cannot merge neighbouring fields.  Light-on-dark crops
+    are inverted first so the whole mosaic has one polarity.
+
+    Returns
+    -------
+    tuple
+        The mosaic and, per crop, its ``(top, bottom)`` rows in it.
+    """
+    width = max(crop.shape[1] for crop in crops) + 2 * pad
+    height = sum(crop.shape[0] for crop in crops) + gap * (len(crops) - 1) + 2 * pad
+    mosaic = np.full((height, width), 255, dtype=np.uint8)
+    slots: list[tuple[int, int]] = []
+    y = pad
+    for crop in crops:
+        h, w = crop.shape
+        target = mosaic[y:y + h, pad:pad + w]
+        if crop.mean() < 127:
+            np.subtract(255, crop, out=target)
+        else:
+            target[...] = crop
+        slots.append((y, y + h))
+        y += h + gap
+    return mosaic, slots
+
+
+def split_words(
+    words: Sequence[OCRWord],
+    slots: Sequence[tuple[int, int]],
+    gap: int = MOSAIC_GAP,
+    pad: int = MOSAIC_PAD,
+) -> list[OCRResult]:
+    """Assign each word to the crop whose rows contain its vertical centre.
+
+    Words falling outside every slot (more than half a gap away) are
+    discarded.  Returns one result per slot, words joined left to right
+    with their mean confidence and their tokens moved back into the
+    crop's own coordinates; slots with no words read as empty.
+    """
+    half_gap = gap / 2
+    buckets: list[list[OCRWord]] = [[] for _ in slots]
+    for word in words:
+        centre = word.top + word.height / 2
+        for bucket, (top, bottom) in zip(buckets, slots):
+            if top - half_gap <= centre < bottom + half_gap:
+                bucket.append(word)
+                break
+
+    results: list[OCRResult] = []
+    for bucket, (top, _) in zip(buckets, slots):
+        bucket.sort(key=lambda w: w.left)
+        result = OCRResult.from_words(bucket)
+        results.append(replace(result, tokens=result.tokens.offset(-pad, -top)))
+    return results
@@ -2,20 +2,53 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, replace
+
 import numpy as np
 
 from bbs_converter.ocr.cache import FrameDiffCache
 from bbs_converter.ocr.confidence import is_confident
-from bbs_converter.ocr.denoise import reduce_noise
-from bbs_converter.ocr.engine import OCRResult, TesseractEngine
-from bbs_converter.ocr.preprocessor import to_grayscale
-from bbs_converter.ocr.threshold import adaptive_threshold
-from bbs_converter.utils.constants import DEFAULT_CONFIDENCE_THRESHOLD
+from bbs_converter.ocr.dirty import DirtyRegionDetector
+from bbs_converter.ocr.engine import OCRResult, TextEngine, WordEngine
+from bbs_converter.ocr.factory import create_engine
+from bbs_converter.ocr.glyph import GlyphBank
+from bbs_converter.ocr.layout import TableLayout
+from bbs_converter.ocr.mosaic import build_mosaic, split_words
+from bbs_converter.ocr.preprocess_chain import PreprocessChain, PreprocessConfig
+from bbs_converter.ocr.result_cache import OCRResultCache, cache_key
+from bbs_converter.ocr.tesseract_pool import PoolHealth, TesseractPool
+from bbs_converter.utils.constants import (
+    DEFAULT_CONFIDENCE_THRESHOLD,
+    DEFAULT_OCR_ENGINE,
+    DEFAULT_PSM,
+    MOSAIC_PSM,
+    TESSERACT_POOL_SIZE,
+    OCREngine,
+)
 from bbs_converter.utils.logger import get_logger
 
 _log = get_logger("ocr.pipeline")
 
 
+@dataclass(frozen=True)
+class _Pending:
+    """A binarised field crop waiting for the engine."""
+
+    name: str
+    clean: np.ndarray
+    psm: int | None
+    whitelist: str | None
+
+
+@dataclass(frozen=True)
+class _Queued:
+    """A pending field missing from the result cache, with its cache key."""
+
+    item: _Pending
+    key: str | None
+
+
 class OCRPipeline:
     """End-to-end OCR pipeline with caching and confidence filtering.
 
@@ -27,6 +60,24 @@ class OCRPipeline:
         Whether to enable frame-diff caching.
     lang:
         Tesseract language code.
+    engine:
+        OCR backend to extract text with.
+    pool_size:
+        Warm instances for :attr:`OCREngine.TESSERACT_POOL`.
+    result_cache:
+        Content-addressed cache of engine results, typically shared by
+        every pipeline in the process.  ``None`` disables it.
+    glyph_bank:
+        Templates for :attr:`OCREngine.GLYPH`, usually shared by every
+        pipeline reading the same site.
+    batch_fields:
+        Let :meth:`process_fields` read changed fields through
+        :meth:`process_many`'s mosaics instead of one call per field.
+    preprocess:
+        Preprocessing step order and parameters.
+    psm:
+        Page segmentation mode for whole-frame reads; layout fields use
+        their own.
     """
 
     def __init__(
@@ -34,9 +85,25 @@ class OCRPipeline:
         confidence_threshold: float = DEFAULT_CONFIDENCE_THRESHOLD,
         use_cache: bool = True,
         lang: str = "eng",
+        engine: OCREngine = DEFAULT_OCR_ENGINE,
+        pool_size: int = TESSERACT_POOL_SIZE,
+        result_cache: OCRResultCache | None = None,
+        glyph_bank: GlyphBank | None = None,
+        batch_fields: bool = False,
+        preprocess: PreprocessConfig | None = None,
+        psm: int = DEFAULT_PSM,
     ) -> None:
-        self._engine = TesseractEngine(lang=lang)
+        self._engine: TextEngine = create_engine(
+            engine, lang=lang, psm=psm, pool_size=pool_size, glyph_bank=glyph_bank,
+        )
+        self._engine_tag = f"{engine.name}:{lang}"
+        self._psm = psm
+        self._result_cache = result_cache
+        self._batch_fields = batch_fields
+        self._preprocess = PreprocessChain(preprocess)
         self._cache = FrameDiffCache() if use_cache else None
+        self._dirty = DirtyRegionDetector() if use_cache else None
+        self._field_results: dict[str, OCRResult] = {}
         self._confidence_threshold = confidence_threshold
 
     def process(self, frame: np.ndarray) -> OCRResult | None:
@@ -52,7 +119,7 @@ class OCRPipeline:
         OCRResult or None
             Extracted text if confidence is sufficient, else None.
         """
-        gray = to_grayscale(frame)
+        gray = self._preprocess.to_gray(frame)
 
         # Check cache first
         if self._cache is not None:
@@ -61,11 +128,10 @@ class OCRPipeline:
                 return cached
 
         # Preprocess
-        binary = adaptive_threshold(gray)
-        clean = reduce_noise(binary)
+        clean = self._preprocess.run(gray)
 
         # Extract
-        result = self._engine.extract(clean)
+        result = self._extract(clean)
 
         # Cache the result
         if self._cache is not None:
@@ -77,7 +143,216 @@ class OCRPipeline:
 
         return result
 
+    def process_fields(
+        self, frame: np.ndarray, layout: TableLayout,
+    ) -> dict[str, OCRResult]:
+        """OCR the fields of *layout* that changed since the last frame.
+
+        Every field runs on its own crop with its own page segmentation
+        mode and character whitelist, or, with *batch_fields*, in a
+        mosaic shared with the other changed fields.  With caching
+        enabled a :class:`DirtyRegionDetector` decides which fields
+        changed; the rest reuse their previous result without touching
+        the engine.
+
+        Returns
+        -------
+        dict
+            Confident results keyed by field name; fields that are empty
+            or below the confidence threshold are left out.  Token boxes
+            are in frame pixels.
+        """
+        gray = self._preprocess.to_gray(frame, "layout")
+        if self._dirty is not None:
+            dirty = self._dirty.update(gray, layout)
+        else:
+            dirty = {roi.name for roi in layout}
+
+        height, width = gray.shape[:2]
+        pending: list[_Pending] = []
+        origins: dict[str, tuple[int, int]] = {}
+        for roi in layout:
+            if roi.name in self._field_results and roi.name not in dirty:
+                continue
+            crop = roi.crop(gray, copy=False)
+            if crop.size == 0:
+                continue
+            clean = self._preprocess.run(crop, f"field:{roi.name}")
+            pending.append(_Pending(roi.name, clean, roi.psm, roi.whitelist))
+            region = roi.region(width, height)
+            origins[roi.name] = (region.x, region.y)
+
+        if self._batch_fields:
+            for name, fresh in self._extract_batch(pending).items():
+                self._store_field(name, fresh, origins[name])
+        else:
+            for item in pending:
+                fresh = self._extract(
+                    item.clean, psm=item.psm, whitelist=item.whitelist,
+                )
+                self._store_field(item.name, fresh, origins[item.name])
+
+        results: dict[str, OCRResult] = {}
+        for roi in layout:
+            result = self._field_results.get(roi.name)
+            if result is None:
+                continue
+            if result.text and is_confident(result, self._confidence_threshold):
+                results[roi.name] = result
+        return results
+
+    def process_many(
+        self,
+        crops: Mapping[str, np.ndarray],
+        whitelists: Mapping[str, str | None] | None = None,
+    ) -> dict[str, OCRResult]:
+        """OCR many small ROI crops with as few engine calls as possible.
+
+        Crops are preprocessed one by one, then those sharing a
+        whitelist are packed into one mosaic and read in a single
+        block-mode call; word boxes are mapped back to the crop they
+        fall in.  Engines that cannot report word boxes read each crop
+        separately.
+
+        Parameters
+        ----------
+        crops:
+            Raw ROI crops (BGR, BGRA or grayscale) keyed by name.
+        whitelists:
+            Optional character whitelist per crop name.
+
+        Returns
+        -------
+        dict
+            Confident results keyed by crop name; empty and
+            low-confidence reads are left out.
+        """
+        whitelists = whitelists or {}
+        pending = [
+            _Pending(
+                name, self._preprocess.run(crop, f"field:{name}"), None,
+                whitelists.get(name),
+            )
+            for name, crop in crops.items() if crop.size
+        ]
+        return {
+            name: result
+            for name, result in self._extract_batch(pending).items()
+            if result.text and is_confident(result, self._confidence_threshold)
+        }
+
     @property
     def cache_hit_rate(self) -> float:
-        """Return the cache hit rate, or 0 if caching is disabled."""
+        """Return the cache hit rate, or 0 if caching is disabled.
+
+        With per-field OCR this is the share of field reads skipped
+        because the field was unchanged.
+        """
+        if self._field_results and self._dirty is not None:
+            return self._dirty.clean_rate
         return self._cache.hit_rate if self._cache is not None else 0.0
+
+    @property
+    def preprocess_timings(self) -> dict[str, float]:
+        """Mean milliseconds per preprocessing step."""
+        return self._preprocess.timings
+
+    @property
+    def result_cache(self) -> OCRResultCache | None:
+        return self._result_cache
+
+    @property
+    def engine(self) -> TextEngine:
+        return self._engine
+
+    @property
+    def engine_health(self) -> PoolHealth | None:
+        """Health of a pooled Tesseract engine; None for other engines."""
+        if isinstance(self._engine, TesseractPool):
+            return self._engine.health
+        return None
+
+    def _extract(
+        self,
+        clean: np.ndarray,
+        psm: int | None = None,
+        whitelist: str | None = None,
+    ) -> OCRResult:
+        """Run the engine on *clean*, answering from the result cache if possible."""
+        if self._result_cache is None:
+            return self._engine.extract(clean, psm=psm, whitelist=whitelist)
+        key = self._cache_key(clean, psm, whitelist)
+        result = self._result_cache.get(key)
+        if result is None:
+            result = self._engine.extract(clean, psm=psm, whitelist=whitelist)
+            self._result_cache.put(key, result)
+        return result
+
+    def _store_field(
+        self, name: str, result: OCRResult, origin: tuple[int, int],
+    ) -> None:
+        """Keep a fresh field result and make its crop the field's reference."""
+        if len(result.tokens):
+            # Engine boxes are crop-relative; report them in the frame.
+            result = replace(result, tokens=result.tokens.offset(*origin))
+        self._field_results[name] = result
+        if self._dirty is not None:
+            self._dirty.commit(name)
+
+    def _extract_batch(self, items: Sequence[_Pending]) -> dict[str, OCRResult]:
+        """Read pending fields, one mosaic per whitelist where the engine allows.
+
+        Results are cached under the page segmentation mode actually
+        used, so a mosaic read never answers a single-field lookup.
+        """
+        cache = self._result_cache
+        word_engine = self._engine if isinstance(self._engine, WordEngine) else None
+        groups: dict[str | None, list[_Pending]] = {}
+        for item in items:
+            groups.setdefault(item.whitelist, []).append(item)
+
+        results: dict[str, OCRResult] = {}
+        for whitelist, group in groups.items():
+            mosaic = word_engine is not None and len(group) > 1
+            queued: list[_Queued] = []
+            for item in group:
+                key = None
+                if cache is not None:
+                    psm = MOSAIC_PSM if mosaic else item.psm
+                    key = self._cache_key(item.clean, psm, whitelist)
+                    cached = cache.get(key)
+                    if cached is not None:
+                        results[item.name] = cached
+                        continue
+                queued.append(_Queued(item, key))
+            if not queued:
+                continue
+
+            if mosaic and word_engine is not None:
+                image, slots = build_mosaic([q.item.clean for q in queued])
+                words = word_engine.extract_words(
+                    image, psm=MOSAIC_PSM, whitelist=whitelist,
+                )
+                read = split_words(words, slots)
+            else:
+                read = [
+                    self._engine.extract(
+                        q.item.clean, psm=q.item.psm, whitelist=whitelist,
+                    )
+                    for q in queued
+                ]
+            for q, result in zip(queued, read):
+                results[q.item.name] = result
+                if cache is not None and q.key is not None:
+                    cache.put(q.key, result)
+        return results
+
+    def _cache_key(
+        self, clean: np.ndarray, psm: int | None, whitelist: str | None,
+    ) -> str:
+        psm = psm if psm is not None else self._psm
+        return cache_key(clean, f"{self._engine_tag}|{psm}|{whitelist or ''}")
+
+    def close(self) -> None:
+        """Release engine resources such as pooled Tesseract instances."""
+        self._engine.close()
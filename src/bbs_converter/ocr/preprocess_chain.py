@@ -0,0 +1,164 @@
+"""Configurable preprocessing chain that reuses its output buffers."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import cv2
+import numpy as np
+
+from bbs_converter.utils.constants import (
+    DENOISE_KERNEL_SIZE,
+    PREPROCESS_STEPS,
+    THRESHOLD_BLOCK_SIZE,
+    THRESHOLD_CONSTANT,
+    PreprocessStep,
+)
+from bbs_converter.utils.exceptions import ConfigError
+
+
+@dataclass(frozen=True)
+class PreprocessConfig:
+    """Step order and parameters of a :class:`PreprocessChain`."""
+
+    steps: tuple[PreprocessStep, ...] = PREPROCESS_STEPS
+    block_size: int = THRESHOLD_BLOCK_SIZE
+    constant: int = THRESHOLD_CONSTANT
+    kernel_size: int = DENOISE_KERNEL_SIZE
+
+    def __post_init__(self) -> None:
+        if self.block_size < 3 or self.block_size % 2 == 0:
+            raise ConfigError(
+                f"Threshold block size must be odd and >= 3, got {self.block_size}"
+            )
+        if self.kernel_size < 1 or self.kernel_size % 2 == 0:
+            raise ConfigError(
+                f"Denoise kernel size must be odd, got {self.kernel_size}"
+            )
+
+    @classmethod
+    def from_config(cls, section: Mapping[str, Any]) -> PreprocessConfig:
+        """Build a config from an ``[ocr.preprocess]`` section.
+
+        Keys are ``steps`` (names of :class:`PreprocessStep`, in order),
+        ``block_size``, ``constant`` and ``kernel_size``; missing keys
+        keep their defaults.
+
+        Raises
+        ------
+        ConfigError
+            If a step is unknown or a size is invalid.
+        """
+        steps = PREPROCESS_STEPS
+        if "steps" in section:
+            names = [str(name) for name in section["steps"]]
+            unknown = [n for n in names if n.upper() not in PreprocessStep.__members__]
+            if unknown:
+                raise ConfigError(f"Unknown preprocessing steps: {', '.join(unknown)}")
+            steps = tuple(PreprocessStep[name.upper()] for name in names)
+        return cls(
+            steps=steps,
+            block_size=int(section.get("block_size", THRESHOLD_BLOCK_SIZE)),
+            constant=int(section.get("constant", THRESHOLD_CONSTANT)),
+            kernel_size=int(section.get("kernel_size", DENOISE_KERNEL_SIZE)),
+        )
+
+
+class PreprocessChain:
+    """Run preprocessing steps into preallocated scratch buffers.
+
+    Every call site (the whole frame, or one layout field) names a
+    *slot*.  A slot owns two buffers of its current image size that the
+    steps ping-pong between via OpenCV's ``dst=``, so steady-state
+    processing allocates nothing.  Input may be a view into a larger
+    frame; it is never copied.
+
+    The returned array belongs to the slot and is overwritten by the
+    next call for the same slot — copy it if it must outlive that.
+
+    Parameters
+    ----------
+    config:
+        Step order and parameters.
+    """
+
+    def __init__(self, config: PreprocessConfig | None = None) -> None:
+        self._config = config or PreprocessConfig()
+        self._slots: dict[str, list[np.ndarray]] = {}
+        self._seconds = {step: 0.0 for step in PreprocessStep}
+        self._calls = {step: 0 for step in PreprocessStep}
+
+    @property
+    def config(self) -> PreprocessConfig:
+        return self._config
+
+    def to_gray(self, image: np.ndarray, slot: str = "frame") -> np.ndarray:
+        """Return *image* as a single channel, converting into a scratch buffer."""
+        if image.ndim == 2:
+            return image
+        out = self._buffers(f"{slot}:gray", image.shape[:2])[0]
+        return self._timed(PreprocessStep.GRAYSCALE, image, out)
+
+    def run(self, image: np.ndarray, slot: str = "frame") -> np.ndarray:
+        """Apply the configured steps to *image*.
+
+        Colour input is converted to grayscale first even if the
+        ``GRAYSCALE`` step is not listed, since the other steps need a
+        single channel.
+        """
+        current = self.to_gray(image, slot)
+        buffers = self._buffers(slot, current.shape)
+        flip = 0
+        for step in self._config.steps:
+            if step is PreprocessStep.GRAYSCALE:
+                continue
+            out = buffers[flip]
+            if out is current:  # never read and write the same buffer
+                flip ^= 1
+                out = buffers[flip]
+            current = self._timed(step, current, out)
+            flip ^= 1
+        return current
+
+    @property
+    def timings(self) -> dict[str, float]:
+        """Mean milliseconds per call of each step that has run."""
+        return {
+            step.name.lower(): self._seconds[step] / self._calls[step] * 1000
+            for step in PreprocessStep if self._calls[step]
+        }
+
+    def _timed(
+        self, step: PreprocessStep, src: np.ndarray, out: np.ndarray,
+    ) -> np.ndarray:
+        start = time.perf_counter()
+        result = self._apply(step, src, out)
+        self._seconds[step] += time.perf_counter() - start
+        self._calls[step] += 1
+        return result
+
+    def _apply(
+        self, step: PreprocessStep, src: np.ndarray, out: np.ndarray,
+    ) -> np.ndarray:
+        config = self._config
+        if step is PreprocessStep.GRAYSCALE:
+            code = cv2.COLOR_BGRA2GRAY if src.shape[2] == 4 else cv2.COLOR_BGR2GRAY
+            return cv2.cvtColor(src, code, dst=out)
+        if step is PreprocessStep.THRESHOLD:
+            return cv2.adaptiveThreshold(
+                src, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY,
+                config.block_size, config.constant, dst=out,
+            )
+        if step is PreprocessStep.DENOISE:
+            return cv2.medianBlur(src, config.kernel_size, dst=out)
+        return cv2.bitwise_not(src, dst=out)
+
+    def _buffers(self, slot: str, shape: tuple[int, ...]) -> list[np.ndarray]:
+        buffers = self._slots.get(slot)
+        if buffers is None or buffers[0].shape != shape:
+            buffers = [np.empty(shape, dtype=np.uint8) for _ in range(2)]
+            self._slots[slot] = buffers
+        return buffers
@@ -0,0 +1,186 @@
+"""Content-addressed LRU cache of OCR results."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from bbs_converter.ocr.engine import NO_TOKENS, OCRResult, OCRTokens
+from bbs_converter.utils.constants import RESULT_CACHE_MAX_ENTRIES
+from bbs_converter.utils.exceptions import OCRError
+from bbs_converter.utils.logger import get_logger
+
+_log = get_logger("ocr.result_cache")
+
+_FORMAT_VERSION = 2  # version 1 entries lack tokens
+
+
+def cache_key(image: np.ndarray, params: str = "") -> str:
+    """Return a digest identifying *image* and the settings it is read with.
+
+    The shape and dtype are hashed with the pixels so differently sized
+    crops with the same bytes cannot collide; *params* should describe
+    anything else that changes the OCR output (engine, psm, whitelist).
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{image.shape}|{image.dtype}|{params}".encode())
+    digest.update(np.ascontiguousarray(image).data)
+    return digest.hexdigest()
+
+
+class OCRResultCache:
+    """Thread-safe, size-bounded LRU mapping preprocessed crops to results.
+
+    Identical binarised glyph strings recur across seats, hands and
+    sessions, so a hit skips the OCR engine entirely.  With a *path* the
+    cache is loaded on creation and written back by :meth:`save`, so a
+    restarted session starts warm.
+
+    Parameters
+    ----------
+    max_entries:
+        Entries kept before the least recently used is evicted.
+    path:
+        Optional JSON file to persist the cache to.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = RESULT_CACHE_MAX_ENTRIES,
+        path: str | Path | None = None,
+    ) -> None:
+        self._max_entries = max(1, max_entries)
+        self._path = Path(path) if path else None
+        self._entries: OrderedDict[str, OCRResult] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._added: list[tuple[str, OCRResult]] | None = None
+        if self._path is not None and self._path.exists():
+            self._load(self._path)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Picklable (e.g. into OCR worker processes) minus the lock.
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> OCRResult | None:
+        """Return the cached result for *key*, marking it recently used."""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return result
+
+    def put(self, key: str, result: OCRResult) -> None:
+        """Store *result*, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            if self._added is not None:
+                self._added.append((key, result))
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def track_additions(self) -> None:
+        """Remember entries put from now on, for :meth:`take_additions`."""
+        with self._lock:
+            if self._added is None:
+                self._added = []
+
+    def take_additions(self) -> list[tuple[str, OCRResult]]:
+        """Return and forget the entries put since the last call.
+
+        Lets a copy of the cache, e.g. in an OCR worker process, send
+        what it learned back to the original.  Empty unless
+        :meth:`track_additions` was called.
+        """
+        with self._lock:
+            added, self._added = self._added, None if self._added is None else []
+        return added or []
+
+    def record_lookups(self, hits: int, misses: int) -> None:
+        """Count lookups made elsewhere, e.g. on a copy in a worker process."""
+        with self._lock:
+            self._hits += hits
+            self._misses += misses
+
+    def save(self) -> None:
+        """Write the cache to its path, if it has one.
+
+        The file is replaced atomically, so a crash mid-write leaves the
+        previous snapshot intact.
+        """
+        if self._path is None:
+            return
+        with self._lock:
+            entries: list[list[Any]] = [
+                [key, r.text, r.confidence, r.tokens.to_payload()]
+                for key, r in self._entries.items()
+            ]
+        payload = {"version": _FORMAT_VERSION, "entries": entries}
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self._path.with_suffix(self._path.suffix + ".tmp")
+        tmp.write_text(json.dumps(payload))
+        os.replace(tmp, self._path)
+        _log.debug("Saved %d OCR results to %s", len(entries), self._path)
+
+    @property
+    def size(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        return self._evictions
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the hit rate as a percentage."""
+        total = self._hits + self._misses
+        return (self._hits / total * 100) if total > 0 else 0.0
+
+    def _load(self, path: Path) -> None:
+        try:
+            payload = json.loads(path.read_text())
+            if payload.get("version") not in (1, _FORMAT_VERSION):
+                raise ValueError(f"unsupported version {payload.get('version')}")
+            entries = [
+                (str(key), OCRResult(
+                    text=str(text),
+                    confidence=float(conf),
+                    tokens=OCRTokens.from_payload(rest[0]) if rest else NO_TOKENS,
+                ))
+                for key, text, conf, *rest in payload["entries"]
+            ]
+        except (OSError, ValueError, KeyError, TypeError, OCRError) as exc:
+            _log.warning("Ignoring unreadable OCR cache %s: %s", path, exc)
+            return
+        for key, result in entries[-self._max_entries:]:
+            self._entries[key] = result
+        _log.info("Loaded %d cached OCR results from %s", len(self._entries), path)
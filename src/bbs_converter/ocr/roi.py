@@ -12,6 +12,7 @@ def extract_roi(
     region: CaptureRegion,
     frame_origin_x: int = 0,
     frame_origin_y: int = 0,
+    copy: bool = True,
 ) -> np.ndarray:
     """Extract a sub-region from a frame.
 
@@ -28,6 +29,9 @@ def extract_roi(
         X-coordinate of the frame's top-left corner on screen.
     frame_origin_y:
         Y-coordinate of the frame's top-left corner on screen.
+    copy:
+        Return an independent copy.  With False the result is a view
+        into *frame*, valid only while the frame is.
 
     Returns
     -------
@@ -38,4 +42,5 @@ def extract_roi(
     y = max(0, region.y - frame_origin_y)
     x2 = min(frame.shape[1], x + region.width)
     y2 = min(frame.shape[0], y + region.height)
-    return frame[y:y2, x:x2].copy()
+    roi = frame[y:y2, x:x2]
+    return roi.copy() if copy else roi
@@ -0,0 +1,364 @@
+"""Pool of warm Tesseract instances driven through the C API.
+
+``pytesseract`` writes a temp image, starts a ``tesseract`` process and
+reloads the language model on every call.  This backend loads
+``libtesseract`` once via :mod:`ctypes` and keeps a fixed number of
+initialised ``TessBaseAPI`` handles alive, so a frame only pays for
+recognition itself.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from bbs_converter.ocr.engine import OCRResult, OCRWord
+from bbs_converter.utils.constants import TESSERACT_POOL_SIZE
+from bbs_converter.utils.exceptions import OCRError
+from bbs_converter.utils.logger import get_logger
+
+_log = get_logger("ocr.tesseract_pool")
+
+# tesseract::PageIteratorLevel
+_RIL_BLOCK = 0
+_RIL_TEXTLINE = 2
+_RIL_WORD = 3
+_CHECKOUT_TIMEOUT = 5.0
+
+
+def _load_libtesseract() -> Any:
+    """Load libtesseract and declare the C API signatures we use.
+
+    Raises
+    ------
+    OCRError
+        If the shared library cannot be found.
+    """
+    name = ctypes.util.find_library("tesseract")
+    if name is None:
+        raise OCRError("libtesseract not found; install Tesseract 4+ or use TESSERACT")
+    lib = ctypes.CDLL(name)
+
+    p, i, f, s = ctypes.c_void_p, ctypes.c_int, ctypes.c_float, ctypes.c_char_p
+    ip = ctypes.POINTER(ctypes.c_int)
+    signatures: dict[str, tuple[Any, list[Any]]] = {
+        "TessBaseAPICreate": (p, []),
+        "TessBaseAPIInit3": (i, [p, s, s]),
+        "TessBaseAPISetPageSegMode": (None, [p, i]),
+        "TessBaseAPISetVariable": (i, [p, s, s]),
+        "TessBaseAPISetImage": (None, [p, p, i, i, i, i]),
+        "TessBaseAPIRecognize": (i, [p, p]),
+        "TessBaseAPIGetIterator": (p, [p]),
+        "TessBaseAPIClear": (None, [p]),
+        "TessBaseAPIEnd": (None, [p]),
+        "TessBaseAPIDelete": (None, [p]),
+        "TessResultIteratorGetPageIterator": (p, [p]),
+        "TessResultIteratorGetUTF8Text": (p, [p, i]),
+        "TessResultIteratorConfidence": (f, [p, i]),
+        "TessResultIteratorDelete": (None, [p]),
+        "TessPageIteratorNext": (i, [p, i]),
+        "TessPageIteratorBoundingBox": (i, [p, i, ip, ip, ip, ip]),
+        "TessPageIteratorIsAtBeginningOf": (i, [p, i]),
+        "TessDeleteText": (None, [p]),
+    }
+    for func_name, (restype, argtypes) in signatures.items():
+        func = getattr(lib, func_name)
+        func.restype = restype
+        func.argtypes = argtypes
+    return lib
+
+
+class _TesseractHandle:
+    """One initialised ``TessBaseAPI`` instance."""
+
+    def __init__(self, lib: Any, lang: str, psm: int, datapath: str | None) -> None:
+        self._lib = lib
+        self._api = lib.TessBaseAPICreate()
+        datapath_arg = datapath.encode() if datapath else None
+        if lib.TessBaseAPIInit3(self._api, datapath_arg, lang.encode()) != 0:
+            lib.TessBaseAPIDelete(self._api)
+            raise OCRError(f"Tesseract failed to load language '{lang}'")
+        lib.TessBaseAPISetPageSegMode(self._api, psm)
+        self._psm = psm
+        self._default_psm = psm
+        self._whitelist = ""
+
+    def configure(self, psm: int | None, whitelist: str | None) -> None:
+        """Apply per-call settings, skipping C calls when nothing changed."""
+        psm = psm if psm is not None else self._default_psm
+        if psm != self._psm:
+            self._lib.TessBaseAPISetPageSegMode(self._api, psm)
+            self._psm = psm
+        whitelist = whitelist or ""
+        if whitelist != self._whitelist:
+            self._lib.TessBaseAPISetVariable(
+                self._api, b"tessedit_char_whitelist", whitelist.encode(),
+            )
+            self._whitelist = whitelist
+
+    def recognize(self, image: np.ndarray) -> list[OCRWord]:
+        """Recognise *image* and return its words with boxes and line numbers.
+
+        *image* must be a contiguous single-channel ``uint8`` array.
+        """
+        lib = self._lib
+        height, width = image.shape
+        lib.TessBaseAPISetImage(
+            self._api, image.ctypes.data, width, height, 1, image.strides[0],
+        )
+        try:
+            if lib.TessBaseAPIRecognize(self._api, None) != 0:
+                raise OCRError("Tesseract recognition failed")
+            return self._collect_words()
+        finally:
+            lib.TessBaseAPIClear(self._api)
+
+    def _collect_words(self) -> list[OCRWord]:
+        """Gather words with the same filtering as :class:`TesseractEngine`."""
+        lib = self._lib
+        words: list[OCRWord] = []
+        it = lib.TessBaseAPIGetIterator(self._api)
+        if not it:
+            return words
+        coords = [ctypes.c_int() for _ in range(4)]
+        page_it = lib.TessResultIteratorGetPageIterator(it)
+        block = line = 0
+        try:
+            while True:
+                if lib.TessPageIteratorIsAtBeginningOf(page_it, _RIL_BLOCK):
+                    block += 1
+                    line = 0
+                if lib.TessPageIteratorIsAtBeginningOf(page_it, _RIL_TEXTLINE):
+                    line += 1
+                ptr = lib.TessResultIteratorGetUTF8Text(it, _RIL_WORD)
+                if ptr:
+                    word = ctypes.string_at(ptr).decode("utf-8", "replace").strip()
+                    lib.TessDeleteText(ptr)
+                    conf = float(lib.TessResultIteratorConfidence(it, _RIL_WORD))
+                    if conf > 0 and word:
+                        lib.TessPageIteratorBoundingBox(
+                            page_it, _RIL_WORD, *(ctypes.byref(c) for c in coords),
+                        )
+                        left, top, right, bottom = (c.value for c in coords)
+                        words.append(OCRWord(
+                            word, conf, left, top, right - left, bottom - top,
+                            block, line,
+                        ))
+                if not lib.TessPageIteratorNext(page_it, _RIL_WORD):
+                    break
+        finally:
+            lib.TessResultIteratorDelete(it)
+        return words
+
+    def close(self) -> None:
+        self._lib.TessBaseAPIEnd(self._api)
+        self._lib.TessBaseAPIDelete(self._api)
+
+
+@dataclass(frozen=True)
+class PoolHealth:
+    """Point-in-time health figures for a :class:`TesseractPool`."""
+
+    size: int
+    capacity: int
+    idle: int
+    calls: int
+    failures: int
+    restarts: int
+    mean_latency_ms: float
+
+    @property
+    def healthy(self) -> bool:
+        """True while every instance is alive and most calls succeed."""
+        return self.size == self.capacity and self.failures * 2 <= self.calls
+
+
+class TesseractPool:
+    """Fixed pool of warm Tesseract instances, usable from many threads.
+
+    Every instance is created and loaded up front.  :meth:`extract`
+    borrows one for the duration of a call; an instance whose call
+    fails in the engine is torn down and replaced so one bad frame
+    cannot poison the pool.  An image the engine cannot take is rejected
+    before an instance is borrowed.  :meth:`close` frees idle instances
+    at once and borrowed ones as soon as their call returns.
+
+    Parameters
+    ----------
+    size:
+        Number of instances, i.e. the maximum concurrent extractions.
+    lang:
+        Tesseract language code.
+    psm:
+        Page segmentation mode (default 7 = single line).
+    datapath:
+        Directory containing ``tessdata``; defaults to ``TESSDATA_PREFIX``
+        or the library's built-in path.
+    """
+
+    def __init__(
+        self,
+        size: int = TESSERACT_POOL_SIZE,
+        lang: str = "eng",
+        psm: int = 7,
+        datapath: str | None = None,
+    ) -> None:
+        if size < 1:
+            raise OCRError(f"Tesseract pool size must be >= 1, got {size}")
+        self._lib = _load_libtesseract()
+        self._lang = lang
+        self._psm = psm
+        self._datapath = datapath or os.environ.get("TESSDATA_PREFIX")
+        self._size = size
+        self._live = size
+        self._idle: queue.Queue[_TesseractHandle] = queue.Queue()
+        self._handles: set[_TesseractHandle] = set()
+        self._lock = threading.Lock()
+        self._closed = False
+        try:
+            for _ in range(size):
+                self._idle.put(self._new_handle())
+        except BaseException:
+            self.close()
+            raise
+        self._calls = 0
+        self._failures = 0
+        self._restarts = 0
+        self._busy_seconds = 0.0
+        _log.info("Tesseract pool ready (%d instances, lang=%s)", size, lang)
+
+    def extract(
+        self,
+        image: np.ndarray,
+        psm: int | None = None,
+        whitelist: str | None = None,
+    ) -> OCRResult:
+        """Run OCR on a preprocessed image using a pooled instance.
+
+        *psm* and *whitelist* override the pool's settings for this call.
+
+        Raises
+        ------
+        OCRError
+            If the pool is closed, no instance frees up in time, or
+            recognition fails.
+        """
+        return OCRResult.from_words(self._run(image, psm, whitelist))
+
+    def extract_words(
+        self,
+        image: np.ndarray,
+        psm: int | None = None,
+        whitelist: str | None = None,
+    ) -> list[OCRWord]:
+        """Like :meth:`extract`, but return the words themselves."""
+        return self._run(image, psm, whitelist)
+
+    def _run(
+        self,
+        image: np.ndarray,
+        psm: int | None,
+        whitelist: str | None,
+    ) -> list[OCRWord]:
+        if self._closed:
+            raise OCRError("Tesseract pool is closed")
+        image = np.ascontiguousarray(image, dtype=np.uint8)
+        if image.ndim != 2:
+            raise OCRError(f"Expected a single-channel image, got shape {image.shape}")
+        try:
+            handle = self._idle.get(timeout=_CHECKOUT_TIMEOUT)
+        except queue.Empty as exc:
+            raise OCRError("No Tesseract instance available") from exc
+
+        start = time.perf_counter()
+        try:
+            handle.configure(psm, whitelist)
+            words = handle.recognize(image)
+        except Exception as exc:
+            self._record(start, failed=True)
+            self._recycle(handle)
+            if isinstance(exc, OCRError):
+                raise
+            raise OCRError(f"Tesseract extraction failed: {exc}") from exc
+        self._checkin(handle)
+        self._record(start, failed=False)
+        return words
+
+    @property
+    def health(self) -> PoolHealth:
+        with self._lock:
+            mean = self._busy_seconds / self._calls * 1000 if self._calls else 0.0
+            return PoolHealth(
+                size=self._live,
+                capacity=self._size,
+                idle=self._idle.qsize(),
+                calls=self._calls,
+                failures=self._failures,
+                restarts=self._restarts,
+                mean_latency_ms=mean,
+            )
+
+    def close(self) -> None:
+        """Shut down idle instances; borrowed ones close when returned."""
+        with self._lock:
+            self._closed = True
+            while True:
+                try:
+                    handle = self._idle.get_nowait()
+                except queue.Empty:
+                    break
+                self._free(handle)
+
+    def _new_handle(self) -> _TesseractHandle:
+        handle = _TesseractHandle(self._lib, self._lang, self._psm, self._datapath)
+        with self._lock:
+            self._handles.add(handle)
+        return handle
+
+    def _free(self, handle: _TesseractHandle) -> None:
+        """Shut *handle* down and stop tracking it.  Caller holds the lock."""
+        self._handles.discard(handle)
+        try:
+            handle.close()
+        except Exception:  # a crashed instance may not shut down cleanly
+            _log.debug("Failed to close broken Tesseract instance", exc_info=True)
+
+    def _checkin(self, handle: _TesseractHandle) -> None:
+        """Return a borrowed handle, or free it if the pool closed meanwhile."""
+        with self._lock:
+            if self._closed:
+                self._free(handle)
+            else:
+                self._idle.put(handle)
+
+    def _recycle(self, handle: _TesseractHandle) -> None:
+        """Replace a handle whose call failed with a fresh instance."""
+        with self._lock:
+            self._free(handle)
+            if self._closed:
+                return
+        try:
+            replacement = self._new_handle()
+        except OCRError:
+            _log.error("Could not restart a Tesseract instance; pool shrinks")
+            with self._lock:
+                self._live -= 1
+            return
+        with self._lock:
+            self._restarts += 1
+        self._checkin(replacement)
+
+    def _record(self, start: float, failed: bool) -> None:
+        with self._lock:
+            self._calls += 1
+            self._busy_seconds += time.perf_counter() - start
+            if failed:
+                self._failures += 1
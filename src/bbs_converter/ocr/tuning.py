@@ -0,0 +1,290 @@
+"""Sweep preprocessing and engine settings over a labelled frame corpus.
+
+The best threshold block size, denoise kernel, step order and page
+segmentation mode depend on the poker client's font and the captured
+resolution.  :func:`tune` reads a corpus of frames with known text under
+every candidate :class:`TunedProfile` and :func:`select_best` keeps the
+one with the best accuracy per millisecond among those that are nearly
+as accurate as the most accurate one.  Profiles are stored in config
+under ``[ocr.profiles.<site>.<width>x<height>]``, keyed by the frame size
+in pixels, and picked up by :func:`find_profile`.
+"""
+
+from __future__ import annotations
+
+import itertools
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from bbs_converter.ocr.layout import TableLayout
+from bbs_converter.ocr.pipeline import OCRPipeline
+from bbs_converter.ocr.preprocess_chain import PreprocessConfig
+from bbs_converter.utils.constants import (
+    DEFAULT_CONFIDENCE_THRESHOLD,
+    DEFAULT_OCR_ENGINE,
+    DEFAULT_PSM,
+    TUNE_ACCURACY_TOLERANCE,
+    OCREngine,
+    PreprocessStep,
+)
+from bbs_converter.utils.exceptions import ConfigError
+from bbs_converter.utils.logger import get_logger
+
+_log = get_logger("ocr.tuning")
+
+
+@dataclass(frozen=True)
+class TunedProfile:
+    """Preprocessing and engine settings for one site and region size."""
+
+    preprocess: PreprocessConfig = field(default_factory=PreprocessConfig)
+    psm: int = DEFAULT_PSM
+
+    @classmethod
+    def from_config(cls, section: Mapping[str, Any]) -> TunedProfile:
+        """Build a profile from an ``[ocr.profiles.<site>.<size>]`` section.
+
+        Raises
+        ------
+        ConfigError
+            If the preprocessing settings are invalid.
+        """
+        return cls(
+            preprocess=PreprocessConfig.from_config(section),
+            psm=int(section.get("psm", DEFAULT_PSM)),
+        )
+
+    def to_config(self) -> dict[str, Any]:
+        """Return the profile as a config section."""
+        config = self.preprocess
+        return {
+            "steps": [step.name.lower() for step in config.steps],
+            "block_size": config.block_size,
+            "constant": config.constant,
+            "kernel_size": config.kernel_size,
+            "psm": self.psm,
+        }
+
+    def describe(self) -> str:
+        """One-line summary for reports."""
+        config = self.preprocess
+        steps = "+".join(step.name.lower() for step in config.steps)
+        return (
+            f"{steps} block={config.block_size} c={config.constant} "
+            f"kernel={config.kernel_size} psm={self.psm}"
+        )
+
+
+def profile_key(width: int, height: int) -> str:
+    """Return the config key of profiles tuned for *width* x *height* frames."""
+    return f"{width}x{height}"
+
+
+def find_profile(
+    ocr_config: Mapping[str, Any], site: str, width: int, height: int,
+) -> TunedProfile | None:
+    """Return the tuned profile for *site* at this frame size in pixels, if any.
+
+    Parameters
+    ----------
+    ocr_config:
+        The ``[ocr]`` config section.
+    """
+    section = ocr_config.get("profiles", {}).get(site, {}).get(
+        profile_key(width, height),
+    )
+    return TunedProfile.from_config(section) if section else None
+
+
+@dataclass(frozen=True)
+class LabelledFrame:
+    """A corpus frame and the text it should read as.
+
+    *expected* is the whole-frame text, or the text of each layout field
+    by field name.
+    """
+
+    frame: np.ndarray
+    expected: str | dict[str, str]
+
+
+@dataclass(frozen=True)
+class TrialResult:
+    """How one profile did on the corpus."""
+
+    profile: TunedProfile
+    accuracy: float  # share of labelled strings read exactly, 0-1
+    ms_per_frame: float
+
+    @property
+    def score(self) -> float:
+        """Accuracy per millisecond of OCR time."""
+        return self.accuracy / max(self.ms_per_frame, 1e-3)
+
+
+def candidate_profiles(
+    step_sets: Iterable[Sequence[PreprocessStep]],
+    block_sizes: Iterable[int],
+    constants: Iterable[int],
+    kernel_sizes: Iterable[int],
+    psms: Iterable[int],
+) -> list[TunedProfile]:
+    """Return every distinct profile in the grid.
+
+    Parameters that a step set does not use (the threshold settings
+    without ``THRESHOLD``, the kernel without ``DENOISE``) are not
+    swept for it, so the grid holds no equivalent duplicates.
+
+    Raises
+    ------
+    ConfigError
+        If a size in the grid is invalid.
+    """
+    block_sizes, constants = list(block_sizes), list(constants)
+    kernel_sizes, psms = list(kernel_sizes), list(psms)
+    profiles: dict[TunedProfile, None] = {}
+    for steps in map(tuple, step_sets):
+        if PreprocessStep.THRESHOLD in steps:
+            thresholds = list(itertools.product(block_sizes, constants))
+        else:
+            thresholds = [(block_sizes[0], constants[0])]
+        kernels = kernel_sizes if PreprocessStep.DENOISE in steps else kernel_sizes[:1]
+        for (block, constant), kernel, psm in itertools.product(
+            thresholds, kernels, psms,
+        ):
+            config = PreprocessConfig(steps, block, constant, kernel)
+            profiles[TunedProfile(config, psm)] = None
+    return list(profiles)
+
+
+def _normalise(text: str) -> str:
+    return " ".join(text.split())
+
+
+def _read(
+    ocr: OCRPipeline, frame: np.ndarray, layout: TableLayout | None,
+) -> dict[str, str]:
+    """Return the text *ocr* reads in *frame*, keyed by field name."""
+    if layout is not None:
+        results = ocr.process_fields(frame, layout)
+        return {name: r.text for name, r in results.items()}
+    result = ocr.process(frame)
+    return {"": result.text if result is not None else ""}
+
+
+def evaluate(
+    profile: TunedProfile,
+    corpus: Sequence[LabelledFrame],
+    layout: TableLayout | None = None,
+    engine: OCREngine = DEFAULT_OCR_ENGINE,
+    lang: str = "eng",
+    confidence_threshold: float = DEFAULT_CONFIDENCE_THRESHOLD,
+) -> TrialResult:
+    """Read *corpus* with *profile* and measure accuracy and OCR time.
+
+    Every labelled string counts once: the whole-frame text, or each
+    labelled field with a *layout*.  A read below the confidence
+    threshold counts as wrong, since the live pipeline would reject it.
+    Frame-to-frame caching is off so every frame reaches the engine,
+    and one untimed read of the first frame warms the engine up so its
+    start-up cost does not land in ``ms_per_frame``.
+
+    Raises
+    ------
+    OCRError
+        If the engine cannot be created or fails.
+    """
+    ocr = OCRPipeline(
+        confidence_threshold=confidence_threshold,
+        use_cache=False,
+        lang=lang,
+        engine=engine,
+        pool_size=1,
+        preprocess=profile.preprocess,
+        psm=profile.psm,
+    )
+    correct = total = 0
+    seconds = 0.0
+    try:
+        if corpus:
+            _read(ocr, corpus[0].frame, layout)
+        for item in corpus:
+            start = time.perf_counter()
+            read = _read(ocr, item.frame, layout)
+            seconds += time.perf_counter() - start
+
+            expected = item.expected
+            if isinstance(expected, str):
+                expected = {"": expected}
+            for name, text in expected.items():
+                total += 1
+                correct += _normalise(read.get(name, "")) == _normalise(text)
+    finally:
+        ocr.close()
+    return TrialResult(
+        profile=profile,
+        accuracy=correct / total if total else 0.0,
+        ms_per_frame=seconds / len(corpus) * 1000 if corpus else 0.0,
+    )
+
+
+def tune(
+    corpus: Sequence[LabelledFrame],
+    profiles: Sequence[TunedProfile],
+    layout: TableLayout | None = None,
+    engine: OCREngine = DEFAULT_OCR_ENGINE,
+    lang: str = "eng",
+    confidence_threshold: float = DEFAULT_CONFIDENCE_THRESHOLD,
+) -> list[TrialResult]:
+    """Evaluate every profile on *corpus*, best score first.
+
+    Raises
+    ------
+    ConfigError
+        If the corpus or the profile list is empty.
+    OCRError
+        If the engine fails.
+    """
+    if not corpus:
+        raise ConfigError("Tuning corpus has no labelled frames")
+    if not profiles:
+        raise ConfigError("No candidate profiles to tune")
+    results = []
+    for index, profile in enumerate(profiles, 1):
+        result = evaluate(
+            profile, corpus, layout=layout, engine=engine, lang=lang,
+            confidence_threshold=confidence_threshold,
+        )
+        _log.debug(
+            "[%d/%d] %s: accuracy %.1f%%, %.2fms/frame",
+            index, len(profiles), profile.describe(),
+            result.accuracy * 100, result.ms_per_frame,
+        )
+        results.append(result)
+    results.sort(key=lambda r: (r.score, r.accuracy), reverse=True)
+    return results
+
+
+def select_best(
+    results: Sequence[TrialResult],
+    tolerance: float = TUNE_ACCURACY_TOLERANCE,
+) -> TrialResult:
+    """Pick the best accuracy per millisecond among near-top accuracy results.
+
+    Ranking on the ratio alone would favour a fast profile that reads
+    almost nothing, so only results within *tolerance* of the best
+    accuracy compete on speed.
+
+    Raises
+    ------
+    ConfigError
+        If *results* is empty.
+    """
+    if not results:
+        raise ConfigError("No tuning results to choose from")
+    floor = max(r.accuracy for r in results) - tolerance
+    return max((r for r in results if r.accuracy >= floor), key=lambda r: r.score)
@@ -2,20 +2,39 @@
 
 from __future__ import annotations
 
+import contextlib
 import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
 
+from bbs_converter.capture.fps_controller import FPSController
 from bbs_converter.models import BBState, CaptureRegion
 from bbs_converter.overlay.colorizer import colorize_stacks
 from bbs_converter.overlay.positioning import compute_positions
 from bbs_converter.overlay.renderer import render_bb_values
-from bbs_converter.overlay.window import OverlayWindow
+from bbs_converter.overlay.window import WINDOW_TITLE, OverlayWindow
+from bbs_converter.utils.exceptions import OverlayError
 from bbs_converter.utils.logger import get_logger
+from bbs_converter.utils.timer import TimingStats
 
 _log = get_logger("overlay.loop")
 
 
+StateSource = Callable[[], "BBState | None"]
+
+
+@dataclass
+class _Panel:
+    """One table's overlay window and what was last drawn on it."""
+
+    region: CaptureRegion
+    get_state: StateSource
+    title: str
+    player_names: list[str] = field(default_factory=list)
+    drawn: BBState | None = None
+
+
 class OverlayLoop:
     """Refresh loop that updates the overlay display.
 
@@ -32,15 +51,36 @@ class OverlayLoop:
     def __init__(
         self,
         region: CaptureRegion,
-        get_state: Callable[[], BBState | None],
+        get_state: StateSource,
         refresh_hz: int = 15,
     ) -> None:
-        self._region = region
-        self._get_state = get_state
+        self._panels = [_Panel(region, get_state, WINDOW_TITLE)]
         self._refresh_interval = 1.0 / refresh_hz
+        self._pacer = FPSController(target_fps=refresh_hz)
         self._stop_event = threading.Event()
         self._thread: threading.Thread | None = None
-        self._player_names: list[str] = []
+        self._latency_ms: float | None = None
+
+    @classmethod
+    def for_tables(
+        cls,
+        tables: Sequence[tuple[CaptureRegion, StateSource]],
+        refresh_hz: int = 15,
+    ) -> OverlayLoop:
+        """Return one loop driving a window over each ``(region, get_state)``.
+
+        All windows are refreshed from the same thread, which on macOS
+        must be the main thread.
+        """
+        if not tables:
+            raise OverlayError("An overlay needs at least one table")
+        loop = cls(*tables[0], refresh_hz=refresh_hz)
+        if len(tables) > 1:
+            loop._panels = [
+                _Panel(region, get_state, f"{WINDOW_TITLE} {number}")
+                for number, (region, get_state) in enumerate(tables, 1)
+            ]
+        return loop
 
     def start(self) -> None:
         """Start the overlay refresh loop in a background thread.
@@ -78,40 +118,71 @@ class OverlayLoop:
     def running(self) -> bool:
         return self._thread is not None and self._thread.is_alive()
 
+    @property
+    def timing_stats(self) -> TimingStats:
+        """Refresh interval jitter, percentiles and overruns."""
+        return self._pacer.timing_stats
+
+    @property
+    def latency_ms(self) -> float | None:
+        """Capture-to-display latency of the last state drawn, if known."""
+        return self._latency_ms
+
     def _run(self) -> None:
-        """Main loop: fetch state → clear → render → show → sleep."""
-        with OverlayWindow(self._region) as window:
+        """Main loop: fetch state → clear → render → show → wait for deadline."""
+        with contextlib.ExitStack() as stack:
+            windows = [
+                stack.enter_context(OverlayWindow(panel.region, panel.title))
+                for panel in self._panels
+            ]
             while not self._stop_event.is_set():
-                state = self._get_state()
-                if state is not None:
-                    # Update player name list if changed
-                    new_names = sorted(state.stacks_bb.keys())
-                    if new_names != self._player_names:
-                        self._player_names = new_names
-
-                    positions = compute_positions(self._region, self._player_names)
-                    colors = colorize_stacks(state.stacks_bb)
-
-                    window.clear()
-                    # Render each player with their stack-depth color
-                    for name in self._player_names:
-                        if name in positions:
-                            color = colors.get(name, (0, 255, 0, 255))
-                            single_state = BBState(
-                                pot_bb=0.0,
-                                stacks_bb={name: state.stacks_bb[name]},
-                            )
-                            render_bb_values(
-                                window.canvas,
-                                single_state,
-                                {name: positions[name]},
-                                color=color,
-                            )
-                    # Render pot
-                    if state.pot_bb > 0:
-                        pot_state = BBState(pot_bb=state.pot_bb, stacks_bb={})
-                        render_bb_values(window.canvas, pot_state, {})
-
-                    window.show()
-
-                time.sleep(self._refresh_interval)
+                for panel, window in zip(self._panels, windows):
+                    self._refresh(panel, window)
+                self._pacer.tick()
+
+    def _refresh(self, panel: _Panel, window: OverlayWindow) -> None:
+        state = panel.get_state()
+        if state is None:
+            return
+        # The pipeline republishes the same object while the table is
+        # unchanged; the canvas already shows it.
+        redraw = state is not panel.drawn
+        if redraw:
+            self._draw(panel, window, state)
+            panel.drawn = state
+
+        window.show()
+        if redraw and state.captured_at is not None:
+            self._latency_ms = (time.perf_counter() - state.captured_at) * 1000
+
+    def _draw(self, panel: _Panel, window: OverlayWindow, state: BBState) -> None:
+        """Redraw *panel*'s canvas for *state*."""
+        # Update player name list if changed
+        new_names = sorted(state.stacks_bb.keys())
+        if new_names != panel.player_names:
+            panel.player_names = new_names
+
+        positions = compute_positions(
+            panel.region, panel.player_names, anchors=state.positions,
+        )
+        colors = colorize_stacks(state.stacks_bb)
+
+        window.clear()
+        # Render each player with their stack-depth color
+        for name in panel.player_names:
+            if name in positions:
+                color = colors.get(name, (0, 255, 0, 255))
+                single_state = BBState(
+                    pot_bb=0.0,
+                    stacks_bb={name: state.stacks_bb[name]},
+                )
+                render_bb_values(
+                    window.canvas,
+                    single_state,
+                    {name: positions[name]},
+                    color=color,
+                )
+        # Render pot
+        if state.pot_bb > 0:
+            pot_state = BBState(pot_bb=state.pot_bb, stacks_bb={})
+            render_bb_values(window.canvas, pot_state, {})
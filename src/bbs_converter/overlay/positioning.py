@@ -2,18 +2,23 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+
 from bbs_converter.models import CaptureRegion
+from bbs_converter.utils.constants import SEAT_LABEL_OFFSET
 
 
 def compute_positions(
     region: CaptureRegion,
     player_names: list[str],
     max_seats: int = 9,
+    anchors: Mapping[str, tuple[int, int]] | None = None,
 ) -> dict[str, tuple[int, int]]:
     """Compute overlay pixel positions for each player.
 
-    Distributes player labels vertically within the capture region,
-    with a left margin offset.
+    Players with an anchor, where their name was read on the table,
+    get a label next to it; the rest are distributed vertically within
+    the capture region, with a left margin offset.
 
     Parameters
     ----------
@@ -23,6 +28,8 @@ def compute_positions(
         Ordered list of player names.
     max_seats:
         Maximum number of seat slots to allocate space for.
+    anchors:
+        Region pixel position of each player's name, if known.
 
     Returns
     -------
@@ -33,12 +40,20 @@ def compute_positions(
     if not player_names:
         return {}
 
-    slot_count = max(len(player_names), 1)
+    anchors = anchors or {}
+    dx, dy = SEAT_LABEL_OFFSET
+    positions: dict[str, tuple[int, int]] = {}
+    for name in player_names:
+        if name in anchors:
+            x, y = anchors[name]
+            positions[name] = (max(x + dx, 0), max(y + dy, 0))
+
+    unplaced = [name for name in player_names if name not in positions]
+    slot_count = max(len(unplaced), 1)
     slot_height = region.height // (slot_count + 1)
     x_offset = 10
 
-    positions: dict[str, tuple[int, int]] = {}
-    for i, name in enumerate(player_names):
+    for i, name in enumerate(unplaced):
         y = slot_height * (i + 1)
         positions[name] = (x_offset, y)
 
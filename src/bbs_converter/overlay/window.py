@@ -10,7 +10,7 @@ from bbs_converter.utils.logger import get_logger
 
 _log = get_logger("overlay.window")
 
-_WINDOW_NAME = "BBS Converter Overlay"
+WINDOW_TITLE = "BBS Converter Overlay"
 
 
 class OverlayWindow:
@@ -20,10 +20,13 @@ class OverlayWindow:
     ----------
     region:
         Screen region the window covers (matches the capture region).
+    title:
+        Window title, which must differ between windows shown at once.
     """
 
-    def __init__(self, region: CaptureRegion) -> None:
+    def __init__(self, region: CaptureRegion, title: str = WINDOW_TITLE) -> None:
         self._region = region
+        self._title = title
         self._canvas: np.ndarray | None = None
         self._open = False
 
@@ -34,12 +37,12 @@ class OverlayWindow:
         except ImportError as exc:
             raise OverlayError("OpenCV is required for the overlay") from exc
 
-        cv2.namedWindow(_WINDOW_NAME, cv2.WINDOW_NORMAL)
+        cv2.namedWindow(self._title, cv2.WINDOW_NORMAL)
         cv2.setWindowProperty(
-            _WINDOW_NAME, cv2.WND_PROP_TOPMOST, 1
+            self._title, cv2.WND_PROP_TOPMOST, 1
         )
-        cv2.resizeWindow(_WINDOW_NAME, self._region.width, self._region.height)
-        cv2.moveWindow(_WINDOW_NAME, self._region.x, self._region.y)
+        cv2.resizeWindow(self._title, self._region.width, self._region.height)
+        cv2.moveWindow(self._title, self._region.x, self._region.y)
 
         # Create transparent canvas (BGRA)
         self._canvas = np.zeros(
@@ -54,7 +57,7 @@ class OverlayWindow:
         if self._open:
             try:
                 import cv2
-                cv2.destroyWindow(_WINDOW_NAME)
+                cv2.destroyWindow(self._title)
             except Exception:
                 pass
             self._open = False
@@ -77,7 +80,7 @@ class OverlayWindow:
         if not self._open or self._canvas is None:
             return
         import cv2
-        cv2.imshow(_WINDOW_NAME, self._canvas)
+        cv2.imshow(self._title, self._canvas)
         cv2.waitKey(1)
 
     @property
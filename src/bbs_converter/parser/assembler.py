@@ -3,19 +3,19 @@
 from __future__ import annotations
 
 from bbs_converter.models import TableState
-from bbs_converter.parser.blind_parser import parse_blinds
-from bbs_converter.parser.pot_parser import parse_pot
-from bbs_converter.parser.stack_parser import parse_stacks
+from bbs_converter.parser.lexer import DEFAULT_LEXER, TableLexer
 from bbs_converter.utils.exceptions import ParserError
 
 
-def assemble_table_state(text: str) -> TableState:
-    """Combine all sub-parsers to build a complete TableState.
+def assemble_table_state(text: str, lexer: TableLexer | None = None) -> TableState:
+    """Build a complete TableState from one pass over *text*.
 
     Parameters
     ----------
     text:
         Raw OCR output from a single frame.
+    lexer:
+        Lexer of the site's profile; the default profile if None.
 
     Returns
     -------
@@ -27,17 +27,14 @@ def assemble_table_state(text: str) -> TableState:
     ParserError
         If required fields (blinds) cannot be extracted.
     """
-    blinds = parse_blinds(text)
-    if blinds is None:
+    table = (lexer or DEFAULT_LEXER).lex(text)
+    if table.blinds is None:
         raise ParserError("Could not extract blind levels from text")
 
-    small_blind, big_blind = blinds
-    pot = parse_pot(text) or 0.0
-    stacks = parse_stacks(text)
-
+    small_blind, big_blind = table.blinds
     return TableState(
         big_blind=big_blind,
         small_blind=small_blind,
-        pot=pot,
-        stacks=stacks,
+        pot=table.pot or 0.0,
+        stacks=table.stacks,
     )
@@ -2,15 +2,7 @@
 
 from __future__ import annotations
 
-import re
-
-_BLIND_PATTERN = re.compile(
-    r"(?:blinds?|bl)\s*:?\s*"
-    r"[\$]?(?P<sb>[\d,]+(?:\.\d{1,2})?)"
-    r"\s*[/\\|]\s*"
-    r"[\$]?(?P<bb>[\d,]+(?:\.\d{1,2})?)",
-    re.IGNORECASE,
-)
+from bbs_converter.parser.lexer import lex_table
 
 
 def parse_blinds(text: str) -> tuple[float, float] | None:
@@ -19,6 +11,10 @@ def parse_blinds(text: str) -> tuple[float, float] | None:
     Looks for patterns like ``Blinds: 50/100``, ``BL 25/50``,
     or ``Blind $100/$200``.
 
+    Calling several ``parse_*`` helpers on the same text lexes it once;
+    to read a whole table use
+    :func:`~bbs_converter.parser.assembler.assemble_table_state`.
+
     Parameters
     ----------
     text:
@@ -29,9 +25,4 @@ def parse_blinds(text: str) -> tuple[float, float] | None:
     tuple or None
         ``(small_blind, big_blind)`` if found, otherwise ``None``.
     """
-    match = _BLIND_PATTERN.search(text)
-    if match is None:
-        return None
-    sb = float(match.group("sb").replace(",", ""))
-    bb = float(match.group("bb").replace(",", ""))
-    return (sb, bb)
+    return lex_table(text).blinds
@@ -0,0 +1,169 @@
+"""Repair common OCR character confusions before parsing.
+
+Tesseract often swaps look-alike characters: ``1,O00`` for ``1,000``,
+``B1inds`` for ``Blinds``.  Such a read would fail to parse, or worse,
+parse to a wrong amount, and the frame's OCR time would be wasted.
+:class:`OCRRepair` makes two fixes:
+
+- inside numbers, letters from :data:`OCR_DIGIT_CONFUSIONS` become the
+  digits they resemble (``1,O00`` → ``1,000``);
+- a word that becomes a table label or keyword once its digits are
+  read as letters (:data:`OCR_LETTER_CONFUSIONS`) is replaced by it.
+
+With ``fuzzy=True`` label words within :data:`KEYWORD_MAX_EDITS` edits
+are replaced as well.  That could turn a player called ``Blink`` into
+``blind``, so :class:`~bbs_converter.parser.memo.ParseMemo` only tries
+it on readings that fail to parse otherwise.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+from collections.abc import Mapping
+
+from bbs_converter.parser.profiles import DEFAULT_PROFILE, SiteProfile
+from bbs_converter.utils.constants import (
+    KEYWORD_FUZZY_MIN_LENGTH,
+    KEYWORD_MAX_EDITS,
+    OCR_DIGIT_CONFUSIONS,
+    OCR_LETTER_CONFUSIONS,
+)
+
+_WORD = re.compile(r"(?<![\w|])(?=[\w|]*[^\W\d_])[\w|]+")  # has a letter
+# Only words mixing letters with digits or bars can be misread table words.
+_MIXED_WORD = re.compile(r"(?<![\w|])(?=[\w|]*[^\W\d_])(?=[\w|]*[\d|])[\w|]+")
+
+
+def within_edits(a: str, b: str, max_edits: int) -> bool:
+    """Return whether *a* becomes *b* in at most *max_edits* edits.
+
+    Levenshtein distance with insertions, deletions and substitutions,
+    abandoned as soon as every path exceeds the bound.
+    """
+    if abs(len(a) - len(b)) > max_edits:
+        return False
+    previous = list(range(len(b) + 1))
+    for i, char in enumerate(a, 1):
+        current = [i]
+        for j, other in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char != other),
+            ))
+        if min(current) > max_edits:
+            return False
+        previous = current
+    return previous[-1] <= max_edits
+
+
+class OCRRepair:
+    """Confusion repair compiled for one :class:`SiteProfile`.
+
+    Build it through :func:`repair_for`, which caches one per profile.
+
+    Parameters
+    ----------
+    profile:
+        Supplies the table words and the number format.
+    """
+
+    def __init__(self, profile: SiteProfile = DEFAULT_PROFILE) -> None:
+        self._to_digits = str.maketrans(OCR_DIGIT_CONFUSIONS)
+        self._to_letters = str.maketrans(OCR_LETTER_CONFUSIONS)
+        self._vocabulary = frozenset(
+            part for word in profile.table_words for part in word.split()
+        )
+        labels = (*profile.blind_labels, *profile.pot_labels, *profile.seat_labels)
+        self._fuzzy_labels = tuple(sorted({
+            part.lower()
+            for label in labels for part in label.split()
+            if len(part) >= KEYWORD_FUZZY_MIN_LENGTH
+        }))
+
+        confusable = re.escape("".join(OCR_DIGIT_CONFUSIONS))
+        separators = re.escape(
+            profile.thousands_separator + profile.decimal_separator,
+        )
+        self._separators = re.compile(f"[{separators}]")
+        suffixes = "".join(letter for letter, _ in profile.suffixes)
+        suffixes += suffixes.upper()
+        char = rf"[\d{confusable}]"
+        end = r"(?![^\W\d_])"
+        if suffixes:
+            end = rf"(?=[{suffixes}]?{end})"
+        # A run of digits and look-alikes, holding at least one
+        # look-alike, that is not part of a word; an amount suffix such
+        # as ``k`` may follow.
+        self._number = re.compile(
+            rf"(?<![^\W\d_])(?=[\d{separators}]*[{confusable}])"
+            rf"{char}(?:[\d{confusable}{separators}]*{char})?{end}",
+        )
+
+    def repair(self, text: str, fuzzy: bool = False, numeric: bool = False) -> str:
+        """Return *text* with confused characters fixed.
+
+        Parameters
+        ----------
+        text:
+            OCR text.
+        fuzzy:
+            Also replace words within a few edits of a table label.
+        numeric:
+            *text* is known to hold amounts, e.g. a pot field crop, so
+            runs of look-alikes are read as numbers even without a real
+            digit among them (``SOO`` → ``500``).
+        """
+        text = self._number.sub(
+            functools.partial(self._fix_number, numeric=numeric), text,
+        )
+        words = _WORD if fuzzy else _MIXED_WORD
+        return words.sub(functools.partial(self._fix_word, fuzzy=fuzzy), text)
+
+    def repair_reading(
+        self, reading: str | Mapping[str, str], fuzzy: bool = False,
+    ) -> str | dict[str, str]:
+        """Repair a whole-frame text, or every field of a per-field reading.
+
+        Name fields are left alone; every other layout field holds
+        amounts.
+        """
+        if isinstance(reading, str):
+            return self.repair(reading, fuzzy)
+        return {
+            name: text if name.endswith("_name")
+            else self.repair(text, fuzzy, numeric=True)
+            for name, text in reading.items()
+        }
+
+    def _fix_number(self, match: re.Match[str], numeric: bool) -> str:
+        # Outside amount fields a run must look like a number: lead with
+        # a digit, or hold one next to a separator (``l,2OO``).  That
+        # keeps names such as ``Bo8`` intact.
+        run = match.group()
+        if numeric or run[0].isdigit() or (
+            self._separators.search(run) and any(c.isdigit() for c in run)
+        ):
+            return run.translate(self._to_digits)
+        return run
+
+    def _fix_word(self, match: re.Match[str], fuzzy: bool) -> str:
+        word = match.group()
+        lower = word.lower()
+        if lower in self._vocabulary:
+            return word
+        letters = lower.translate(self._to_letters)
+        if letters in self._vocabulary:
+            return letters
+        if fuzzy:
+            for label in self._fuzzy_labels:
+                if within_edits(letters, label, KEYWORD_MAX_EDITS):
+                    return label
+        return word
+
+
+@functools.cache
+def repair_for(profile: SiteProfile) -> OCRRepair:
+    """Return the confusion repair of *profile*, compiling it on first use."""
+    return OCRRepair(profile)
@@ -0,0 +1,85 @@
+"""Build a TableState from per-field OCR text."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Mapping
+
+from bbs_converter.models import TableState
+from bbs_converter.parser.lexer import DEFAULT_LEXER, TableLexer
+from bbs_converter.utils.exceptions import ParserError
+
+_SEAT_FIELD = re.compile(r"seat(?P<seat>\d+)_(?P<part>name|stack)")
+
+
+def parse_amount(text: str, lexer: TableLexer | None = None) -> float | None:
+    """Return the first chip amount in *text*, e.g. ``"$1,250"`` → 1250.0."""
+    return (lexer or DEFAULT_LEXER).parse_amount(text)
+
+
+def _parse_field_blinds(text: str, lexer: TableLexer) -> tuple[float, float] | None:
+    """Blinds from a field crop, with or without the ``Blinds:`` label."""
+    return lexer.lex(text).blinds or lexer.parse_bare_blinds(text)
+
+
+def assemble_from_fields(
+    fields: Mapping[str, str], lexer: TableLexer | None = None,
+) -> TableState:
+    """Combine per-field OCR text into a TableState.
+
+    Parameters
+    ----------
+    fields:
+        OCR text keyed by layout field name: ``blinds``, ``pot``,
+        ``seat<N>_name`` and ``seat<N>_stack``.  Missing fields are
+        treated as unread.
+    lexer:
+        Lexer of the site's profile; the default profile if None.
+
+    Returns
+    -------
+    TableState
+        Table state with a stack for every seat whose name and stack
+        were both read.
+
+    Raises
+    ------
+    ParserError
+        If the blinds field is missing or unparseable.
+    """
+    lexer = lexer or DEFAULT_LEXER
+    blinds = _parse_field_blinds(fields.get("blinds", ""), lexer)
+    if blinds is None:
+        raise ParserError("Could not extract blind levels from the blinds field")
+    small_blind, big_blind = blinds
+
+    pot_text = fields.get("pot", "")
+    pot = lexer.lex(pot_text).pot or lexer.parse_amount(pot_text) or 0.0
+
+    names: dict[int, str] = {}
+    amounts: dict[int, float] = {}
+    for field_name, text in fields.items():
+        match = _SEAT_FIELD.fullmatch(field_name)
+        if match is None:
+            continue
+        seat = int(match.group("seat"))
+        if match.group("part") == "name":
+            name = text.strip()
+            if name:
+                names[seat] = name
+        else:
+            amount = lexer.parse_amount(text)
+            if amount is not None:
+                amounts[seat] = amount
+
+    stacks = {
+        names[seat]: amounts[seat]
+        for seat in sorted(names)
+        if seat in amounts
+    }
+    return TableState(
+        big_blind=big_blind,
+        small_blind=small_blind,
+        pot=pot,
+        stacks=stacks,
+    )
@@ -0,0 +1,259 @@
+"""Single-pass lexer for whole-table OCR text.
+
+One master pattern walks the text once, left to right, and classifies
+each span as blinds, pot, seat, player name (with its stack, if one
+follows) or a stray amount.  Table words such as ``Pot`` or ``Fold``
+are matched before the generic name rule, so they never become player
+names and need no filtering afterwards.
+
+The labels, keywords and number format come from a
+:class:`~bbs_converter.parser.profiles.SiteProfile`; :func:`lexer_for`
+compiles each profile once and reuses it.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+
+from bbs_converter.parser.profiles import DEFAULT_PROFILE, SiteProfile
+from bbs_converter.utils.constants import LEX_TABLE_CACHE_ENTRIES, TokenKind
+
+_KINDS = {
+    "blinds": TokenKind.BLINDS,
+    "pot": TokenKind.POT,
+    "seat": TokenKind.SEAT,
+    "keyword": TokenKind.KEYWORD,
+    "word": TokenKind.NAME,
+    "amount": TokenKind.AMOUNT,
+}
+
+
+def _alternatives(words: Iterable[str]) -> str:
+    """Regex alternation of *words*, longest first, spaces matching any run."""
+    escaped = (
+        r"\s+".join(re.escape(part) for part in word.split())
+        for word in sorted(set(words), key=len, reverse=True)
+    )
+    return "|".join(escaped)
+
+
+@dataclass(frozen=True)
+class Token:
+    """One classified span of OCR text.
+
+    *amounts* holds ``(small, big)`` for blinds, the pot for a pot, the
+    stack for a seat or name that has one, and the value of an amount.
+    """
+
+    kind: TokenKind
+    start: int
+    end: int
+    name: str = ""
+    seat: int = 0
+    amounts: tuple[float, ...] = ()
+
+
+@dataclass(frozen=True)
+class TableText:
+    """Everything read from one frame's OCR text."""
+
+    blinds: tuple[float, float] | None = None
+    pot: float | None = None
+    stacks: dict[str, float] = field(default_factory=dict)
+    seats: dict[int, str] = field(default_factory=dict)
+
+
+class TableLexer:
+    """Table-text lexer compiled from one :class:`SiteProfile`.
+
+    Build it through :func:`lexer_for`, which caches one lexer per
+    profile, rather than directly.
+
+    Parameters
+    ----------
+    profile:
+        Labels, keywords and number format of the site.
+    """
+
+    def __init__(self, profile: SiteProfile = DEFAULT_PROFILE) -> None:
+        self._profile = profile
+        self._table_words = profile.table_words
+        self._suffixes = dict(profile.suffixes)
+        self._thousands = profile.thousands_separator
+        self._decimal = profile.decimal_separator
+
+        thousands = re.escape(self._thousands)
+        amount = rf"\d[\d{thousands}]*(?:{re.escape(self._decimal)}\d{{1,2}})?"
+        if self._suffixes:
+            amount += rf"(?:[{''.join(self._suffixes)}](?![A-Za-z]))?"
+        symbols = _alternatives(profile.currency)
+        currency = rf"(?:{symbols})?\s*" if symbols else ""
+        separator = rf"(?::|{symbols})?" if symbols else ":?"
+
+        def stack(group: str) -> str:
+            return rf"\s*{separator}\s*{currency}(?P<{group}>{amount})"
+
+        # Alternatives are tried in order at each position; the outer
+        # group of each names the token kind.
+        self._master = re.compile(
+            rf"""
+            (?P<blinds>(?:{_alternatives(profile.blind_labels)})\s*:?\s*
+                {currency}(?P<sb>{amount})\s*[/\\|]\s*{currency}(?P<bb>{amount}))
+            | (?P<pot>(?:{_alternatives(profile.pot_labels)})\s*:?\s*
+                {currency}(?P<pot_amount>{amount}))
+            | (?P<seat>(?:{_alternatives(profile.seat_labels)})\s*\#?
+                (?P<seat_no>\d+)\s*:?\s*
+                (?:(?P<seat_name>[A-Za-z]\w*)(?:{stack("seat_amount")})?)?)
+            | (?P<keyword>(?:{_alternatives(self._table_words)})\b)
+            | (?P<word>(?P<name>[A-Za-z]\w*)(?:{stack("name_amount")})?)
+            | (?P<amount>{amount})
+            """,
+            re.IGNORECASE | re.VERBOSE,
+        )
+        self._amount = re.compile(amount, re.IGNORECASE)
+        self._amount_word = re.compile(
+            rf"{currency}(?P<amount>{amount})", re.IGNORECASE,
+        )
+        self._bare_blinds = re.compile(
+            rf"{currency}(?P<sb>{amount})\s*[/\\|]\s*{currency}(?P<bb>{amount})",
+            re.IGNORECASE,
+        )
+
+    @property
+    def profile(self) -> SiteProfile:
+        return self._profile
+
+    @property
+    def table_words(self) -> frozenset[str]:
+        """Lower-cased words that are never player names."""
+        return self._table_words
+
+    def number(self, text: str) -> float:
+        """Convert an amount matched by this lexer, e.g. ``"1.250,5"`` → 1250.5."""
+        multiplier = 1.0
+        if text[-1].isalpha():
+            multiplier = self._suffixes[text[-1].lower()]
+            text = text[:-1]
+        if self._thousands:
+            text = text.replace(self._thousands, "")
+        if self._decimal != ".":
+            text = text.replace(self._decimal, ".")
+        return float(text) * multiplier
+
+    def parse_amount(self, text: str) -> float | None:
+        """Return the first amount in *text*, or None."""
+        match = self._amount.search(text)
+        return self.number(match.group()) if match else None
+
+    def parse_amount_word(self, text: str) -> float | None:
+        """Return the amount if *text* is one and nothing else, e.g. ``"$1,250"``."""
+        match = self._amount_word.fullmatch(text)
+        return self.number(match["amount"]) if match else None
+
+    def parse_bare_blinds(self, text: str) -> tuple[float, float] | None:
+        """Return ``(small, big)`` from unlabelled text such as ``$50/$100``."""
+        match = self._bare_blinds.search(text)
+        if match is None:
+            return None
+        return self.number(match["sb"]), self.number(match["bb"])
+
+    def tokenize(self, text: str) -> Iterator[Token]:
+        """Yield the tokens of *text* in reading order.
+
+        Characters that start no token (punctuation, stray symbols) are
+        skipped.
+        """
+        number = self.number
+        for match in self._master.finditer(text):
+            kind = _KINDS[match.lastgroup or ""]
+            start, end = match.span()
+            if kind is TokenKind.BLINDS:
+                amounts = (number(match["sb"]), number(match["bb"]))
+                yield Token(kind, start, end, amounts=amounts)
+            elif kind is TokenKind.POT:
+                yield Token(kind, start, end, amounts=(number(match["pot_amount"]),))
+            elif kind is TokenKind.SEAT:
+                name = match["seat_name"] or ""
+                if name.lower() in self._table_words:
+                    name = ""
+                stack = match["seat_amount"]
+                yield Token(
+                    kind, start, end, name=name, seat=int(match["seat_no"]),
+                    amounts=(number(stack),) if stack and name else (),
+                )
+            elif kind is TokenKind.NAME:
+                stack = match["name_amount"]
+                yield Token(
+                    kind, start, end, name=match["name"],
+                    amounts=(number(stack),) if stack else (),
+                )
+            elif kind is TokenKind.AMOUNT:
+                yield Token(kind, start, end, amounts=(number(match["amount"]),))
+            else:
+                yield Token(kind, start, end, name=match["keyword"])
+
+    def lex(self, text: str) -> TableText:
+        """Read blinds, pot, stacks and seats from *text* in one pass.
+
+        The first blinds and pot found win; a later stack for the same
+        player replaces an earlier one.  This is the per-frame hot path,
+        so it reads the match groups directly rather than building
+        :class:`Token` objects.
+
+        Parameters
+        ----------
+        text:
+            Raw OCR output from a single frame.
+        """
+        number = self.number
+        blinds: tuple[float, float] | None = None
+        pot: float | None = None
+        stacks: dict[str, float] = {}
+        seats: dict[int, str] = {}
+        for match in self._master.finditer(text):
+            group = match.lastgroup
+            if group == "word":
+                stack = match["name_amount"]
+                if stack:
+                    stacks[match["name"]] = number(stack)
+            elif group == "seat":
+                name = match["seat_name"]
+                if name and name.lower() not in self._table_words:
+                    seats[int(match["seat_no"])] = name
+                    stack = match["seat_amount"]
+                    if stack:
+                        stacks[name] = number(stack)
+            elif group == "blinds":
+                if blinds is None:
+                    blinds = (number(match["sb"]), number(match["bb"]))
+            elif group == "pot" and pot is None:
+                pot = number(match["pot_amount"])
+        return TableText(blinds=blinds, pot=pot, stacks=stacks, seats=seats)
+
+
+@functools.cache
+def lexer_for(profile: SiteProfile) -> TableLexer:
+    """Return the lexer of *profile*, compiling it on first use."""
+    return TableLexer(profile)
+
+
+DEFAULT_LEXER = lexer_for(DEFAULT_PROFILE)
+
+
+def tokenize(text: str) -> Iterator[Token]:
+    """Yield the tokens of *text* under the default profile."""
+    return DEFAULT_LEXER.tokenize(text)
+
+
+@functools.lru_cache(maxsize=LEX_TABLE_CACHE_ENTRIES)
+def lex_table(text: str) -> TableText:
+    """Read *text* in one pass under the default profile; see :meth:`TableLexer.lex`.
+
+    Recent texts are remembered, so the ``parse_*`` helpers called one
+    after another on the same text lex it once.  The result is shared:
+    do not modify its dicts.
+    """
+    return DEFAULT_LEXER.lex(text)
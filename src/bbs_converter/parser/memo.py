@@ -0,0 +1,198 @@
+"""Memoized parse of OCR readings into table and big-blind states."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping
+from dataclasses import replace
+
+from bbs_converter.converter.batch import convert_table
+from bbs_converter.models import BBState, TableState
+from bbs_converter.ocr.engine import NO_TOKENS, OCRTokens
+from bbs_converter.parser.assembler import assemble_table_state
+from bbs_converter.parser.confusion import repair_for
+from bbs_converter.parser.field_parser import assemble_from_fields
+from bbs_converter.parser.lexer import lexer_for
+from bbs_converter.parser.profiles import DEFAULT_PROFILE, SiteProfile
+from bbs_converter.parser.sanitizer import sanitize
+from bbs_converter.parser.spatial import SeatIndex, assign_seats
+from bbs_converter.utils.constants import PARSE_MEMO_MAX_ENTRIES
+from bbs_converter.utils.exceptions import ParserError
+from bbs_converter.utils.logger import get_logger
+
+_log = get_logger("parser.memo")
+
+Parsed = tuple[TableState, BBState]
+
+
+def _normalise(text: str) -> str:
+    return " ".join(text.split()).lower()
+
+
+def memo_key(reading: str | Mapping[str, str]) -> Hashable:
+    """Return the memo key of a whole-frame text or a per-field reading.
+
+    Whitespace runs collapse to one space and case is folded, so reads
+    that differ only in OCR spacing or capitalisation share an entry.
+    """
+    if isinstance(reading, str):
+        return _normalise(reading)
+    return tuple(sorted((name, _normalise(text)) for name, text in reading.items()))
+
+
+class ParseMemo:
+    """Size-bounded LRU from normalised OCR text to its parsed states.
+
+    A static table reads the same text frame after frame; a hit returns
+    the very :class:`TableState` and :class:`BBState` objects built the
+    first time, so callers can tell "nothing changed" with ``is`` and
+    skip the work downstream.  Texts that fail to parse are remembered
+    too and raise again without being re-parsed.
+
+    Each new reading first has its OCR confusions repaired (see
+    :mod:`~bbs_converter.parser.confusion`); if it still fails to
+    parse, fuzzy label matching gets one more try before it is given
+    up on.
+
+    With a *seat_index*, whole-frame readings that come with word boxes
+    take their players from :func:`~bbs_converter.parser.spatial.assign_seats`
+    instead of from the text order.  Their key then also holds the seat
+    each word fell in, so the same text read with players in other seats
+    is parsed again; smaller moves within a seat hit, and keep the label
+    positions of the first read.
+
+    Because the key folds case, a hit returns the names as first read.
+    Not thread-safe: each lane owns its memo.
+
+    Parameters
+    ----------
+    max_entries:
+        Readings kept before the least recently used is evicted.
+    profile:
+        Site profile the readings are parsed with.
+    seat_index:
+        Seat lookup of the table region, to place players by word box.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = PARSE_MEMO_MAX_ENTRIES,
+        profile: SiteProfile = DEFAULT_PROFILE,
+        seat_index: SeatIndex | None = None,
+    ) -> None:
+        self._lexer = lexer_for(profile)
+        self._seat_index = seat_index
+        self._repair = repair_for(profile)
+        self._max_entries = max(1, max_entries)
+        self._entries: OrderedDict[Hashable, Parsed | ParserError] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._repairs = 0
+
+    def parse(
+        self, reading: str | Mapping[str, str], tokens: OCRTokens = NO_TOKENS,
+    ) -> Parsed:
+        """Parse, sanitize and convert *reading*, reusing a previous result.
+
+        Parameters
+        ----------
+        reading:
+            Whole-frame OCR text, or the text of each layout field.
+        tokens:
+            Words of a whole-frame reading with their boxes in region
+            pixels.
+
+        Raises
+        ------
+        ParserError
+            If the reading cannot be parsed.
+        """
+        key = memo_key(reading)
+        if self._seat_index is not None and len(tokens):
+            seats = self._seat_index.lookup(tokens.centres)
+            key = (key, seats.tobytes())
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            entry = self._build(reading, tokens)
+            self._entries[key] = entry
+            if len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        else:
+            self._hits += 1
+            self._entries.move_to_end(key)
+        if isinstance(entry, ParserError):
+            raise ParserError(str(entry))
+        return entry
+
+    def _build(
+        self, reading: str | Mapping[str, str], tokens: OCRTokens,
+    ) -> Parsed | ParserError:
+        repaired = self._repair.repair_reading(reading)
+        entry = self._parse_reading(repaired, tokens)
+        if isinstance(entry, ParserError):
+            fuzzy = self._repair.repair_reading(reading, fuzzy=True)
+            if fuzzy != repaired:
+                repaired, entry = fuzzy, self._parse_reading(fuzzy, tokens)
+        if not isinstance(entry, ParserError) and repaired != reading:
+            self._repairs += 1
+            _log.debug("Repaired OCR read %r as %r", reading, repaired)
+        return entry
+
+    def _parse_reading(
+        self, reading: str | Mapping[str, str], tokens: OCRTokens,
+    ) -> Parsed | ParserError:
+        lexer = self._lexer
+        try:
+            if isinstance(reading, str):
+                table_state = assemble_table_state(reading, lexer)
+                if self._seat_index is not None and len(tokens):
+                    table_state = self._place_players(table_state, tokens)
+            else:
+                table_state = assemble_from_fields(reading, lexer)
+            table_state = sanitize(table_state, lexer.table_words)
+        except ParserError as exc:
+            return exc
+        return table_state, convert_table(table_state)
+
+    def _place_players(self, state: TableState, tokens: OCRTokens) -> TableState:
+        assert self._seat_index is not None
+        players = assign_seats(tokens, self._seat_index, self._lexer, self._repair)
+        if not players:
+            return state
+        return replace(
+            state,
+            stacks={player.name: player.stack for player in players},
+            players=tuple(players),
+        )
+
+    @property
+    def seat_index(self) -> SeatIndex | None:
+        return self._seat_index
+
+    @property
+    def profile(self) -> SiteProfile:
+        return self._lexer.profile
+
+    @property
+    def size(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def repairs(self) -> int:
+        """Distinct readings that parsed after confusion repair changed them."""
+        return self._repairs
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the hit rate as a percentage."""
+        total = self._hits + self._misses
+        return (self._hits / total * 100) if total > 0 else 0.0
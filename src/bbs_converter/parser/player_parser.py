@@ -2,21 +2,19 @@
 
 from __future__ import annotations
 
-import re
-
 from bbs_converter.models import PlayerInfo
-from bbs_converter.parser.stack_parser import parse_stacks
-
-_SEAT_PATTERN = re.compile(
-    r"[Ss]eat\s*#?(?P<seat>\d+)\s*:?\s*(?P<name>[A-Za-z]\w*)",
-)
+from bbs_converter.parser.lexer import lex_table
 
 
 def parse_players(text: str) -> list[PlayerInfo]:
     """Extract player information from raw OCR text.
 
-    Combines seat assignments (``Seat 3: Alice``) with stack amounts
-    extracted by the stack parser to produce full PlayerInfo records.
+    Combines seat assignments (``Seat 3: Alice``) with the stack amounts
+    found in the same pass to produce full PlayerInfo records.
+
+    Calling several ``parse_*`` helpers on the same text lexes it once;
+    to read a whole table use
+    :func:`~bbs_converter.parser.assembler.assemble_table_state`.
 
     Parameters
     ----------
@@ -28,13 +26,8 @@ def parse_players(text: str) -> list[PlayerInfo]:
     list
         PlayerInfo records for each matched player.
     """
-    stacks = parse_stacks(text)
-    players: list[PlayerInfo] = []
-
-    for match in _SEAT_PATTERN.finditer(text):
-        seat = int(match.group("seat"))
-        name = match.group("name")
-        stack = stacks.get(name, 0.0)
-        players.append(PlayerInfo(name=name, seat=seat, stack=stack))
-
-    return players
+    table = lex_table(text)
+    return [
+        PlayerInfo(name=name, seat=seat, stack=table.stacks.get(name, 0.0))
+        for seat, name in table.seats.items()
+    ]
@@ -2,12 +2,7 @@
 
 from __future__ import annotations
 
-import re
-
-_POT_PATTERN = re.compile(
-    r"(?:pot|total)\s*:?\s*[\$]?(?P<amount>[\d,]+(?:\.\d{1,2})?)",
-    re.IGNORECASE,
-)
+from bbs_converter.parser.lexer import lex_table
 
 
 def parse_pot(text: str) -> float | None:
@@ -16,6 +11,10 @@ def parse_pot(text: str) -> float | None:
     Looks for patterns like ``Pot: 350``, ``Total $1,200``,
     or ``Pot 500.50``.
 
+    Calling several ``parse_*`` helpers on the same text lexes it once;
+    to read a whole table use
+    :func:`~bbs_converter.parser.assembler.assemble_table_state`.
+
     Parameters
     ----------
     text:
@@ -26,7 +25,4 @@ def parse_pot(text: str) -> float | None:
     float or None
         The pot size if found, otherwise ``None``.
     """
-    match = _POT_PATTERN.search(text)
-    if match is None:
-        return None
-    return float(match.group("amount").replace(",", ""))
+    return lex_table(text).pot
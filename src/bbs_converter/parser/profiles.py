@@ -0,0 +1,180 @@
+"""Per-site parsing profiles read from config.
+
+Poker clients label and format the same table differently: ``Blinds``
+or ``Stakes``, ``1,250.50`` or ``1.250,50``, ``$`` or ``€``, ``12.5k``.
+A :class:`SiteProfile` describes one client's conventions and is
+compiled into a :class:`~bbs_converter.parser.lexer.TableLexer` once,
+via :func:`~bbs_converter.parser.lexer.lexer_for`.
+
+Profiles live in config under ``[parser.profiles.<site>]``::
+
+    [parser.profiles.unibet]
+    blind_labels = ["stakes"]
+    pot_labels = ["pot", "main pot"]
+    keywords = ["fold", "check", "call", "raise", "bet", "all-in"]
+    currency = ["€"]
+    thousands_separator = "."
+    decimal_separator = ","
+    suffixes = { k = 1000, m = 1000000 }
+
+Missing keys keep the values of the built-in ``default`` profile.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from bbs_converter.utils.constants import (
+    AMOUNT_SUFFIXES,
+    BLIND_LABELS,
+    CURRENCY_SYMBOLS,
+    DEFAULT_PARSER_SITE,
+    POT_LABELS,
+    SEAT_LABELS,
+    TABLE_KEYWORDS,
+)
+from bbs_converter.utils.exceptions import ConfigError
+
+
+@dataclass(frozen=True)
+class SiteProfile:
+    """Labels, keywords and number format of one poker client's table text.
+
+    *keywords* are table words that must never be read as player names;
+    the labels are added to them automatically.  *suffixes* maps a
+    letter written after an amount to its multiplier.
+    """
+
+    name: str = DEFAULT_PARSER_SITE
+    blind_labels: tuple[str, ...] = BLIND_LABELS
+    pot_labels: tuple[str, ...] = POT_LABELS
+    seat_labels: tuple[str, ...] = SEAT_LABELS
+    keywords: tuple[str, ...] = TABLE_KEYWORDS
+    currency: tuple[str, ...] = CURRENCY_SYMBOLS
+    thousands_separator: str = ","
+    decimal_separator: str = "."
+    suffixes: tuple[tuple[str, float], ...] = AMOUNT_SUFFIXES
+
+    def __post_init__(self) -> None:
+        for key in ("blind_labels", "pot_labels", "seat_labels"):
+            labels = getattr(self, key)
+            if not labels or not all(label.strip() for label in labels):
+                raise ConfigError(f"Profile {self.name!r}: {key} must not be empty")
+        if len(self.decimal_separator) != 1 or self.decimal_separator.isalnum():
+            raise ConfigError(
+                f"Profile {self.name!r}: decimal separator must be one symbol, "
+                f"got {self.decimal_separator!r}"
+            )
+        if len(self.thousands_separator) > 1 or self.thousands_separator.isalnum():
+            raise ConfigError(
+                f"Profile {self.name!r}: thousands separator must be one symbol "
+                f"or empty, got {self.thousands_separator!r}"
+            )
+        if self.thousands_separator == self.decimal_separator:
+            raise ConfigError(
+                f"Profile {self.name!r}: thousands and decimal separators are both "
+                f"{self.decimal_separator!r}"
+            )
+        for letter, multiplier in self.suffixes:
+            if len(letter) != 1 or not letter.isalpha() or multiplier <= 0:
+                raise ConfigError(
+                    f"Profile {self.name!r}: invalid amount suffix "
+                    f"{letter!r} = {multiplier}"
+                )
+
+    @property
+    def table_words(self) -> frozenset[str]:
+        """Lower-cased keywords and labels, none of which is a player name."""
+        return frozenset(
+            word.lower() for word in (
+                *self.keywords, *self.blind_labels,
+                *self.pot_labels, *self.seat_labels,
+            )
+        )
+
+    @classmethod
+    def from_config(cls, name: str, section: Mapping[str, Any]) -> SiteProfile:
+        """Build a profile from a ``[parser.profiles.<name>]`` section.
+
+        Raises
+        ------
+        ConfigError
+            If a key is unknown or a value is invalid.
+        """
+        unknown = set(section) - _CONFIG_KEYS
+        if unknown:
+            raise ConfigError(
+                f"Profile {name!r}: unknown keys {', '.join(sorted(unknown))}"
+            )
+        values: dict[str, Any] = {}
+        string_lists = (
+            "blind_labels", "pot_labels", "seat_labels", "keywords", "currency",
+        )
+        for key in string_lists:
+            if key in section:
+                values[key] = _strings(name, key, section[key])
+        for key in ("thousands_separator", "decimal_separator"):
+            if key in section:
+                values[key] = str(section[key])
+        if "suffixes" in section:
+            try:
+                values["suffixes"] = tuple(
+                    (str(letter).lower(), float(multiplier))
+                    for letter, multiplier in dict(section["suffixes"]).items()
+                )
+            except (TypeError, ValueError) as exc:
+                raise ConfigError(f"Profile {name!r}: invalid suffixes: {exc}") from exc
+        return cls(name=name, **values)
+
+
+_CONFIG_KEYS = frozenset({
+    "blind_labels", "pot_labels", "seat_labels", "keywords", "currency",
+    "thousands_separator", "decimal_separator", "suffixes",
+})
+
+
+def _strings(profile: str, key: str, value: Any) -> tuple[str, ...]:
+    if isinstance(value, str) or not isinstance(value, Sequence):
+        raise ConfigError(f"Profile {profile!r}: {key} must be a list of strings")
+    return tuple(str(item) for item in value)
+
+
+DEFAULT_PROFILE = SiteProfile()
+
+
+def load_profiles(section: Mapping[str, Any]) -> dict[str, SiteProfile]:
+    """Return every profile in a ``[parser.profiles]`` section by site name.
+
+    The built-in ``default`` profile is always present unless the
+    section overrides it.
+
+    Raises
+    ------
+    ConfigError
+        If a profile is invalid.
+    """
+    profiles = {DEFAULT_PARSER_SITE: DEFAULT_PROFILE}
+    for name, profile_section in section.items():
+        if not isinstance(profile_section, Mapping):
+            raise ConfigError(f"Profile {name!r} must be a table")
+        profiles[name] = SiteProfile.from_config(name, profile_section)
+    return profiles
+
+
+def select_profile(profiles: Mapping[str, SiteProfile], site: str) -> SiteProfile:
+    """Return the profile of *site*.
+
+    Raises
+    ------
+    ConfigError
+        If there is no profile for *site*.
+    """
+    try:
+        return profiles[site]
+    except KeyError:
+        known = ", ".join(sorted(profiles))
+        raise ConfigError(
+            f"No parser profile for site {site!r} (known: {known})"
+        ) from None
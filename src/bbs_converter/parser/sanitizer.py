@@ -3,15 +3,17 @@
 from __future__ import annotations
 
 from bbs_converter.models import TableState
+from bbs_converter.utils.constants import TABLE_KEYWORDS
 from bbs_converter.utils.exceptions import ParserError
 
-_KEYWORD_NAMES = frozenset({
-    "blinds", "blind", "pot", "total", "seat", "bl",
-    "dealer", "button", "fold", "check", "call", "raise", "bet",
-})
+# The lexer never emits these as names, but a seat name field can still
+# show an action label such as "Fold" in place of the player.
+_KEYWORD_NAMES = frozenset(TABLE_KEYWORDS)
 
 
-def sanitize(state: TableState) -> TableState:
+def sanitize(
+    state: TableState, keywords: frozenset[str] = _KEYWORD_NAMES,
+) -> TableState:
     """Validate and clean a parsed TableState.
 
     Removes stacks whose player names are actually parser keywords
@@ -21,6 +23,8 @@ def sanitize(state: TableState) -> TableState:
     ----------
     state:
         Raw parsed table state.
+    keywords:
+        Lower-cased table words of the site's profile.
 
     Returns
     -------
@@ -43,12 +47,15 @@ def sanitize(state: TableState) -> TableState:
     cleaned_stacks = {
         name: stack
         for name, stack in state.stacks.items()
-        if name.lower() not in _KEYWORD_NAMES and stack >= 0
+        if name.lower() not in keywords and stack >= 0
     }
 
+    players = tuple(p for p in state.players if p.name in cleaned_stacks)
+
     return TableState(
         big_blind=state.big_blind,
         small_blind=state.small_blind,
         pot=state.pot,
         stacks=cleaned_stacks,
+        players=players,
     )
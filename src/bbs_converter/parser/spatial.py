@@ -0,0 +1,219 @@
+"""Assign OCR words to table seats by where they were read.
+
+Pairing names with stacks in flattened text breaks as soon as the OCR
+reads the table in an unexpected order.  With word boxes the seat is
+simply the one whose anchor is nearest: a :class:`SeatTemplate` places
+the anchors of a 2-, 6- or 9-max table, and a :class:`SeatIndex`
+precomputes the nearest seat of every cell of a coarse pixel grid, so
+each word is one array lookup.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+from bbs_converter.models import PlayerInfo
+from bbs_converter.ocr.engine import OCRTokens
+from bbs_converter.parser.confusion import OCRRepair
+from bbs_converter.parser.lexer import TableLexer
+from bbs_converter.utils.constants import (
+    SEAT_GRID_CELL,
+    SEAT_MAX_DISTANCE,
+    SEAT_TEMPLATES,
+)
+from bbs_converter.utils.exceptions import ConfigError
+
+
+@dataclass(frozen=True)
+class SeatTemplate:
+    """Seat anchors of a table, as ``(x, y)`` fractions of its region.
+
+    Seat numbers follow the order of *anchors*, starting at 1.
+    """
+
+    anchors: tuple[tuple[float, float], ...]
+
+    def __post_init__(self) -> None:
+        if not self.anchors:
+            raise ConfigError("A seat template needs at least one anchor")
+        if not all(0 <= x <= 1 and 0 <= y <= 1 for x, y in self.anchors):
+            raise ConfigError("Seat anchors must be fractions of the region (0-1)")
+
+    @classmethod
+    def for_table_size(cls, seats: int) -> SeatTemplate:
+        """Return the built-in template of a *seats*-max table.
+
+        Raises
+        ------
+        ConfigError
+            If there is no template for that size.
+        """
+        try:
+            return cls(SEAT_TEMPLATES[seats])
+        except KeyError:
+            sizes = ", ".join(str(size) for size in sorted(SEAT_TEMPLATES))
+            raise ConfigError(
+                f"No seat template for {seats}-max tables (known: {sizes})"
+            ) from None
+
+    def __len__(self) -> int:
+        return len(self.anchors)
+
+
+class SeatIndex:
+    """Nearest-seat lookup over a region of *width* x *height* pixels.
+
+    Every ``cell`` x ``cell`` block of the region stores the 0-based
+    index of its nearest anchor, or -1 when even that anchor is further
+    than *max_distance* (a share of the region diagonal) away, as the
+    pot and board in the middle of the table usually are.
+
+    Parameters
+    ----------
+    template:
+        Seat anchors.
+    width, height:
+        Region size in pixels.
+    cell:
+        Grid resolution in pixels.
+    max_distance:
+        Distance beyond which a word belongs to no seat.
+    """
+
+    def __init__(
+        self,
+        template: SeatTemplate,
+        width: int,
+        height: int,
+        cell: int = SEAT_GRID_CELL,
+        max_distance: float = SEAT_MAX_DISTANCE,
+    ) -> None:
+        if width <= 0 or height <= 0 or cell <= 0:
+            raise ConfigError(f"Invalid seat grid {width}x{height} / {cell}")
+        self._template = template
+        self._size = (width, height)
+        self._cell = cell
+        self._anchors = np.array(template.anchors, dtype=np.float32) * (width, height)
+
+        xs = (np.arange(math.ceil(width / cell), dtype=np.float32) + 0.5) * cell
+        ys = (np.arange(math.ceil(height / cell), dtype=np.float32) + 0.5) * cell
+        dx = xs[None, :, None] - self._anchors[:, 0]
+        dy = ys[:, None, None] - self._anchors[:, 1]
+        distances = np.hypot(dx, dy)
+        nearest = distances.argmin(axis=2)
+        limit = max_distance * math.hypot(width, height)
+        self._grid = np.where(
+            distances.min(axis=2) <= limit, nearest, -1,
+        ).astype(np.int8)
+
+    @property
+    def template(self) -> SeatTemplate:
+        return self._template
+
+    @property
+    def size(self) -> tuple[int, int]:
+        """``(width, height)`` of the indexed region in pixels."""
+        return self._size
+
+    @property
+    def anchors(self) -> np.ndarray:
+        """``(seats, 2)`` anchor positions in pixels."""
+        return self._anchors
+
+    def lookup(self, points: np.ndarray) -> np.ndarray:
+        """Return the 0-based seat of each ``(x, y)`` row of *points*, or -1."""
+        if not len(points):
+            return np.zeros(0, dtype=np.int8)
+        rows, cols = self._grid.shape
+        cells = np.floor_divide(points, self._cell).astype(np.intp)
+        x = np.clip(cells[:, 0], 0, cols - 1)
+        y = np.clip(cells[:, 1], 0, rows - 1)
+        seats: np.ndarray = self._grid[y, x]
+        return seats
+
+
+def assign_seats(
+    tokens: OCRTokens,
+    index: SeatIndex,
+    lexer: TableLexer,
+    repair: OCRRepair | None = None,
+) -> list[PlayerInfo]:
+    """Build a seat-indexed player list from the words of one read.
+
+    Each word goes to the seat nearest its box centre.  Within a seat,
+    the first word that is neither a table word nor an amount starts the
+    name, joined by the words that follow it on the same text line; the
+    first amount is the stack.  Seats without a name are left out.
+
+    Parameters
+    ----------
+    tokens:
+        Words with boxes in region pixels, in reading order.
+    index:
+        Seat lookup for the region.
+    lexer:
+        Lexer of the site's profile, which knows its amounts and table
+        words.
+    repair:
+        Confusion repair tried on words that do not read as an amount.
+
+    Returns
+    -------
+    list
+        :class:`PlayerInfo` records by seat number, each positioned at
+        the centre of the name; the stack is 0 when none was read.
+    """
+    if not len(tokens):
+        return []
+    seats = index.lookup(tokens.centres)
+    records = tokens.records
+    centres = tokens.centres
+    by_seat: dict[int, list[int]] = {}
+    for i, seat in enumerate(seats.tolist()):
+        if seat >= 0:
+            by_seat.setdefault(seat, []).append(i)
+
+    players = []
+    for seat in sorted(by_seat):
+        name_words: list[int] = []
+        stack: float | None = None
+        for i in by_seat[seat]:
+            text = tokens.texts[i]
+            amount = _amount(text, lexer, repair)
+            if amount is not None:
+                if stack is None:
+                    stack = amount
+            elif text.lower() in lexer.table_words or not text[0].isalpha():
+                continue
+            elif not name_words or _same_line(records, name_words[0], i):
+                name_words.append(i)
+        if not name_words:
+            continue
+        x, y = centres[name_words].mean(axis=0)
+        players.append(PlayerInfo(
+            name=" ".join(tokens.texts[i] for i in name_words),
+            seat=seat + 1,
+            stack=stack or 0.0,
+            position=(int(x), int(y)),
+        ))
+    return players
+
+
+def _amount(
+    text: str, lexer: TableLexer, repair: OCRRepair | None,
+) -> float | None:
+    amount = lexer.parse_amount_word(text)
+    if amount is None and repair is not None and any(c.isdigit() for c in text):
+        amount = lexer.parse_amount_word(repair.repair(text))
+    return amount
+
+
+def _same_line(records: np.ndarray, a: int, b: int) -> bool:
+    return bool(
+        records["block"][a] == records["block"][b]
+        and records["line"][a] == records["line"][b]
+    )
+
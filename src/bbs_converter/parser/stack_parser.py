@@ -2,18 +2,19 @@
 
 from __future__ import annotations
 
-import re
-
-_STACK_PATTERN = re.compile(
-    r"(?P<name>[A-Za-z]\w*)\s*[\$:]?\s*(?P<amount>[\d,]+(?:\.\d{1,2})?)",
-)
+from bbs_converter.parser.lexer import lex_table
 
 
 def parse_stacks(text: str) -> dict[str, float]:
     """Extract player-name → chip-stack mappings from raw OCR text.
 
     Looks for patterns like ``Alice 5,000``, ``Bob: $3200``,
-    or ``Carol 1234.56``.
+    or ``Carol 1234.56``.  Table words such as ``Pot 350`` are not
+    taken for player names.
+
+    Calling several ``parse_*`` helpers on the same text lexes it once;
+    to read a whole table use
+    :func:`~bbs_converter.parser.assembler.assemble_table_state`.
 
     Parameters
     ----------
@@ -25,9 +26,4 @@ def parse_stacks(text: str) -> dict[str, float]:
     dict
         Mapping of player names to chip amounts.
     """
-    stacks: dict[str, float] = {}
-    for match in _STACK_PATTERN.finditer(text):
-        name = match.group("name")
-        raw_amount = match.group("amount").replace(",", "")
-        stacks[name] = float(raw_amount)
-    return stacks
+    return dict(lex_table(text).stacks)
@@ -0,0 +1,420 @@
+"""Per-table processing lane: OCR → parse → convert for one region."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import replace
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from bbs_converter.capture.frame_buffer import LatestFrameBuffer
+from bbs_converter.cli.status import PipelineStats
+from bbs_converter.models import BBState, CaptureRegion, FrameEnvelope
+from bbs_converter.ocr.engine import NO_TOKENS, OCRTokens
+from bbs_converter.ocr.glyph import GlyphBank
+from bbs_converter.ocr.layout import TableLayout
+from bbs_converter.ocr.pipeline import OCRPipeline
+from bbs_converter.ocr.preprocess_chain import PreprocessConfig
+from bbs_converter.ocr.result_cache import OCRResultCache
+from bbs_converter.parser.memo import ParseMemo
+from bbs_converter.parser.profiles import DEFAULT_PROFILE, SiteProfile
+from bbs_converter.parser.spatial import SeatIndex, SeatTemplate
+from bbs_converter.utils.constants import (
+    DEFAULT_BUFFER_MAX_BYTES,
+    DEFAULT_CONFIDENCE_THRESHOLD,
+    DEFAULT_OCR_ENGINE,
+    DEFAULT_PSM,
+    PARSE_MEMO_MAX_ENTRIES,
+    TESSERACT_POOL_SIZE,
+    OCREngine,
+)
+from bbs_converter.utils.exceptions import OCRError, ParserError, PipelineError
+from bbs_converter.utils.logger import get_logger
+
+_log = get_logger("pipeline.lane")
+
+_OCR_CYCLE_SMOOTHING = 0.2  # EMA weight of the newest OCR cycle time
+
+if TYPE_CHECKING:
+    # OCR output for one frame: whole-frame text or text per layout field,
+    # the mean confidence and, for whole-frame reads, the words with their
+    # boxes.  Annotation-only: a runtime ``|`` union needs Python 3.10.
+    Reading = tuple[str | dict[str, str], float, OCRTokens]
+
+
+def read_frame(
+    ocr: OCRPipeline, frame: np.ndarray, layout: TableLayout | None,
+) -> Reading | None:
+    """OCR *frame* as a whole, or field by field when *layout* is set.
+
+    Returns the text (per field with a layout), its confidence and the
+    words read from the whole frame, or None if nothing confident was
+    read.
+
+    Raises
+    ------
+    OCRError
+        If the engine fails.
+    """
+    if layout is None:
+        result = ocr.process(frame)
+        if result is None:
+            return None
+        return result.text, result.confidence, result.tokens
+    fields = ocr.process_fields(frame, layout)
+    if not fields:
+        return None
+    confidence = sum(r.confidence for r in fields.values()) / len(fields)
+    return {name: r.text for name, r in fields.items()}, confidence, NO_TOKENS
+
+
+class TableLane:
+    """Turns one table's captured frames into its latest :class:`BBState`.
+
+    The lane owns the table's latest-frame buffer, OCR pipeline,
+    statistics and published state, so several tables can be processed
+    independently behind a shared capture loop.
+
+    Parameters
+    ----------
+    region:
+        Screen region of the table.
+    confidence_threshold:
+        OCR confidence threshold.
+    buffer_max_bytes:
+        Memory budget the lane's frame buffer reports against; it is
+        monitored, not enforced (see :class:`LatestFrameBuffer`).
+    frame_deadline:
+        Maximum frame age in seconds; older frames are dropped before
+        OCR.  ``None`` disables the check.
+    name:
+        Lane name for logging and worker threads.
+    ocr_engine:
+        OCR backend for the lane's pipeline.
+    ocr_pool_size:
+        Warm instances when *ocr_engine* is a Tesseract pool.
+    layout:
+        Field layout to OCR crop by crop.  ``None`` OCRs the whole
+        region as one line of text.
+    result_cache:
+        OCR result cache, usually shared with the other lanes.
+    glyph_bank:
+        Glyph templates when *ocr_engine* is :attr:`OCREngine.GLYPH`.
+    ocr_batch_fields:
+        Read changed layout fields in one mosaic per whitelist.
+    preprocess:
+        Preprocessing step order and parameters.
+    ocr_psm:
+        Page segmentation mode for whole-region reads.
+    parse_memo_size:
+        Parsed readings remembered, so repeated text is not re-parsed.
+    parser_profile:
+        Labels and number format of the site's table text.
+    seat_template:
+        Seat layout to place players by their word boxes in whole-frame
+        reads; None pairs names and stacks by text order only.  Word
+        boxes are in frame pixels, so the seat index is built from the
+        first frame's size, and positions are scaled back to region
+        points on the returned states.
+    on_ocr_failure:
+        Called after a frame's OCR raised, e.g. to have capture hand
+        over the next frame even if it is a duplicate.
+    local_ocr:
+        Build the lane's own OCR pipeline.  False when frames are read
+        elsewhere, e.g. by an :class:`OCRProcessPool`, and only their
+        readings reach :meth:`complete`; :meth:`process` then raises.
+    """
+
+    def __init__(
+        self,
+        region: CaptureRegion,
+        confidence_threshold: float = DEFAULT_CONFIDENCE_THRESHOLD,
+        buffer_max_bytes: int | None = DEFAULT_BUFFER_MAX_BYTES,
+        frame_deadline: float | None = None,
+        name: str = "",
+        ocr_engine: OCREngine = DEFAULT_OCR_ENGINE,
+        ocr_pool_size: int = TESSERACT_POOL_SIZE,
+        layout: TableLayout | None = None,
+        result_cache: OCRResultCache | None = None,
+        glyph_bank: GlyphBank | None = None,
+        ocr_batch_fields: bool = False,
+        preprocess: PreprocessConfig | None = None,
+        ocr_psm: int = DEFAULT_PSM,
+        parse_memo_size: int = PARSE_MEMO_MAX_ENTRIES,
+        parser_profile: SiteProfile = DEFAULT_PROFILE,
+        seat_template: SeatTemplate | None = None,
+        on_ocr_failure: Callable[[], None] | None = None,
+        local_ocr: bool = True,
+    ) -> None:
+        self._region = region
+        self._on_ocr_failure = on_ocr_failure
+        self._layout = layout
+        self._name = name or f"lane@{region.x},{region.y}"
+        self._frame_deadline = frame_deadline
+        self._buffer = LatestFrameBuffer(max_bytes=buffer_max_bytes)
+        self._ocr: OCRPipeline | None = None
+        if local_ocr:
+            self._ocr = OCRPipeline(
+                confidence_threshold=confidence_threshold,
+                engine=ocr_engine,
+                pool_size=ocr_pool_size,
+                result_cache=result_cache,
+                glyph_bank=glyph_bank,
+                batch_fields=ocr_batch_fields,
+                preprocess=preprocess,
+                psm=ocr_psm,
+            )
+        self._parse_memo_size = parse_memo_size
+        self._seat_template = seat_template
+        self._seat_index: SeatIndex | None = None  # built on the first frame
+        self._parse_memo = ParseMemo(parse_memo_size, parser_profile)
+        self._earlier_repairs = 0  # by memos replaced earlier
+        self._stats = PipelineStats()
+        self._readings = 0  # frames that reached the parser
+        self._ocr_cycle_ema: float | None = None
+        self._latest_state: BBState | None = None
+        self._last_parsed: BBState | None = None
+        self._last_stamped: BBState | None = None
+        self._state_lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def region(self) -> CaptureRegion:
+        return self._region
+
+    @property
+    def layout(self) -> TableLayout | None:
+        return self._layout
+
+    @property
+    def buffer(self) -> LatestFrameBuffer:
+        return self._buffer
+
+    @property
+    def ocr(self) -> OCRPipeline | None:
+        """The lane's OCR pipeline; None when built without *local_ocr*."""
+        return self._ocr
+
+    @property
+    def parse_memo(self) -> ParseMemo:
+        return self._parse_memo
+
+    @property
+    def parser_profile(self) -> SiteProfile:
+        return self._parse_memo.profile
+
+    def set_parser_profile(self, profile: SiteProfile) -> None:
+        """Parse subsequent readings with *profile*.
+
+        The parse memo starts empty, since the same text may read
+        differently under another profile.
+        """
+        if profile == self._parse_memo.profile:
+            return
+        self._replace_memo(profile)
+
+    @property
+    def ocr_fps(self) -> float:
+        """Smoothed OCR throughput in frames per second (0 if unknown)."""
+        if not self._ocr_cycle_ema:
+            return 0.0
+        return 1.0 / self._ocr_cycle_ema
+
+    @property
+    def stats(self) -> PipelineStats:
+        """Return lane statistics, refreshing buffer and cache figures."""
+        buffer_stats = self._buffer.stats
+        if self._ocr is not None:
+            self._stats.cache_hit_rate = self._ocr.cache_hit_rate
+            self._stats.preprocess_ms = self._ocr.preprocess_timings
+            result_cache = self._ocr.result_cache
+            if result_cache is not None:
+                self._stats.result_cache_hit_rate = result_cache.hit_rate
+            health = self._ocr.engine_health
+            if health is not None:
+                self._stats.ocr_restarts = health.restarts
+                self._stats.ocr_engine_healthy = health.healthy
+        self._stats.parse_memo_hit_rate = self._parse_memo.hit_rate
+        self._stats.parse_repairs = self._earlier_repairs + self._parse_memo.repairs
+        if self._readings:
+            self._stats.parse_failure_rate = (
+                self._stats.parse_errors / self._readings * 100
+            )
+        self._stats.buffer_bytes = buffer_stats.live_bytes
+        self._stats.buffer_high_water_bytes = buffer_stats.high_water_bytes
+        self._stats.buffer_drops = buffer_stats.drops
+        return self._stats
+
+    def latest_state(self) -> BBState | None:
+        with self._state_lock:
+            return self._latest_state
+
+    def publish(self, state: BBState) -> None:
+        with self._state_lock:
+            self._latest_state = state
+
+    def process(self, envelope: FrameEnvelope) -> BBState | None:
+        """Run one frame through OCR, parsing and conversion.
+
+        Returns
+        -------
+        BBState or None
+            The converted state stamped with the frame's sequence number
+            and capture time, or None if the frame was stale, unreadable
+            or unparseable.
+
+        Raises
+        ------
+        PipelineError
+            If the lane was built without *local_ocr*.
+        """
+        if self._ocr is None:
+            raise PipelineError(f"Lane {self._name} has no local OCR pipeline")
+        if not self.admit(envelope):
+            return None
+
+        # OCR
+        ocr_start = time.perf_counter()
+        try:
+            reading = read_frame(self._ocr, envelope.frame, self._layout)
+        except OCRError as exc:
+            self.record_ocr_failure(exc, time.perf_counter() - ocr_start)
+            return None
+        return self.complete(envelope, reading, time.perf_counter() - ocr_start)
+
+    def admit(self, envelope: FrameEnvelope) -> bool:
+        """Return False, counting the frame as stale, if it is past its deadline.
+
+        A frame whose pooled slot was already released is stale too.
+        """
+        if envelope.released or (
+            self._frame_deadline is not None
+            and envelope.age() > self._frame_deadline
+        ):
+            self._stats.stale_frames += 1
+            return False
+        return True
+
+    def record_ocr_failure(self, exc: Exception, ocr_seconds: float) -> None:
+        """Count a frame whose OCR raised *exc*."""
+        self._record_ocr_cycle(ocr_seconds)
+        self._stats.ocr_errors += 1
+        _log.debug("OCR failed: %s", exc)
+        if self._on_ocr_failure is not None:
+            self._on_ocr_failure()
+
+    def complete(
+        self,
+        envelope: FrameEnvelope,
+        reading: Reading | None,
+        ocr_seconds: float,
+    ) -> BBState | None:
+        """Parse and convert an OCR *reading* of *envelope*'s frame.
+
+        Split from :meth:`process` so OCR can run elsewhere, e.g. in a
+        worker process, while parsing stays with the lane.  When the
+        table has not changed since the previous frame, the previously
+        returned state object is returned again.
+        """
+        stats = self._stats
+        self._record_ocr_cycle(ocr_seconds)
+        stats.frames_processed += 1
+        if reading is None:
+            return None
+        text, stats.ocr_confidence, tokens = reading
+        self._readings += 1
+        self._ensure_seat_index(envelope.frame)
+
+        # Parse and convert; a repeated reading returns the memoised states
+        try:
+            _, converted = self._parse_memo.parse(text, tokens)
+        except ParserError:
+            stats.parse_errors += 1
+            _log.debug("Parse failed for: %s", str(text)[:80])
+            return None
+
+        # Stamp with the frame the state was first read from.  An
+        # unchanged table returns the last stamped object itself, so
+        # consumers can skip it by identity.
+        stats.latency_ms = envelope.age() * 1000
+        if converted is self._last_parsed and self._last_stamped is not None:
+            stats.unchanged_frames += 1
+            return self._last_stamped
+        bb_state = replace(
+            converted,
+            frame_seq=envelope.seq,
+            captured_at=envelope.captured_at,
+            positions=self._region_positions(converted.positions),
+        )
+        self._last_parsed, self._last_stamped = converted, bb_state
+        return bb_state
+
+    def run(
+        self,
+        stop_event: threading.Event,
+        on_cycle: Callable[[TableLane], None] | None = None,
+    ) -> None:
+        """Process frames from the lane's buffer until *stop_event* is set.
+
+        *on_cycle* is invoked after every processed frame, e.g. to feed
+        throughput back to capture pacing.
+        """
+        while not stop_event.is_set():
+            envelope = self._buffer.get(timeout=0.1)
+            if envelope is None:
+                continue
+            bb_state = self.process(envelope)
+            if on_cycle is not None:
+                on_cycle(self)
+            if bb_state is not None and bb_state is not self._latest_state:
+                self.publish(bb_state)
+
+    def _record_ocr_cycle(self, seconds: float) -> None:
+        if self._ocr_cycle_ema is None:
+            self._ocr_cycle_ema = seconds
+        else:
+            delta = seconds - self._ocr_cycle_ema
+            self._ocr_cycle_ema += _OCR_CYCLE_SMOOTHING * delta
+
+    def _replace_memo(self, profile: SiteProfile) -> None:
+        self._earlier_repairs += self._parse_memo.repairs
+        self._parse_memo = ParseMemo(
+            self._parse_memo_size, profile, self._seat_index,
+        )
+
+    def _ensure_seat_index(self, frame: np.ndarray) -> None:
+        """Index the seat template over *frame*'s size in pixels.
+
+        Built on the first frame and again if the frame size changes,
+        e.g. when the display scale does.  The memo is replaced along
+        with it, since its entries hold seats of the old index.
+        """
+        if self._seat_template is None:
+            return
+        height, width = frame.shape[:2]
+        index = self._seat_index
+        if index is not None and index.size == (width, height):
+            return
+        self._seat_index = SeatIndex(self._seat_template, width, height)
+        self._replace_memo(self._parse_memo.profile)
+
+    def _region_positions(
+        self, positions: dict[str, tuple[int, int]],
+    ) -> dict[str, tuple[int, int]]:
+        """Scale *positions* from frame pixels to capture-region points."""
+        index = self._seat_index
+        if not positions or index is None:
+            return positions
+        width, height = index.size
+        sx = self._region.width / width
+        sy = self._region.height / height
+        return {
+            name: (round(x * sx), round(y * sy))
+            for name, (x, y) in positions.items()
+        }
@@ -0,0 +1,237 @@
+"""Orchestrate several tables behind one shared capture loop."""
+
+from __future__ import annotations
+
+import functools
+from collections.abc import Sequence
+
+from bbs_converter.capture.monitor import MonitorInfo
+from bbs_converter.capture.multi import MultiRegionCapture
+from bbs_converter.cli.status import PipelineStats
+from bbs_converter.models import BBState, CaptureRegion
+from bbs_converter.ocr.glyph import GlyphBank
+from bbs_converter.ocr.layout import TableLayout
+from bbs_converter.ocr.preprocess_chain import PreprocessConfig
+from bbs_converter.ocr.result_cache import OCRResultCache
+from bbs_converter.overlay.loop import OverlayLoop
+from bbs_converter.parser.profiles import DEFAULT_PROFILE, SiteProfile
+from bbs_converter.parser.spatial import SeatTemplate
+from bbs_converter.pipeline.lane import TableLane
+from bbs_converter.pipeline.thread_pool import ThreadPool
+from bbs_converter.utils.constants import (
+    DEFAULT_BUFFER_MAX_BYTES,
+    DEFAULT_CONFIDENCE_THRESHOLD,
+    DEFAULT_FPS,
+    DEFAULT_IDLE_FPS,
+    DEFAULT_OCR_ENGINE,
+    DEFAULT_PSM,
+    TESSERACT_POOL_SIZE,
+    OCREngine,
+    OverrunPolicy,
+)
+from bbs_converter.utils.logger import get_logger
+
+_log = get_logger("pipeline.multi_table")
+
+
+class MultiTableOrchestrator:
+    """Capture many tables with one grab loop and process each in its lane.
+
+    Parameters
+    ----------
+    regions:
+        Screen region of each table.
+    fps:
+        Target capture FPS.
+    confidence_threshold:
+        OCR confidence threshold.
+    buffer_max_bytes:
+        Memory budget each lane's frame buffer reports against;
+        monitored, not enforced.
+    frame_deadline:
+        Maximum frame age in seconds before a lane drops it.
+    monitors:
+        If given, grab once per monitor instead of one bounding box.
+    dedupe:
+        Skip tables whose pixels did not change.
+    adaptive_fps:
+        Let the capture rate follow table activity and OCR throughput.
+    idle_fps:
+        Capture-rate floor in adaptive mode.
+    capture_spin:
+        Busy-wait the last millisecond before each capture deadline.
+    overrun_policy:
+        How capture pacing reschedules after a missed deadline.
+    ocr_engine:
+        OCR backend used by every lane.
+    ocr_pool_size:
+        Warm instances when *ocr_engine* is a Tesseract pool.
+    layout:
+        Field layout for per-field OCR of every table; ``None`` OCRs the whole region.
+    result_cache:
+        OCR result cache shared by every lane; saved on :meth:`stop`.
+    glyph_bank:
+        Glyph templates shared by every lane; saved on :meth:`stop`.
+    ocr_batch_fields:
+        Read changed layout fields in one mosaic per whitelist.
+    preprocess:
+        Preprocessing step order and parameters.
+    ocr_psm:
+        Page segmentation mode for whole-region reads.
+    parser_profile:
+        Labels and number format of the site's table text.
+    seat_template:
+        Seat layout to place players by their word boxes; None pairs
+        names and stacks by text order only.
+    """
+
+    def __init__(
+        self,
+        regions: Sequence[CaptureRegion],
+        fps: int = DEFAULT_FPS,
+        confidence_threshold: float = DEFAULT_CONFIDENCE_THRESHOLD,
+        buffer_max_bytes: int | None = DEFAULT_BUFFER_MAX_BYTES,
+        frame_deadline: float | None = None,
+        monitors: Sequence[MonitorInfo] | None = None,
+        dedupe: bool = True,
+        adaptive_fps: bool = False,
+        idle_fps: float = DEFAULT_IDLE_FPS,
+        capture_spin: bool = False,
+        overrun_policy: OverrunPolicy = OverrunPolicy.SKIP,
+        ocr_engine: OCREngine = DEFAULT_OCR_ENGINE,
+        ocr_pool_size: int = TESSERACT_POOL_SIZE,
+        layout: TableLayout | None = None,
+        result_cache: OCRResultCache | None = None,
+        glyph_bank: GlyphBank | None = None,
+        ocr_batch_fields: bool = False,
+        preprocess: PreprocessConfig | None = None,
+        ocr_psm: int = DEFAULT_PSM,
+        parser_profile: SiteProfile = DEFAULT_PROFILE,
+        seat_template: SeatTemplate | None = None,
+    ) -> None:
+        self._lanes = [
+            TableLane(
+                region,
+                confidence_threshold=confidence_threshold,
+                buffer_max_bytes=buffer_max_bytes,
+                frame_deadline=frame_deadline,
+                name=f"lane-{index}",
+                ocr_engine=ocr_engine,
+                ocr_pool_size=ocr_pool_size,
+                layout=layout,
+                result_cache=result_cache,
+                glyph_bank=glyph_bank,
+                ocr_batch_fields=ocr_batch_fields,
+                preprocess=preprocess,
+                ocr_psm=ocr_psm,
+                parser_profile=parser_profile,
+                seat_template=seat_template,
+                on_ocr_failure=functools.partial(self._readmit_frame, index),
+            )
+            for index, region in enumerate(regions)
+        ]
+        self._capture = MultiRegionCapture(
+            regions,
+            [lane.buffer for lane in self._lanes],
+            fps=fps,
+            monitors=monitors,
+            dedupe=dedupe,
+            adaptive=adaptive_fps,
+            idle_fps=idle_fps,
+            spin=capture_spin,
+            overrun_policy=overrun_policy,
+        )
+        self._workers = ThreadPool({
+            lane.name: functools.partial(self._run_lane, lane)
+            for lane in self._lanes
+        })
+        self._result_cache = result_cache
+        self._glyph_bank = glyph_bank
+        self._running = False
+        self._overlay: OverlayLoop | None = None
+
+    def start(self) -> None:
+        """Start the shared capture thread and one worker per lane.
+
+        As with :class:`PipelineOrchestrator`, the overlay is not
+        started here: call :meth:`run_overlay` on the main thread, or
+        :meth:`start_overlay`, to show one window over each table.
+        """
+        _log.info("Starting %d-table pipeline...", len(self._lanes))
+        self._capture.start()
+        self._workers.start()
+        self._running = True
+        self._overlay = OverlayLoop.for_tables(
+            [(lane.region, lane.latest_state) for lane in self._lanes],
+            refresh_hz=15,
+        )
+
+    def run_overlay(self) -> None:
+        """Run the overlay loop on the calling thread (blocking)."""
+        if self._overlay is None:
+            return
+        self._overlay.run_forever()
+
+    def start_overlay(self) -> None:
+        """Start the overlay in a background thread (not on macOS)."""
+        if self._overlay is None:
+            return
+        self._overlay.start()
+
+    def stop(self) -> None:
+        """Stop capture and every lane."""
+        _log.info("Stopping multi-table pipeline...")
+        self._running = False
+        if self._overlay is not None:
+            self._overlay.stop()
+        self._workers.stop(timeout=3.0)
+        self._capture.stop()
+        for lane in self._lanes:
+            if lane.ocr is not None:
+                lane.ocr.close()
+        if self._result_cache is not None:
+            self._result_cache.save()
+        if self._glyph_bank is not None:
+            self._glyph_bank.save()
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    @property
+    def table_count(self) -> int:
+        return len(self._lanes)
+
+    @property
+    def lanes(self) -> list[TableLane]:
+        return list(self._lanes)
+
+    def latest_state(self, index: int) -> BBState | None:
+        """Return the latest published state of table *index*."""
+        return self._lanes[index].latest_state()
+
+    def latest_states(self) -> list[BBState | None]:
+        """Return the latest state of every table, in region order."""
+        return [lane.latest_state() for lane in self._lanes]
+
+    def stats(self, index: int) -> PipelineStats:
+        """Return statistics for table *index*, including shared capture."""
+        stats = self._lanes[index].stats
+        timing = self._capture.timing_stats
+        stats.capture_fps = self._capture.actual_fps
+        stats.capture_duplicate_rate = self._capture.duplicate_rate
+        stats.capture_interval_p95_ms = timing.p95_ms
+        stats.capture_overruns = timing.overruns
+        return stats
+
+    def _readmit_frame(self, index: int) -> None:
+        self._capture.readmit(index)
+
+    def _run_lane(self, lane: TableLane) -> None:
+        lane.run(self._workers.stop_event, on_cycle=self._report_throughput)
+
+    def _report_throughput(self, lane: TableLane) -> None:
+        # The shared loop only needs to keep up with the fastest lane.
+        self._capture.report_downstream_fps(
+            max(other.ocr_fps for other in self._lanes)
+        )
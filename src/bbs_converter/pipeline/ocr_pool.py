@@ -0,0 +1,419 @@
+"""Process-pool OCR stage with shared-memory frame hand-off.
+
+Recognition is CPU-bound and holds the GIL for much of its Python-side
+work, so a single processing thread caps one table at about one core.
+:class:`OCRProcessPool` fans frames out to worker processes instead.
+Frames are never pickled: the pool owns one
+:class:`~multiprocessing.shared_memory.SharedMemory` block split into
+fixed-size slots, sized from the first frame unless given and regrown
+if a larger frame arrives, copies each frame into a free slot and sends
+the worker only the block name, slot offset, shape and dtype.  Only the
+small OCR reading travels back, with the result-cache entries and glyph
+templates the worker learned from the frame, which are merged into the
+parent's cache and bank.  Completed frames are released in submission
+order, so downstream state never goes backwards.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from bbs_converter.models import FrameEnvelope
+from bbs_converter.ocr.engine import OCRResult
+from bbs_converter.ocr.glyph import GlyphBank
+from bbs_converter.ocr.layout import TableLayout
+from bbs_converter.ocr.pipeline import OCRPipeline
+from bbs_converter.ocr.preprocess_chain import PreprocessConfig
+from bbs_converter.ocr.result_cache import OCRResultCache
+from bbs_converter.pipeline.lane import read_frame
+from bbs_converter.utils.constants import (
+    DEFAULT_CONFIDENCE_THRESHOLD,
+    DEFAULT_OCR_ENGINE,
+    DEFAULT_PSM,
+    OCR_SLOTS_PER_WORKER,
+    OCREngine,
+)
+from bbs_converter.utils.exceptions import OCRError, PipelineError
+from bbs_converter.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from bbs_converter.pipeline.lane import Reading
+
+_log = get_logger("pipeline.ocr_pool")
+
+
+def ocr_worker_count(requested: int, cpu_budget: int = 0) -> int:
+    """Clamp *requested* OCR workers to the global CPU budget.
+
+    One core of the budget is left for capture and the coordinating
+    threads.  ``cpu_budget`` 0 means every core of the machine.
+    Returns 0 (OCR in-thread) when *requested* is 0.
+    """
+    if requested <= 0:
+        return 0
+    budget = cpu_budget if cpu_budget > 0 else (os.cpu_count() or 1)
+    return max(1, min(requested, budget - 1))
+
+
+# --- worker side -------------------------------------------------------------
+
+_worker_ocr: OCRPipeline | None = None
+_worker_layout: TableLayout | None = None
+_worker_block: SharedMemory | None = None
+_worker_cache: OCRResultCache | None = None
+_worker_bank: GlyphBank | None = None
+_worker_lookups: tuple[int, int] = (0, 0)  # cache hits, misses already sent
+
+
+@dataclass(frozen=True)
+class _Learned:
+    """What a worker added to its copies of the cache and glyph bank."""
+
+    results: list[tuple[str, OCRResult]]
+    glyphs: list[tuple[str, np.ndarray]]
+    hits: int = 0
+    misses: int = 0
+
+
+def _init_worker(
+    engine: OCREngine, lang: str, confidence_threshold: float,
+    layout: TableLayout | None, preprocess: PreprocessConfig | None = None,
+    psm: int = DEFAULT_PSM, pool_size: int = 1,
+    result_cache: OCRResultCache | None = None,
+    glyph_bank: GlyphBank | None = None, batch_fields: bool = False,
+) -> None:
+    global _worker_ocr, _worker_layout, _worker_cache, _worker_bank, _worker_lookups
+    # Keep each worker to one core so the pool stays inside its budget.
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+    # Frames reach workers out of order.  The frame-diff cache and dirty
+    # fields compare a frame with the pixels their results were read
+    # from, not with the previous frame, so they stay on.
+    _worker_ocr = OCRPipeline(
+        confidence_threshold=confidence_threshold,
+        lang=lang,
+        engine=engine,
+        pool_size=pool_size,
+        result_cache=result_cache,
+        glyph_bank=glyph_bank,
+        batch_fields=batch_fields,
+        preprocess=preprocess,
+        psm=psm,
+    )
+    _worker_layout = layout
+    _worker_cache, _worker_bank = result_cache, glyph_bank
+    if result_cache is not None:
+        _worker_lookups = result_cache.hits, result_cache.misses
+    if result_cache is not None:
+        result_cache.track_additions()
+    if glyph_bank is not None:
+        glyph_bank.track_additions()
+
+
+def _take_learned() -> _Learned:
+    global _worker_lookups
+    glyphs = _worker_bank.take_additions() if _worker_bank is not None else []
+    if _worker_cache is None:
+        return _Learned([], glyphs)
+    hits, misses = _worker_cache.hits, _worker_cache.misses
+    reported_hits, reported_misses = _worker_lookups
+    _worker_lookups = hits, misses
+    return _Learned(
+        _worker_cache.take_additions(), glyphs,
+        hits - reported_hits, misses - reported_misses,
+    )
+
+
+def _attach(name: str) -> SharedMemory:
+    """Return the worker's mapping of block *name*, reattaching if it changed."""
+    global _worker_block
+    if _worker_block is None or _worker_block.name != name:
+        if _worker_block is not None:
+            _worker_block.close()
+        _worker_block = SharedMemory(name=name)
+    return _worker_block
+
+
+def _ocr_slot(
+    name: str, offset: int, shape: tuple[int, ...], dtype: str,
+) -> tuple[Reading | None, float, _Learned]:
+    """Worker task: OCR the frame stored at *offset* in block *name*."""
+    assert _worker_ocr is not None, "worker not initialised"
+    start = time.perf_counter()
+    block = _attach(name)
+    frame = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf, offset=offset)
+    try:
+        reading = read_frame(_worker_ocr, frame, _worker_layout)
+    finally:
+        del frame  # release the export before the block can be closed
+    return reading, time.perf_counter() - start, _take_learned()
+
+
+# --- parent side -------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class OCROutcome:
+    """A finished frame: its reading, or the error its OCR raised.
+
+    Only the envelope's metadata is meaningful here: a pooled frame is
+    usually :attr:`~FrameEnvelope.released` by now, leaving a blank of
+    the frame's shape.
+    """
+
+    envelope: FrameEnvelope
+    reading: Reading | None
+    ocr_seconds: float
+    error: Exception | None = None
+
+
+class OCRProcessPool:
+    """Run OCR for one table in worker processes.
+
+    Parameters
+    ----------
+    workers:
+        Worker processes; see :func:`ocr_worker_count`.
+    slot_bytes:
+        Initial slot size.  ``None`` sizes the slots from the first
+        submitted frame, which is in physical pixels even when the
+        region was chosen in logical points.  A larger frame later,
+        e.g. after a display-scale change, regrows the block once every
+        slot is free again.
+    engine, lang, confidence_threshold, layout, preprocess, psm:
+        Settings for each worker's :class:`OCRPipeline`.
+    batch_fields:
+        Likewise.  Each single-threaded worker uses one Tesseract
+        instance.
+    result_cache, glyph_bank:
+        Copied into each worker at start-up.  What a worker adds to its
+        copy comes back with each frame and is merged into these, so
+        they can be saved as usual.
+    slots_per_worker:
+        Frames that may be queued or in flight per worker.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        slot_bytes: int | None = None,
+        engine: OCREngine = DEFAULT_OCR_ENGINE,
+        lang: str = "eng",
+        confidence_threshold: float = DEFAULT_CONFIDENCE_THRESHOLD,
+        layout: TableLayout | None = None,
+        preprocess: PreprocessConfig | None = None,
+        psm: int = DEFAULT_PSM,
+        result_cache: OCRResultCache | None = None,
+        glyph_bank: GlyphBank | None = None,
+        batch_fields: bool = False,
+        slots_per_worker: int = OCR_SLOTS_PER_WORKER,
+    ) -> None:
+        if workers < 1:
+            raise PipelineError(f"OCR pool needs at least one worker, got {workers}")
+        self._workers = workers
+        self._result_cache = result_cache
+        self._glyph_bank = glyph_bank
+        self._slots = workers * slots_per_worker
+        self._slot_bytes = slot_bytes
+        self._block: SharedMemory | None = None
+        if slot_bytes is not None:
+            self._block = SharedMemory(create=True, size=slot_bytes * self._slots)
+        self._free: queue.Queue[int] = queue.Queue()
+        for index in range(self._slots):
+            self._free.put(index)
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(
+                engine, lang, confidence_threshold, layout, preprocess, psm,
+                1, result_cache, glyph_bank, batch_fields,
+            ),
+        )
+        self._lock = threading.Condition()
+        self._done: dict[int, OCROutcome] = {}
+        self._next_submit = 0
+        self._next_release = 0
+        self._closed = False
+        _log.info(
+            "OCR process pool ready (%d workers, %d slots)", workers, self._slots,
+        )
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    @property
+    def in_flight(self) -> int:
+        """Frames submitted but not yet released by :meth:`completed`."""
+        with self._lock:
+            return self._next_submit - self._next_release
+
+    def submit(self, envelope: FrameEnvelope, timeout: float | None = None) -> bool:
+        """Copy *envelope*'s frame into a free slot and queue it for OCR.
+
+        Blocks up to *timeout* for a slot, or for every slot when the
+        frame outgrew them and the block must be regrown; returns False
+        if that did not happen in time.  The envelope's lease, if any,
+        can be released as soon as this returns.
+
+        Raises
+        ------
+        PipelineError
+            If the pool is closed.
+        """
+        if self._closed:
+            raise PipelineError("OCR pool is closed")
+        frame = envelope.frame
+        block = self._block
+        if block is None:
+            block = self._allocate(frame.nbytes)
+        elif frame.nbytes > block.size // self._slots:
+            regrown = self._regrow(frame.nbytes, timeout)
+            if regrown is None:
+                return False
+            block = regrown
+        slot_bytes = block.size // self._slots
+        try:
+            slot = self._free.get(timeout=timeout)
+        except queue.Empty:
+            return False
+
+        offset = slot * slot_bytes
+        dst = np.ndarray(
+            frame.shape, dtype=frame.dtype, buffer=block.buf, offset=offset,
+        )
+        np.copyto(dst, frame)
+        del dst
+        with self._lock:
+            seq = self._next_submit
+            self._next_submit += 1
+        try:
+            future = self._executor.submit(
+                _ocr_slot, block.name, offset, frame.shape, frame.dtype.str,
+            )
+        except RuntimeError as exc:  # includes BrokenProcessPool
+            self._free.put(slot)
+            raise PipelineError(f"OCR pool cannot accept work: {exc}") from exc
+        future.add_done_callback(
+            lambda f: self._finish(f, seq, slot, envelope),
+        )
+        return True
+
+    def completed(self) -> Iterator[OCROutcome]:
+        """Yield finished frames in submission order, without blocking."""
+        while True:
+            with self._lock:
+                outcome = self._done.pop(self._next_release, None)
+                if outcome is None:
+                    return
+                self._next_release += 1
+            yield outcome
+
+    def drain(self, timeout: float | None = None) -> Iterator[OCROutcome]:
+        """Wait for every submitted frame and yield the rest in order."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            target = self._next_submit
+        while True:
+            yield from self.completed()
+            with self._lock:
+                if self._next_release >= target:
+                    return
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return
+                self._lock.wait(remaining)
+
+    def close(self) -> None:
+        """Shut the workers down and free the shared block."""
+        if self._closed:
+            return
+        self._closed = True
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        if self._block is not None:
+            self._block.close()
+            self._block.unlink()
+
+    def _allocate(self, frame_bytes: int) -> SharedMemory:
+        """Create the shared block, sizing slots from the first frame."""
+        slot_bytes = max(self._slot_bytes or 0, frame_bytes)
+        self._block = SharedMemory(create=True, size=slot_bytes * self._slots)
+        _log.debug("OCR slots sized to %d bytes", slot_bytes)
+        return self._block
+
+    def _regrow(self, frame_bytes: int, timeout: float | None) -> SharedMemory | None:
+        """Replace the block with one whose slots fit *frame_bytes*.
+
+        Waits up to *timeout* for every slot to be free, so no worker is
+        still reading the old block; returns None if they were not.
+        Workers attach to the new block by name on their next frame.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        taken: list[int] = []
+        try:
+            while len(taken) < self._slots:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return None
+                taken.append(self._free.get(timeout=remaining))
+        except queue.Empty:
+            return None
+        finally:
+            if len(taken) < self._slots:
+                for slot in taken:
+                    self._free.put(slot)
+        old = self._block
+        assert old is not None
+        self._slot_bytes = frame_bytes
+        block = self._allocate(frame_bytes)
+        old.close()
+        old.unlink()
+        for slot in taken:
+            self._free.put(slot)
+        _log.info("Frame grew; OCR slots regrown to %d bytes", frame_bytes)
+        return block
+
+    def _finish(
+        self,
+        future: Future[tuple[Reading | None, float, _Learned]],
+        seq: int,
+        slot: int,
+        envelope: FrameEnvelope,
+    ) -> None:
+        """Executor callback: record the outcome and free the slot."""
+        error = None if future.cancelled() else future.exception()
+        if future.cancelled():
+            outcome = OCROutcome(envelope, None, 0.0, OCRError("OCR cancelled"))
+        elif error is not None:
+            if not isinstance(error, Exception):
+                error = OCRError(f"OCR worker failed: {error!r}")
+            outcome = OCROutcome(envelope, None, 0.0, error)
+        else:
+            reading, seconds, learned = future.result()
+            self._merge(learned)
+            outcome = OCROutcome(envelope, reading, seconds)
+        self._free.put(slot)
+        with self._lock:
+            self._done[seq] = outcome
+            self._lock.notify_all()
+
+    def _merge(self, learned: _Learned) -> None:
+        """Fold a worker's new cache entries, lookups and glyphs into the parent's."""
+        if self._result_cache is not None:
+            for key, result in learned.results:
+                self._result_cache.put(key, result)
+            self._result_cache.record_lookups(learned.hits, learned.misses)
+        if self._glyph_bank is not None:
+            for label, descriptor in learned.glyphs:
+                self._glyph_bank.add(label, descriptor)
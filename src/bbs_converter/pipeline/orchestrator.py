@@ -3,16 +3,39 @@
 from __future__ import annotations
 
 import threading
+import time
+from collections.abc import Iterable, Mapping
 
-from bbs_converter.capture.frame_buffer import FrameBuffer
+from bbs_converter.capture.recorder import SessionRecorder
+from bbs_converter.capture.replay import ReplayGrabber
 from bbs_converter.capture.thread import CaptureThread
-from bbs_converter.converter.batch import convert_table
+from bbs_converter.cli.status import PipelineStats
 from bbs_converter.models import BBState, CaptureRegion
-from bbs_converter.ocr.pipeline import OCRPipeline
+from bbs_converter.ocr.glyph import GlyphBank
+from bbs_converter.ocr.layout import TableLayout
+from bbs_converter.ocr.preprocess_chain import PreprocessConfig
+from bbs_converter.ocr.result_cache import OCRResultCache
 from bbs_converter.overlay.loop import OverlayLoop
-from bbs_converter.parser.assembler import assemble_table_state
-from bbs_converter.parser.sanitizer import sanitize
-from bbs_converter.utils.exceptions import ParserError
+from bbs_converter.parser.profiles import (
+    DEFAULT_PROFILE,
+    SiteProfile,
+    select_profile,
+)
+from bbs_converter.parser.spatial import SeatTemplate
+from bbs_converter.pipeline.lane import TableLane
+from bbs_converter.pipeline.ocr_pool import OCROutcome, OCRProcessPool
+from bbs_converter.utils.constants import (
+    CAPTURE_POOL_SIZE,
+    DEFAULT_BUFFER_MAX_BYTES,
+    DEFAULT_IDLE_FPS,
+    DEFAULT_OCR_ENGINE,
+    DEFAULT_PARSER_SITE,
+    DEFAULT_PSM,
+    TESSERACT_POOL_SIZE,
+    OCREngine,
+    OverrunPolicy,
+)
+from bbs_converter.utils.exceptions import PipelineError
 from bbs_converter.utils.logger import get_logger
 
 _log = get_logger("pipeline.orchestrator")
@@ -29,6 +52,67 @@ class PipelineOrchestrator:
         Target capture FPS.
     confidence_threshold:
         OCR confidence threshold.
+    buffer_max_bytes:
+        Memory budget the capture frame buffer reports against;
+        monitored, not enforced.
+    frame_deadline:
+        Maximum frame age in seconds; older frames are dropped before
+        OCR.  ``None`` disables the check.
+    dedupe:
+        Skip captured frames identical to the previous one.
+    adaptive_fps:
+        Let the capture rate follow table activity and OCR throughput.
+    idle_fps:
+        Capture-rate floor in adaptive mode.
+    capture_spin:
+        Busy-wait the last millisecond before each capture deadline.
+    overrun_policy:
+        How capture pacing reschedules after a missed deadline.
+    capture_pool_size:
+        Preallocated capture slots that frames are grabbed into and
+        handed to processing without a further copy; 0 copies each
+        frame into the frame buffer instead.
+    replay:
+        Recorded frames to process instead of the live screen.  When it
+        is not realtime, every frame is processed and the pipeline runs
+        as fast as OCR allows.
+    recorder:
+        Session recorder that captured frames are teed to; started and
+        closed with the pipeline.
+    ocr_engine:
+        OCR backend to extract text with.
+    ocr_pool_size:
+        Warm instances when *ocr_engine* is a Tesseract pool.  OCR
+        worker processes use one each.
+    layout:
+        Field layout for per-field OCR; ``None`` OCRs the whole region.
+    result_cache:
+        Content-addressed OCR result cache; saved on :meth:`stop`.
+    glyph_bank:
+        Glyph templates for :attr:`OCREngine.GLYPH`; saved on :meth:`stop`.
+    ocr_batch_fields:
+        Read changed layout fields in one mosaic per whitelist.
+    preprocess:
+        Preprocessing step order and parameters.
+    ocr_psm:
+        Page segmentation mode for whole-region reads.
+    ocr_workers:
+        Worker processes for OCR, already clamped to the CPU budget
+        (see :func:`ocr_worker_count`).  0 runs OCR on the processing
+        thread.
+    parser_profiles:
+        Parsing profiles by site name; the built-in default profile
+        only when None.
+    parser_site:
+        Site whose profile parses the table text at start.
+    seat_template:
+        Seat layout to place players by their word boxes; None pairs
+        names and stacks by text order only.
+
+    Raises
+    ------
+    ConfigError
+        If there is no profile for *parser_site*.
     """
 
     def __init__(
@@ -36,13 +120,81 @@ class PipelineOrchestrator:
         region: CaptureRegion,
         fps: int = 30,
         confidence_threshold: float = 60.0,
+        buffer_max_bytes: int | None = DEFAULT_BUFFER_MAX_BYTES,
+        frame_deadline: float | None = None,
+        dedupe: bool = True,
+        adaptive_fps: bool = False,
+        idle_fps: float = DEFAULT_IDLE_FPS,
+        capture_spin: bool = False,
+        overrun_policy: OverrunPolicy = OverrunPolicy.SKIP,
+        capture_pool_size: int = CAPTURE_POOL_SIZE,
+        replay: ReplayGrabber | None = None,
+        recorder: SessionRecorder | None = None,
+        ocr_engine: OCREngine = DEFAULT_OCR_ENGINE,
+        ocr_pool_size: int = TESSERACT_POOL_SIZE,
+        layout: TableLayout | None = None,
+        result_cache: OCRResultCache | None = None,
+        glyph_bank: GlyphBank | None = None,
+        ocr_batch_fields: bool = False,
+        ocr_workers: int = 0,
+        preprocess: PreprocessConfig | None = None,
+        ocr_psm: int = DEFAULT_PSM,
+        parser_profiles: Mapping[str, SiteProfile] | None = None,
+        parser_site: str = DEFAULT_PARSER_SITE,
+        seat_template: SeatTemplate | None = None,
     ) -> None:
         self._region = region
-        self._frame_buffer = FrameBuffer(maxsize=30)
-        self._capture = CaptureThread(region, self._frame_buffer, fps=fps)
-        self._ocr = OCRPipeline(confidence_threshold=confidence_threshold)
-        self._latest_state: BBState | None = None
-        self._state_lock = threading.Lock()
+        self._parser_profiles = dict(
+            parser_profiles or {DEFAULT_PARSER_SITE: DEFAULT_PROFILE},
+        )
+        self._lane = TableLane(
+            region,
+            confidence_threshold=confidence_threshold,
+            buffer_max_bytes=buffer_max_bytes,
+            frame_deadline=frame_deadline,
+            ocr_engine=ocr_engine,
+            ocr_pool_size=ocr_pool_size,
+            layout=layout,
+            result_cache=result_cache,
+            glyph_bank=glyph_bank,
+            ocr_batch_fields=ocr_batch_fields,
+            preprocess=preprocess,
+            ocr_psm=ocr_psm,
+            parser_profile=select_profile(self._parser_profiles, parser_site),
+            seat_template=seat_template,
+            on_ocr_failure=self._readmit_frame,
+            local_ocr=ocr_workers <= 0,
+        )
+        # OCR is far slower than capture, so only the newest frame matters.
+        self._frame_buffer = self._lane.buffer
+        self._ocr = self._lane.ocr
+        self._capture = CaptureThread(
+            region, self._frame_buffer, fps=fps, pool_size=capture_pool_size,
+            dedupe=dedupe,
+            adaptive=adaptive_fps, idle_fps=idle_fps, spin=capture_spin,
+            overrun_policy=overrun_policy, grabber=replay,
+            lossless=replay is not None and not replay.realtime,
+            recorder=recorder,
+        )
+        self._recorder = recorder
+        self._result_cache = result_cache
+        self._glyph_bank = glyph_bank
+        self._ocr_pool: OCRProcessPool | None = None
+        if ocr_workers > 0:
+            # Slots are sized from the first frame, and regrown if it
+            # grows: captures are in physical pixels, which the region's
+            # points undercount on HiDPI screens.
+            self._ocr_pool = OCRProcessPool(
+                ocr_workers,
+                engine=ocr_engine,
+                confidence_threshold=confidence_threshold,
+                layout=layout,
+                preprocess=preprocess,
+                psm=ocr_psm,
+                result_cache=result_cache,
+                glyph_bank=glyph_bank,
+                batch_fields=ocr_batch_fields,
+            )
         self._stop_event = threading.Event()
         self._process_thread: threading.Thread | None = None
         self._overlay: OverlayLoop | None = None
@@ -59,6 +211,8 @@ class PipelineOrchestrator:
         self._stop_event.clear()
 
         # Start capture thread
+        if self._recorder is not None:
+            self._recorder.start()
         self._capture.start()
 
         # Start processing thread
@@ -101,39 +255,131 @@ class PipelineOrchestrator:
         if self._process_thread is not None:
             self._process_thread.join(timeout=3.0)
         self._capture.stop()
+        if self._recorder is not None:
+            self._recorder.close()
+        if self._ocr_pool is not None:
+            self._ocr_pool.close()
+        if self._ocr is not None:
+            self._ocr.close()
+        if self._result_cache is not None:
+            self._result_cache.save()
+        if self._glyph_bank is not None:
+            self._glyph_bank.save()
 
         _log.info("Pipeline stopped")
 
+    def wait_until_exhausted(self, timeout: float | None = None) -> bool:
+        """Block until a replay source has been fully handed to processing.
+
+        Returns once capture has run out of frames and the processing
+        loop has taken the last one; :meth:`stop` then waits for that
+        frame to finish.  Returns False if this has not happened within
+        *timeout* (always the case for live capture).
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if not self._capture.wait(timeout):
+            return False
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        return self._frame_buffer.wait_drained(remaining)
+
     @property
     def running(self) -> bool:
         return not self._stop_event.is_set()
 
+    @property
+    def parser_profiles(self) -> dict[str, SiteProfile]:
+        """Available parsing profiles by site name."""
+        return dict(self._parser_profiles)
+
+    @property
+    def parser_profile(self) -> SiteProfile:
+        """Profile the table text is currently parsed with."""
+        return self._lane.parser_profile
+
+    def select_profile(self, site: str) -> SiteProfile:
+        """Parse table text with the profile of *site* from the next frame on.
+
+        Safe to call while the pipeline runs.
+
+        Raises
+        ------
+        ConfigError
+            If there is no profile for *site*.
+        """
+        profile = select_profile(self._parser_profiles, site)
+        self._lane.set_parser_profile(profile)
+        _log.info("Parsing table text with the %r profile", site)
+        return profile
+
+    @property
+    def stats(self) -> PipelineStats:
+        """Return live statistics, refreshing capture and buffer figures."""
+        stats = self._lane.stats
+        if self._ocr_pool is not None and self._result_cache is not None:
+            # Workers look results up; their counts are merged here.
+            stats.result_cache_hit_rate = self._result_cache.hit_rate
+        stats.capture_fps = self._capture.actual_fps
+        stats.capture_duplicate_rate = self._capture.duplicate_rate
+        capture_timing = self._capture.timing_stats
+        stats.capture_interval_p95_ms = capture_timing.p95_ms
+        stats.capture_overruns = capture_timing.overruns
+        if self._overlay is not None:
+            stats.overlay_interval_p95_ms = self._overlay.timing_stats.p95_ms
+        return stats
+
+    def _readmit_frame(self) -> None:
+        # Duplicates of a frame that failed to read must not be skipped.
+        self._capture.readmit()
+
     def _get_latest_state(self) -> BBState | None:
-        with self._state_lock:
-            return self._latest_state
+        return self._lane.latest_state()
 
     def _process_loop(self) -> None:
         """Main processing loop: grab frame → OCR → parse → convert."""
+        if self._ocr_pool is not None:
+            self._pooled_process_loop(self._ocr_pool)
+            return
         while not self._stop_event.is_set():
-            frame = self._frame_buffer.get(timeout=0.1)
-            if frame is None:
+            envelope = self._frame_buffer.get(timeout=0.1)
+            if envelope is None:
                 continue
 
-            # OCR
-            ocr_result = self._ocr.process(frame)
-            if ocr_result is None:
-                continue
+            bb_state = self._lane.process(envelope)
+            self._capture.report_downstream_fps(self._lane.ocr_fps)
+            if bb_state is not None and bb_state is not self._lane.latest_state():
+                self._lane.publish(bb_state)
 
-            # Parse
-            try:
-                table_state = assemble_table_state(ocr_result.text)
-                table_state = sanitize(table_state)
-            except ParserError:
-                _log.debug("Parse failed for: %s", ocr_result.text[:80])
-                continue
+    def _pooled_process_loop(self, pool: OCRProcessPool) -> None:
+        """Processing loop with OCR farmed out to worker processes.
 
-            # Convert
-            bb_state = convert_table(table_state)
+        Frames are submitted as slots free up; finished frames are
+        parsed and published in capture order.  On stop, frames still
+        in flight are waited for so none is lost.
+        """
+        while not self._stop_event.is_set():
+            envelope = self._frame_buffer.get(timeout=0.01)
+            if envelope is not None and self._lane.admit(envelope):
+                try:
+                    while not pool.submit(envelope, timeout=0.05):
+                        self._publish_outcomes(pool.completed())
+                        if self._stop_event.is_set():
+                            break
+                except PipelineError as exc:
+                    self._lane.record_ocr_failure(exc, 0.0)
+            self._publish_outcomes(pool.completed())
+        self._publish_outcomes(pool.drain(timeout=3.0))
 
-            with self._state_lock:
-                self._latest_state = bb_state
+    def _publish_outcomes(self, outcomes: Iterable[OCROutcome]) -> None:
+        for outcome in outcomes:
+            if outcome.error is not None:
+                self._lane.record_ocr_failure(outcome.error, outcome.ocr_seconds)
+                continue
+            bb_state = self._lane.complete(
+                outcome.envelope, outcome.reading, outcome.ocr_seconds,
+            )
+            if self._ocr_pool is not None:
+                self._capture.report_downstream_fps(
+                    self._lane.ocr_fps * self._ocr_pool.workers,
+                )
+            if bb_state is not None and bb_state is not self._lane.latest_state():
+                self._lane.publish(bb_state)
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-import queue
+import threading
 from typing import Generic, TypeVar
 
 from bbs_converter.utils.constants import DEFAULT_QUEUE_MAXSIZE
+from bbs_converter.utils.memory import BoundedDeque, BufferStats
 
 T = TypeVar("T")
 
@@ -13,8 +14,10 @@ T = TypeVar("T")
 class StageQueue(Generic[T]):
     """Thread-safe bounded queue for passing data between pipeline stages.
 
-    Uses a drop-oldest policy when the queue is full to prevent the
-    pipeline from stalling.
+    Uses a drop-oldest policy when the queue is full — by item count or
+    by byte budget — to prevent the pipeline from stalling.  Item sizes
+    are taken from their ``nbytes`` attribute; items without one count
+    as zero bytes.
 
     Parameters
     ----------
@@ -22,38 +25,48 @@ class StageQueue(Generic[T]):
         Maximum number of items in the queue.
     name:
         Optional name for logging/debugging.
+    max_bytes:
+        Optional byte budget across all queued items.
     """
 
-    def __init__(self, maxsize: int = DEFAULT_QUEUE_MAXSIZE, name: str = "") -> None:
-        self._queue: queue.Queue[T] = queue.Queue(maxsize=maxsize)
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_QUEUE_MAXSIZE,
+        name: str = "",
+        max_bytes: int | None = None,
+    ) -> None:
+        self._items: BoundedDeque[T] = BoundedDeque(maxsize, max_bytes)
+        self._cond = threading.Condition()
         self._name = name
 
     def put(self, item: T) -> None:
-        """Add an item, dropping the oldest if full."""
-        try:
-            self._queue.put_nowait(item)
-        except queue.Full:
-            try:
-                self._queue.get_nowait()
-            except queue.Empty:
-                pass
-            self._queue.put_nowait(item)
+        """Add an item, dropping the oldest until it fits."""
+        with self._cond:
+            self._items.push(item)
+            self._cond.notify()
 
     def get(self, timeout: float | None = None) -> T | None:
         """Retrieve the next item, or None on timeout."""
-        try:
-            return self._queue.get(timeout=timeout)
-        except queue.Empty:
-            return None
+        with self._cond:
+            if not self._cond.wait_for(lambda: bool(self._items), timeout=timeout):
+                return None
+            return self._items.pop()
 
     @property
     def size(self) -> int:
-        return self._queue.qsize()
+        with self._cond:
+            return len(self._items)
 
     @property
     def empty(self) -> bool:
-        return self._queue.empty()
+        return self.size == 0
 
     @property
     def name(self) -> str:
         return self._name
+
+    @property
+    def stats(self) -> BufferStats:
+        """Live bytes, high-water mark and drop count."""
+        with self._cond:
+            return self._items.snapshot()
@@ -2,32 +2,74 @@
 
 from __future__ import annotations
 
+import os
+import re
 import sys
+from collections.abc import Mapping, Sequence
+from enum import Enum
 
 if sys.version_info >= (3, 11):
     import tomllib
 else:
     import tomli as tomllib
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 from bbs_converter.utils.constants import (
+    CAPTURE_POOL_SIZE,
+    DEFAULT_BUFFER_MAX_BYTES,
     DEFAULT_CONFIDENCE_THRESHOLD,
     DEFAULT_CONFIG_FILENAME,
     DEFAULT_FPS,
+    DEFAULT_IDLE_FPS,
+    RESULT_CACHE_MAX_ENTRIES,
+    TESSERACT_POOL_SIZE,
 )
 from bbs_converter.utils.exceptions import ConfigError
 
+_E = TypeVar("_E", bound=Enum)
+
 _DEFAULTS: dict[str, Any] = {
     "capture": {
         "fps": DEFAULT_FPS,
+        "dedupe": True,
+        "adaptive": False,
+        "idle_fps": DEFAULT_IDLE_FPS,
+        "spin": False,
+        "overrun_policy": "skip",
+        "pool_size": CAPTURE_POOL_SIZE,
+        "tables": [],
+        "backend": "mss",
+        "replay_source": "",
+        "replay_realtime": True,
+        "record_dir": "",
+        "record_max_bytes": 0,
+        "record_dedupe": False,
     },
     "ocr": {
         "confidence_threshold": DEFAULT_CONFIDENCE_THRESHOLD,
+        "engine": "tesseract",
+        "pool_size": TESSERACT_POOL_SIZE,
+        "result_cache_size": RESULT_CACHE_MAX_ENTRIES,
+        "result_cache_path": "",
+        "glyph_bank": "",
+        "batch_fields": False,
+        "site": "default",
+        "profiles": {},
+    },
+    "parser": {
+        "profiles": {},
+        "table_size": 0,
     },
     "overlay": {
         "enabled": True,
     },
+    "pipeline": {
+        "buffer_max_bytes": DEFAULT_BUFFER_MAX_BYTES,
+        "frame_deadline": 0.0,
+        "ocr_workers": 0,
+        "cpu_budget": 0,
+    },
 }
 
 
@@ -74,3 +116,91 @@ def load_config(path: Path | None = None) -> dict[str, Any]:
         raise ConfigError(f"Failed to parse config file {path}: {exc}") from exc
 
     return _deep_merge(_DEFAULTS, user_config)
+
+
+def config_choice(enum: type[_E], value: Any, key: str) -> _E:
+    """Return the member of *enum* named by the config *value*.
+
+    Names are matched case-insensitively, as written in the config file.
+
+    Raises
+    ------
+    ConfigError
+        If *value* names no member; the message lists the valid choices.
+    """
+    name = str(value).upper()
+    if name not in enum.__members__:
+        choices = ", ".join(member.lower() for member in enum.__members__)
+        raise ConfigError(f"Invalid {key} {value!r}; expected one of: {choices}")
+    return enum[name]
+
+
+_BARE_KEY = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
+def _toml_key(key: str) -> str:
+    return key if _BARE_KEY.match(key) else _toml_string(key)
+
+
+def _toml_string(value: str) -> str:
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def _toml_value(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, str):
+        return _toml_string(value)
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(_toml_value(item) for item in value) + "]"
+    raise ConfigError(f"Cannot write {type(value).__name__} value to TOML")
+
+
+def save_table(path: Path, table: Sequence[str], values: Mapping[str, Any]) -> None:
+    """Write *values* as the TOML table *table* of the file at *path*.
+
+    The table is replaced if the file already has it and appended
+    otherwise; the rest of the file, comments included, is kept as is.
+    Only scalar and flat list values are supported.
+
+    Parameters
+    ----------
+    path:
+        Config file; created if missing.
+    table:
+        Key path of the table, e.g. ``["ocr", "profiles", "site"]``.
+    values:
+        Keys and values of the table.
+
+    Raises
+    ------
+    ConfigError
+        If a value cannot be written or the result does not parse.
+    """
+    header = "[" + ".".join(_toml_key(part) for part in table) + "]"
+    lines = path.read_text().splitlines() if path.exists() else []
+
+    kept: list[str] = []
+    skipping = False
+    for line in lines:
+        stripped = line.strip()
+        if stripped.startswith("["):
+            skipping = stripped == header
+        if not skipping:
+            kept.append(line)
+    while kept and not kept[-1].strip():
+        kept.pop()
+
+    body = [header] + [f"{_toml_key(k)} = {_toml_value(v)}" for k, v in values.items()]
+    text = "\n".join(kept + ([""] if kept else []) + body) + "\n"
+    try:
+        tomllib.loads(text)
+    except Exception as exc:
+        raise ConfigError(f"Refusing to write unparsable config {path}: {exc}") from exc
+
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(text)
+    os.replace(tmp, path)
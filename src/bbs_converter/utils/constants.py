@@ -9,12 +9,50 @@ class CaptureBackend(Enum):
     """Supported screen capture backends."""
 
     MSS = auto()
+    REPLAY = auto()    # recorded frames, for headless benchmarks and regression runs
 
 
 class OCREngine(Enum):
     """Supported OCR engines."""
 
     TESSERACT = auto()
+    TESSERACT_POOL = auto()   # warm libtesseract instances via the C API
+    GLYPH = auto()            # template-matched digits, Tesseract as fallback
+
+
+class FieldKind(Enum):
+    """What a layout ROI contains, which decides how it is OCR'd and parsed."""
+
+    BLINDS = auto()    # e.g. 50/100
+    AMOUNT = auto()    # a single chip amount: pot or stack
+    TEXT = auto()      # free text such as a player name
+
+
+class TokenKind(Enum):
+    """What a span of whole-table OCR text was read as by the lexer."""
+
+    BLINDS = auto()    # "Blinds: 50/100"
+    POT = auto()       # "Pot: 350" or "Total 1,200"
+    SEAT = auto()      # "Seat 3: Alice", optionally followed by a stack
+    NAME = auto()      # a player name, optionally followed by a stack
+    AMOUNT = auto()    # a number not attached to anything above
+    KEYWORD = auto()   # a table word that is never a player name
+
+
+class PreprocessStep(Enum):
+    """Image operations a preprocessing chain can apply, in configured order."""
+
+    GRAYSCALE = auto()   # BGR/BGRA to single channel; a no-op on grayscale input
+    THRESHOLD = auto()   # adaptive Gaussian binarisation
+    DENOISE = auto()     # median blur
+    INVERT = auto()      # swap foreground and background
+
+
+class OverrunPolicy(Enum):
+    """What a paced loop does after missing one or more tick deadlines."""
+
+    SKIP = auto()       # drop the missed slots and realign to now
+    CATCH_UP = auto()   # keep the original schedule and tick back-to-back
 
 
 class DisplayMode(Enum):
@@ -29,10 +67,96 @@ class DisplayMode(Enum):
 DEFAULT_FPS = 30
 MIN_FPS = 1
 MAX_FPS = 120
+DEFAULT_IDLE_FPS = 2.0           # adaptive capture floor while the table is static
+ADAPTIVE_FPS_DECAY = 0.85        # per-unchanged-frame rate multiplier
+DOWNSTREAM_FPS_HEADROOM = 2.0    # capture at most this multiple of OCR throughput
+DEFAULT_SPIN_SECONDS = 0.001     # busy-wait window before a deadline when spinning
+MAX_CATCH_UP_TICKS = 3           # CATCH_UP realigns when further behind than this
+CAPTURE_POOL_SIZE = 3            # pooled capture slots: written, latest, being read
+
+# --- Recorder defaults ---
+RECORDER_SEGMENT_BYTES = 128 * 1024 * 1024  # preallocated size of one segment file
+RECORDER_INDEX_CAPACITY = 4096              # frames per segment
+RECORDER_QUEUE_SIZE = 64                    # frames the writer may lag before dropping
 
 # --- OCR defaults ---
 DEFAULT_OCR_ENGINE = OCREngine.TESSERACT
 DEFAULT_CONFIDENCE_THRESHOLD = 60.0  # minimum OCR confidence (0-100)
+TESSERACT_POOL_SIZE = 2  # warm Tesseract instances per pool
+AMOUNT_WHITELIST = "0123456789.,$kM"  # characters Tesseract may emit for amounts
+BLINDS_WHITELIST = AMOUNT_WHITELIST + "/"
+DIRTY_DOWNSCALE = 4          # shrink factor before per-field change detection
+DIRTY_PIXEL_THRESHOLD = 24   # per-pixel intensity change that marks a field dirty
+PREPROCESS_STEPS: tuple[PreprocessStep, ...] = (
+    PreprocessStep.GRAYSCALE, PreprocessStep.THRESHOLD, PreprocessStep.DENOISE,
+)
+THRESHOLD_BLOCK_SIZE = 11   # adaptive threshold neighbourhood (odd)
+THRESHOLD_CONSTANT = 2      # subtracted from the neighbourhood mean
+DENOISE_KERNEL_SIZE = 3     # median blur kernel (odd)
+RESULT_CACHE_MAX_ENTRIES = 4096  # OCR results kept by content hash
+GLYPH_ALPHABET = "0123456789,.$/kM"  # characters the glyph engine can learn
+GLYPH_SIZE = 16                  # side of the normalised glyph descriptor
+GLYPH_MIN_AREA = 2               # components smaller than this are noise
+GLYPH_MIN_SCORE = 0.85           # worst per-glyph correlation accepted without fallback
+GLYPH_HARVEST_CONFIDENCE = 85.0  # Tesseract confidence needed to learn templates
+GLYPH_TEMPLATES_PER_CHAR = 8     # template variants kept per character
+GLYPH_SPACE_RATIO = 0.4          # gap, relative to line height, read as a space
+MOSAIC_GAP = 16   # blank rows between crops packed into one OCR call
+MOSAIC_PAD = 8    # blank margin around a mosaic
+MOSAIC_PSM = 6    # Tesseract block mode used for mosaics
+DEFAULT_PSM = 7   # Tesseract single-line mode for whole-region reads
+
+# --- Tuner defaults ---
+TUNE_STEP_SETS = (
+    PREPROCESS_STEPS,
+    (PreprocessStep.GRAYSCALE, PreprocessStep.THRESHOLD),
+    PREPROCESS_STEPS + (PreprocessStep.INVERT,),
+)
+TUNE_BLOCK_SIZES = (11, 15, 21, 31)
+TUNE_CONSTANTS = (2, 5, 8)
+TUNE_KERNEL_SIZES = (1, 3, 5)
+TUNE_PSMS = (6, 7, 13)
+TUNE_ACCURACY_TOLERANCE = 0.02  # accuracy given up at most for a faster profile
+
+# --- Parser defaults ---
+PARSE_MEMO_MAX_ENTRIES = 256  # parsed table states kept by normalised OCR text
+LEX_TABLE_CACHE_ENTRIES = 8  # recent texts whose lex_table() result is reused
+DEFAULT_PARSER_SITE = "default"  # built-in parser profile
+BLIND_LABELS = ("blinds", "blind", "bl")
+POT_LABELS = ("pot", "total")
+SEAT_LABELS = ("seat",)
+CURRENCY_SYMBOLS = ("$",)
+AMOUNT_SUFFIXES = (("k", 1_000.0), ("m", 1_000_000.0))  # e.g. 12.5k, 1.2M
+TABLE_KEYWORDS = (  # words never read as player names
+    "blinds", "blind", "bl", "pot", "total", "seat",
+    "dealer", "button", "fold", "check", "call", "raise", "bet",
+)
+# Letters OCR confuses with digits, fixed inside numbers: 1,O00 -> 1,000
+OCR_DIGIT_CONFUSIONS = {
+    "O": "0", "o": "0", "D": "0", "Q": "0",
+    "l": "1", "I": "1", "i": "1",
+    "S": "5", "s": "5", "B": "8", "Z": "2", "z": "2",
+}
+# Digits OCR confuses with letters, fixed inside table words: B1inds -> blinds
+OCR_LETTER_CONFUSIONS = {"0": "o", "1": "l", "5": "s", "8": "b", "|": "l"}
+KEYWORD_MAX_EDITS = 1         # edits tolerated when matching a misread label
+KEYWORD_FUZZY_MIN_LENGTH = 5  # shorter labels must match exactly
+# Seat anchors as (x, y) fractions of the table region, seat 1 at the top,
+# numbered clockwise.
+SEAT_TEMPLATES = {
+    2: ((0.5, 0.15), (0.5, 0.85)),
+    6: (
+        (0.5, 0.12), (0.88, 0.3), (0.88, 0.7),
+        (0.5, 0.88), (0.12, 0.7), (0.12, 0.3),
+    ),
+    9: (
+        (0.5, 0.12), (0.77, 0.21), (0.91, 0.43), (0.86, 0.69), (0.64, 0.86),
+        (0.36, 0.86), (0.14, 0.69), (0.09, 0.43), (0.23, 0.21),
+    ),
+}
+SEAT_GRID_CELL = 8            # pixels per cell of the nearest-seat grid
+SEAT_MAX_DISTANCE = 0.2       # beyond this share of the diagonal, no seat
+SEAT_LABEL_OFFSET = (-24, 22)  # overlay label origin from the name centre
 
 # --- Converter defaults ---
 DEFAULT_DISPLAY_MODE = DisplayMode.DECIMAL
@@ -44,5 +168,7 @@ DEFAULT_CONFIG_FILENAME = "bbs_converter.toml"
 
 # --- Pipeline defaults ---
 DEFAULT_QUEUE_MAXSIZE = 30
+DEFAULT_BUFFER_MAX_BYTES = 64 * 1024 * 1024  # per-buffer frame memory budget
+OCR_SLOTS_PER_WORKER = 2  # shared-memory frame slots per OCR worker process
 DEFAULT_RETRY_LIMIT = 3
 DEFAULT_RETRY_DELAY_SECONDS = 1.0
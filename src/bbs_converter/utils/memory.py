@@ -0,0 +1,133 @@
+"""Byte accounting for bounded buffers."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+def item_nbytes(item: object) -> int:
+    """Return the payload size of *item* in bytes.
+
+    Arrays, pooled frames and anything else exposing ``nbytes`` report
+    that value; other objects are treated as free.
+    """
+    nbytes = getattr(item, "nbytes", 0)
+    return int(nbytes) if isinstance(nbytes, int) else 0
+
+
+@dataclass(frozen=True)
+class BufferStats:
+    """Point-in-time memory statistics for a buffer."""
+
+    live_bytes: int = 0
+    high_water_bytes: int = 0
+    drops: int = 0
+    max_bytes: int | None = None
+
+
+class MemoryAccount:
+    """Track live bytes, the high-water mark and drop count of a buffer.
+
+    Not thread-safe on its own — callers update it under their own lock.
+
+    Parameters
+    ----------
+    max_bytes:
+        Byte budget, or ``None`` for unbounded.
+    """
+
+    def __init__(self, max_bytes: int | None = None) -> None:
+        self._max_bytes = max_bytes
+        self._live = 0
+        self._high_water = 0
+        self._drops = 0
+
+    def fits(self, nbytes: int) -> bool:
+        """Return True if *nbytes* more would stay within the budget."""
+        return self._max_bytes is None or self._live + nbytes <= self._max_bytes
+
+    def add(self, nbytes: int) -> None:
+        self._live += nbytes
+        self._high_water = max(self._high_water, self._live)
+
+    def remove(self, nbytes: int) -> None:
+        self._live = max(0, self._live - nbytes)
+
+    def record_drop(self) -> None:
+        self._drops += 1
+
+    @property
+    def live_bytes(self) -> int:
+        return self._live
+
+    @property
+    def max_bytes(self) -> int | None:
+        return self._max_bytes
+
+    def snapshot(self) -> BufferStats:
+        """Return the current figures as an immutable :class:`BufferStats`."""
+        return BufferStats(
+            live_bytes=self._live,
+            high_water_bytes=self._high_water,
+            drops=self._drops,
+            max_bytes=self._max_bytes,
+        )
+
+
+class BoundedDeque(Generic[T]):
+    """Drop-oldest FIFO bounded by item count and by a byte budget.
+
+    Item sizes come from :func:`item_nbytes`.  A single item larger than
+    the whole budget is still accepted, so a producer never stalls.
+    Not thread-safe on its own — callers update it under their own lock.
+
+    Parameters
+    ----------
+    maxsize:
+        Maximum number of items held.
+    max_bytes:
+        Byte budget across all items, or ``None`` for unbounded.
+    """
+
+    def __init__(self, maxsize: int, max_bytes: int | None = None) -> None:
+        self._maxsize = maxsize
+        self._items: deque[tuple[T, int]] = deque()
+        self._account = MemoryAccount(max_bytes)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def push(self, item: T) -> list[T]:
+        """Append *item*, dropping the oldest until it fits; return those dropped."""
+        nbytes = item_nbytes(item)
+        dropped: list[T] = []
+        while self._items and (
+            len(self._items) >= self._maxsize or not self._account.fits(nbytes)
+        ):
+            old, old_bytes = self._items.popleft()
+            self._account.remove(old_bytes)
+            self._account.record_drop()
+            dropped.append(old)
+        self._items.append((item, nbytes))
+        self._account.add(nbytes)
+        return dropped
+
+    def pop(self) -> T:
+        """Remove and return the oldest item.
+
+        Raises
+        ------
+        IndexError
+            If the deque is empty.
+        """
+        item, nbytes = self._items.popleft()
+        self._account.remove(nbytes)
+        return item
+
+    def snapshot(self) -> BufferStats:
+        """Return live bytes, high-water mark and drop count."""
+        return self._account.snapshot()
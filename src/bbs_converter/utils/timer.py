@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import functools
+import math
 import time
+from collections import deque
 from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any, TypeVar
 
 from bbs_converter.utils.logger import get_logger
@@ -27,3 +30,66 @@ def timed(func: F) -> F:
             _log.debug("%s took %.1f ms", func.__qualname__, elapsed_ms)
 
     return wrapper  # type: ignore[return-value]
+
+
+@dataclass(frozen=True)
+class TimingStats:
+    """Summary of recent loop intervals, in milliseconds."""
+
+    count: int = 0
+    mean_ms: float = 0.0
+    jitter_ms: float = 0.0
+    p95_ms: float = 0.0
+    p99_ms: float = 0.0
+    overruns: int = 0
+
+
+class IntervalStats:
+    """Rolling window of loop intervals with percentile summaries.
+
+    Parameters
+    ----------
+    window:
+        Number of most recent intervals kept.
+    """
+
+    def __init__(self, window: int = 240) -> None:
+        self._intervals: deque[float] = deque(maxlen=window)
+        self._overruns = 0
+
+    def record(self, interval: float) -> None:
+        """Add one interval, in seconds."""
+        self._intervals.append(interval)
+
+    def record_overrun(self) -> None:
+        self._overruns += 1
+
+    @property
+    def mean(self) -> float:
+        """Mean interval in seconds (0 if empty)."""
+        if not self._intervals:
+            return 0.0
+        return sum(self._intervals) / len(self._intervals)
+
+    def snapshot(self) -> TimingStats:
+        """Summarise the current window as a :class:`TimingStats`."""
+        count = len(self._intervals)
+        if count == 0:
+            return TimingStats(overruns=self._overruns)
+        ordered = sorted(self._intervals)
+        mean = sum(ordered) / count
+        variance = sum((v - mean) ** 2 for v in ordered) / count
+        return TimingStats(
+            count=count,
+            mean_ms=mean * 1000,
+            jitter_ms=math.sqrt(variance) * 1000,
+            p95_ms=_percentile(ordered, 0.95) * 1000,
+            p99_ms=_percentile(ordered, 0.99) * 1000,
+            overruns=self._overruns,
+        )
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    index = min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
@@ -0,0 +1,53 @@
+"""Fixtures shared by the unit tests."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from contextlib import AbstractContextManager
+from typing import Any
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from bbs_converter.ocr.engine import OCRResult
+from bbs_converter.utils.constants import DEFAULT_PSM
+
+
+class PsmEngine:
+    """Fake OCR engine whose reading depends only on the page segmentation mode."""
+
+    def __init__(self, psm: int, readings: Mapping[int, str], default: str) -> None:
+        self.psm = psm
+        self.readings = readings
+        self.default = default
+
+    def extract(
+        self, image: np.ndarray, psm: int | None = None, whitelist: str | None = None,
+    ) -> OCRResult:
+        psm = psm if psm is not None else self.psm
+        return OCRResult(text=self.readings.get(psm, self.default), confidence=90.0)
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture()
+def psm_engines() -> Callable[..., AbstractContextManager[Any]]:
+    """Return ``patch(readings, default="")`` making pipelines use a :class:`PsmEngine`.
+
+    *readings* maps page segmentation modes to the text read in them;
+    every other mode reads *default*.
+    """
+
+    def engines(
+        readings: Mapping[int, str], default: str = "",
+    ) -> AbstractContextManager[Any]:
+        return patch(
+            "bbs_converter.ocr.pipeline.create_engine",
+            side_effect=lambda kind, lang="eng", psm=DEFAULT_PSM, **kw: PsmEngine(
+                psm, readings, default,
+            ),
+        )
+
+    return engines
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import threading
 import time
 
 from bbs_converter.capture.fps_controller import FPSController
+from bbs_converter.utils.constants import OverrunPolicy
 
 
 class TestFPSController:
@@ -39,3 +41,132 @@ class TestFPSController:
         elapsed = time.perf_counter() - start
         # first tick should return immediately (no previous reference)
         assert elapsed < 0.05
+
+
+class TestAdaptiveFPSController:
+    def test_static_frames_decay_to_idle_floor(self) -> None:
+        ctrl = FPSController(target_fps=30, adaptive=True, idle_fps=2.0)
+        for _ in range(100):
+            ctrl.report_activity(changed=False)
+        assert ctrl.current_fps == 2.0
+
+    def test_change_snaps_back_to_target(self) -> None:
+        ctrl = FPSController(target_fps=30, adaptive=True, idle_fps=2.0)
+        for _ in range(100):
+            ctrl.report_activity(changed=False)
+        ctrl.report_activity(changed=True)
+        assert ctrl.current_fps == 30.0
+
+    def test_decay_is_gradual(self) -> None:
+        ctrl = FPSController(target_fps=30, adaptive=True, idle_fps=2.0, decay=0.5)
+        ctrl.report_activity(changed=False)
+        assert ctrl.current_fps == 15.0
+
+    def test_downstream_throughput_caps_rate(self) -> None:
+        ctrl = FPSController(target_fps=30, adaptive=True, idle_fps=2.0)
+        ctrl.report_downstream_fps(5.0)
+        assert ctrl.current_fps == 10.0  # 2x headroom over OCR
+        ctrl.report_activity(changed=True)
+        assert ctrl.current_fps == 10.0
+
+    def test_downstream_cap_never_below_floor(self) -> None:
+        ctrl = FPSController(target_fps=30, adaptive=True, idle_fps=2.0)
+        ctrl.report_downstream_fps(0.1)
+        assert ctrl.current_fps == 2.0
+
+    def test_non_adaptive_ignores_feedback(self) -> None:
+        ctrl = FPSController(target_fps=30)
+        ctrl.report_activity(changed=False)
+        ctrl.report_downstream_fps(1.0)
+        assert ctrl.current_fps == 30.0
+
+    def test_feedback_from_another_thread(self) -> None:
+        ctrl = FPSController(target_fps=200, adaptive=True, idle_fps=100.0)
+        stop = threading.Event()
+
+        def feedback() -> None:
+            while not stop.is_set():
+                ctrl.report_downstream_fps(60.0)
+                ctrl.report_activity(changed=True)
+
+        thread = threading.Thread(target=feedback)
+        thread.start()
+        try:
+            ctrl.tick()
+            start = time.perf_counter()
+            for _ in range(10):
+                ctrl.tick()
+        finally:
+            stop.set()
+            thread.join()
+        # Capped at 120 fps by the 60 fps consumer: ten ticks take >= 10/120 s.
+        assert time.perf_counter() - start >= 10 / 120 * 0.9
+        assert ctrl.current_fps == 120.0
+
+    def test_idle_rate_slows_ticks(self) -> None:
+        ctrl = FPSController(target_fps=100, adaptive=True, idle_fps=20.0)
+        for _ in range(50):
+            ctrl.report_activity(changed=False)
+        ctrl.tick()
+        start = time.perf_counter()
+        ctrl.tick()
+        assert time.perf_counter() - start >= 0.04
+
+
+class TestDeadlinePacing:
+    def test_oversleep_does_not_accumulate(self) -> None:
+        ctrl = FPSController(target_fps=100)
+        ctrl.tick()
+        start = time.perf_counter()
+        for _ in range(20):
+            time.sleep(0.003)  # loop body
+            ctrl.tick()
+        elapsed = time.perf_counter() - start
+        # 20 periods of 10ms; relative sleeps would drift well past this.
+        assert elapsed < 0.25
+
+    def test_overrun_counted_and_skipped(self) -> None:
+        ctrl = FPSController(target_fps=100, overrun_policy=OverrunPolicy.SKIP)
+        ctrl.tick()
+        time.sleep(0.05)  # miss several deadlines
+        ctrl.tick()
+        start = time.perf_counter()
+        ctrl.tick()
+        # Realigned: the next tick waits a full period instead of bursting.
+        assert time.perf_counter() - start >= 0.005
+        assert ctrl.timing_stats.overruns == 1
+
+    def test_catch_up_ticks_back_to_back(self) -> None:
+        ctrl = FPSController(target_fps=100, overrun_policy=OverrunPolicy.CATCH_UP)
+        ctrl.tick()
+        time.sleep(0.025)  # ~2 periods behind
+        ctrl.tick()
+        start = time.perf_counter()
+        ctrl.tick()
+        assert time.perf_counter() - start < 0.005
+
+    def test_catch_up_counts_one_overrun_per_miss(self) -> None:
+        ctrl = FPSController(target_fps=100, overrun_policy=OverrunPolicy.CATCH_UP)
+        ctrl.tick()
+        time.sleep(0.025)  # ~2 periods behind
+        for _ in range(5):
+            ctrl.tick()
+        assert ctrl.timing_stats.overruns == 1
+
+    def test_spin_mode_keeps_rate(self) -> None:
+        ctrl = FPSController(target_fps=200, spin=True)
+        ctrl.tick()
+        start = time.perf_counter()
+        for _ in range(10):
+            ctrl.tick()
+        elapsed = time.perf_counter() - start
+        assert 0.045 <= elapsed < 0.1
+
+    def test_timing_stats_populated(self) -> None:
+        ctrl = FPSController(target_fps=200)
+        for _ in range(5):
+            ctrl.tick()
+        stats = ctrl.timing_stats
+        assert stats.count == 4
+        assert stats.p95_ms >= stats.mean_ms * 0.5
+        assert ctrl.actual_fps > 0
@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+import threading
+import time
+
 import numpy as np
+import pytest
 
-from bbs_converter.capture.frame_buffer import FrameBuffer
+from bbs_converter.capture.frame_buffer import FrameBuffer, LatestFrameBuffer
+from bbs_converter.capture.frame_pool import FramePool
+from bbs_converter.models import CaptureRegion, FrameEnvelope
+from bbs_converter.utils.exceptions import CaptureError
 
 
 class TestFrameBuffer:
@@ -46,3 +53,185 @@ class TestFrameBuffer:
         assert buf.empty is True
         buf.put(self._frame())
         assert buf.empty is False
+
+    def test_drop_oldest_releases_pooled_frame(self) -> None:
+        pool = FramePool((10, 10, 4), capacity=3)
+        buf = FrameBuffer(maxsize=1)
+        first = pool.acquire()
+        second = pool.acquire()
+        assert first is not None and second is not None
+        buf.put(first)
+        buf.put(second)  # drops and releases first
+        assert first.released is True
+        assert pool.available == 2
+
+    def test_byte_budget_drops_oldest(self) -> None:
+        frame_bytes = self._frame().nbytes
+        buf = FrameBuffer(maxsize=10, max_bytes=frame_bytes * 2)
+        for value in (1, 2, 3):
+            buf.put(self._frame(value))
+        assert buf.size == 2
+        stats = buf.stats
+        assert stats.live_bytes == frame_bytes * 2
+        assert stats.high_water_bytes == frame_bytes * 2
+        assert stats.drops == 1
+        first = buf.get(timeout=0.1)
+        assert first is not None
+        assert first[0, 0, 0] == 2
+
+    def test_oversized_frame_still_accepted(self) -> None:
+        buf = FrameBuffer(maxsize=10, max_bytes=10)
+        buf.put(self._frame(1))
+        assert buf.size == 1
+
+    def test_wait_drained(self) -> None:
+        buf = FrameBuffer(maxsize=5)
+        assert buf.wait_drained(timeout=0) is True
+        buf.put(self._frame())
+        assert buf.wait_drained(timeout=0.01) is False
+        threading.Timer(0.02, buf.get).start()
+        assert buf.wait_drained(timeout=1.0) is True
+
+    def test_get_releases_bytes(self) -> None:
+        buf = FrameBuffer(maxsize=10)
+        buf.put(self._frame())
+        buf.get(timeout=0.1)
+        assert buf.stats.live_bytes == 0
+        assert buf.stats.high_water_bytes == self._frame().nbytes
+
+
+class TestLatestFrameBuffer:
+    def _frame(self, value: int = 0) -> FrameEnvelope:
+        f = np.zeros((10, 10, 4), dtype=np.uint8)
+        f[0, 0, 0] = value
+        region = CaptureRegion(x=0, y=0, width=10, height=10)
+        return FrameEnvelope(value, time.perf_counter(), region, f)
+
+    def test_put_and_get(self) -> None:
+        buf = LatestFrameBuffer()
+        buf.put(self._frame(42))
+        result = buf.get(timeout=1.0)
+        assert result is not None
+        assert result.frame[0, 0, 0] == 42
+
+    def test_empty_get_returns_none(self) -> None:
+        buf = LatestFrameBuffer()
+        assert buf.get(timeout=0.01) is None
+
+    def test_latest_frame_wins(self) -> None:
+        buf = LatestFrameBuffer()
+        for value in (1, 2, 3, 4):
+            buf.put(self._frame(value))
+        result = buf.get(timeout=0.1)
+        assert result is not None
+        assert result.frame[0, 0, 0] == 4
+        assert buf.overwritten == 3
+
+    def test_same_frame_not_returned_twice(self) -> None:
+        buf = LatestFrameBuffer()
+        buf.put(self._frame(1))
+        assert buf.get(timeout=0.1) is not None
+        assert buf.get(timeout=0.01) is None
+
+    def test_held_frame_is_not_overwritten(self) -> None:
+        buf = LatestFrameBuffer()
+        buf.put(self._frame(1))
+        held = buf.get(timeout=0.1)
+        assert held is not None
+        for value in range(2, 10):
+            buf.put(self._frame(value))
+        assert held.frame[0, 0, 0] == 1
+        assert held.seq == 1
+
+    def test_slots_are_reused(self) -> None:
+        buf = LatestFrameBuffer(slots=3)
+        seen = set()
+        for value in range(12):
+            buf.put(self._frame(value))
+            frame = buf.get(timeout=0.1)
+            assert frame is not None
+            seen.add(id(frame.frame))
+        assert len(seen) <= 3
+
+    def test_get_wakes_on_put(self) -> None:
+        buf = LatestFrameBuffer()
+        timer = threading.Timer(0.05, buf.put, args=(self._frame(7),))
+        timer.start()
+        result = buf.get(timeout=1.0)
+        timer.join()
+        assert result is not None
+        assert result.frame[0, 0, 0] == 7
+
+    def test_sequence_and_size(self) -> None:
+        buf = LatestFrameBuffer()
+        assert buf.sequence == 0
+        assert buf.empty is True
+        buf.put(self._frame())
+        assert buf.sequence == 1
+        assert buf.size == 1
+        buf.get(timeout=0.1)
+        assert buf.empty is True
+
+    def test_wait_drained_until_latest_read(self) -> None:
+        buf = LatestFrameBuffer()
+        assert buf.wait_drained(timeout=0) is True
+        buf.put(self._frame(1))
+        assert buf.wait_drained(timeout=0.01) is False
+        threading.Timer(0.02, buf.get).start()
+        assert buf.wait_drained(timeout=1.0) is True
+
+    def test_too_few_slots_raises(self) -> None:
+        with pytest.raises(CaptureError, match="3 slots"):
+            LatestFrameBuffer(slots=2)
+
+    def test_stats_report_slot_memory(self) -> None:
+        buf = LatestFrameBuffer()
+        for value in range(5):
+            buf.put(self._frame(value))
+        stats = buf.stats
+        assert stats.live_bytes == 3 * self._frame().frame.nbytes
+        assert stats.drops == 4
+
+    def test_envelope_metadata_survives_copy(self) -> None:
+        buf = LatestFrameBuffer()
+        envelope = self._frame(5)
+        buf.put(envelope)
+        result = buf.get(timeout=0.1)
+        assert result is not None
+        assert result.seq == 5
+        assert result.captured_at == envelope.captured_at
+        assert result.region == envelope.region
+        assert result.frame is not envelope.frame
+
+    def test_pooled_frame_kept_without_copy(self) -> None:
+        pool = FramePool((10, 10, 4), capacity=3)
+        region = CaptureRegion(x=0, y=0, width=10, height=10)
+        buf = LatestFrameBuffer()
+        leases = []
+        for seq in range(1, 4):
+            lease = pool.acquire()
+            assert lease is not None
+            leases.append(lease)
+            buf.put(FrameEnvelope(seq, time.perf_counter(), region, lease.array, lease))
+            if seq == 1:
+                held = buf.get(timeout=0.1)
+                assert held is not None
+                assert held.frame is lease.array
+        # Frame 2 was overwritten unread; frame 1 is still being read.
+        assert leases[1].released is True
+        assert leases[0].released is False
+        assert buf.get(timeout=0.1) is not None
+        assert leases[0].released is True
+        assert pool.available == 2
+
+    def test_pooled_frames_counted_in_stats(self) -> None:
+        pool = FramePool((10, 10, 4), capacity=3)
+        region = CaptureRegion(x=0, y=0, width=10, height=10)
+        buf = LatestFrameBuffer(max_bytes=100)
+        for seq in range(1, 4):
+            lease = pool.acquire()
+            assert lease is not None
+            buf.put(FrameEnvelope(seq, time.perf_counter(), region, lease.array, lease))
+        # Only the latest frame is still held; the budget is not enforced.
+        assert buf.stats.live_bytes == 400
+        assert buf.get(timeout=0.1) is not None
@@ -0,0 +1,83 @@
+"""Tests for the preallocated frame pool."""
+
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+import pytest
+
+from bbs_converter.capture.frame_pool import FramePool
+from bbs_converter.utils.exceptions import CaptureError
+
+
+class TestFramePool:
+    def test_acquire_returns_preallocated_slot(self) -> None:
+        pool = FramePool((10, 20, 4), capacity=2)
+        frame = pool.acquire()
+        assert frame is not None
+        assert frame.array.shape == (10, 20, 4)
+        assert frame.array.dtype == np.uint8
+        assert pool.available == 1
+
+    def test_exhausted_pool_returns_none(self) -> None:
+        pool = FramePool((4, 4, 4), capacity=1)
+        first = pool.acquire()
+        assert first is not None
+        assert pool.acquire() is None
+        assert pool.exhausted_count == 1
+
+    def test_release_makes_slot_reusable(self) -> None:
+        pool = FramePool((4, 4, 4), capacity=1)
+        first = pool.acquire()
+        assert first is not None
+        storage = first.array
+        first.release()
+        second = pool.acquire()
+        assert second is not None
+        assert second.array is storage
+
+    def test_release_is_idempotent(self) -> None:
+        pool = FramePool((4, 4, 4), capacity=2)
+        frame = pool.acquire()
+        assert frame is not None
+        frame.release()
+        frame.release()
+        assert pool.available == 2
+
+    def test_concurrent_release_frees_slot_once(self) -> None:
+        pool = FramePool((2, 2), capacity=2)
+        for _ in range(50):
+            frame = pool.acquire()
+            assert frame is not None
+            barrier = threading.Barrier(4)
+
+            def release(frame=frame, barrier=barrier) -> None:
+                barrier.wait()
+                frame.release()
+
+            threads = [threading.Thread(target=release) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert pool.available == 2
+
+    def test_context_manager_releases(self) -> None:
+        pool = FramePool((4, 4, 4), capacity=1)
+        with pool.acquire() as frame:  # type: ignore[union-attr]
+            assert pool.available == 0
+        assert frame.released is True
+        assert pool.available == 1
+
+    def test_use_after_release_raises(self) -> None:
+        pool = FramePool((4, 4, 4), capacity=1)
+        frame = pool.acquire()
+        assert frame is not None
+        frame.release()
+        with pytest.raises(CaptureError, match="after release"):
+            _ = frame.array
+
+    def test_invalid_capacity_raises(self) -> None:
+        with pytest.raises(CaptureError, match="capacity"):
+            FramePool((4, 4, 4), capacity=0)
@@ -55,3 +55,56 @@ class TestFrameGrabber:
             grabber.close()
 
         mock_sct.close.assert_called_once()
+
+    def test_zero_copy_grab_wraps_raw_buffer(self) -> None:
+        raw = bytearray(range(2 * 3 * 4))
+        shot = MagicMock(raw=raw, width=3, height=2)
+        mock_sct = MagicMock()
+        mock_sct.grab.return_value = shot
+
+        with patch("bbs_converter.capture.grabber.mss.mss", return_value=mock_sct):
+            with FrameGrabber(self._make_region(), zero_copy=True) as grabber:
+                frame = grabber.grab()
+
+        assert frame.shape == (2, 3, 4)
+        raw[0] = 99
+        assert frame[0, 0, 0] == 99  # view, not a copy
+
+    def test_grab_into_fills_destination(self) -> None:
+        raw = bytearray([7] * (2 * 3 * 4))
+        mock_sct = MagicMock()
+        mock_sct.grab.return_value = MagicMock(raw=raw, width=3, height=2)
+        out = np.zeros((2, 3, 4), dtype=np.uint8)
+
+        with patch("bbs_converter.capture.grabber.mss.mss", return_value=mock_sct):
+            with FrameGrabber(self._make_region()) as grabber:
+                result = grabber.grab_into(out)
+
+        assert result is out
+        assert (out == 7).all()
+
+    def test_grab_into_shape_mismatch_raises(self) -> None:
+        mock_sct = MagicMock()
+        mock_sct.grab.return_value = MagicMock(
+            raw=bytearray(2 * 3 * 4), width=3, height=2,
+        )
+        out = np.zeros((5, 5, 4), dtype=np.uint8)
+
+        with patch("bbs_converter.capture.grabber.mss.mss", return_value=mock_sct):
+            with FrameGrabber(self._make_region()) as grabber:
+                with pytest.raises(CaptureError, match="does not match"):
+                    grabber.grab_into(out)
+
+    def test_grab_region_uses_given_monitor(self) -> None:
+        mock_sct = MagicMock()
+        mock_sct.grab.return_value = MagicMock(
+            raw=bytearray(2 * 3 * 4), width=3, height=2,
+        )
+        other = CaptureRegion(x=40, y=50, width=3, height=2)
+
+        with patch("bbs_converter.capture.grabber.mss.mss", return_value=mock_sct):
+            with FrameGrabber(self._make_region()) as grabber:
+                frame = grabber.grab_region(other)
+
+        mock_sct.grab.assert_called_once_with(other.to_mss_monitor())
+        assert frame.shape == (2, 3, 4)
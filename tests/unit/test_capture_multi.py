@@ -0,0 +1,93 @@
+"""Tests for multi-region capture."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from bbs_converter.capture.frame_buffer import LatestFrameBuffer
+from bbs_converter.capture.monitor import MonitorInfo
+from bbs_converter.capture.multi import (
+    MultiRegionCapture,
+    bounding_region,
+    group_by_monitor,
+)
+from bbs_converter.models import CaptureRegion
+from bbs_converter.utils.exceptions import CaptureError
+
+
+class TestBoundingRegion:
+    def test_bounds_all_regions(self) -> None:
+        regions = [
+            CaptureRegion(x=10, y=20, width=100, height=50),
+            CaptureRegion(x=200, y=5, width=30, height=30),
+        ]
+        assert bounding_region(regions) == CaptureRegion(
+            x=10, y=5, width=220, height=65,
+        )
+
+    def test_empty_raises(self) -> None:
+        with pytest.raises(CaptureError, match="empty"):
+            bounding_region([])
+
+
+class TestGroupByMonitor:
+    def test_groups_regions_per_monitor(self) -> None:
+        monitors = [
+            MonitorInfo(index=1, left=0, top=0, width=1920, height=1080),
+            MonitorInfo(index=2, left=1920, top=0, width=1920, height=1080),
+        ]
+        regions = [
+            CaptureRegion(x=0, y=0, width=800, height=600),
+            CaptureRegion(x=2000, y=0, width=800, height=600),
+            CaptureRegion(x=900, y=0, width=800, height=600),
+        ]
+        assert group_by_monitor(regions, monitors) == [[0, 2], [1]]
+
+
+class TestMultiRegionCapture:
+    def _screen(self) -> np.ndarray:
+        # 2x HiDPI grab of a 40x20 logical bounding box; pixel value = x.
+        frame = np.zeros((40, 80, 4), dtype=np.uint8)
+        frame[:, :, 0] = np.arange(80, dtype=np.uint8)
+        return frame
+
+    def _mock_grabber(self) -> MagicMock:
+        mock = MagicMock()
+        mock.grab_region.return_value = self._screen()
+        mock.__enter__ = MagicMock(return_value=mock)
+        mock.__exit__ = MagicMock(return_value=False)
+        return mock
+
+    def test_mismatched_buffers_raise(self) -> None:
+        region = CaptureRegion(x=0, y=0, width=10, height=10)
+        with pytest.raises(CaptureError, match="buffers"):
+            MultiRegionCapture([region, region], [LatestFrameBuffer()])
+
+    def test_single_grab_split_into_table_views(self) -> None:
+        regions = [
+            CaptureRegion(x=0, y=0, width=20, height=20),
+            CaptureRegion(x=20, y=0, width=20, height=20),
+        ]
+        buffers = [LatestFrameBuffer(), LatestFrameBuffer()]
+        grabber = self._mock_grabber()
+        with patch("bbs_converter.capture.multi.FrameGrabber", return_value=grabber):
+            capture = MultiRegionCapture(regions, buffers, fps=100)
+            capture.start()
+            time.sleep(0.05)
+            capture.stop()
+
+        assert capture.grab_count == 1
+        left = buffers[0].get(timeout=0.1)
+        right = buffers[1].get(timeout=0.1)
+        assert left is not None and right is not None
+        assert left.frame.shape == (40, 40, 4)
+        assert left.frame[0, 0, 0] == 0
+        assert right.frame[0, 0, 0] == 40
+        assert left.region == regions[0]
+        assert left.seq == right.seq
+        # Static screen: only the first view per table is pushed.
+        assert capture.duplicate_rate > 0
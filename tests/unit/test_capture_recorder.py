@@ -0,0 +1,160 @@
+"""Tests for the session recorder."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from bbs_converter.capture.frame_pool import FramePool
+from bbs_converter.capture.recorder import SessionReader, SessionRecorder
+from bbs_converter.capture.replay import load_replay_source
+from bbs_converter.models import CaptureRegion, FrameEnvelope
+from bbs_converter.utils.exceptions import CaptureError
+
+_REGION = CaptureRegion(x=0, y=0, width=8, height=6)
+
+
+def _envelope(value: int, ts: float) -> FrameEnvelope:
+    frame = np.full((6, 8, 4), value, dtype=np.uint8)
+    return FrameEnvelope(value, ts, _REGION, frame)
+
+
+class TestSessionRecorder:
+    def test_round_trip(self, tmp_path: Path) -> None:
+        recorder = SessionRecorder(tmp_path, segment_bytes=1 << 20, index_capacity=16)
+        recorder.start()
+        for i in range(3):
+            assert recorder.record(_envelope(i, 10.0 + i * 0.5))
+        recorder.close()
+
+        reader = SessionReader(tmp_path)
+        assert len(reader) == 3
+        assert reader[2].shape == (6, 8, 4)
+        assert (reader[1] == 1).all()
+        assert reader.timestamps == [10.0, 10.5, 11.0]
+        assert recorder.frames_written == 3
+
+    def test_segment_truncated_on_close(self, tmp_path: Path) -> None:
+        recorder = SessionRecorder(tmp_path, segment_bytes=1 << 20, index_capacity=16)
+        recorder.start()
+        recorder.record(_envelope(1, 0.0))
+        recorder.close()
+        (segment,) = tmp_path.glob("*.bbsrec")
+        assert segment.stat().st_size < 1 << 20
+
+    def test_rolls_over_to_new_segments(self, tmp_path: Path) -> None:
+        recorder = SessionRecorder(tmp_path, segment_bytes=1 << 20, index_capacity=2)
+        recorder.start()
+        for i in range(5):
+            recorder.record(_envelope(i, float(i)))
+        recorder.close()
+        assert len(list(tmp_path.glob("*.bbsrec"))) == 3
+        reader = SessionReader(tmp_path)
+        assert [int(reader[i][0, 0, 0]) for i in range(5)] == [0, 1, 2, 3, 4]
+
+    def test_rolling_retention_deletes_oldest(self, tmp_path: Path) -> None:
+        recorder = SessionRecorder(
+            tmp_path, segment_bytes=512, max_total_bytes=3 * 512,
+            index_capacity=1,
+        )
+        recorder.start()
+        for i in range(6):
+            recorder.record(_envelope(i, float(i)))
+        recorder.close()
+        reader = SessionReader(tmp_path)
+        assert recorder.segments_deleted > 0
+        assert int(reader[len(reader) - 1][0, 0, 0]) == 5
+        assert sum(p.stat().st_size for p in tmp_path.glob("*.bbsrec")) <= 3 * 512
+
+    def test_retention_keeps_earlier_sessions(self, tmp_path: Path) -> None:
+        first = SessionRecorder(tmp_path, segment_bytes=512, index_capacity=1)
+        first.start()
+        first.record(_envelope(9, 0.0))
+        first.close()
+        earlier = sorted(tmp_path.glob("*.bbsrec"))
+
+        recorder = SessionRecorder(
+            tmp_path, segment_bytes=512, max_total_bytes=2 * 512,
+            index_capacity=1,
+        )
+        recorder.start()
+        for i in range(4):
+            recorder.record(_envelope(i, float(i)))
+        recorder.close()
+        assert recorder.segments_deleted > 0
+        assert all(path.exists() for path in earlier)
+
+    def test_cap_smaller_than_segment_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(CaptureError, match="smaller"):
+            SessionRecorder(tmp_path, segment_bytes=8192, max_total_bytes=4096)
+
+    def test_dedupe_skips_identical_frames(self, tmp_path: Path) -> None:
+        recorder = SessionRecorder(tmp_path, segment_bytes=1 << 20, dedupe=True)
+        recorder.start()
+        for value in (1, 1, 2, 2, 2):
+            recorder.record(_envelope(value, time.perf_counter()))
+        recorder.close()
+        assert recorder.frames_written == 2
+        assert recorder.frames_deduped == 3
+
+    def test_full_queue_drops_instead_of_blocking(self, tmp_path: Path) -> None:
+        recorder = SessionRecorder(tmp_path, segment_bytes=1 << 20, queue_size=1)
+        # Writer not started: the queue fills and further frames drop.
+        assert recorder.record(_envelope(1, 0.0)) is True
+        assert recorder.record(_envelope(2, 0.1)) is False
+        assert recorder.frames_dropped == 1
+
+    def test_writer_failure_stops_recording(self, tmp_path: Path) -> None:
+        # A 192-byte frame cannot fit in a 200-byte segment.
+        recorder = SessionRecorder(
+            tmp_path, segment_bytes=200, index_capacity=1, queue_size=1,
+        )
+        assert recorder.record(_envelope(1, 0.0)) is True
+        assert recorder.record(_envelope(2, 0.1)) is False  # queue full
+        recorder.start()
+        deadline = time.monotonic() + 5.0
+        while recorder.recording and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert recorder.failed
+        assert recorder.record(_envelope(3, 0.2)) is False
+        assert recorder.frames_dropped == 2
+        started = time.monotonic()
+        recorder.close(timeout=1.0)
+        assert time.monotonic() - started < 1.0
+        assert recorder.frames_written == 0
+
+    def test_pooled_frames_are_copied(self, tmp_path: Path) -> None:
+        pool = FramePool((6, 8, 4), capacity=1)
+        lease = pool.acquire()
+        assert lease is not None
+        lease.array[...] = 7
+        envelope = FrameEnvelope(1, 0.0, _REGION, lease.array, lease=lease)
+        recorder = SessionRecorder(tmp_path, segment_bytes=1 << 20)
+        recorder.record(envelope)
+        envelope.release()
+        recorder.start()
+        recorder.close()
+        assert (SessionReader(tmp_path)[0] == 7).all()
+
+
+class TestSessionReplay:
+    def test_session_is_a_replay_source(self, tmp_path: Path) -> None:
+        recorder = SessionRecorder(tmp_path, segment_bytes=1 << 20)
+        recorder.start()
+        for i in range(3):
+            recorder.record(_envelope(i, 100.0 + i * 0.25))
+        recorder.close()
+
+        source = load_replay_source(tmp_path)
+        assert len(source) == 3
+        assert source.duration == pytest.approx(0.5)
+        assert source.frame(2)[0, 0, 0] == 2
+
+    def test_not_a_segment_raises(self, tmp_path: Path) -> None:
+        path = tmp_path / "bogus.bbsrec"
+        path.write_bytes(b"x" * 128)
+        with pytest.raises(CaptureError, match="Not a session segment"):
+            SessionReader(path)
@@ -0,0 +1,101 @@
+"""Tests for the replay capture backend."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+from bbs_converter.capture.replay import (
+    ReplayGrabber,
+    ReplaySource,
+    load_replay_source,
+)
+from bbs_converter.models import CaptureRegion
+from bbs_converter.utils.exceptions import CaptureError
+
+
+def _stack(count: int = 3) -> np.ndarray:
+    return np.stack([
+        np.full((4, 6, 4), i, dtype=np.uint8) for i in range(count)
+    ])
+
+
+class TestLoadReplaySource:
+    def test_png_directory_in_name_order(self, tmp_path: Path) -> None:
+        for i in (2, 0, 1):
+            frame = np.full((4, 6, 3), i, np.uint8)
+            cv2.imwrite(str(tmp_path / f"frame_{i:03d}.png"), frame)
+        source = load_replay_source(tmp_path)
+        assert len(source) == 3
+        frame = source.frame(1)
+        assert frame.shape == (4, 6, 4)  # BGR promoted to BGRA
+        assert frame[0, 0, 0] == 1
+
+    def test_npy_stack(self, tmp_path: Path) -> None:
+        path = tmp_path / "frames.npy"
+        np.save(path, _stack())
+        source = load_replay_source(path, fps=10)
+        assert len(source) == 3
+        assert source.frame(2)[0, 0, 0] == 2
+        assert source.duration == pytest.approx(0.2)
+
+    def test_missing_path_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(CaptureError, match="not found"):
+            load_replay_source(tmp_path / "nope")
+
+    def test_unsupported_file_raises(self, tmp_path: Path) -> None:
+        path = tmp_path / "frames.txt"
+        path.write_text("x")
+        with pytest.raises(CaptureError, match="Unsupported"):
+            load_replay_source(path)
+
+    def test_empty_directory_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(CaptureError, match="no frames"):
+            load_replay_source(tmp_path)
+
+
+class TestReplaySource:
+    def test_timestamp_count_must_match(self) -> None:
+        with pytest.raises(CaptureError, match="timestamps"):
+            ReplaySource(list(_stack()), timestamps=[0.0])
+
+    def test_offsets_from_timestamps(self) -> None:
+        source = ReplaySource(list(_stack()), timestamps=[10.0, 10.5, 12.0])
+        assert source.offset(1) == pytest.approx(0.5)
+        assert source.duration == pytest.approx(2.0)
+
+
+class TestReplayGrabber:
+    def test_fast_replay_returns_every_frame_then_exhausts(self) -> None:
+        grabber = ReplayGrabber(ReplaySource(list(_stack())), realtime=False)
+        with grabber:
+            values = [int(grabber.grab()[0, 0, 0]) for _ in range(3)]
+            assert grabber.exhausted
+            with pytest.raises(CaptureError, match="exhausted"):
+                grabber.grab()
+        assert values == [0, 1, 2]
+
+    def test_realtime_replay_honours_timestamps(self) -> None:
+        source = ReplaySource(list(_stack()), timestamps=[0.0, 0.05, 0.1])
+        with ReplayGrabber(source, realtime=True) as grabber:
+            start = time.perf_counter()
+            while not grabber.exhausted:
+                grabber.grab()
+            elapsed = time.perf_counter() - start
+        assert elapsed >= 0.09
+
+    def test_grab_into(self) -> None:
+        out = np.zeros((4, 6, 4), dtype=np.uint8)
+        with ReplayGrabber(ReplaySource(list(_stack())), realtime=False) as grabber:
+            grabber.grab()
+            grabber.grab_into(out)
+        assert (out == 1).all()
+
+    def test_region_from_frame_size(self) -> None:
+        grabber = ReplayGrabber(ReplaySource(list(_stack())))
+        assert grabber.region == CaptureRegion(x=0, y=0, width=6, height=4)
+        assert grabber.self_paced is True
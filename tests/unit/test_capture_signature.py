@@ -0,0 +1,56 @@
+"""Tests for capture-side frame signatures."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from bbs_converter.capture.signature import FrameSignature
+
+
+class TestFrameSignature:
+    def _frame(self) -> np.ndarray:
+        rng = np.random.default_rng(0)
+        return rng.integers(0, 256, (40, 60, 4), dtype=np.uint8)
+
+    def test_identical_frames_match(self) -> None:
+        sig = FrameSignature()
+        frame = self._frame()
+        assert sig.compute(frame) == sig.compute(frame.copy())
+
+    def test_glyph_change_detected(self) -> None:
+        sig = FrameSignature()
+        frame = self._frame()
+        changed = frame.copy()
+        changed[10:14, 20:22, :] ^= 0xFF  # small multi-row stroke
+        assert sig.compute(frame) != sig.compute(changed)
+
+    def test_shape_change_detected(self) -> None:
+        sig = FrameSignature()
+        a = np.zeros((40, 60, 4), dtype=np.uint8)
+        b = np.zeros((60, 40, 4), dtype=np.uint8)
+        assert sig.compute(a) != sig.compute(b)
+
+    def test_grayscale_frames_supported(self) -> None:
+        sig = FrameSignature()
+        frame = np.zeros((10, 10), dtype=np.uint8)
+        assert isinstance(sig.compute(frame), int)
+
+    def test_single_row_change_detected(self) -> None:
+        sig = FrameSignature()
+        frame = self._frame()
+        changed = frame.copy()
+        changed[11, 20:30, 1] ^= 0xFF  # one pixel row, odd index
+        assert sig.compute(frame) != sig.compute(changed)
+
+    def test_red_only_change_detected(self) -> None:
+        sig = FrameSignature()
+        frame = self._frame()
+        changed = frame.copy()
+        changed[10:14, 20:22, 2] ^= 0xFF
+        assert sig.compute(frame) != sig.compute(changed)
+
+    def test_non_contiguous_view_matches_copy(self) -> None:
+        sig = FrameSignature()
+        frame = self._frame()
+        view = frame[:, 10:50]
+        assert sig.compute(view) == sig.compute(view.copy())
@@ -7,9 +7,11 @@ from unittest.mock import MagicMock, patch
 
 import numpy as np
 
-from bbs_converter.capture.frame_buffer import FrameBuffer
+from bbs_converter.capture.frame_buffer import FrameBuffer, LatestFrameBuffer
+from bbs_converter.capture.frame_pool import PooledFrame
+from bbs_converter.capture.replay import ReplayGrabber, ReplaySource
 from bbs_converter.capture.thread import CaptureThread
-from bbs_converter.models import CaptureRegion
+from bbs_converter.models import CaptureRegion, FrameEnvelope
 
 
 class TestCaptureThread:
@@ -55,6 +57,152 @@ class TestCaptureThread:
             ct.stop()
         assert buf.size > 0
 
+    def test_pooled_capture_reuses_slots(self) -> None:
+        buf = FrameBuffer(maxsize=2)
+        grabber = self._mock_grabber()
+        with patch(
+            "bbs_converter.capture.thread.FrameGrabber",
+            return_value=grabber,
+        ):
+            ct = CaptureThread(
+                self._make_region(), buf, fps=200, pool_size=3,
+            )
+            ct.start()
+            time.sleep(0.1)
+            ct.stop()
+
+        envelope = buf.get(timeout=0.1)
+        assert isinstance(envelope, FrameEnvelope)
+        assert isinstance(envelope.lease, PooledFrame)
+        assert envelope.frame.shape == (100, 100, 4)
+        envelope.release()
+        # Drop-oldest released old slots, so capture never starved.
+        assert ct.pool_misses == 0
+        assert grabber.grab_into.call_count > 0
+
+    def test_frames_are_sequenced_envelopes(self) -> None:
+        buf = FrameBuffer(maxsize=10)
+        grabber = self._mock_grabber()
+        with patch(
+            "bbs_converter.capture.thread.FrameGrabber",
+            return_value=grabber,
+        ):
+            ct = CaptureThread(self._make_region(), buf, fps=200)
+            ct.start()
+            time.sleep(0.05)
+            ct.stop()
+
+        first = buf.get(timeout=0.1)
+        second = buf.get(timeout=0.1)
+        assert isinstance(first, FrameEnvelope)
+        assert isinstance(second, FrameEnvelope)
+        assert second.seq == first.seq + 1
+        assert second.captured_at >= first.captured_at
+        assert first.region == self._make_region()
+
+    def test_dedupe_skips_identical_frames(self) -> None:
+        buf = FrameBuffer(maxsize=50)
+        grabber = self._mock_grabber()
+        with patch(
+            "bbs_converter.capture.thread.FrameGrabber",
+            return_value=grabber,
+        ):
+            ct = CaptureThread(self._make_region(), buf, fps=200, dedupe=True)
+            ct.start()
+            time.sleep(0.1)
+            ct.stop()
+
+        assert buf.size == 1
+        assert ct.frames_captured > 1
+        assert ct.duplicates == ct.frames_captured - 1
+        assert ct.duplicate_rate > 0
+
+    def test_readmit_passes_next_duplicate(self) -> None:
+        buf = FrameBuffer(maxsize=5)
+        grabber = self._mock_grabber()
+        ct = CaptureThread(self._make_region(), buf, fps=30, dedupe=True)
+        assert ct._capture_one(grabber) is not None
+        assert ct._capture_one(grabber) is None
+        ct.readmit()
+        assert ct._capture_one(grabber) is not None
+        assert ct._capture_one(grabber) is None
+
+    def test_dedupe_passes_changed_frames(self) -> None:
+        buf = FrameBuffer(maxsize=50)
+        grabber = self._mock_grabber()
+        frames = [np.full((100, 100, 4), i % 256, dtype=np.uint8) for i in range(500)]
+        grabber.grab.side_effect = frames
+        with patch(
+            "bbs_converter.capture.thread.FrameGrabber",
+            return_value=grabber,
+        ):
+            ct = CaptureThread(self._make_region(), buf, fps=200, dedupe=True)
+            ct.start()
+            time.sleep(0.05)
+            ct.stop()
+
+        assert ct.duplicates == 0
+        assert buf.size > 1
+
+    def test_adaptive_capture_slows_on_static_frames(self) -> None:
+        buf = FrameBuffer(maxsize=5)
+        grabber = self._mock_grabber()
+        with patch(
+            "bbs_converter.capture.thread.FrameGrabber",
+            return_value=grabber,
+        ):
+            ct = CaptureThread(
+                self._make_region(), buf, fps=200, adaptive=True, idle_fps=20.0,
+            )
+            ct.start()
+            time.sleep(0.6)
+            ct.stop()
+
+        assert ct.current_fps == 20.0
+        assert buf.size == 5  # adaptive alone does not drop frames
+
+    def test_replay_stops_when_exhausted(self) -> None:
+        frames = [np.full((10, 10, 4), i, dtype=np.uint8) for i in range(3)]
+        buf = FrameBuffer(maxsize=10)
+        grabber = ReplayGrabber(ReplaySource(frames), realtime=False)
+        ct = CaptureThread(self._make_region(), buf, fps=1, grabber=grabber)
+        ct.start()
+        assert ct.wait(timeout=1.0) is True  # not paced at 1 FPS
+        assert ct.frames_captured == 3
+        assert buf.size == 3
+
+    def test_lossless_replay_delivers_every_frame(self) -> None:
+        frames = [np.full((10, 10, 4), i, dtype=np.uint8) for i in range(5)]
+        buf = LatestFrameBuffer()
+        grabber = ReplayGrabber(ReplaySource(frames), realtime=False)
+        ct = CaptureThread(
+            self._make_region(), buf, grabber=grabber, lossless=True,
+        )
+        ct.start()
+        seen = []
+        while len(seen) < 5:
+            envelope = buf.get(timeout=1.0)
+            assert envelope is not None
+            seen.append(int(envelope.frame[0, 0, 0]))
+            time.sleep(0.01)  # slow consumer
+        assert ct.wait(timeout=1.0) is True
+        ct.stop()
+        assert seen == [0, 1, 2, 3, 4]
+        assert buf.overwritten == 0
+
+    def test_recorder_receives_pushed_frames(self) -> None:
+        frames = [np.full((10, 10, 4), i % 2, dtype=np.uint8) for i in range(4)]
+        recorder = MagicMock()
+        grabber = ReplayGrabber(ReplaySource(frames), realtime=False)
+        ct = CaptureThread(
+            self._make_region(), FrameBuffer(maxsize=10), grabber=grabber,
+            recorder=recorder,
+        )
+        ct.start()
+        assert ct.wait(timeout=1.0) is True
+        seqs = [call.args[0].seq for call in recorder.record.call_args_list]
+        assert seqs == [1, 2, 3, 4]
+
     def test_double_start_is_safe(self) -> None:
         buf = FrameBuffer(maxsize=5)
         grabber = self._mock_grabber()
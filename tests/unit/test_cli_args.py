@@ -2,10 +2,24 @@
 
 from __future__ import annotations
 
+from unittest.mock import MagicMock, patch
+
 import pytest
 
-from bbs_converter.main import _parse_region, parse_args
+from bbs_converter.main import (
+    _build_parser_profiles,
+    _build_profile,
+    _build_replay,
+    _build_seat_template,
+    _build_tables,
+    _frame_size,
+    _parse_region,
+    main,
+    parse_args,
+)
 from bbs_converter.models import CaptureRegion
+from bbs_converter.utils.config import load_config
+from bbs_converter.utils.exceptions import CaptureError, ConfigError
 
 
 class TestParseArgs:
@@ -28,6 +42,16 @@ class TestParseArgs:
         args = parse_args(["--region", "100,200,800,600"])
         assert args.region == "100,200,800,600"
 
+    def test_replay_flags(self) -> None:
+        args = parse_args(["--replay", "frames.npy", "--replay-fast"])
+        assert args.replay == "frames.npy"
+        assert args.replay_fast is True
+        assert parse_args([]).replay_fast is False
+
+    def test_record_flag(self) -> None:
+        assert parse_args(["--record", "sessions/a"]).record == "sessions/a"
+        assert parse_args([]).record is None
+
     def test_config_flag(self) -> None:
         args = parse_args(["--config", "/path/to/config.toml"])
         assert args.config == "/path/to/config.toml"
@@ -57,3 +81,120 @@ class TestParseRegion:
     def test_invalid_count(self) -> None:
         with pytest.raises(ValueError, match="Expected 4"):
             _parse_region("100,200,800")
+
+
+class TestBuildProfile:
+    def _config(self, **ocr) -> dict:
+        return {"ocr": {"site": "stars", "profiles": {}, **ocr}}
+
+    def test_tuned_profile_for_region_size(self) -> None:
+        config = self._config(
+            profiles={"stars": {"800x600": {"block_size": 21, "psm": 13}}},
+            preprocess={"block_size": 15},
+        )
+        profile = _build_profile(config, 800, 600)
+        assert profile.preprocess.block_size == 21
+        assert profile.psm == 13
+
+    def test_falls_back_to_preprocess_section(self) -> None:
+        config = self._config(preprocess={"block_size": 15})
+        profile = _build_profile(config, 800, 600)
+        assert profile.preprocess.block_size == 15
+        assert profile.psm == 7
+
+
+class TestFrameSize:
+    def test_live_region_measured_in_pixels(self) -> None:
+        region = CaptureRegion(0, 0, 400, 300)
+        with patch("bbs_converter.main.capture_size", return_value=(800, 600)):
+            assert _frame_size(region) == (800, 600)
+
+    def test_falls_back_to_region_points(self) -> None:
+        region = CaptureRegion(0, 0, 400, 300)
+        failure = CaptureError("no display")
+        with patch("bbs_converter.main.capture_size", side_effect=failure):
+            assert _frame_size(region) == (400, 300)
+
+    def test_replay_uses_recorded_frames(self) -> None:
+        replay = MagicMock(region=CaptureRegion(0, 0, 640, 480))
+        with patch("bbs_converter.main.capture_size") as capture:
+            assert _frame_size(CaptureRegion(0, 0, 1, 1), replay) == (640, 480)
+        capture.assert_not_called()
+
+
+class TestBuildParserProfiles:
+    def test_site_with_profile(self) -> None:
+        config = {
+            "ocr": {"site": "eu"},
+            "parser": {"profiles": {"eu": {"currency": ["€"]}}},
+        }
+        profiles, site = _build_parser_profiles(config)
+        assert site == "eu"
+        assert profiles["eu"].currency == ("€",)
+
+    def test_site_without_profile_uses_default(self) -> None:
+        config = {"ocr": {"site": "stars"}, "parser": {"profiles": {}}}
+        profiles, site = _build_parser_profiles(config)
+        assert site == "default"
+        assert list(profiles) == ["default"]
+
+
+class TestBuildSeatTemplate:
+    def test_off_by_default(self) -> None:
+        assert _build_seat_template({"parser": {"table_size": 0}}) is None
+
+    def test_table_size(self) -> None:
+        template = _build_seat_template({"parser": {"table_size": 6}})
+        assert template is not None
+        assert len(template) == 6
+
+    def test_unknown_table_size(self) -> None:
+        with pytest.raises(ConfigError):
+            _build_seat_template({"parser": {"table_size": 4}})
+
+
+class TestBuildTables:
+    def _config(self, **capture: object) -> dict:
+        return {
+            "capture": {
+                "tables": [], "replay_source": "", "record_dir": "", **capture,
+            },
+            "pipeline": {"ocr_workers": 0},
+        }
+
+    def test_tables_from_cli(self) -> None:
+        args = parse_args(["--table", "0,0,400,300", "--table", "400,0,400,300"])
+        tables = _build_tables(args, self._config())
+        assert tables == [
+            CaptureRegion(0, 0, 400, 300), CaptureRegion(400, 0, 400, 300),
+        ]
+
+    def test_tables_from_config(self) -> None:
+        config = self._config(tables=["0,0,10,10", "10,0,10,10"])
+        assert len(_build_tables(parse_args([]), config)) == 2
+
+    def test_no_tables(self) -> None:
+        assert _build_tables(parse_args([]), self._config()) == []
+
+    def test_several_tables_reject_replay(self) -> None:
+        args = parse_args([
+            "--table", "0,0,10,10", "--table", "10,0,10,10", "--replay", "x",
+        ])
+        with pytest.raises(ConfigError, match="single table"):
+            _build_tables(args, self._config())
+
+
+class TestBuildReplay:
+    def test_replay_backend_without_source(self) -> None:
+        config = load_config()
+        config["capture"] = {**config["capture"], "backend": "replay"}
+        with pytest.raises(ConfigError, match="replay_source"):
+            _build_replay(parse_args([]), config)
+
+    def test_config_error_exits_without_traceback(self, tmp_path, capsys) -> None:
+        path = tmp_path / "bbs.toml"
+        path.write_text('[capture]\nbackend = "replay"\n')
+        with pytest.raises(SystemExit) as excinfo:
+            main(["--config", str(path)])
+        assert excinfo.value.code == 2
+        assert "replay_source" in capsys.readouterr().err
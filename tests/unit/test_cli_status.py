@@ -11,11 +11,18 @@ class TestPipelineStats:
     def test_default_values(self) -> None:
         stats = PipelineStats()
         assert stats.capture_fps == 0.0
+        assert stats.capture_duplicate_rate == 0.0
         assert stats.ocr_confidence == 0.0
         assert stats.cache_hit_rate == 0.0
+        assert stats.result_cache_hit_rate == 0.0
         assert stats.frames_processed == 0
         assert stats.parse_errors == 0
         assert stats.ocr_errors == 0
+        assert stats.ocr_restarts == 0
+        assert stats.ocr_engine_healthy
+        assert stats.buffer_bytes == 0
+        assert stats.buffer_high_water_bytes == 0
+        assert stats.buffer_drops == 0
 
     def test_mutable(self) -> None:
         stats = PipelineStats()
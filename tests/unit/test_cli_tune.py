@@ -0,0 +1,105 @@
+"""Tests for the OCR tuning command."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+from bbs_converter.cli.tune import load_corpus, main, parse_args
+from bbs_converter.utils.config import load_config
+from bbs_converter.utils.constants import TUNE_PSMS
+from bbs_converter.utils.exceptions import ConfigError
+
+
+@pytest.fixture(autouse=True)
+def _engines(psm_engines):
+    with psm_engines({13: "50/100"}):
+        yield
+
+
+@pytest.fixture()
+def recording(tmp_path: Path) -> tuple[Path, Path]:
+    frames = tmp_path / "frames.npy"
+    np.save(frames, np.full((4, 30, 80, 3), 220, dtype=np.uint8))
+    labels = tmp_path / "labels.json"
+    labels.write_text(json.dumps({"0": "50/100", "2": "50/100"}))
+    return frames, labels
+
+
+def _tune(tmp_path: Path, recording: tuple[Path, Path], *extra: str) -> int:
+    frames, labels = recording
+    argv = [
+        "--frames", str(frames), "--labels", str(labels),
+        "--config", str(tmp_path / "bbs.toml"), "--site", "stars",
+        "--block-sizes", "11,15", "--constants", "2", "--kernel-sizes", "3",
+        *extra,
+    ]
+    return main(argv)
+
+
+class TestParseArgs:
+    def test_grid_defaults_and_lists(self) -> None:
+        args = parse_args(["--frames", "f", "--labels", "l", "--psms", "6, 7"])
+        assert args.psms == (6, 7)
+        assert args.block_sizes
+        assert parse_args(["--frames", "f", "--labels", "l"]).psms == TUNE_PSMS
+
+    def test_bad_list_rejected(self) -> None:
+        with pytest.raises(SystemExit):
+            parse_args(["--frames", "f", "--labels", "l", "--psms", "6,x"])
+
+
+class TestLoadCorpus:
+    def test_pairs_frames_with_labels(self, recording: tuple[Path, Path]) -> None:
+        corpus = load_corpus(*recording)
+        assert len(corpus) == 2
+        assert corpus[0].expected == "50/100"
+        assert corpus[0].frame.shape[:2] == (30, 80)
+
+    def test_out_of_range_index(self, recording, tmp_path: Path) -> None:
+        labels = tmp_path / "bad.json"
+        labels.write_text(json.dumps({"9": "x"}))
+        with pytest.raises(ConfigError, match="frame 9"):
+            load_corpus(recording[0], labels)
+
+    def test_bad_label_value(self, recording, tmp_path: Path) -> None:
+        labels = tmp_path / "bad.json"
+        labels.write_text(json.dumps({"0": 12}))
+        with pytest.raises(ConfigError):
+            load_corpus(recording[0], labels)
+
+
+    def test_mixed_frame_sizes_rejected(self, tmp_path: Path) -> None:
+        frames = tmp_path / "png"
+        frames.mkdir()
+        for i, (h, w) in enumerate([(30, 80), (30, 80), (40, 100)]):
+            image = np.full((h, w, 3), 220, dtype=np.uint8)
+            cv2.imwrite(str(frames / f"frame_{i:03d}.png"), image)
+        labels = tmp_path / "labels.json"
+        labels.write_text(json.dumps({"0": "a", "1": "b"}))
+        assert len(load_corpus(frames, labels)) == 2
+        labels.write_text(json.dumps({"0": "a", "2": "b"}))
+        with pytest.raises(ConfigError, match="100x40"):
+            load_corpus(frames, labels)
+
+
+class TestMain:
+    def test_writes_winning_profile(self, tmp_path: Path, recording) -> None:
+        assert _tune(tmp_path, recording) == 0
+        config = load_config(tmp_path / "bbs.toml")
+        profile = config["ocr"]["profiles"]["stars"]["80x30"]
+        assert profile["psm"] == 13
+        assert profile["kernel_size"] == 3
+
+    def test_dry_run_writes_nothing(self, tmp_path: Path, recording) -> None:
+        assert _tune(tmp_path, recording, "--dry-run") == 0
+        assert not (tmp_path / "bbs.toml").exists()
+
+    def test_bad_labels_fail(self, tmp_path: Path, recording, capsys) -> None:
+        recording[1].write_text("{")
+        assert _tune(tmp_path, recording) == 1
+        assert "Tuning failed" in capsys.readouterr().err
@@ -6,8 +6,14 @@ from pathlib import Path
 
 import pytest
 
-from bbs_converter.utils.config import load_config
-from bbs_converter.utils.constants import DEFAULT_CONFIDENCE_THRESHOLD, DEFAULT_FPS
+from bbs_converter.utils.config import config_choice, load_config, save_table
+from bbs_converter.utils.constants import (
+    DEFAULT_BUFFER_MAX_BYTES,
+    DEFAULT_CONFIDENCE_THRESHOLD,
+    DEFAULT_FPS,
+    OCREngine,
+    OverrunPolicy,
+)
 from bbs_converter.utils.exceptions import ConfigError
 
 
@@ -15,8 +21,18 @@ class TestLoadConfig:
     def test_defaults_when_no_file(self, tmp_path: Path) -> None:
         config = load_config(tmp_path / "nonexistent.toml")
         assert config["capture"]["fps"] == DEFAULT_FPS
+        assert config["capture"]["dedupe"] is True
+        assert config["capture"]["adaptive"] is False
+        assert config["capture"]["spin"] is False
+        assert config["capture"]["overrun_policy"] == "skip"
+        assert config["capture"]["backend"] == "mss"
+        assert config["capture"]["replay_realtime"] is True
         assert config["ocr"]["confidence_threshold"] == DEFAULT_CONFIDENCE_THRESHOLD
+        assert config["ocr"]["engine"] == "tesseract"
+        assert config["ocr"]["result_cache_path"] == ""
         assert config["overlay"]["enabled"] is True
+        assert config["pipeline"]["buffer_max_bytes"] == DEFAULT_BUFFER_MAX_BYTES
+        assert config["pipeline"]["frame_deadline"] == 0.0
 
     def test_user_values_override_defaults(self, tmp_path: Path) -> None:
         toml_path = tmp_path / "config.toml"
@@ -46,3 +62,46 @@ class TestLoadConfig:
         toml_path.write_text('[custom]\nkey = "value"\n')
         config = load_config(toml_path)
         assert config["custom"]["key"] == "value"
+
+
+class TestConfigChoice:
+    def test_case_insensitive(self) -> None:
+        policy = config_choice(OverrunPolicy, "Catch_Up", "capture.overrun_policy")
+        assert policy is OverrunPolicy.CATCH_UP
+
+    def test_invalid_value_lists_choices(self) -> None:
+        with pytest.raises(ConfigError, match="ocr.engine 'tesseact'.*tesseract"):
+            config_choice(OCREngine, "tesseact", "ocr.engine")
+
+
+class TestSaveTable:
+    def test_creates_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "config.toml"
+        save_table(path, ["ocr", "profiles", "stars", "800x600"], {"psm": 7})
+        config = load_config(path)
+        assert config["ocr"]["profiles"]["stars"]["800x600"]["psm"] == 7
+
+    def test_replaces_table_and_keeps_rest(self, tmp_path: Path) -> None:
+        path = tmp_path / "config.toml"
+        path.write_text(
+            "# my settings\n[capture]\nfps = 60\n\n"
+            "[ocr.profiles.stars.800x600]\npsm = 6\nblock_size = 11\n\n"
+            "[overlay]\nenabled = false\n"
+        )
+        save_table(path, ["ocr", "profiles", "stars", "800x600"], {"psm": 13})
+        text = path.read_text()
+        assert "# my settings" in text
+        config = load_config(path)
+        assert config["capture"]["fps"] == 60
+        assert config["overlay"]["enabled"] is False
+        assert config["ocr"]["profiles"]["stars"]["800x600"] == {"psm": 13}
+
+    def test_writes_value_types_and_quotes_keys(self, tmp_path: Path) -> None:
+        path = tmp_path / "config.toml"
+        values = {"steps": ["grayscale", "threshold"], "ratio": 0.5, "on": True}
+        save_table(path, ["ocr", "profiles", "my site"], values)
+        assert load_config(path)["ocr"]["profiles"]["my site"] == values
+
+    def test_unsupported_value_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(ConfigError):
+            save_table(tmp_path / "config.toml", ["ocr"], {"bad": object()})
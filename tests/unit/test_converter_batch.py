@@ -49,3 +49,18 @@ class TestConvertTable:
         result = convert_table(state)
         assert result.pot_bb == 0.0
         assert result.stacks_bb["Alice"] == 0.0
+
+    def test_positions_of_located_players(self) -> None:
+        from bbs_converter.models import PlayerInfo
+
+        state = TableState(
+            big_blind=10.0,
+            small_blind=5.0,
+            pot=0.0,
+            stacks={"Alice": 100.0, "Bob": 50.0},
+            players=(
+                PlayerInfo(name="Alice", seat=1, stack=100.0, position=(200, 40)),
+                PlayerInfo(name="Bob", seat=2, stack=50.0),
+            ),
+        )
+        assert convert_table(state).positions == {"Alice": (200, 40)}
@@ -0,0 +1,75 @@
+"""Tests for buffer byte accounting."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from bbs_converter.utils.memory import BoundedDeque, MemoryAccount, item_nbytes
+
+
+class TestItemNbytes:
+    def test_array(self) -> None:
+        assert item_nbytes(np.zeros((4, 4), dtype=np.uint8)) == 16
+
+    def test_plain_object(self) -> None:
+        assert item_nbytes("text") == 0
+
+
+class TestMemoryAccount:
+    def test_tracks_live_and_high_water(self) -> None:
+        account = MemoryAccount()
+        account.add(100)
+        account.add(50)
+        account.remove(120)
+        stats = account.snapshot()
+        assert stats.live_bytes == 30
+        assert stats.high_water_bytes == 150
+
+    def test_fits_respects_budget(self) -> None:
+        account = MemoryAccount(max_bytes=100)
+        account.add(60)
+        assert account.fits(40) is True
+        assert account.fits(41) is False
+
+    def test_unbounded_always_fits(self) -> None:
+        assert MemoryAccount().fits(10**12) is True
+
+    def test_drops_counted(self) -> None:
+        account = MemoryAccount()
+        account.record_drop()
+        account.record_drop()
+        assert account.snapshot().drops == 2
+
+
+class TestBoundedDeque:
+    def test_fifo(self) -> None:
+        items: BoundedDeque[int] = BoundedDeque(maxsize=3)
+        for value in (1, 2):
+            assert items.push(value) == []
+        assert len(items) == 2
+        assert [items.pop(), items.pop()] == [1, 2]
+
+    def test_drops_oldest_by_count(self) -> None:
+        items: BoundedDeque[int] = BoundedDeque(maxsize=2)
+        items.push(1)
+        items.push(2)
+        assert items.push(3) == [1]
+        assert items.snapshot().drops == 1
+
+    def test_drops_oldest_by_bytes(self) -> None:
+        items: BoundedDeque[np.ndarray] = BoundedDeque(maxsize=10, max_bytes=32)
+        first = np.zeros(16, dtype=np.uint8)
+        items.push(first)
+        items.push(np.zeros(16, dtype=np.uint8))
+        dropped = items.push(np.zeros(16, dtype=np.uint8))
+        assert len(dropped) == 1 and dropped[0] is first
+        stats = items.snapshot()
+        assert (stats.live_bytes, stats.high_water_bytes) == (32, 32)
+
+    def test_oversized_item_accepted(self) -> None:
+        items: BoundedDeque[np.ndarray] = BoundedDeque(maxsize=10, max_bytes=8)
+        items.push(np.zeros(4, dtype=np.uint8))
+        assert len(items.push(np.zeros(64, dtype=np.uint8))) == 1
+        assert len(items) == 1
+        items.pop()
+        assert items.snapshot().live_bytes == 0
@@ -1,8 +1,11 @@
 """Tests for core data models."""
 
+import numpy as np
+
 from bbs_converter.models import (
     BBState,
     CaptureRegion,
+    FrameEnvelope,
     GameConfig,
     PlayerInfo,
     TableState,
@@ -105,3 +108,57 @@ class TestGameConfig:
             raise AssertionError("Should have raised")
         except AttributeError:
             pass
+
+
+class TestFrameEnvelope:
+    def _make(self, captured_at: float = 10.0) -> FrameEnvelope:
+        region = CaptureRegion(x=0, y=0, width=4, height=2)
+        frame = np.zeros((2, 4, 4), dtype=np.uint8)
+        return FrameEnvelope(3, captured_at, region, frame)
+
+    def test_fields(self) -> None:
+        env = self._make()
+        assert env.seq == 3
+        assert env.captured_at == 10.0
+        assert env.nbytes == 32
+
+    def test_has_no_instance_dict(self) -> None:
+        assert not hasattr(self._make(), "__dict__")
+
+    def test_age(self) -> None:
+        assert self._make(captured_at=10.0).age(now=10.5) == 0.5
+
+    def test_with_frame_keeps_metadata(self) -> None:
+        env = self._make()
+        other = env.with_frame(np.ones((1, 1, 4), dtype=np.uint8))
+        assert other.seq == env.seq
+        assert other.captured_at == env.captured_at
+        assert other.frame.shape == (1, 1, 4)
+
+    def test_release_without_lease_is_noop(self) -> None:
+        env = self._make()
+        env.release()
+        assert not env.released
+
+    def test_release_blanks_pooled_frame(self) -> None:
+        from bbs_converter.capture.frame_pool import FramePool
+
+        pool = FramePool((2, 4, 4), capacity=1)
+        lease = pool.acquire()
+        assert lease is not None
+        lease.array[...] = 9
+        region = CaptureRegion(x=0, y=0, width=4, height=2)
+        env = FrameEnvelope(1, 0.0, region, lease.array, lease=lease)
+        env.release()
+        assert env.released
+        assert pool.available == 1
+        assert env.frame.shape == (2, 4, 4)
+        assert not env.frame.any()
+        assert not env.frame.flags.writeable
+
+
+class TestBBStateStamp:
+    def test_defaults_unstamped(self) -> None:
+        state = BBState(pot_bb=1.0)
+        assert state.frame_seq is None
+        assert state.captured_at is None
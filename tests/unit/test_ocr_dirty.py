@@ -0,0 +1,91 @@
+"""Tests for per-field dirty-region detection."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from bbs_converter.ocr.dirty import DirtyRegionDetector
+from bbs_converter.ocr.layout import FieldROI, TableLayout
+from bbs_converter.utils.constants import FieldKind
+
+
+def _layout() -> TableLayout:
+    return TableLayout((
+        FieldROI("blinds", FieldKind.BLINDS, 0.0, 0.0, 0.5, 0.5),
+        FieldROI("pot", FieldKind.AMOUNT, 0.5, 0.5, 0.5, 0.5),
+    ))
+
+
+def _read(detector: DirtyRegionDetector, frame: np.ndarray) -> set[str]:
+    """Update *detector* and commit every dirty field, as a full read does."""
+    dirty = detector.update(frame, _layout())
+    for name in dirty:
+        detector.commit(name)
+    return dirty
+
+
+class TestDirtyRegionDetector:
+    def test_first_frame_all_dirty(self) -> None:
+        detector = DirtyRegionDetector()
+        frame = np.zeros((100, 200), dtype=np.uint8)
+        assert detector.update(frame, _layout()) == {"blinds", "pot"}
+
+    def test_unchanged_frame_is_clean(self) -> None:
+        detector = DirtyRegionDetector()
+        frame = np.zeros((100, 200), dtype=np.uint8)
+        _read(detector, frame)
+        assert detector.update(frame.copy(), _layout()) == set()
+        assert detector.clean_rate == 50.0
+
+    def test_only_changed_field_reported(self) -> None:
+        detector = DirtyRegionDetector()
+        frame = np.zeros((100, 200), dtype=np.uint8)
+        _read(detector, frame)
+        frame[60:80, 120:160] = 255
+        assert detector.update(frame, _layout()) == {"pot"}
+
+    def test_change_outside_fields_ignored(self) -> None:
+        detector = DirtyRegionDetector()
+        frame = np.zeros((100, 200), dtype=np.uint8)
+        _read(detector, frame)
+        frame[70:90, 10:50] = 255  # bottom-left: no field there
+        assert detector.update(frame, _layout()) == set()
+
+    def test_small_noise_below_threshold(self) -> None:
+        detector = DirtyRegionDetector(pixel_threshold=24)
+        frame = np.full((100, 200), 100, dtype=np.uint8)
+        _read(detector, frame)
+        assert detector.update(frame + 10, _layout()) == set()
+
+    def test_resize_marks_everything_dirty(self) -> None:
+        detector = DirtyRegionDetector()
+        _read(detector, np.zeros((100, 200), dtype=np.uint8))
+        assert detector.update(
+            np.zeros((120, 240), dtype=np.uint8), _layout(),
+        ) == {"blinds", "pot"}
+
+    def test_reset(self) -> None:
+        detector = DirtyRegionDetector()
+        frame = np.zeros((100, 200), dtype=np.uint8)
+        _read(detector, frame)
+        detector.reset()
+        assert detector.update(frame, _layout()) == {"blinds", "pot"}
+
+    def test_uncommitted_field_stays_dirty(self) -> None:
+        detector = DirtyRegionDetector()
+        frame = np.zeros((100, 200), dtype=np.uint8)
+        detector.update(frame, _layout())
+        detector.commit("blinds")  # the pot read failed
+        assert detector.update(frame, _layout()) == {"pot"}
+
+    def test_slow_fade_is_detected(self) -> None:
+        detector = DirtyRegionDetector(pixel_threshold=24)
+        frame = np.full((100, 200), 100, dtype=np.uint8)
+        _read(detector, frame)
+        dirty: set[str] = set()
+        for step in range(1, 6):
+            dirty = detector.update(frame + 8 * step, _layout())
+            if dirty:
+                break
+        assert dirty == {"blinds", "pot"}
+        assert step == 4
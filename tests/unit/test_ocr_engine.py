@@ -7,12 +7,21 @@ from unittest.mock import MagicMock, patch
 import numpy as np
 import pytest
 
-from bbs_converter.ocr.engine import OCRResult, TesseractEngine
+from bbs_converter.ocr.engine import (
+    NO_TOKENS,
+    OCRResult,
+    OCRTokens,
+    OCRWord,
+    TesseractEngine,
+)
 from bbs_converter.utils.exceptions import OCRError
 
 
 class TestTesseractEngine:
     def _mock_pytesseract(self, data: dict) -> MagicMock:
+        # image_to_data always returns every column; fill the ones a test omits.
+        columns = ("left", "top", "width", "height", "block_num", "line_num")
+        data = {key: [0] * len(data["text"]) for key in columns} | data
         mock = MagicMock()
         mock.image_to_data.return_value = data
         mock.Output.DICT = "dict"
@@ -63,3 +72,107 @@ class TestTesseractEngine:
         with patch.dict(sys.modules, {"pytesseract": mock_pt}):
             with pytest.raises(OCRError, match="Tesseract extraction failed"):
                 engine.extract(image)
+
+    def test_per_call_psm_and_whitelist(self) -> None:
+        mock_pt = self._mock_pytesseract({"text": ["100"], "conf": [95.0]})
+        engine = TesseractEngine(psm=7)
+        image = np.zeros((20, 60), dtype=np.uint8)
+
+        import sys
+        with patch.dict(sys.modules, {"pytesseract": mock_pt}):
+            engine.extract(image, psm=8, whitelist="0123456789")
+            engine.extract(image)
+
+        configs = [c.kwargs["config"] for c in mock_pt.image_to_data.call_args_list]
+        assert configs == [
+            "--psm 8 -c tessedit_char_whitelist=0123456789",
+            "--psm 7",
+        ]
+
+    def test_extract_words_returns_boxes(self) -> None:
+        data = {
+            "text": ["Pot", "", "150"],
+            "conf": [90.0, -1, 80.0],
+            "left": [2, 0, 40],
+            "top": [3, 0, 4],
+            "width": [30, 0, 25],
+            "height": [12, 0, 11],
+        }
+        mock_pt = self._mock_pytesseract(data)
+        engine = TesseractEngine()
+
+        import sys
+        with patch.dict(sys.modules, {"pytesseract": mock_pt}):
+            words = engine.extract_words(np.zeros((20, 80), dtype=np.uint8), psm=6)
+
+        assert [(w.text, w.left, w.width) for w in words] == [
+            ("Pot", 2, 30), ("150", 40, 25),
+        ]
+        assert mock_pt.image_to_data.call_args.kwargs["config"] == "--psm 6"
+
+    def test_extract_keeps_tokens(self) -> None:
+        data = {
+            "text": ["Seat", "", "1,250"],
+            "conf": [91.0, -1, 83.0],
+            "left": [4, 0, 60],
+            "top": [2, 0, 30],
+            "width": [40, 0, 36],
+            "height": [12, 0, 12],
+            "block_num": [1, 1, 2],
+            "line_num": [1, 1, 1],
+        }
+        mock_pt = self._mock_pytesseract(data)
+
+        import sys
+        with patch.dict(sys.modules, {"pytesseract": mock_pt}):
+            result = TesseractEngine().extract(np.zeros((50, 120), dtype=np.uint8))
+
+        assert result.text == "Seat 1,250"
+        assert result.tokens.texts == ("Seat", "1,250")
+        assert result.tokens.boxes.tolist() == [[4, 2, 40, 12], [60, 30, 36, 12]]
+        assert result.tokens.records["block"].tolist() == [1, 2]
+        assert result.tokens.confidences.tolist() == [91.0, 83.0]
+
+
+class TestOCRTokens:
+    def _tokens(self) -> OCRTokens:
+        return OCRTokens.from_words([
+            OCRWord("50/100", 92.0, 10, 5, 48, 14, block=1, line=1),
+            OCRWord("Pot", 88.0, 100, 40, 30, 12, block=2, line=1),
+        ])
+
+    def test_words_round_trip(self) -> None:
+        tokens = self._tokens()
+        assert len(tokens) == 2
+        assert tokens[1] == OCRWord("Pot", 88.0, 100, 40, 30, 12, block=2, line=1)
+        assert [w.text for w in tokens] == ["50/100", "Pot"]
+
+    def test_centres(self) -> None:
+        assert self._tokens().centres.tolist() == [[34.0, 12.0], [115.0, 46.0]]
+
+    def test_offset_returns_moved_copy(self) -> None:
+        tokens = self._tokens()
+        moved = tokens.offset(200, 300)
+        assert moved.boxes[:, :2].tolist() == [[210, 305], [300, 340]]
+        assert tokens.boxes[0, 0] == 10
+        assert tokens.offset(0, 0) is tokens
+
+    def test_payload_round_trip(self) -> None:
+        tokens = self._tokens()
+        restored = OCRTokens.from_payload(tokens.to_payload())
+        assert list(restored) == list(tokens)
+
+    def test_mismatched_lengths_raise(self) -> None:
+        with pytest.raises(OCRError):
+            OCRTokens(("a", "b"), self._tokens().records[:1])
+
+    def test_tokens_do_not_affect_equality(self) -> None:
+        with_tokens = OCRResult("50/100 Pot", 90.0, tokens=self._tokens())
+        assert with_tokens == OCRResult("50/100 Pot", 90.0)
+        assert OCRResult("x", 1.0).tokens is NO_TOKENS
+
+    def test_result_from_words(self) -> None:
+        result = OCRResult.from_words(list(self._tokens()))
+        assert result.text == "50/100 Pot"
+        assert result.confidence == pytest.approx(90.0)
+        assert len(result.tokens) == 2
@@ -0,0 +1,131 @@
+"""Tests for the glyph template-matching engine."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import cv2
+import numpy as np
+import pytest
+
+from bbs_converter.ocr.engine import OCRResult
+from bbs_converter.ocr.glyph import GlyphBank, GlyphEngine, segment_glyphs
+from bbs_converter.utils.constants import AMOUNT_WHITELIST
+
+
+def _render(text: str) -> np.ndarray:
+    """Dark text on white, as adaptive thresholding leaves it."""
+    image = np.full((30, 16 * len(text) + 10), 255, dtype=np.uint8)
+    cv2.putText(image, text, (4, 22), cv2.FONT_HERSHEY_SIMPLEX, 0.7, 0, 2)
+    return image
+
+
+def _fallback(text: str, confidence: float = 95.0) -> MagicMock:
+    engine = MagicMock()
+    engine.extract.return_value = OCRResult(text=text, confidence=confidence)
+    return engine
+
+
+class TestSegmentGlyphs:
+    def test_one_descriptor_per_character(self) -> None:
+        descriptors, spaces = segment_glyphs(_render("1250"))
+        assert descriptors.shape[0] == 4
+        assert spaces == [False] * 4
+        norms = np.linalg.norm(descriptors, axis=1)
+        assert norms == pytest.approx(np.ones(4), abs=1e-5)
+
+    def test_polarity_independent(self) -> None:
+        image = _render("70")
+        dark, _ = segment_glyphs(image)
+        light, _ = segment_glyphs(255 - image)
+        np.testing.assert_allclose(dark, light, atol=1e-6)
+
+    def test_blank_image(self) -> None:
+        descriptors, spaces = segment_glyphs(np.full((20, 40), 255, dtype=np.uint8))
+        assert descriptors.shape[0] == 0
+        assert spaces == []
+
+
+class TestGlyphBank:
+    def test_match_restricted_to_alphabet(self) -> None:
+        bank = GlyphBank()
+        (one,), _ = segment_glyphs(_render("1"))
+        (seven,), _ = segment_glyphs(_render("7"))
+        bank.add("1", one)
+        bank.add("7", seven)
+
+        labels, scores = bank.match(np.stack([one]), alphabet="7")
+        assert labels == ["7"]
+        assert scores[0] < 1.0
+
+    def test_duplicates_and_quota(self) -> None:
+        bank = GlyphBank(per_char=1)
+        descriptors, _ = segment_glyphs(_render("11"))
+        assert bank.add("1", descriptors[0])
+        assert not bank.add("1", descriptors[1])
+        assert len(bank) == 1
+
+    def test_round_trip(self, tmp_path) -> None:
+        path = tmp_path / "site.npz"
+        bank = GlyphBank(path)
+        descriptors, _ = segment_glyphs(_render("42"))
+        bank.add("4", descriptors[0])
+        bank.add("2", descriptors[1])
+        bank.save()
+
+        assert GlyphBank(path).characters == {"4", "2"}
+
+
+class TestGlyphEngine:
+    def test_harvests_then_matches_without_fallback(self) -> None:
+        fallback = _fallback("1,250")
+        engine = GlyphEngine(fallback)
+        image = _render("1,250")
+
+        first = engine.extract(image, whitelist=AMOUNT_WHITELIST)
+        second = engine.extract(image, whitelist=AMOUNT_WHITELIST)
+
+        assert first.text == "1,250"
+        assert second.text == "1,250"
+        assert fallback.extract.call_count == 1
+        assert engine.matched == 1
+        assert engine.bank.characters == {"1", ",", "2", "5", "0"}
+
+    def test_unknown_glyph_falls_back(self) -> None:
+        engine = GlyphEngine(_fallback("10"))
+        engine.extract(_render("10"), whitelist=AMOUNT_WHITELIST)
+
+        fallback = _fallback("18")
+        engine._fallback = fallback
+        result = engine.extract(_render("18"), whitelist=AMOUNT_WHITELIST)
+
+        assert result.text == "18"
+        fallback.extract.assert_called_once()
+
+    def test_low_confidence_not_harvested(self) -> None:
+        engine = GlyphEngine(_fallback("10", confidence=40.0))
+        engine.extract(_render("10"), whitelist=AMOUNT_WHITELIST)
+        assert len(engine.bank) == 0
+
+    def test_count_mismatch_not_harvested(self) -> None:
+        engine = GlyphEngine(_fallback("100"))
+        engine.extract(_render("10"), whitelist=AMOUNT_WHITELIST)
+        assert len(engine.bank) == 0
+
+    def test_free_text_goes_to_fallback(self) -> None:
+        fallback = _fallback("Alice")
+        engine = GlyphEngine(fallback)
+        result = engine.extract(_render("Alice"), psm=7)
+
+        assert result.text == "Alice"
+        fallback.extract.assert_called_once()
+        assert engine.fallbacks == 1
+
+    def test_factory_builds_glyph_engine(self) -> None:
+        from bbs_converter.ocr.factory import create_engine
+        from bbs_converter.utils.constants import OCREngine
+
+        bank = GlyphBank()
+        engine = create_engine(OCREngine.GLYPH, glyph_bank=bank)
+        assert isinstance(engine, GlyphEngine)
+        assert engine.bank is bank
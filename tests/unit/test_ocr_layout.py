@@ -0,0 +1,83 @@
+"""Tests for table layouts and field ROIs."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from bbs_converter.models import CaptureRegion
+from bbs_converter.ocr.layout import FieldROI, TableLayout
+from bbs_converter.utils.constants import AMOUNT_WHITELIST, FieldKind
+from bbs_converter.utils.exceptions import ConfigError
+
+
+class TestFieldROI:
+    def test_defaults_by_kind(self) -> None:
+        amount = FieldROI("pot", FieldKind.AMOUNT, 0.4, 0.4, 0.2, 0.1)
+        text = FieldROI("seat1_name", FieldKind.TEXT, 0.0, 0.0, 0.2, 0.1)
+        assert amount.psm == 8
+        assert amount.whitelist == AMOUNT_WHITELIST
+        assert {"k", "M"} <= set(amount.whitelist)  # abbreviated stacks
+        assert text.psm == 7
+        assert text.whitelist is None
+
+    def test_explicit_settings_win(self) -> None:
+        roi = FieldROI("pot", FieldKind.AMOUNT, 0, 0, 0.5, 0.5, psm=6, whitelist="0")
+        assert (roi.psm, roi.whitelist) == (6, "0")
+
+    def test_region_scales_with_frame(self) -> None:
+        roi = FieldROI("pot", FieldKind.AMOUNT, 0.25, 0.5, 0.5, 0.25)
+        assert roi.region(400, 200) == CaptureRegion(
+            x=100, y=100, width=200, height=50,
+        )
+        assert roi.region(800, 400) == CaptureRegion(
+            x=200, y=200, width=400, height=100,
+        )
+
+    def test_crop(self) -> None:
+        frame = np.zeros((100, 200), dtype=np.uint8)
+        frame[50:75, 50:150] = 255
+        roi = FieldROI("pot", FieldKind.AMOUNT, 0.25, 0.5, 0.5, 0.25)
+        crop = roi.crop(frame)
+        assert crop.shape == (25, 100)
+        assert (crop == 255).all()
+
+    def test_invalid_geometry_raises(self) -> None:
+        with pytest.raises(ConfigError, match="inside"):
+            FieldROI("pot", FieldKind.AMOUNT, 1.5, 0, 0.1, 0.1)
+        with pytest.raises(ConfigError, match="positive"):
+            FieldROI("pot", FieldKind.AMOUNT, 0, 0, 0, 0.1)
+
+
+class TestTableLayout:
+    def test_from_config(self) -> None:
+        layout = TableLayout.from_config({
+            "fields": {
+                "blinds": {
+                    "kind": "blinds", "x": 0.4, "y": 0.0,
+                    "width": 0.2, "height": 0.05,
+                },
+                "pot": {
+                    "kind": "amount", "x": 0.4, "y": 0.4,
+                    "width": 0.2, "height": 0.05, "psm": 7,
+                },
+            },
+        })
+        assert [f.name for f in layout] == ["blinds", "pot"]
+        assert layout.fields[1].psm == 7
+
+    def test_empty_section(self) -> None:
+        assert len(TableLayout.from_config({})) == 0
+
+    def test_unknown_kind_raises(self) -> None:
+        with pytest.raises(ConfigError, match="unknown kind"):
+            TableLayout.from_config({"fields": {"pot": {"kind": "chips"}}})
+
+    def test_missing_key_raises(self) -> None:
+        with pytest.raises(ConfigError, match="missing"):
+            TableLayout.from_config({"fields": {"pot": {"kind": "amount", "x": 0.1}}})
+
+    def test_duplicate_names_raise(self) -> None:
+        roi = FieldROI("pot", FieldKind.AMOUNT, 0, 0, 0.1, 0.1)
+        with pytest.raises(ConfigError, match="unique"):
+            TableLayout((roi, roi))
@@ -0,0 +1,60 @@
+"""Tests for packing crops into a single OCR mosaic."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from bbs_converter.ocr.engine import OCRWord
+from bbs_converter.ocr.mosaic import build_mosaic, split_words
+
+
+class TestBuildMosaic:
+    def test_slots_and_size(self) -> None:
+        crops = [np.full((10, 30), 255, np.uint8), np.full((20, 50), 255, np.uint8)]
+        mosaic, slots = build_mosaic(crops, gap=4, pad=2)
+
+        assert mosaic.shape == (2 + 10 + 4 + 20 + 2, 54)
+        assert slots == [(2, 12), (16, 36)]
+
+    def test_light_on_dark_crops_inverted(self) -> None:
+        dark = np.zeros((6, 6), np.uint8)
+        dark[2:4, 2:4] = 255
+        mosaic, [(top, bottom)] = build_mosaic([dark], gap=4, pad=1)
+
+        region = mosaic[top:bottom, 1:7]
+        assert region[2, 2] == 0
+        assert region[0, 0] == 255
+
+
+class TestSplitWords:
+    def _word(self, text: str, left: int, top: int, conf: float = 90.0) -> OCRWord:
+        return OCRWord(text, conf, left, top, 10, 8)
+
+    def test_words_assigned_by_row(self) -> None:
+        slots = [(0, 10), (20, 30)]
+        words = [
+            self._word("1,250", 30, 21, 80.0),
+            self._word("Alice", 0, 1),
+            self._word("$", 0, 21, 100.0),
+        ]
+        first, second = split_words(words, slots, gap=10)
+
+        assert first.text == "Alice"
+        assert second.text == "$ 1,250"
+        assert second.confidence == pytest.approx(90.0)
+
+    def test_tokens_in_crop_coordinates(self) -> None:
+        words = [self._word("Alice", 10, 25), self._word("$5", 30, 25)]
+        (result,) = split_words(words, [(24, 34)], gap=10, pad=8)
+        assert result.tokens.texts == ("Alice", "$5")
+        assert result.tokens.boxes[:, :2].tolist() == [[2, 1], [22, 1]]
+
+    def test_empty_slot(self) -> None:
+        (result,) = split_words([], [(0, 10)])
+        assert result.text == ""
+        assert result.confidence == 0.0
+
+    def test_stray_words_dropped(self) -> None:
+        (result,) = split_words([self._word("x", 0, 200)], [(0, 10)], gap=10)
+        assert result.text == ""
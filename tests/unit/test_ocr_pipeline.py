@@ -5,6 +5,7 @@ from __future__ import annotations
 from unittest.mock import patch
 
 import numpy as np
+import pytest
 
 from bbs_converter.ocr.engine import OCRResult
 from bbs_converter.ocr.pipeline import OCRPipeline
@@ -65,3 +66,218 @@ class TestOCRPipeline:
             pipeline.process(frame)
 
         assert pipeline.cache_hit_rate == 0.0
+
+
+class TestProcessFields:
+    def _layout(self):
+        from bbs_converter.ocr.layout import FieldROI, TableLayout
+        from bbs_converter.utils.constants import FieldKind
+
+        return TableLayout((
+            FieldROI("blinds", FieldKind.BLINDS, 0.0, 0.0, 0.5, 0.5),
+            FieldROI("pot", FieldKind.AMOUNT, 0.5, 0.5, 0.5, 0.5),
+        ))
+
+    def test_each_field_ocrd_with_its_settings(self) -> None:
+        pipeline = OCRPipeline(use_cache=False)
+        result = OCRResult(text="100", confidence=90.0)
+        frame = np.random.randint(0, 256, (100, 200, 3), dtype=np.uint8)
+
+        with patch.object(pipeline._engine, "extract", return_value=result) as extract:
+            fields = pipeline.process_fields(frame, self._layout())
+
+        assert set(fields) == {"blinds", "pot"}
+        psms = [call.kwargs["psm"] for call in extract.call_args_list]
+        assert psms == [7, 8]
+        crop = extract.call_args_list[1].args[0]
+        assert crop.shape == (50, 100)
+
+    def test_field_tokens_in_frame_coordinates(self) -> None:
+        from bbs_converter.ocr.engine import OCRWord
+
+        pipeline = OCRPipeline(use_cache=False)
+        result = OCRResult.from_words([OCRWord("100", 90.0, 4, 6, 20, 10)])
+        frame = np.zeros((100, 200, 3), dtype=np.uint8)
+
+        with patch.object(pipeline._engine, "extract", return_value=result):
+            fields = pipeline.process_fields(frame, self._layout())
+
+        assert fields["blinds"].tokens.boxes.tolist() == [[4, 6, 20, 10]]
+        assert fields["pot"].tokens.boxes.tolist() == [[104, 56, 20, 10]]
+        assert result.tokens.boxes[0, 0] == 4  # engine result left untouched
+
+    def test_low_confidence_fields_dropped(self) -> None:
+        pipeline = OCRPipeline(confidence_threshold=60.0, use_cache=False)
+        results = [
+            OCRResult(text="1/2", confidence=90.0),
+            OCRResult(text="??", confidence=10.0),
+        ]
+        frame = np.zeros((100, 200, 3), dtype=np.uint8)
+
+        with patch.object(pipeline._engine, "extract", side_effect=results):
+            fields = pipeline.process_fields(frame, self._layout())
+
+        assert list(fields) == ["blinds"]
+
+    def test_unchanged_fields_hit_cache(self) -> None:
+        pipeline = OCRPipeline()
+        result = OCRResult(text="100", confidence=90.0)
+        frame = np.zeros((100, 200, 3), dtype=np.uint8)
+
+        with patch.object(pipeline._engine, "extract", return_value=result) as extract:
+            pipeline.process_fields(frame, self._layout())
+            frame[60:90, 110:190] = 255  # only the pot changes
+            pipeline.process_fields(frame, self._layout())
+
+        assert extract.call_count == 3
+        assert pipeline.cache_hit_rate == pytest.approx(25.0)
+
+    def test_failed_field_reread_next_frame(self) -> None:
+        pipeline = OCRPipeline()
+        result = OCRResult(text="100", confidence=90.0)
+        frame = np.zeros((100, 200, 3), dtype=np.uint8)
+
+        with patch.object(
+            pipeline._engine, "extract", side_effect=[result, RuntimeError("boom")],
+        ):
+            with pytest.raises(RuntimeError):
+                pipeline.process_fields(frame, self._layout())
+        with patch.object(pipeline._engine, "extract", return_value=result) as extract:
+            fields = pipeline.process_fields(frame, self._layout())
+
+        assert extract.call_count == 1  # only the pot, whose read failed
+        assert set(fields) == {"blinds", "pot"}
+
+
+class TestResultCache:
+    def test_repeated_content_skips_engine(self) -> None:
+        from bbs_converter.ocr.result_cache import OCRResultCache
+
+        cache = OCRResultCache()
+        first = OCRPipeline(use_cache=False, result_cache=cache)
+        second = OCRPipeline(use_cache=False, result_cache=cache)
+        result = OCRResult(text="5000", confidence=90.0)
+        frame = np.zeros((100, 200, 3), dtype=np.uint8)
+        frame[40:60, 50:150] = 255
+
+        with patch.object(first._engine, "extract", return_value=result):
+            first.process(frame)
+        with patch.object(second._engine, "extract") as extract:
+            out = second.process(frame.copy())
+
+        extract.assert_not_called()
+        assert out == result
+        assert cache.hits == 1
+
+    def test_field_settings_part_of_key(self) -> None:
+        from bbs_converter.ocr.layout import FieldROI, TableLayout
+        from bbs_converter.ocr.result_cache import OCRResultCache
+        from bbs_converter.utils.constants import FieldKind
+
+        layout = TableLayout((
+            FieldROI("blinds", FieldKind.BLINDS, 0.0, 0.0, 0.5, 1.0),
+            FieldROI("pot", FieldKind.AMOUNT, 0.5, 0.0, 0.5, 1.0),
+        ))
+        pipeline = OCRPipeline(use_cache=False, result_cache=OCRResultCache())
+        result = OCRResult(text="100", confidence=90.0)
+        frame = np.zeros((100, 200, 3), dtype=np.uint8)  # identical halves
+
+        with patch.object(pipeline._engine, "extract", return_value=result) as extract:
+            pipeline.process_fields(frame, layout)
+
+        assert extract.call_count == 2
+
+
+class TestProcessMany:
+    def _words_for(self, mosaic, psm=None, whitelist=None):
+        from bbs_converter.ocr.engine import OCRWord
+        from bbs_converter.utils.constants import MOSAIC_GAP, MOSAIC_PAD
+
+        # One word per 20-row crop, in packing order.
+        row = 20 + MOSAIC_GAP
+        return [
+            OCRWord(str(100 * (i + 1)), 90.0, MOSAIC_PAD, MOSAIC_PAD + i * row, 20, 20)
+            for i in range(3)
+        ]
+
+    def test_one_engine_call_per_whitelist(self) -> None:
+        pipeline = OCRPipeline(use_cache=False)
+        crops = {f"seat{i}_stack": np.zeros((20, 60), np.uint8) for i in range(3)}
+        crops["seat0_name"] = np.zeros((20, 60), dtype=np.uint8)
+        whitelists = {f"seat{i}_stack": "0123456789" for i in range(3)}
+
+        engine = pipeline._engine
+        name = OCRResult("Bob", 90.0)
+        with (
+            patch.object(engine, "extract_words", side_effect=self._words_for) as words,
+            patch.object(engine, "extract", return_value=name) as single,
+        ):
+            results = pipeline.process_many(crops, whitelists)
+
+        words.assert_called_once()
+        assert words.call_args.kwargs["whitelist"] == "0123456789"
+        single.assert_called_once()
+        assert {name: r.text for name, r in results.items()} == {
+            "seat0_stack": "100", "seat1_stack": "200", "seat2_stack": "300",
+            "seat0_name": "Bob",
+        }
+
+    def test_batched_fields_fill_result_cache(self) -> None:
+        from bbs_converter.ocr.result_cache import OCRResultCache
+
+        cache = OCRResultCache()
+        pipeline = OCRPipeline(use_cache=False, result_cache=cache)
+        crops = {
+            f"f{i}": np.random.randint(0, 256, (20, 60), dtype=np.uint8)
+            for i in range(3)
+        }
+
+        engine = pipeline._engine
+        fake = self._words_for
+        with patch.object(engine, "extract_words", side_effect=fake) as words:
+            pipeline.process_many(crops)
+            again = pipeline.process_many(crops)
+
+        assert words.call_count == 1
+        assert again["f2"].text == "300"
+
+    def test_mosaic_reads_cached_under_mosaic_psm(self) -> None:
+        from bbs_converter.ocr.result_cache import OCRResultCache
+
+        cache = OCRResultCache()
+        pipeline = OCRPipeline(use_cache=False, result_cache=cache)
+        crops = {
+            f"f{i}": np.random.randint(0, 256, (20, 60), dtype=np.uint8)
+            for i in range(3)
+        }
+
+        engine = pipeline._engine
+        single = OCRResult("7", 90.0)
+        with (
+            patch.object(engine, "extract_words", side_effect=self._words_for),
+            patch.object(engine, "extract", return_value=single) as extract,
+        ):
+            pipeline.process_many(crops)
+            alone = pipeline.process_many({"f0": crops["f0"]})
+
+        extract.assert_called_once()  # the mosaic read does not answer it
+        assert alone["f0"].text == "7"
+
+    def test_process_fields_batches_when_enabled(self) -> None:
+        from bbs_converter.ocr.layout import FieldROI, TableLayout
+        from bbs_converter.utils.constants import FieldKind
+
+        layout = TableLayout(tuple(
+            FieldROI(f"seat{i}_stack", FieldKind.AMOUNT, 0.0, i / 3, 1.0, 1 / 3)
+            for i in range(3)
+        ))
+        pipeline = OCRPipeline(use_cache=False, batch_fields=True)
+        frame = np.zeros((60, 60, 3), dtype=np.uint8)
+
+        engine = pipeline._engine
+        fake = self._words_for
+        with patch.object(engine, "extract_words", side_effect=fake) as words:
+            fields = pipeline.process_fields(frame, layout)
+
+        words.assert_called_once()
+        assert fields["seat1_stack"].text == "200"
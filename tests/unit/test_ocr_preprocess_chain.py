@@ -0,0 +1,82 @@
+"""Tests for the buffer-reusing preprocessing chain."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from bbs_converter.ocr.denoise import reduce_noise
+from bbs_converter.ocr.preprocess_chain import PreprocessChain, PreprocessConfig
+from bbs_converter.ocr.preprocessor import to_grayscale
+from bbs_converter.ocr.threshold import adaptive_threshold
+from bbs_converter.utils.constants import PreprocessStep
+from bbs_converter.utils.exceptions import ConfigError
+
+
+def _frame() -> np.ndarray:
+    rng = np.random.default_rng(7)
+    return rng.integers(0, 256, (40, 60, 4), dtype=np.uint8)
+
+
+class TestPreprocessChain:
+    def test_matches_separate_functions(self) -> None:
+        frame = _frame()
+        expected = reduce_noise(adaptive_threshold(to_grayscale(frame)))
+        np.testing.assert_array_equal(PreprocessChain().run(frame), expected)
+
+    def test_buffers_reused_between_calls(self) -> None:
+        chain = PreprocessChain()
+        first = chain.run(_frame())
+        second = chain.run(_frame())
+        assert second is first
+
+    def test_slots_keep_separate_buffers(self) -> None:
+        chain = PreprocessChain()
+        a = chain.run(_frame(), "field:a")
+        b = chain.run(_frame(), "field:b")
+        assert a is not b
+
+    def test_runs_on_roi_view(self) -> None:
+        gray = to_grayscale(_frame())
+        view = gray[5:25, 10:50]
+        expected = reduce_noise(adaptive_threshold(view.copy()))
+        out = PreprocessChain().run(view, "field:pot")
+        np.testing.assert_array_equal(out, expected)
+
+    def test_step_order_and_invert(self) -> None:
+        steps = (PreprocessStep.THRESHOLD, PreprocessStep.INVERT)
+        frame = _frame()
+        out = PreprocessChain(PreprocessConfig(steps=steps)).run(frame)
+        expected = 255 - adaptive_threshold(to_grayscale(frame))
+        np.testing.assert_array_equal(out, expected)
+
+    def test_grayscale_input_passes_through(self) -> None:
+        gray = to_grayscale(_frame())
+        chain = PreprocessChain(PreprocessConfig(steps=()))
+        assert chain.run(gray) is gray
+
+    def test_timings_per_step(self) -> None:
+        chain = PreprocessChain()
+        chain.run(_frame())
+        timings = chain.timings
+        assert set(timings) == {"grayscale", "threshold", "denoise"}
+        assert all(ms >= 0 for ms in timings.values())
+
+
+class TestPreprocessConfig:
+    def test_from_config(self) -> None:
+        config = PreprocessConfig.from_config(
+            {"steps": ["grayscale", "denoise", "threshold"], "block_size": 15},
+        )
+        assert config.steps == (
+            PreprocessStep.GRAYSCALE, PreprocessStep.DENOISE, PreprocessStep.THRESHOLD,
+        )
+        assert config.block_size == 15
+
+    def test_unknown_step_rejected(self) -> None:
+        with pytest.raises(ConfigError, match="sharpen"):
+            PreprocessConfig.from_config({"steps": ["sharpen"]})
+
+    def test_even_block_size_rejected(self) -> None:
+        with pytest.raises(ConfigError, match="block size"):
+            PreprocessConfig(block_size=10)
@@ -0,0 +1,110 @@
+"""Tests for the content-addressed OCR result cache."""
+
+from __future__ import annotations
+
+import json
+
+import numpy as np
+
+from bbs_converter.ocr.engine import OCRResult, OCRWord
+from bbs_converter.ocr.result_cache import OCRResultCache, cache_key
+
+
+class TestCacheKey:
+    def test_same_content_same_key(self) -> None:
+        a = np.full((10, 20), 255, dtype=np.uint8)
+        assert cache_key(a, "p") == cache_key(a.copy(), "p")
+
+    def test_params_change_key(self) -> None:
+        a = np.zeros((10, 20), dtype=np.uint8)
+        assert cache_key(a, "psm=7") != cache_key(a, "psm=8")
+
+    def test_shape_changes_key(self) -> None:
+        a = np.zeros((10, 20), dtype=np.uint8)
+        assert cache_key(a) != cache_key(a.reshape(20, 10))
+
+    def test_non_contiguous_view(self) -> None:
+        a = np.arange(400, dtype=np.uint8).reshape(20, 20)
+        view = a[::2, ::2]
+        assert cache_key(view) == cache_key(view.copy())
+
+
+class TestOCRResultCache:
+    def test_miss_then_hit(self) -> None:
+        cache = OCRResultCache()
+        result = OCRResult(text="100", confidence=90.0)
+
+        assert cache.get("k") is None
+        cache.put("k", result)
+        assert cache.get("k") == result
+        assert cache.hits == 1
+        assert cache.misses == 1
+        assert cache.hit_rate == 50.0
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = OCRResultCache(max_entries=2)
+        cache.put("a", OCRResult(text="a", confidence=90.0))
+        cache.put("b", OCRResult(text="b", confidence=90.0))
+        cache.get("a")
+        cache.put("c", OCRResult(text="c", confidence=90.0))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.size == 2
+        assert cache.evictions == 1
+
+    def test_persists_across_instances(self, tmp_path) -> None:
+        path = tmp_path / "ocr-cache.json"
+        cache = OCRResultCache(path=path)
+        cache.put("k", OCRResult(text="1/2", confidence=88.5))
+        cache.save()
+
+        reloaded = OCRResultCache(path=path)
+        assert reloaded.get("k") == OCRResult(text="1/2", confidence=88.5)
+
+    def test_tokens_persist(self, tmp_path) -> None:
+        path = tmp_path / "ocr-cache.json"
+        words = [OCRWord("1,250", 91.0, 3, 2, 40, 12, block=1, line=1)]
+        cache = OCRResultCache(path=path)
+        cache.put("k", OCRResult.from_words(words))
+        cache.save()
+
+        tokens = OCRResultCache(path=path).get("k").tokens
+        assert list(tokens) == words
+
+    def test_loads_version_one_without_tokens(self, tmp_path) -> None:
+        path = tmp_path / "ocr-cache.json"
+        path.write_text(json.dumps({"version": 1, "entries": [["k", "50", 90.0]]}))
+        result = OCRResultCache(path=path).get("k")
+        assert result == OCRResult(text="50", confidence=90.0)
+        assert len(result.tokens) == 0
+
+    def test_reload_respects_max_entries(self, tmp_path) -> None:
+        path = tmp_path / "ocr-cache.json"
+        cache = OCRResultCache(path=path)
+        for i in range(5):
+            cache.put(str(i), OCRResult(text=str(i), confidence=90.0))
+        cache.save()
+
+        reloaded = OCRResultCache(max_entries=2, path=path)
+        assert reloaded.size == 2
+        assert reloaded.get("4") is not None
+
+    def test_corrupt_file_ignored(self, tmp_path) -> None:
+        path = tmp_path / "ocr-cache.json"
+        path.write_text("{not json")
+        cache = OCRResultCache(path=path)
+        assert cache.size == 0
+
+    def test_save_without_path_is_noop(self) -> None:
+        OCRResultCache().save()
+
+    def test_take_additions(self) -> None:
+        cache = OCRResultCache()
+        cache.put("a", OCRResult(text="1", confidence=90.0))
+        assert cache.take_additions() == []
+        cache.track_additions()
+        result = OCRResult(text="2", confidence=90.0)
+        cache.put("b", result)
+        assert cache.take_additions() == [("b", result)]
+        assert cache.take_additions() == []
@@ -41,3 +41,11 @@ class TestExtractROI:
         region = CaptureRegion(x=0, y=0, width=50, height=50)
         roi = extract_roi(frame, region)
         assert roi.shape == (50, 50, 3)
+
+    def test_view_without_copy(self) -> None:
+        frame = np.ones((100, 200), dtype=np.uint8) * 42
+        region = CaptureRegion(x=5, y=5, width=10, height=10)
+        roi = extract_roi(frame, region, copy=False)
+        roi[:] = 0
+        assert frame[5, 5] == 0
+        assert np.shares_memory(roi, frame)
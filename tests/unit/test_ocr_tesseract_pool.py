@@ -0,0 +1,276 @@
+"""Tests for the pooled Tesseract C API engine."""
+
+from __future__ import annotations
+
+import ctypes
+import threading
+import time
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from bbs_converter.ocr.factory import create_engine
+from bbs_converter.ocr.tesseract_pool import TesseractPool
+from bbs_converter.utils.constants import OCREngine
+from bbs_converter.utils.exceptions import OCRError
+
+
+class FakeTessLib:
+    """Stand-in for libtesseract's C API returning a fixed word list."""
+
+    def __init__(self, words: list[tuple[str, float]], fail_init: bool = False) -> None:
+        self.words = words
+        self.boxes = [(10 * i, 0, 10 * i + 8, 12) for i in range(len(words))]
+        self.lines = [0] * len(words)  # text line index of each word
+        self.fail_init = fail_init
+        self.fail_recognize = False
+        self.created = 0
+        self.deleted = 0
+        self.images: list[tuple[int, int, int]] = []
+        self.settings: list[tuple[str, object]] = []
+        self._buffers: list[ctypes.Array[ctypes.c_char]] = []
+        self._pos: dict[int, int] = {}
+
+    def TessBaseAPICreate(self) -> int:  # noqa: N802 — C API names
+        self.created += 1
+        return self.created
+
+    def TessBaseAPIInit3(self, api: int, datapath: bytes | None, lang: bytes) -> int:  # noqa: N802
+        return -1 if self.fail_init else 0
+
+    def TessBaseAPISetPageSegMode(self, api: int, psm: int) -> None:  # noqa: N802
+        self.settings.append(("psm", psm))
+
+    def TessBaseAPISetVariable(self, api: int, name: bytes, value: bytes) -> int:  # noqa: N802
+        self.settings.append((name.decode(), value.decode()))
+        return 1
+
+    def TessBaseAPISetImage(self, api, data, width, height, bpp, bpl) -> None:  # noqa: N802
+        self.images.append((width, height, bpl))
+
+    def TessBaseAPIRecognize(self, api: int, monitor: None) -> int:  # noqa: N802
+        return -1 if self.fail_recognize else 0
+
+    def TessBaseAPIGetIterator(self, api: int) -> int:  # noqa: N802
+        it = 1000 + api
+        self._pos[it] = 0
+        return it
+
+    def TessResultIteratorGetPageIterator(self, it: int) -> int:  # noqa: N802
+        return it
+
+    def TessResultIteratorGetUTF8Text(self, it: int, level: int) -> int:  # noqa: N802
+        buf = ctypes.create_string_buffer(self.words[self._pos[it]][0].encode())
+        self._buffers.append(buf)
+        return ctypes.addressof(buf)
+
+    def TessResultIteratorConfidence(self, it: int, level: int) -> float:  # noqa: N802
+        return self.words[self._pos[it]][1]
+
+    def TessPageIteratorBoundingBox(  # noqa: N802
+        self, it: int, level: int, left, top, right, bottom,
+    ) -> int:
+        index = self._pos[it]
+        for ref, value in zip((left, top, right, bottom), self.boxes[index]):
+            ref._obj.value = value
+        return 1
+
+    def TessPageIteratorIsAtBeginningOf(self, it: int, level: int) -> int:  # noqa: N802
+        index = self._pos[it]
+        if index == 0:
+            return 1
+        return int(level == 2 and self.lines[index] != self.lines[index - 1])
+
+    def TessPageIteratorNext(self, it: int, level: int) -> int:  # noqa: N802
+        self._pos[it] += 1
+        return int(self._pos[it] < len(self.words))
+
+    def TessResultIteratorDelete(self, it: int) -> None:  # noqa: N802
+        pass
+
+    def TessDeleteText(self, ptr: int) -> None:  # noqa: N802
+        pass
+
+    def TessBaseAPIClear(self, api: int) -> None:  # noqa: N802
+        pass
+
+    def TessBaseAPIEnd(self, api: int) -> None:  # noqa: N802
+        pass
+
+    def TessBaseAPIDelete(self, api: int) -> None:  # noqa: N802
+        self.deleted += 1
+
+
+def _pool(lib: FakeTessLib, size: int = 2) -> TesseractPool:
+    with patch(
+        "bbs_converter.ocr.tesseract_pool._load_libtesseract", return_value=lib,
+    ):
+        return TesseractPool(size=size)
+
+
+class TestTesseractPool:
+    def test_instances_created_up_front(self) -> None:
+        lib = FakeTessLib([("x", 90.0)])
+        pool = _pool(lib, size=3)
+        assert lib.created == 3
+        assert pool.health.idle == 3
+
+    def test_extract_matches_pytesseract_filtering(self) -> None:
+        lib = FakeTessLib([("Pot:", 90.0), ("", 80.0), ("150", 70.0), ("noise", -1.0)])
+        pool = _pool(lib)
+        result = pool.extract(np.zeros((20, 40), dtype=np.uint8))
+        assert result.text == "Pot: 150"
+        assert result.confidence == pytest.approx(80.0)
+        assert lib.images == [(40, 20, 40)]
+
+    def test_instances_are_reused(self) -> None:
+        lib = FakeTessLib([("a", 90.0)])
+        pool = _pool(lib, size=1)
+        for _ in range(5):
+            pool.extract(np.zeros((8, 8), dtype=np.uint8))
+        assert lib.created == 1
+        health = pool.health
+        assert health.calls == 5
+        assert health.healthy
+
+    def test_failed_instance_is_replaced(self) -> None:
+        lib = FakeTessLib([("a", 90.0)])
+        pool = _pool(lib, size=1)
+        lib.fail_recognize = True
+        with pytest.raises(OCRError, match="recognition failed"):
+            pool.extract(np.zeros((8, 8), dtype=np.uint8))
+        lib.fail_recognize = False
+        assert pool.extract(np.zeros((8, 8), dtype=np.uint8)).text == "a"
+        health = pool.health
+        assert health.restarts == 1
+        assert health.failures == 1
+        assert health.size == 1
+
+    def test_per_call_settings_applied_only_on_change(self) -> None:
+        lib = FakeTessLib([("1", 90.0)])
+        pool = _pool(lib, size=1)
+        lib.settings.clear()
+        image = np.zeros((8, 8), dtype=np.uint8)
+        pool.extract(image, psm=8, whitelist="0123")
+        pool.extract(image, psm=8, whitelist="0123")
+        pool.extract(image)
+        assert lib.settings == [
+            ("psm", 8), ("tessedit_char_whitelist", "0123"),
+            ("psm", 7), ("tessedit_char_whitelist", ""),
+        ]
+
+    def test_extract_words_reports_boxes(self) -> None:
+        lib = FakeTessLib([("1/2", 90.0), ("noise", -1.0), ("150", 70.0)])
+        pool = _pool(lib, size=1)
+        words = pool.extract_words(np.zeros((20, 40), dtype=np.uint8), psm=6)
+        assert [(w.text, w.left, w.width, w.height) for w in words] == [
+            ("1/2", 0, 8, 12), ("150", 20, 8, 12),
+        ]
+
+    def test_extract_keeps_tokens_with_line_numbers(self) -> None:
+        lib = FakeTessLib([("Pot", 90.0), ("150", 80.0), ("Seat", 85.0)])
+        lib.lines = [0, 0, 1]
+        result = _pool(lib, size=1).extract(np.zeros((20, 40), dtype=np.uint8))
+        assert result.text == "Pot 150 Seat"
+        assert result.tokens.boxes[:, 0].tolist() == [0, 10, 20]
+        assert result.tokens.records["line"].tolist() == [1, 1, 2]
+        assert result.tokens.records["block"].tolist() == [1, 1, 1]
+
+    def test_colour_image_rejected(self) -> None:
+        lib = FakeTessLib([("a", 90.0)])
+        pool = _pool(lib)
+        with pytest.raises(OCRError, match="single-channel"):
+            pool.extract(np.zeros((8, 8, 3), dtype=np.uint8))
+        # Bad input is not an engine failure: no instance is recycled.
+        health = pool.health
+        assert (health.calls, health.failures, health.restarts) == (0, 0, 0)
+        assert lib.created == 2
+
+    def test_bad_language_raises(self) -> None:
+        with pytest.raises(OCRError, match="language"):
+            _pool(FakeTessLib([], fail_init=True))
+
+    def test_concurrent_extract(self) -> None:
+        lib = FakeTessLib([("a", 90.0)])
+        pool = _pool(lib, size=2)
+        results: list[str] = []
+        lock = threading.Lock()
+
+        def work() -> None:
+            for _ in range(20):
+                text = pool.extract(np.zeros((8, 8), dtype=np.uint8)).text
+                with lock:
+                    results.append(text)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert results == ["a"] * 80
+        assert lib.created == 2
+
+    def test_closed_pool_raises(self) -> None:
+        lib = FakeTessLib([("a", 90.0)])
+        pool = _pool(lib, size=2)
+        pool.close()
+        assert lib.deleted == 2
+        with pytest.raises(OCRError, match="closed"):
+            pool.extract(np.zeros((8, 8), dtype=np.uint8))
+
+    def test_close_frees_borrowed_instances(self) -> None:
+        lib = FakeTessLib([("a", 90.0)])
+        pool = _pool(lib, size=1)
+        release = threading.Event()
+        recognize = lib.TessBaseAPIRecognize
+
+        def slow_recognize(api: int, monitor: None) -> int:
+            release.wait(timeout=5.0)
+            return recognize(api, monitor)
+
+        lib.TessBaseAPIRecognize = slow_recognize  # type: ignore[method-assign]
+        worker = threading.Thread(
+            target=pool.extract, args=(np.zeros((8, 8), dtype=np.uint8),),
+        )
+        worker.start()
+        while pool.health.idle:
+            time.sleep(0.001)
+        pool.close()
+        assert lib.deleted == 0
+        release.set()
+        worker.join()
+        assert lib.deleted == 1
+
+    def test_partial_startup_frees_created_instances(self) -> None:
+        lib = FakeTessLib([])
+        init = lib.TessBaseAPIInit3
+
+        def flaky_init(api: int, datapath: bytes | None, lang: bytes) -> int:
+            return -1 if api == 3 else init(api, datapath, lang)
+
+        lib.TessBaseAPIInit3 = flaky_init  # type: ignore[method-assign]
+        with pytest.raises(OCRError, match="language"):
+            _pool(lib, size=4)
+        assert lib.created == 3
+        assert lib.deleted == 3
+
+    def test_missing_library_raises(self) -> None:
+        with patch("ctypes.util.find_library", return_value=None):
+            with pytest.raises(OCRError, match="libtesseract"):
+                TesseractPool()
+
+
+class TestCreateEngine:
+    def test_selects_pool(self) -> None:
+        lib = FakeTessLib([("a", 90.0)])
+        with patch(
+            "bbs_converter.ocr.tesseract_pool._load_libtesseract", return_value=lib,
+        ):
+            engine = create_engine(OCREngine.TESSERACT_POOL, pool_size=1)
+        assert isinstance(engine, TesseractPool)
+
+    def test_default_is_subprocess_engine(self) -> None:
+        from bbs_converter.ocr.engine import TesseractEngine
+
+        assert isinstance(create_engine(OCREngine.TESSERACT), TesseractEngine)
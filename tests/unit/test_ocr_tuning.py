@@ -0,0 +1,137 @@
+"""Tests for the preprocessing/engine parameter tuner."""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+import pytest
+
+from bbs_converter.ocr.layout import FieldROI, TableLayout
+from bbs_converter.ocr.pipeline import OCRPipeline
+from bbs_converter.ocr.preprocess_chain import PreprocessConfig
+from bbs_converter.ocr.tuning import (
+    LabelledFrame,
+    TrialResult,
+    TunedProfile,
+    candidate_profiles,
+    evaluate,
+    find_profile,
+    select_best,
+    tune,
+)
+from bbs_converter.utils.constants import DEFAULT_PSM, FieldKind, PreprocessStep
+from bbs_converter.utils.exceptions import ConfigError
+
+G, T, D = PreprocessStep.GRAYSCALE, PreprocessStep.THRESHOLD, PreprocessStep.DENOISE
+
+
+@pytest.fixture(autouse=True)
+def _engines(psm_engines):
+    # Reads "100" in single-line mode and garbage otherwise.
+    with psm_engines({7: "100"}, default="l00"):
+        yield
+
+
+def corpus(n: int = 3, expected="100") -> list[LabelledFrame]:
+    frame = np.full((40, 120, 4), 200, dtype=np.uint8)
+    return [LabelledFrame(frame, expected) for _ in range(n)]
+
+
+class TestTunedProfile:
+    def test_config_round_trip(self) -> None:
+        profile = TunedProfile(PreprocessConfig((G, T), 15, 5, 3), psm=6)
+        assert TunedProfile.from_config(profile.to_config()) == profile
+
+    def test_find_profile(self) -> None:
+        ocr = {"profiles": {"stars": {"800x600": {"block_size": 21, "psm": 13}}}}
+        profile = find_profile(ocr, "stars", 800, 600)
+        assert profile is not None
+        assert profile.preprocess.block_size == 21
+        assert profile.psm == 13
+        assert find_profile(ocr, "stars", 1024, 768) is None
+        assert find_profile(ocr, "party", 800, 600) is None
+        assert find_profile({}, "stars", 800, 600) is None
+
+
+class TestCandidateProfiles:
+    def test_full_grid(self) -> None:
+        profiles = candidate_profiles([(G, T, D)], [11, 15], [2, 5], [1, 3], [6, 7])
+        assert len(profiles) == 16
+
+    def test_unused_parameters_not_swept(self) -> None:
+        profiles = candidate_profiles([(G, T), (G, D)], [11, 15], [2], [1, 3], [7])
+        with_threshold = [p for p in profiles if T in p.preprocess.steps]
+        assert len(with_threshold) == 2  # block sizes only, kernel fixed
+        assert len(profiles) == 4        # plus kernels only for denoise
+
+    def test_invalid_size_raises(self) -> None:
+        with pytest.raises(ConfigError):
+            candidate_profiles([(G, T)], [4], [2], [3], [7])
+
+
+class TestEvaluate:
+    def test_accuracy_follows_engine(self) -> None:
+        good = evaluate(TunedProfile(psm=7), corpus())
+        bad = evaluate(TunedProfile(psm=6), corpus())
+        assert good.accuracy == 1.0
+        assert bad.accuracy == 0.0
+        assert good.ms_per_frame > 0
+
+    def test_whitespace_is_normalised(self) -> None:
+        result = evaluate(TunedProfile(), corpus(expected="  100 "))
+        assert result.accuracy == 1.0
+
+    def test_warm_up_read_is_not_timed(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        reads = []
+        process = OCRPipeline.process
+
+        def slow_first_read(self, frame, *args, **kwargs):
+            if not reads:
+                time.sleep(0.3)
+            reads.append(frame)
+            return process(self, frame, *args, **kwargs)
+
+        monkeypatch.setattr(OCRPipeline, "process", slow_first_read)
+        result = evaluate(TunedProfile(psm=7), corpus())
+        assert len(reads) == 4
+        assert result.accuracy == 1.0
+        assert result.ms_per_frame < 50
+
+    def test_fields_scored_individually(self) -> None:
+        layout = TableLayout((
+            FieldROI("pot", FieldKind.TEXT, 0.0, 0.0, 0.5, 1.0),
+            FieldROI("stack", FieldKind.TEXT, 0.5, 0.0, 0.5, 1.0),
+        ))
+        expected = {"pot": "100", "stack": "250"}
+        result = evaluate(TunedProfile(), corpus(2, expected), layout=layout)
+        assert result.accuracy == 0.5
+
+
+class TestSelection:
+    def _result(self, accuracy: float, ms: float) -> TrialResult:
+        return TrialResult(TunedProfile(psm=DEFAULT_PSM), accuracy, ms)
+
+    def test_fast_but_inaccurate_loses(self) -> None:
+        slow = self._result(0.95, 20.0)
+        fast = self._result(0.30, 1.0)
+        assert select_best([slow, fast]) is slow
+
+    def test_faster_within_tolerance_wins(self) -> None:
+        slow = self._result(0.95, 20.0)
+        fast = self._result(0.94, 5.0)
+        assert select_best([slow, fast], tolerance=0.02) is fast
+        assert select_best([slow, fast], tolerance=0.0) is slow
+
+    def test_empty_results_raise(self) -> None:
+        with pytest.raises(ConfigError):
+            select_best([])
+
+    def test_tune_ranks_by_score(self) -> None:
+        profiles = [TunedProfile(psm=6), TunedProfile(psm=7)]
+        results = tune(corpus(), profiles)
+        assert results[0].profile.psm == 7
+
+    def test_tune_rejects_empty_corpus(self) -> None:
+        with pytest.raises(ConfigError):
+            tune([], [TunedProfile()])
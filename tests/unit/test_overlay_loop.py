@@ -64,3 +64,46 @@ class TestOverlayLoop:
             time.sleep(0.03)
             loop.stop()
             # Should not crash when state is None
+
+    def test_exposes_refresh_timing(self) -> None:
+        cv2_mock = MagicMock()
+        cv2_mock.WINDOW_NORMAL = 0
+        cv2_mock.WND_PROP_TOPMOST = 5
+
+        get_state = MagicMock(return_value=None)
+
+        with patch.dict(sys.modules, {"cv2": cv2_mock}):
+            from bbs_converter.overlay.loop import OverlayLoop
+            loop = OverlayLoop(self._make_region(), get_state, refresh_hz=100)
+            loop.start()
+            time.sleep(0.1)
+            loop.stop()
+
+        stats = loop.timing_stats
+        assert stats.count > 0
+        assert stats.mean_ms > 0
+
+    def test_one_window_per_table(self) -> None:
+        cv2_mock = MagicMock()
+        cv2_mock.WINDOW_NORMAL = 0
+        cv2_mock.WND_PROP_TOPMOST = 5
+        cv2_mock.FONT_HERSHEY_SIMPLEX = 0
+        cv2_mock.getTextSize.return_value = ((100, 20), 5)
+
+        first = MagicMock(return_value=BBState(pot_bb=1.0, stacks_bb={"A": 5.0}))
+        second = MagicMock(return_value=None)
+        tables = [
+            (self._make_region(), first),
+            (CaptureRegion(x=400, y=0, width=400, height=300), second),
+        ]
+
+        with patch.dict(sys.modules, {"cv2": cv2_mock}):
+            from bbs_converter.overlay.loop import OverlayLoop
+            loop = OverlayLoop.for_tables(tables, refresh_hz=100)
+            loop.start()
+            time.sleep(0.05)
+            loop.stop()
+
+        titles = [c.args[0] for c in cv2_mock.namedWindow.call_args_list]
+        assert len(set(titles)) == 2
+        assert first.call_count > 0 and second.call_count > 0
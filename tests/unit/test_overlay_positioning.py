@@ -34,3 +34,11 @@ class TestComputePositions:
         for name, (x, y) in positions.items():
             assert 0 <= x < region.width
             assert 0 < y < region.height
+
+    def test_anchored_players_placed_at_their_seat(self) -> None:
+        region = CaptureRegion(x=0, y=0, width=400, height=300)
+        positions = compute_positions(
+            region, ["Alice", "Bob"], anchors={"Bob": (200, 40)},
+        )
+        assert positions["Bob"] == (176, 62)
+        assert positions["Alice"] == (10, 150)
@@ -26,9 +26,9 @@ class TestAssembleTableState:
     def test_no_player_stacks_only_keywords(self) -> None:
         text = "Blinds: 50/100\nPot: 350"
         state = assemble_table_state(text)
-        # stack parser picks up keywords as names — sanitizer handles this later
         assert state.big_blind == 100.0
         assert state.pot == 350.0
+        assert state.stacks == {}
 
     def test_missing_blinds_raises(self) -> None:
         text = "Pot: 350\nAlice 5000"
@@ -0,0 +1,60 @@
+"""Tests for OCR confusion repair."""
+
+from __future__ import annotations
+
+import pytest
+
+from bbs_converter.parser.confusion import repair_for, within_edits
+from bbs_converter.parser.profiles import DEFAULT_PROFILE, SiteProfile
+
+
+class TestWithinEdits:
+    @pytest.mark.parametrize(("a", "b", "edits", "expected"), [
+        ("blinds", "blinds", 0, True),
+        ("bllnds", "blinds", 1, True),
+        ("blnds", "blinds", 1, True),
+        ("blindss", "blinds", 1, True),
+        ("bxxnds", "blinds", 1, False),
+        ("bl", "blinds", 1, False),
+    ])
+    def test_bound(self, a: str, b: str, edits: int, expected: bool) -> None:
+        assert within_edits(a, b, edits) is expected
+
+
+class TestOCRRepair:
+    def test_digits_inside_numbers(self) -> None:
+        repair = repair_for(DEFAULT_PROFILE)
+        assert repair.repair("Alice 1,O00 Pot 5OO") == "Alice 1,000 Pot 500"
+        assert repair.repair("Bob l,2OO") == "Bob 1,200"
+        assert repair.repair("Ian 2.5Ok") == "Ian 2.50k"
+
+    def test_names_left_alone(self) -> None:
+        repair = repair_for(DEFAULT_PROFILE)
+        text = "Io 500 IS 20 Bo8 30 Player1 40 Sid 50"
+        assert repair.repair(text) == text
+
+    def test_misread_labels(self) -> None:
+        repair = repair_for(DEFAULT_PROFILE)
+        assert repair.repair("B1inds: 5O/1OO") == "blinds: 50/100"
+        text = "B|inds 1/2 Tota1 30 5eat 2"
+        assert repair.repair(text) == "blinds 1/2 total 30 seat 2"
+
+    def test_fuzzy_labels_only_on_request(self) -> None:
+        repair = repair_for(DEFAULT_PROFILE)
+        assert repair.repair("Bllnds 50/100") == "Bllnds 50/100"
+        assert repair.repair("Bllnds 50/100", fuzzy=True) == "blinds 50/100"
+        assert repair.repair("Pat 50", fuzzy=True) == "Pat 50"  # labels < 5 exact
+
+    def test_amount_fields_need_no_real_digit(self) -> None:
+        repair = repair_for(DEFAULT_PROFILE)
+        reading = {"pot": "SOO", "seat1_stack": "l,ZOO", "seat1_name": "SOO"}
+        assert repair.repair_reading(reading) == {
+            "pot": "500", "seat1_stack": "1,200", "seat1_name": "SOO",
+        }
+
+    def test_profile_number_format(self) -> None:
+        repair = repair_for(SiteProfile(
+            name="eu", thousands_separator=".", decimal_separator=",",
+            blind_labels=("stakes",),
+        ))
+        assert repair.repair("5takes 1.O00,5O") == "stakes 1.000,50"
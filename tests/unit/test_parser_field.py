@@ -0,0 +1,57 @@
+"""Tests for the per-field table assembler."""
+
+from __future__ import annotations
+
+import pytest
+
+from bbs_converter.parser.field_parser import assemble_from_fields, parse_amount
+from bbs_converter.utils.exceptions import ParserError
+
+
+class TestParseAmount:
+    def test_plain_and_formatted(self) -> None:
+        assert parse_amount("5000") == 5000.0
+        assert parse_amount("$1,250.50") == 1250.5
+
+    def test_no_digits(self) -> None:
+        assert parse_amount("All-in") is None
+
+
+class TestAssembleFromFields:
+    def test_full_table(self) -> None:
+        state = assemble_from_fields({
+            "blinds": "50/100",
+            "pot": "1,500",
+            "seat1_name": "Alice",
+            "seat1_stack": "5,000",
+            "seat2_name": "Bob",
+            "seat2_stack": "$2400",
+        })
+        assert (state.small_blind, state.big_blind) == (50.0, 100.0)
+        assert state.pot == 1500.0
+        assert state.stacks == {"Alice": 5000.0, "Bob": 2400.0}
+
+    def test_labelled_fields_still_parse(self) -> None:
+        state = assemble_from_fields({"blinds": "Blinds: 1/2", "pot": "Pot: 30"})
+        assert state.big_blind == 2.0
+        assert state.pot == 30.0
+
+    def test_seat_without_stack_is_skipped(self) -> None:
+        state = assemble_from_fields({
+            "blinds": "1/2", "seat3_name": "Carol", "seat4_stack": "100",
+        })
+        assert state.stacks == {}
+
+    def test_names_with_digits_are_not_read_as_amounts(self) -> None:
+        # Separate crops mean "Player22" never bleeds into a stack.
+        state = assemble_from_fields({
+            "blinds": "1/2", "seat1_name": "Player22", "seat1_stack": "300",
+        })
+        assert state.stacks == {"Player22": 300.0}
+
+    def test_missing_pot_defaults_to_zero(self) -> None:
+        assert assemble_from_fields({"blinds": "1/2"}).pot == 0.0
+
+    def test_missing_blinds_raises(self) -> None:
+        with pytest.raises(ParserError):
+            assemble_from_fields({"pot": "100"})
@@ -0,0 +1,93 @@
+"""Tests for the single-pass table text lexer."""
+
+from __future__ import annotations
+
+import pytest
+
+from bbs_converter.parser.blind_parser import parse_blinds
+from bbs_converter.parser.lexer import DEFAULT_LEXER, lex_table, tokenize
+from bbs_converter.parser.pot_parser import parse_pot
+from bbs_converter.parser.stack_parser import parse_stacks
+from bbs_converter.utils.constants import TokenKind
+
+
+class TestTokenize:
+    def test_classifies_each_span(self) -> None:
+        text = "Blinds: 50/100 Pot: 350 Seat 3: Alice 5,000 Dealer 42"
+        kinds = [token.kind for token in tokenize(text)]
+        assert kinds == [
+            TokenKind.BLINDS, TokenKind.POT, TokenKind.SEAT,
+            TokenKind.KEYWORD, TokenKind.AMOUNT,
+        ]
+
+    def test_spans_point_into_text(self) -> None:
+        text = "Pot: 350 Alice 12"
+        spans = [text[t.start:t.end] for t in tokenize(text)]
+        assert spans == ["Pot: 350", "Alice 12"]
+
+    def test_name_without_stack(self) -> None:
+        (token,) = tokenize("Alice")
+        assert token.kind is TokenKind.NAME
+        assert token.name == "Alice"
+        assert token.amounts == ()
+
+    def test_keyword_prefix_is_still_a_name(self) -> None:
+        names = [t.name for t in tokenize("Potter 12 Betty 30 Blake 7")]
+        assert names == ["Potter", "Betty", "Blake"]
+
+
+class TestLexTable:
+    def test_full_text(self) -> None:
+        table = lex_table("Blinds: 50/100\nPot: 350\nAlice 5000\nBob: $3,200")
+        assert table.blinds == (50.0, 100.0)
+        assert table.pot == 350.0
+        assert table.stacks == {"Alice": 5000.0, "Bob": 3200.0}
+
+    def test_keywords_never_become_stacks(self) -> None:
+        table = lex_table("Pot 350 Total 400 Fold 20 Raise 60 Alice 900")
+        assert table.stacks == {"Alice": 900.0}
+        assert table.pot == 350.0
+
+    def test_seats_and_their_stacks(self) -> None:
+        table = lex_table("Seat 1: Alice 1,500\nSeat #2: Bob\nBob 800")
+        assert table.seats == {1: "Alice", 2: "Bob"}
+        assert table.stacks == {"Alice": 1500.0, "Bob": 800.0}
+
+    def test_seat_showing_an_action_has_no_player(self) -> None:
+        table = lex_table("Seat 4: Fold 200")
+        assert table.seats == {}
+        assert table.stacks == {}
+
+    def test_first_blinds_and_pot_win(self) -> None:
+        table = lex_table("BL 25/50 Pot 10 Blinds 50/100 Pot 20")
+        assert table.blinds == (25.0, 50.0)
+        assert table.pot == 10.0
+
+    def test_empty_text(self) -> None:
+        table = lex_table("")
+        assert table.blinds is None
+        assert table.pot is None
+        assert table.stacks == {}
+
+    def test_parse_helpers_share_one_pass(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls = []
+        real_lex = DEFAULT_LEXER.lex
+
+        def counting_lex(text: str):
+            calls.append(text)
+            return real_lex(text)
+
+        monkeypatch.setattr(DEFAULT_LEXER, "lex", counting_lex)
+        lex_table.cache_clear()
+        text = "Blinds: 5/10 Pot: 40 Alice 990 Bob 1010"
+        assert parse_blinds(text) == (5.0, 10.0)
+        assert parse_pot(text) == 40.0
+        assert parse_stacks(text) == {"Alice": 990.0, "Bob": 1010.0}
+        assert calls == [text]
+
+    def test_parse_stacks_returns_a_private_copy(self) -> None:
+        text = "Alice 990 Bob 1010"
+        parse_stacks(text)["Alice"] = 0.0
+        assert parse_stacks(text) == {"Alice": 990.0, "Bob": 1010.0}
@@ -0,0 +1,154 @@
+"""Tests for the memoized parse layer."""
+
+from __future__ import annotations
+
+import pytest
+
+from bbs_converter.parser.memo import ParseMemo, memo_key
+from bbs_converter.utils.exceptions import ParserError
+
+
+class TestMemoKey:
+    def test_folds_whitespace_and_case(self) -> None:
+        assert memo_key("Blinds: 50/100   Alice\n5000") == memo_key(
+            "blinds: 50/100 ALICE 5000",
+        )
+
+    def test_field_order_ignored(self) -> None:
+        a = memo_key({"pot": "1,200", "blinds": "50/100"})
+        b = memo_key({"blinds": "50/100", "pot": " 1,200"})
+        assert a == b
+
+    def test_different_text_differs(self) -> None:
+        assert memo_key("Pot: 100") != memo_key("Pot: 101")
+
+
+class TestParseMemo:
+    def test_parses_and_converts(self) -> None:
+        memo = ParseMemo()
+        table, bb_state = memo.parse("Blinds: 50/100 Pot: 300 Alice 5000")
+        assert table.big_blind == 100.0
+        assert bb_state.pot_bb == 3.0
+        assert bb_state.stacks_bb == {"Alice": 50.0}
+
+    def test_repeat_returns_same_objects(self) -> None:
+        memo = ParseMemo()
+        first = memo.parse("Blinds: 50/100 Alice 5000")
+        second = memo.parse("blinds:  50/100 Alice 5000")
+        assert first[0] is second[0]
+        assert first[1] is second[1]
+        assert memo.hits == 1
+        assert memo.misses == 1
+        assert memo.hit_rate == pytest.approx(50.0)
+
+    def test_field_readings(self) -> None:
+        memo = ParseMemo()
+        fields = {"blinds": "50/100", "pot": "200"}
+        _, first = memo.parse(fields)
+        _, second = memo.parse(dict(fields))
+        assert first is second
+        assert first.pot_bb == 2.0
+
+    def test_failure_remembered(self) -> None:
+        memo = ParseMemo()
+        for _ in range(2):
+            with pytest.raises(ParserError):
+                memo.parse("nothing useful")
+        assert memo.hits == 1
+        assert memo.misses == 1
+
+    def test_evicts_least_recently_used(self) -> None:
+        memo = ParseMemo(max_entries=2)
+        a = memo.parse("Blinds: 1/2")
+        memo.parse("Blinds: 2/4")
+        memo.parse("Blinds: 1/2")  # refresh a
+        memo.parse("Blinds: 5/10")  # evicts 2/4
+        assert memo.size == 2
+        assert memo.parse("Blinds: 1/2") is a
+        memo.parse("Blinds: 2/4")
+        assert memo.misses == 4
+
+    def test_parses_with_profile(self) -> None:
+        from bbs_converter.parser.profiles import SiteProfile
+
+        profile = SiteProfile(name="eu", blind_labels=("stakes",), keywords=("fold",))
+        memo = ParseMemo(profile=profile)
+        table, _ = memo.parse("Stakes 1/2 Blinds 40 Anna 80")
+        assert memo.profile is profile
+        assert table.big_blind == 2.0
+        assert table.stacks == {"Blinds": 40.0, "Anna": 80.0}
+
+    def test_recovers_confused_reads(self) -> None:
+        memo = ParseMemo()
+        table, _ = memo.parse("B1inds: 5O/1OO Alice 1,O00")
+        assert (table.small_blind, table.big_blind) == (50.0, 100.0)
+        assert table.stacks == {"Alice": 1000.0}
+        assert memo.repairs == 1
+
+    def test_fuzzy_label_only_when_parse_fails(self) -> None:
+        memo = ParseMemo()
+        table, _ = memo.parse("Bllnds 50/100 Blink 300")
+        assert table.big_blind == 100.0
+        assert table.stacks == {}
+        table, _ = memo.parse("Blinds 50/100 Blink 300")
+        assert table.stacks == {"Blink": 300.0}
+
+    def test_clean_read_not_counted_as_repair(self) -> None:
+        memo = ParseMemo()
+        memo.parse("Blinds 50/100 Alice 300")
+        assert memo.repairs == 0
+
+    def test_places_players_by_word_boxes(self) -> None:
+        from bbs_converter.ocr.engine import OCRResult, OCRWord
+        from bbs_converter.parser.spatial import SeatIndex, SeatTemplate
+
+        index = SeatIndex(SeatTemplate.for_table_size(2), 400, 400)
+        # Both stacks are read before both names.
+        result = OCRResult.from_words([
+            OCRWord("Blinds", 90.0, 170, 190, 40, 12),
+            OCRWord("5/10", 90.0, 215, 190, 30, 12),
+            OCRWord("200", 90.0, 180, 80, 40, 12, block=1, line=2),
+            OCRWord("350", 90.0, 180, 360, 40, 12, block=2, line=2),
+            OCRWord("Alice", 90.0, 180, 50, 40, 12, block=1, line=1),
+            OCRWord("Bob", 90.0, 180, 330, 40, 12, block=2, line=1),
+        ])
+        memo = ParseMemo(seat_index=index)
+        table, bb_state = memo.parse(result.text, result.tokens)
+        assert memo.seat_index is index
+        assert table.stacks == {"Alice": 200.0, "Bob": 350.0}
+        assert [player.seat for player in table.players] == [1, 2]
+        assert bb_state.stacks_bb == {"Alice": 20.0, "Bob": 35.0}
+        assert bb_state.positions == {"Alice": (200, 56), "Bob": (200, 336)}
+
+    def test_players_in_other_seats_parsed_again(self) -> None:
+        from bbs_converter.ocr.engine import OCRResult, OCRWord
+        from bbs_converter.parser.spatial import SeatIndex, SeatTemplate
+
+        def read(alice_y: int, bob_y: int) -> OCRResult:
+            return OCRResult.from_words([
+                OCRWord("Blinds", 90.0, 170, 190, 40, 12),
+                OCRWord("5/10", 90.0, 215, 190, 30, 12),
+                OCRWord("Alice", 90.0, 180, alice_y, 40, 12, block=1, line=1),
+                OCRWord("200", 90.0, 180, alice_y + 30, 40, 12, block=1, line=2),
+                OCRWord("Bob", 90.0, 180, bob_y, 40, 12, block=2, line=1),
+                OCRWord("350", 90.0, 180, bob_y + 30, 40, 12, block=2, line=2),
+            ])
+
+        memo = ParseMemo(seat_index=SeatIndex(SeatTemplate.for_table_size(2), 400, 400))
+        first = read(50, 330)
+        memo.parse(first.text, first.tokens)
+        memo.parse(first.text, first.tokens)
+        swapped = read(330, 50)
+        assert swapped.text == first.text
+        table, _ = memo.parse(swapped.text, swapped.tokens)
+        assert (memo.hits, memo.misses) == (1, 2)
+        seats = {player.name: player.seat for player in table.players}
+        assert seats == {"Alice": 2, "Bob": 1}
+
+    def test_without_tokens_pairs_by_text(self) -> None:
+        from bbs_converter.parser.spatial import SeatIndex, SeatTemplate
+
+        memo = ParseMemo(seat_index=SeatIndex(SeatTemplate.for_table_size(2), 400, 400))
+        table, bb_state = memo.parse("Blinds 5/10 Alice 200")
+        assert table.stacks == {"Alice": 200.0}
+        assert bb_state.positions == {}
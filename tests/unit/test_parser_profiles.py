@@ -0,0 +1,98 @@
+"""Tests for per-site parsing profiles."""
+
+from __future__ import annotations
+
+import pytest
+
+from bbs_converter.parser.lexer import TableLexer, lexer_for
+from bbs_converter.parser.profiles import (
+    DEFAULT_PROFILE,
+    SiteProfile,
+    load_profiles,
+    select_profile,
+)
+from bbs_converter.utils.exceptions import ConfigError
+
+
+class TestSiteProfile:
+    def test_from_config_overrides_given_keys(self) -> None:
+        profile = SiteProfile.from_config("eu", {
+            "blind_labels": ["stakes"],
+            "currency": ["€"],
+            "thousands_separator": ".",
+            "decimal_separator": ",",
+            "suffixes": {"K": 1000},
+        })
+        assert profile.name == "eu"
+        assert profile.blind_labels == ("stakes",)
+        assert profile.pot_labels == DEFAULT_PROFILE.pot_labels
+        assert profile.suffixes == (("k", 1000.0),)
+
+    def test_table_words_include_labels(self) -> None:
+        profile = SiteProfile(blind_labels=("Stakes",), keywords=("fold",))
+        assert {"stakes", "fold", "pot", "seat"} <= profile.table_words
+
+    @pytest.mark.parametrize("section", [
+        {"colour": "red"},
+        {"blind_labels": []},
+        {"blind_labels": "stakes"},
+        {"decimal_separator": ""},
+        {"thousands_separator": ",", "decimal_separator": ","},
+        {"thousands_separator": "x"},
+        {"suffixes": {"kk": 1000}},
+        {"suffixes": {"k": 0}},
+    ])
+    def test_invalid_sections_rejected(self, section: dict) -> None:
+        with pytest.raises(ConfigError):
+            SiteProfile.from_config("bad", section)
+
+    def test_load_profiles_keeps_default(self) -> None:
+        profiles = load_profiles({"eu": {"currency": ["€"]}})
+        assert profiles["default"] is DEFAULT_PROFILE
+        assert profiles["eu"].currency == ("€",)
+
+    def test_select_unknown_site(self) -> None:
+        with pytest.raises(ConfigError, match="stars"):
+            select_profile(load_profiles({}), "stars")
+
+
+class TestProfileLexer:
+    def _eu(self) -> TableLexer:
+        return lexer_for(SiteProfile(
+            name="eu",
+            blind_labels=("stakes",),
+            pot_labels=("main pot", "pot"),
+            keywords=("fold", "all-in"),
+            currency=("€",),
+            thousands_separator=".",
+            decimal_separator=",",
+        ))
+
+    def test_compiled_once_per_profile(self) -> None:
+        profile = SiteProfile(name="x", currency=("£",))
+        assert lexer_for(profile) is lexer_for(SiteProfile(name="x", currency=("£",)))
+
+    def test_locale_number_format(self) -> None:
+        table = self._eu().lex("Stakes €0,50/€1 Main Pot: €1.250,50 Anna €98,25")
+        assert table.blinds == (0.5, 1.0)
+        assert table.pot == 1250.5
+        assert table.stacks == {"Anna": 98.25}
+
+    def test_profile_keywords_are_not_names(self) -> None:
+        table = self._eu().lex("All-in 300 Fold 20 Stakes 300 Anna 5")
+        assert table.stacks == {"Anna": 5.0}
+
+    def test_amount_suffixes(self) -> None:
+        table = lexer_for(DEFAULT_PROFILE).lex("Blinds 1k/2k Alice 12.5k Bob 1.2M kate")
+        assert table.blinds == (1000.0, 2000.0)
+        assert table.stacks == {"Alice": 12500.0, "Bob": 1_200_000.0}
+
+    def test_suffix_needs_word_end(self) -> None:
+        table = lexer_for(DEFAULT_PROFILE).lex("Alice 500kate")
+        assert table.stacks == {"Alice": 500.0}
+
+    def test_field_helpers(self) -> None:
+        lexer = self._eu()
+        assert lexer.parse_amount("€ 2.500") == 2500.0
+        assert lexer.parse_bare_blinds("€1/€2") == (1.0, 2.0)
+        assert lexer.parse_amount("--") is None
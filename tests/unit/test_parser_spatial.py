@@ -0,0 +1,105 @@
+"""Tests for seat assignment from OCR word boxes."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from bbs_converter.ocr.engine import NO_TOKENS, OCRTokens, OCRWord
+from bbs_converter.parser.confusion import repair_for
+from bbs_converter.parser.lexer import DEFAULT_LEXER
+from bbs_converter.parser.profiles import DEFAULT_PROFILE
+from bbs_converter.parser.spatial import SeatIndex, SeatTemplate, assign_seats
+from bbs_converter.utils.exceptions import ConfigError
+
+
+def _word(text: str, x: int, y: int, line: int = 1) -> OCRWord:
+    """A 40x12 word centred on ``(x, y)``."""
+    return OCRWord(text, 90.0, x - 20, y - 6, 40, 12, block=1, line=line)
+
+
+class TestSeatTemplate:
+    @pytest.mark.parametrize("seats", [2, 6, 9])
+    def test_built_in_sizes(self, seats: int) -> None:
+        assert len(SeatTemplate.for_table_size(seats)) == seats
+
+    def test_unknown_size(self) -> None:
+        with pytest.raises(ConfigError, match="7-max"):
+            SeatTemplate.for_table_size(7)
+
+    def test_anchors_must_be_fractions(self) -> None:
+        with pytest.raises(ConfigError):
+            SeatTemplate(((0.5, 1.5),))
+        with pytest.raises(ConfigError):
+            SeatTemplate(())
+
+
+class TestSeatIndex:
+    def test_lookup_nearest_anchor(self) -> None:
+        index = SeatIndex(SeatTemplate.for_table_size(6), 800, 600)
+        points = np.array([[400.0, 70.0], [700.0, 420.0], [90.0, 180.0]])
+        assert index.lookup(points).tolist() == [0, 2, 5]
+
+    def test_centre_belongs_to_no_seat(self) -> None:
+        index = SeatIndex(SeatTemplate.for_table_size(6), 800, 600)
+        assert index.lookup(np.array([[400.0, 300.0]])).tolist() == [-1]
+
+    def test_points_outside_region_clipped(self) -> None:
+        index = SeatIndex(SeatTemplate.for_table_size(2), 200, 200)
+        assert index.lookup(np.array([[100.0, -50.0]])).tolist() == [0]
+
+    def test_size(self) -> None:
+        index = SeatIndex(SeatTemplate.for_table_size(2), 640, 480)
+        assert index.size == (640, 480)
+
+    def test_invalid_size(self) -> None:
+        with pytest.raises(ConfigError):
+            SeatIndex(SeatTemplate.for_table_size(2), 0, 100)
+
+
+class TestAssignSeats:
+    def _index(self) -> SeatIndex:
+        return SeatIndex(SeatTemplate.for_table_size(6), 800, 600)
+
+    def test_pairs_names_and_stacks_by_seat(self) -> None:
+        # Read order interleaves the seats; boxes keep them apart.
+        tokens = OCRTokens.from_words([
+            _word("Alice", 400, 60),
+            _word("Bob", 700, 170),
+            _word("1,500", 400, 80, line=2),
+            _word("$820", 700, 190, line=2),
+        ])
+        players = assign_seats(tokens, self._index(), DEFAULT_LEXER)
+        assert [(p.seat, p.name, p.stack) for p in players] == [
+            (1, "Alice", 1500.0), (2, "Bob", 820.0),
+        ]
+        assert players[0].position == (400, 60)
+
+    def test_multi_word_name_on_one_line(self) -> None:
+        tokens = OCRTokens.from_words([
+            _word("Big", 380, 60), _word("Joe", 420, 60), _word("300", 400, 80, 2),
+        ])
+        [player] = assign_seats(tokens, self._index(), DEFAULT_LEXER)
+        assert player.name == "Big Joe"
+        assert player.position == (400, 60)
+
+    def test_table_words_and_centre_skipped(self) -> None:
+        tokens = OCRTokens.from_words([
+            _word("Fold", 400, 50),
+            _word("Carol", 400, 65, line=2),
+            _word("250", 400, 80, line=3),
+            _word("Pot", 400, 300),
+        ])
+        [player] = assign_seats(tokens, self._index(), DEFAULT_LEXER)
+        assert (player.name, player.stack) == ("Carol", 250.0)
+
+    def test_repair_reads_confused_stack(self) -> None:
+        tokens = OCRTokens.from_words([
+            _word("Dave", 400, 60), _word("1,2O0", 400, 80, line=2),
+        ])
+        repair = repair_for(DEFAULT_PROFILE)
+        [player] = assign_seats(tokens, self._index(), DEFAULT_LEXER, repair)
+        assert player.stack == 1200.0
+
+    def test_no_tokens(self) -> None:
+        assert assign_seats(NO_TOKENS, self._index(), DEFAULT_LEXER) == []
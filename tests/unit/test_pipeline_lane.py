@@ -0,0 +1,221 @@
+"""Tests for the per-table processing lane."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import PropertyMock, patch
+
+import numpy as np
+import pytest
+
+from bbs_converter.models import CaptureRegion, FrameEnvelope
+from bbs_converter.ocr.engine import NO_TOKENS, OCRResult, OCRWord
+from bbs_converter.ocr.tesseract_pool import PoolHealth
+from bbs_converter.parser.spatial import SeatTemplate
+from bbs_converter.pipeline.lane import TableLane
+from bbs_converter.utils.exceptions import OCRError, PipelineError
+
+
+class TestTableLane:
+    def _region(self) -> CaptureRegion:
+        return CaptureRegion(x=0, y=0, width=10, height=10)
+
+    def _envelope(self, age: float = 0.0) -> FrameEnvelope:
+        frame = np.zeros((10, 10, 4), dtype=np.uint8)
+        return FrameEnvelope(3, time.perf_counter() - age, self._region(), frame)
+
+    def test_without_local_ocr_only_completes(self) -> None:
+        lane = TableLane(self._region(), local_ocr=False)
+        assert lane.ocr is None
+        with pytest.raises(PipelineError, match="no local OCR"):
+            lane.process(self._envelope())
+        reading = ("Blinds: 50/100 Alice 5000", 90.0, NO_TOKENS)
+        state = lane.complete(self._envelope(), reading, 0.01)
+        assert state is not None
+        assert state.stacks_bb == {"Alice": 50.0}
+
+    def test_process_returns_stamped_state(self) -> None:
+        lane = TableLane(self._region())
+        result = OCRResult(text="Blinds: 50/100 Alice 5000", confidence=90.0)
+        with patch.object(lane.ocr, "process", return_value=result):
+            state = lane.process(self._envelope())
+        assert state is not None
+        assert state.stacks_bb == {"Alice": 50.0}
+        assert state.frame_seq == 3
+        assert lane.ocr_fps > 0
+
+    def test_parse_failure_counted(self) -> None:
+        lane = TableLane(self._region())
+        result = OCRResult(text="nothing useful", confidence=90.0)
+        with patch.object(lane.ocr, "process", return_value=result):
+            assert lane.process(self._envelope()) is None
+        assert lane.stats.parse_errors == 1
+
+    def test_ocr_failure_counted(self) -> None:
+        lane = TableLane(self._region())
+        with patch.object(lane.ocr, "process", side_effect=OCRError("boom")):
+            assert lane.process(self._envelope()) is None
+        assert lane.stats.ocr_errors == 1
+
+    def test_ocr_failure_callback(self) -> None:
+        failures = []
+        lane = TableLane(self._region(), on_ocr_failure=lambda: failures.append(1))
+        with patch.object(lane.ocr, "process", side_effect=OCRError("boom")):
+            assert lane.process(self._envelope()) is None
+        assert failures == [1]
+
+    def test_stale_frame_dropped(self) -> None:
+        lane = TableLane(self._region(), frame_deadline=0.01)
+        with patch.object(lane.ocr, "process") as process:
+            assert lane.process(self._envelope(age=1.0)) is None
+        process.assert_not_called()
+        assert lane.stats.stale_frames == 1
+
+    def test_released_frame_is_stale(self) -> None:
+        from bbs_converter.capture.frame_pool import FramePool
+
+        pool = FramePool((10, 10, 4), capacity=1)
+        lease = pool.acquire()
+        assert lease is not None
+        envelope = FrameEnvelope(
+            1, time.perf_counter(), self._region(), lease.array, lease,
+        )
+        envelope.release()
+        lane = TableLane(self._region())
+        assert not lane.admit(envelope)
+        assert lane.stats.stale_frames == 1
+
+    def test_publish_and_latest_state(self) -> None:
+        lane = TableLane(self._region())
+        assert lane.latest_state() is None
+        result = OCRResult(text="Blinds: 1/2 Bob 20", confidence=90.0)
+        with patch.object(lane.ocr, "process", return_value=result):
+            state = lane.process(self._envelope())
+        assert state is not None
+        lane.publish(state)
+        assert lane.latest_state() is state
+
+    def test_layout_reads_table_field_by_field(self) -> None:
+        from bbs_converter.ocr.layout import FieldROI, TableLayout
+        from bbs_converter.utils.constants import FieldKind
+
+        layout = TableLayout((
+            FieldROI("blinds", FieldKind.BLINDS, 0.0, 0.0, 0.5, 0.5),
+            FieldROI("seat1_name", FieldKind.TEXT, 0.5, 0.0, 0.5, 0.5),
+            FieldROI("seat1_stack", FieldKind.AMOUNT, 0.5, 0.5, 0.5, 0.5),
+        ))
+        lane = TableLane(self._region(), layout=layout)
+        fields = {
+            "blinds": OCRResult(text="50/100", confidence=90.0),
+            "seat1_name": OCRResult(text="Alice", confidence=80.0),
+            "seat1_stack": OCRResult(text="5,000", confidence=70.0),
+        }
+        with patch.object(lane.ocr, "process_fields", return_value=fields):
+            state = lane.process(self._envelope())
+        assert state is not None
+        assert state.stacks_bb == {"Alice": 50.0}
+        assert lane.stats.ocr_confidence == 80.0
+
+    def test_complete_parses_reading_from_elsewhere(self) -> None:
+        lane = TableLane(self._region())
+        state = lane.complete(
+            self._envelope(), ("Blinds: 1/2 Bob 20", 88.0, NO_TOKENS), 0.05,
+        )
+        assert state is not None
+        assert state.stacks_bb == {"Bob": 10.0}
+        assert lane.stats.frames_processed == 1
+        assert lane.ocr_fps == 20.0
+
+    def test_record_ocr_failure(self) -> None:
+        lane = TableLane(self._region())
+        lane.record_ocr_failure(OCRError("worker died"), 0.1)
+        assert lane.stats.ocr_errors == 1
+
+    def test_unchanged_table_returns_same_state(self) -> None:
+        lane = TableLane(self._region())
+        result = OCRResult(text="Blinds: 50/100 Alice 5000", confidence=90.0)
+        with patch.object(lane.ocr, "process", return_value=result):
+            first = lane.process(self._envelope())
+            second = lane.process(self._envelope())
+        assert first is not None
+        assert second is first
+        assert lane.stats.unchanged_frames == 1
+        assert lane.stats.parse_memo_hit_rate == 50.0
+
+    def test_changed_table_gets_new_state(self) -> None:
+        lane = TableLane(self._region())
+        reads = [
+            OCRResult(text="Blinds: 50/100 Alice 5000", confidence=90.0),
+            OCRResult(text="Blinds: 50/100 Alice 4000", confidence=90.0),
+        ]
+        with patch.object(lane.ocr, "process", side_effect=reads):
+            first = lane.process(self._envelope())
+            second = lane.process(self._envelope())
+        assert first is not None and second is not None
+        assert second is not first
+        assert second.stacks_bb == {"Alice": 40.0}
+        assert lane.stats.unchanged_frames == 0
+
+    def test_parse_failure_rate_and_repairs(self) -> None:
+        lane = TableLane(self._region())
+        reads = [
+            OCRResult(text="B1inds: 5O/1OO Alice 5,OOO", confidence=90.0),
+            OCRResult(text="nothing useful", confidence=90.0),
+        ]
+        with patch.object(lane.ocr, "process", side_effect=reads):
+            state = lane.process(self._envelope())
+            assert lane.process(self._envelope()) is None
+        assert state is not None
+        assert state.stacks_bb == {"Alice": 50.0}
+        stats = lane.stats
+        assert stats.parse_failure_rate == 50.0
+        assert stats.parse_repairs == 1
+
+    def test_stats_report_result_cache_hit_rate(self) -> None:
+        from bbs_converter.ocr.result_cache import OCRResultCache
+
+        cache = OCRResultCache()
+        cache.put("a", OCRResult(text="1", confidence=90.0))
+        cache.get("a")
+        cache.get("b")
+        lane = TableLane(self._region(), result_cache=cache)
+        assert lane.stats.result_cache_hit_rate == 50.0
+
+    def test_stats_report_engine_health(self) -> None:
+        lane = TableLane(self._region())
+        health = PoolHealth(
+            size=1, capacity=2, idle=1, calls=10, failures=1, restarts=3,
+            mean_latency_ms=5.0,
+        )
+        with patch.object(
+            type(lane.ocr), "engine_health", new_callable=PropertyMock,
+            return_value=health,
+        ):
+            stats = lane.stats
+        assert stats.ocr_restarts == 3
+        assert not stats.ocr_engine_healthy
+
+    def test_seat_positions_scaled_to_region_points(self) -> None:
+        # A 2x display: the 200-point region is captured as 400 pixels.
+        region = CaptureRegion(x=0, y=0, width=200, height=200)
+        frame = np.zeros((400, 400, 4), dtype=np.uint8)
+        envelope = FrameEnvelope(1, time.perf_counter(), region, frame)
+        result = OCRResult.from_words([
+            OCRWord("Blinds", 90.0, 170, 190, 40, 12),
+            OCRWord("5/10", 90.0, 215, 190, 30, 12),
+            OCRWord("Alice", 90.0, 180, 50, 40, 12, block=1, line=1),
+            OCRWord("200", 90.0, 180, 80, 40, 12, block=1, line=2),
+            OCRWord("Bob", 90.0, 180, 330, 40, 12, block=2, line=1),
+            OCRWord("350", 90.0, 180, 360, 40, 12, block=2, line=2),
+        ])
+        lane = TableLane(
+            region, local_ocr=False, seat_template=SeatTemplate.for_table_size(2),
+        )
+        assert lane.parse_memo.seat_index is None
+        reading = (result.text, result.confidence, result.tokens)
+        state = lane.complete(envelope, reading, 0.01)
+        index = lane.parse_memo.seat_index
+        assert index is not None
+        assert index.size == (400, 400)
+        assert state is not None
+        assert state.positions == {"Alice": (100, 28), "Bob": (100, 168)}
@@ -0,0 +1,55 @@
+"""Tests for the multi-table orchestrator."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from bbs_converter.models import CaptureRegion
+from bbs_converter.ocr.engine import OCRResult
+from bbs_converter.pipeline.multi_table import MultiTableOrchestrator
+
+
+class TestMultiTableOrchestrator:
+    def _regions(self) -> list[CaptureRegion]:
+        return [
+            CaptureRegion(x=0, y=0, width=50, height=50),
+            CaptureRegion(x=50, y=0, width=50, height=50),
+        ]
+
+    def _mock_grabber(self) -> MagicMock:
+        mock = MagicMock()
+        mock.grab_region.return_value = np.zeros((50, 100, 4), dtype=np.uint8)
+        mock.__enter__ = MagicMock(return_value=mock)
+        mock.__exit__ = MagicMock(return_value=False)
+        return mock
+
+    def test_each_table_gets_its_own_state(self) -> None:
+        orch = MultiTableOrchestrator(self._regions(), fps=100)
+        texts = ["Blinds: 50/100 Alice 5000", "Blinds: 1/2 Bob 300"]
+        for lane, text in zip(orch.lanes, texts):
+            lane.ocr.process = MagicMock(  # type: ignore[method-assign]
+                return_value=OCRResult(text=text, confidence=90.0),
+            )
+
+        with patch(
+            "bbs_converter.capture.multi.FrameGrabber",
+            return_value=self._mock_grabber(),
+        ):
+            orch.start()
+            time.sleep(0.2)
+            orch.stop()
+
+        first, second = orch.latest_states()
+        assert first is not None and second is not None
+        assert first.stacks_bb == {"Alice": 50.0}
+        assert second.stacks_bb == {"Bob": 150.0}
+        assert orch.stats(0).frames_processed >= 1
+        assert orch.table_count == 2
+
+    def test_initial_states_none(self) -> None:
+        orch = MultiTableOrchestrator(self._regions())
+        assert orch.latest_state(0) is None
+        assert orch.running is False
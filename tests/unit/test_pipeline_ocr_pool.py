@@ -0,0 +1,187 @@
+"""Tests for the process-pool OCR stage."""
+
+from __future__ import annotations
+
+import pickle
+import time
+from concurrent.futures import Future
+from multiprocessing.shared_memory import SharedMemory
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from bbs_converter.models import CaptureRegion, FrameEnvelope
+from bbs_converter.ocr.engine import OCRResult
+from bbs_converter.ocr.glyph import GlyphBank
+from bbs_converter.ocr.result_cache import OCRResultCache
+from bbs_converter.pipeline import ocr_pool
+from bbs_converter.pipeline.ocr_pool import OCRProcessPool, ocr_worker_count
+from bbs_converter.utils.constants import GLYPH_SIZE
+from bbs_converter.utils.exceptions import OCRError, PipelineError
+
+
+def _envelope(seq: int, value: int = 0) -> FrameEnvelope:
+    frame = np.full((8, 12, 4), value, dtype=np.uint8)
+    return FrameEnvelope(seq, time.perf_counter(), CaptureRegion(0, 0, 12, 8), frame)
+
+
+class TestWorkerCount:
+    def test_zero_means_in_thread(self) -> None:
+        assert ocr_worker_count(0, cpu_budget=8) == 0
+
+    def test_clamped_to_budget_minus_one(self) -> None:
+        assert ocr_worker_count(16, cpu_budget=4) == 3
+        assert ocr_worker_count(2, cpu_budget=4) == 2
+
+    def test_at_least_one_worker(self) -> None:
+        assert ocr_worker_count(4, cpu_budget=1) == 1
+
+
+class TestWorkerTask:
+    def test_reads_frame_from_shared_slot(self) -> None:
+        block = SharedMemory(create=True, size=2 * 384)
+        try:
+            frame = (np.arange(384) % 256).astype(np.uint8).reshape(8, 12, 4)
+            np.ndarray(frame.shape, np.uint8, buffer=block.buf, offset=384)[:] = frame
+            seen: list[np.ndarray] = []
+
+            def fake_read(ocr, view, layout):
+                seen.append(view.copy())
+                return "Blinds: 1/2", 91.0
+
+            ocr_pool._init_worker(ocr_pool.DEFAULT_OCR_ENGINE, "eng", 60.0, None)
+            with patch.object(ocr_pool, "read_frame", side_effect=fake_read):
+                reading, seconds, _ = ocr_pool._ocr_slot(
+                    block.name, 384, frame.shape, "|u1",
+                )
+
+            assert reading == ("Blinds: 1/2", 91.0)
+            assert seconds >= 0
+            np.testing.assert_array_equal(seen[0], frame)
+        finally:
+            if ocr_pool._worker_block is not None:
+                ocr_pool._worker_block.close()
+                ocr_pool._worker_block = None
+            block.close()
+            block.unlink()
+
+    def test_worker_gets_caches_and_settings(self) -> None:
+        cache = OCRResultCache(max_entries=8)
+        bank = GlyphBank()
+        ocr_pool._init_worker(
+            ocr_pool.DEFAULT_OCR_ENGINE, "eng", 60.0, None,
+            pool_size=1, result_cache=cache, glyph_bank=bank, batch_fields=True,
+        )
+        assert ocr_pool._worker_ocr is not None
+        assert ocr_pool._worker_ocr.result_cache is cache
+        assert ocr_pool._worker_ocr._batch_fields
+
+    def test_learned_entries_returned(self) -> None:
+        cache = OCRResultCache(max_entries=8)
+        bank = GlyphBank()
+        ocr_pool._init_worker(
+            ocr_pool.DEFAULT_OCR_ENGINE, "eng", 60.0, None,
+            result_cache=cache, glyph_bank=bank,
+        )
+        result = OCRResult(text="100", confidence=90.0)
+        glyph = np.ones(GLYPH_SIZE * GLYPH_SIZE, dtype=np.float32)
+        cache.put("key", result)
+        bank.add("1", glyph)
+        cache.get("key")
+        cache.get("other")
+        learned = ocr_pool._take_learned()
+        assert learned.results == [("key", result)]
+        assert [label for label, _ in learned.glyphs] == ["1"]
+        assert (learned.hits, learned.misses) == (1, 1)
+        assert ocr_pool._take_learned() == ocr_pool._Learned([], [])
+
+    def test_caches_survive_pickling(self) -> None:
+        cache = pickle.loads(pickle.dumps(OCRResultCache(max_entries=8)))
+        bank = pickle.loads(pickle.dumps(GlyphBank()))
+        assert cache.get("missing") is None
+        assert len(bank) == 0
+
+
+class TestOCRProcessPool:
+    def test_outcomes_released_in_submission_order(self) -> None:
+        pool = OCRProcessPool(workers=2, slot_bytes=8 * 12 * 4)
+        try:
+            for seq in range(6):
+                assert pool.submit(_envelope(seq, seq), timeout=10.0)
+            outcomes = list(pool.drain(timeout=60.0))
+        finally:
+            pool.close()
+
+        assert [o.envelope.seq for o in outcomes] == list(range(6))
+        # Without Tesseract installed frames fail, but still come back in order.
+        assert all(o.error is None or isinstance(o.error, OCRError) for o in outcomes)
+        assert pool.in_flight == 0
+
+    def test_learned_entries_merged_into_parent(self) -> None:
+        cache = OCRResultCache(max_entries=8)
+        bank = GlyphBank()
+        pool = OCRProcessPool(
+            workers=1, slot_bytes=16, result_cache=cache, glyph_bank=bank,
+        )
+        try:
+            result = OCRResult(text="100", confidence=90.0)
+            glyph = np.ones(GLYPH_SIZE * GLYPH_SIZE, dtype=np.float32)
+            future: Future[tuple[object, float, ocr_pool._Learned]] = Future()
+            learned = ocr_pool._Learned([("key", result)], [("1", glyph)], 3, 1)
+            future.set_result((None, 0.1, learned))
+            pool._free.get()
+            pool._finish(future, 0, 0, _envelope(0))  # type: ignore[arg-type]
+        finally:
+            pool.close()
+        assert (cache.hits, cache.misses) == (3, 1)
+        assert cache.get("key") == result
+        assert bank.characters == {"1"}
+
+    def test_slots_sized_from_first_frame(self) -> None:
+        pool = OCRProcessPool(workers=1)
+        try:
+            assert pool.submit(_envelope(0), timeout=10.0)
+            assert pool._block is not None
+            assert pool._block.size // pool._slots == 8 * 12 * 4
+            list(pool.drain(timeout=60.0))
+        finally:
+            pool.close()
+
+    def test_slots_regrown_for_larger_frame(self) -> None:
+        pool = OCRProcessPool(workers=1, slot_bytes=16)
+        try:
+            assert pool.submit(_envelope(0), timeout=10.0)
+            big = FrameEnvelope(
+                1, time.perf_counter(), CaptureRegion(0, 0, 12, 8),
+                np.zeros((16, 24, 4), dtype=np.uint8),  # a 2x HiDPI frame
+            )
+            # Waits for the first frame to free its slot, then regrows.
+            assert pool.submit(big, timeout=60.0)
+            assert pool._block is not None
+            assert pool._block.size // pool._slots == 16 * 24 * 4
+            outcomes = list(pool.drain(timeout=60.0))
+        finally:
+            pool.close()
+        assert [o.envelope.seq for o in outcomes] == [0, 1]
+
+    def test_regrow_waits_for_slots_in_flight(self) -> None:
+        pool = OCRProcessPool(workers=1, slot_bytes=16)
+        try:
+            pool._allocate(16)
+            pool._free.get()  # a frame still in flight
+            assert pool._regrow(64, timeout=0.01) is None
+            assert pool._free.qsize() == pool._slots - 1
+            assert pool._block.size // pool._slots == 16
+        finally:
+            pool.close()
+
+    def test_closed_pool_rejects_work(self) -> None:
+        pool = OCRProcessPool(workers=1, slot_bytes=8 * 12 * 4)
+        pool.close()
+        with pytest.raises(PipelineError, match="closed"):
+            pool.submit(_envelope(0))
+
+    def test_at_least_one_worker_required(self) -> None:
+        with pytest.raises(PipelineError):
+            OCRProcessPool(workers=0, slot_bytes=16)
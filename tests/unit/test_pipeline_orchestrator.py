@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import sys
+import threading
 import time
 from unittest.mock import MagicMock, patch
 
 import numpy as np
+import pytest
 
-from bbs_converter.models import BBState, CaptureRegion
+from bbs_converter.models import BBState, CaptureRegion, FrameEnvelope
+from bbs_converter.ocr.engine import OCRResult
 
 
 class TestPipelineOrchestrator:
@@ -50,6 +53,105 @@ class TestPipelineOrchestrator:
         from bbs_converter.pipeline.orchestrator import PipelineOrchestrator
         orch = PipelineOrchestrator(self._make_region())
         state = BBState(pot_bb=3.5, stacks_bb={"A": 50.0})
-        with orch._state_lock:
-            orch._latest_state = state
+        orch._lane.publish(state)
         assert orch._get_latest_state() == state
+
+    def test_stats_expose_buffer_memory(self) -> None:
+        from bbs_converter.pipeline.orchestrator import PipelineOrchestrator
+        orch = PipelineOrchestrator(self._make_region(), buffer_max_bytes=1024)
+        frame = np.zeros((10, 10, 4), dtype=np.uint8)
+        orch._frame_buffer.put(
+            FrameEnvelope(1, time.perf_counter(), self._make_region(), frame)
+        )
+        stats = orch.stats
+        assert stats.buffer_bytes == 400
+        assert stats.buffer_high_water_bytes == 400
+        assert stats.buffer_drops == 0
+
+    def _run_one_frame(self, orch, envelope: FrameEnvelope) -> None:
+        orch._frame_buffer.put(envelope)
+        orch._stop_event.clear()
+        thread = threading.Thread(target=orch._process_loop, daemon=True)
+        thread.start()
+        time.sleep(0.05)
+        orch._stop_event.set()
+        thread.join(timeout=1.0)
+
+    def test_published_state_carries_frame_stamp(self) -> None:
+        from bbs_converter.pipeline.orchestrator import PipelineOrchestrator
+        orch = PipelineOrchestrator(self._make_region())
+        result = OCRResult(text="Blinds: 50/100 Alice 5000", confidence=90.0)
+        frame = np.zeros((10, 10, 4), dtype=np.uint8)
+        envelope = FrameEnvelope(7, time.perf_counter(), self._make_region(), frame)
+
+        with patch.object(orch._ocr, "process", return_value=result):
+            self._run_one_frame(orch, envelope)
+
+        state = orch._get_latest_state()
+        assert state is not None
+        assert state.frame_seq == 7
+        assert state.captured_at == envelope.captured_at
+        assert orch.stats.latency_ms > 0
+
+    def test_select_parser_profile(self) -> None:
+        from bbs_converter.parser.profiles import load_profiles
+        from bbs_converter.pipeline.orchestrator import PipelineOrchestrator
+        from bbs_converter.utils.exceptions import ConfigError
+
+        profiles = load_profiles({"eu": {"blind_labels": ["stakes"]}})
+        orch = PipelineOrchestrator(self._make_region(), parser_profiles=profiles)
+        assert orch.parser_profile.name == "default"
+
+        assert orch.select_profile("eu").name == "eu"
+        result = OCRResult(text="Stakes: 50/100 Alice 5000", confidence=90.0)
+        frame = np.zeros((10, 10, 4), dtype=np.uint8)
+        envelope = FrameEnvelope(1, time.perf_counter(), self._make_region(), frame)
+        with patch.object(orch._ocr, "process", return_value=result):
+            self._run_one_frame(orch, envelope)
+        state = orch._get_latest_state()
+        assert state is not None
+        assert state.stacks_bb == {"Alice": 50.0}
+
+        with pytest.raises(ConfigError):
+            orch.select_profile("stars")
+
+    def test_unknown_parser_site_rejected(self) -> None:
+        from bbs_converter.pipeline.orchestrator import PipelineOrchestrator
+        from bbs_converter.utils.exceptions import ConfigError
+
+        with pytest.raises(ConfigError):
+            PipelineOrchestrator(self._make_region(), parser_site="stars")
+
+    def test_stale_frames_dropped_before_ocr(self) -> None:
+        from bbs_converter.pipeline.orchestrator import PipelineOrchestrator
+        orch = PipelineOrchestrator(self._make_region(), frame_deadline=0.01)
+        frame = np.zeros((10, 10, 4), dtype=np.uint8)
+        envelope = FrameEnvelope(
+            1, time.perf_counter() - 1.0, self._make_region(), frame,
+        )
+
+        with patch.object(orch._ocr, "process") as process:
+            self._run_one_frame(orch, envelope)
+
+        process.assert_not_called()
+        assert orch.stats.stale_frames == 1
+
+    def test_fast_replay_processes_every_frame(self) -> None:
+        from bbs_converter.capture.replay import ReplayGrabber, ReplaySource
+        from bbs_converter.pipeline.orchestrator import PipelineOrchestrator
+
+        frames = [np.full((10, 10, 4), i, dtype=np.uint8) for i in range(4)]
+        replay = ReplayGrabber(ReplaySource(frames), realtime=False)
+        orch = PipelineOrchestrator(replay.region, replay=replay)
+        result = OCRResult(text="Blinds: 50/100 Alice 5000", confidence=90.0)
+        with patch.object(orch._ocr, "process", return_value=result):
+            orch.start()
+            assert orch.wait_until_exhausted(timeout=5.0) is True
+            orch.stop()
+
+        assert orch.stats.frames_processed == 4
+        # Every frame read the same table, so the first state stands.
+        assert orch.stats.unchanged_frames == 3
+        state = orch._get_latest_state()
+        assert state is not None
+        assert state.frame_seq == 1
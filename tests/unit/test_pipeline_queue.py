@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import numpy as np
+
 from bbs_converter.pipeline.queue import StageQueue
 
 
@@ -34,3 +36,19 @@ class TestStageQueue:
     def test_name_property(self) -> None:
         q: StageQueue[int] = StageQueue(name="ocr_output")
         assert q.name == "ocr_output"
+
+    def test_byte_budget_drops_oldest(self) -> None:
+        item = np.zeros(100, dtype=np.uint8)
+        q: StageQueue[np.ndarray] = StageQueue(maxsize=10, max_bytes=250)
+        for _ in range(3):
+            q.put(item)
+        assert q.size == 2
+        assert q.stats.live_bytes == 200
+        assert q.stats.drops == 1
+
+    def test_items_without_nbytes_count_as_zero(self) -> None:
+        q: StageQueue[str] = StageQueue(maxsize=5, max_bytes=1)
+        q.put("a")
+        q.put("b")
+        assert q.size == 2
+        assert q.stats.live_bytes == 0
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 
-from bbs_converter.utils.timer import timed
+from bbs_converter.utils.timer import IntervalStats, timed
 
 
 class TestTimed:
@@ -46,3 +46,37 @@ class TestTimed:
             assert str(exc) == "boom"
         else:
             raise AssertionError("Expected ValueError")
+
+
+class TestIntervalStats:
+    def test_empty_snapshot(self) -> None:
+        stats = IntervalStats().snapshot()
+        assert stats.count == 0
+        assert stats.mean_ms == 0.0
+
+    def test_mean_and_percentiles(self) -> None:
+        stats = IntervalStats()
+        for ms in range(1, 101):
+            stats.record(ms / 1000)
+        snap = stats.snapshot()
+        assert snap.count == 100
+        assert abs(snap.mean_ms - 50.5) < 1e-6
+        assert abs(snap.p95_ms - 95.0) < 1e-6
+        assert abs(snap.p99_ms - 99.0) < 1e-6
+
+    def test_constant_intervals_have_no_jitter(self) -> None:
+        stats = IntervalStats()
+        for _ in range(10):
+            stats.record(0.01)
+        assert stats.snapshot().jitter_ms < 1e-9
+
+    def test_window_is_rolling(self) -> None:
+        stats = IntervalStats(window=3)
+        for value in (1.0, 1.0, 0.1, 0.1, 0.1):
+            stats.record(value)
+        assert abs(stats.mean - 0.1) < 1e-9
+
+    def test_overruns_counted(self) -> None:
+        stats = IntervalStats()
+        stats.record_overrun()
+        assert stats.snapshot().overruns == 1